@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Benchmark batched assertion verification on generated modules.
+
+Generates modules with many classes and methods, extracts every claim with
+ClaimExtractor, then times:
+- the previous per-assertion path (read, ast.parse and ast.walk the file
+  for every assertion)
+- AssertionVerifier.verify_many (one parse per file, dictionary lookups)
+- a second verify_many over unchanged files (lookup tables reused)
+
+Usage:
+    python scripts/benchmark_assertions.py [--modules 20] [--classes 30] [--methods 15] [--workers 4] [--legacy-sample 200]
+"""
+import argparse
+import ast
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.understanding.assertions import (
+    AssertionVerifier,
+    ClaimExtractor,
+)
+
+
+def build_module(index: int, classes: int, methods: int) -> str:
+    lines = ["from typing import Generic", ""]
+    for c in range(classes):
+        base = f"Base{index}_{c - 1}" if c else "Generic[T]"
+        lines.append(f"class Base{index}_{c}({base}):")
+        lines.append(f'    """Service {c}."""')
+        for m in range(methods):
+            lines.append(f"    def method_{m}(self, value: int, name: str) -> int:")
+            lines.append("        return value")
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def legacy_verify(repo: Path, assertion) -> bool:
+    """The previous path: re-read, re-parse and re-walk the file per assertion."""
+    tree = ast.parse((repo / assertion.source_file).read_text())
+    class_name, _, method_name = assertion.source_concept.partition(".")
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef) and node.name == class_name:
+            if not method_name:
+                return True
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name == method_name:
+                    return True
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=20)
+    parser.add_argument("--classes", type=int, default=30)
+    parser.add_argument("--methods", type=int, default=15)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--legacy-sample", type=int, default=200,
+                        help="assertions to time on the per-assertion path")
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir)
+        (repo / "pkg").mkdir()
+        assertions = []
+        for i in range(args.modules):
+            source = build_module(i, args.classes, args.methods)
+            (repo / "pkg" / f"mod{i}.py").write_text(source)
+            extractor = ClaimExtractor(source, f"pkg/mod{i}.py")
+            for c in range(args.classes):
+                assertions.extend(extractor.extract_from_class(f"Base{i}_{c}", 0))
+        print(f"{args.modules} modules, {len(assertions):,} assertions "
+              f"({len(assertions) // args.modules:,} per file)")
+
+        verifier = AssertionVerifier(repo)
+        start = time.perf_counter()
+        results = verifier.verify_many(assertions, max_workers=args.workers)
+        batch_s = time.perf_counter() - start
+        verified = sum(a.is_verified() for a in results)
+        print(f"verify_many (cold):     {batch_s * 1000:10.1f}ms ({verified:,} verified)")
+
+        start = time.perf_counter()
+        verifier.verify_many(assertions, max_workers=args.workers)
+        print(f"verify_many (warm):     {(time.perf_counter() - start) * 1000:10.1f}ms")
+
+        if not args.skip_legacy:
+            sample = assertions[:: max(1, len(assertions) // args.legacy_sample)]
+            start = time.perf_counter()
+            for assertion in sample:
+                legacy_verify(repo, assertion)
+            legacy_s = (time.perf_counter() - start) * len(assertions) / len(sample)
+            print(f"per-assertion parse:    {legacy_s * 1000:10.1f}ms "
+                  f"(extrapolated from {len(sample):,}; {legacy_s / batch_s:.0f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Benchmark ASTParser.parse_directory and get_callers on a generated repository.
+
+Generates a repository of small modules, then times:
+- a cold parse_directory (every file parsed, across worker processes)
+- a warm parse with a fresh parser over the on-disk cache
+- a warm parse with the same parser (in-memory cache)
+- the previous serial rglob + parse loop, for comparison
+- get_callers lookups against the previous linear scan
+
+Usage:
+    python scripts/benchmark_ast_parser.py [--files 5000] [--functions 10] [--workers 4]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.analyze.ast_parser import ASTParser
+
+
+def build_module(index: int, functions: int) -> str:
+    lines = ["import os", "from pkg import util", ""]
+    lines.append(f"class Handler{index}:")
+    lines.append(f'    """Handler {index}."""')
+    lines.append("    def run(self, value: int) -> int:")
+    lines.append(f"        return self.step_{index}(value)")
+    lines.append(f"    def step_{index}(self, value: int = 0) -> int:")
+    lines.append("        return util.helper(value)")
+    for f in range(functions):
+        lines.append("")
+        lines.append(f"def task_{f}(value: int) -> str:")
+        lines.append(f'    """Task {f}."""')
+        lines.append(f"    return os.path.join(str(util.helper(value)), task_{(f + 1) % functions}(value))")
+    return "\n".join(lines) + "\n"
+
+
+def legacy_parse_directory(parser: ASTParser, dir_path: Path) -> list:
+    """The previous algorithm: serial rglob with substring skip checks."""
+    all_symbols = []
+    for py_file in dir_path.rglob("*.py"):
+        path_str = str(py_file)
+        if any(skip in path_str for skip in [
+            "__pycache__", ".venv", "node_modules", ".git", "dist", "build"
+        ]):
+            continue
+        all_symbols.extend(parser.parse_file(py_file, enhanced=True))
+    return all_symbols
+
+
+def legacy_get_callers(symbols: list, target_name: str) -> list[str]:
+    """The previous algorithm: scan every symbol's calls."""
+    callers = []
+    for symbol in symbols:
+        if symbol.kind in ("function", "method", "async_function", "async_method"):
+            for call in symbol.calls:
+                if call == target_name or call.endswith(f".{target_name}"):
+                    callers.append(symbol.qualified_name)
+                    break
+    return callers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--functions", type=int, default=10, help="module-level functions per file")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir) / "repo"
+        for i in range(args.files):
+            package = repo / "pkg" / f"sub{i // 100}"
+            package.mkdir(parents=True, exist_ok=True)
+            (package / f"mod{i}.py").write_text(build_module(i, args.functions))
+        cache_dir = Path(tmpdir) / "cache"
+        print(f"{args.files:,} files x {args.functions + 3} symbols")
+
+        cold = ASTParser(cache_dir=cache_dir)
+        start = time.perf_counter()
+        symbols = cold.parse_directory(repo, max_workers=args.workers)
+        cold_s = time.perf_counter() - start
+        print(f"cold parse_directory:       {cold_s:8.2f}s  ({len(symbols):,} symbols)")
+
+        warm = ASTParser(cache_dir=cache_dir)
+        start = time.perf_counter()
+        warm_symbols = warm.parse_directory(repo, max_workers=args.workers)
+        warm_s = time.perf_counter() - start
+        stats = warm.last_parse_stats
+        print(f"warm (disk cache):          {warm_s:8.2f}s  ({stats.disk_hits:,} disk hits, {stats.parsed} parsed)")
+        assert warm_symbols == symbols
+
+        start = time.perf_counter()
+        warm.parse_directory(repo, max_workers=args.workers)
+        print(f"warm (memory cache):        {time.perf_counter() - start:8.2f}s")
+
+        if not args.skip_legacy:
+            start = time.perf_counter()
+            legacy = legacy_parse_directory(ASTParser(), repo)
+            legacy_s = time.perf_counter() - start
+            print(f"legacy parse_directory:     {legacy_s:8.2f}s  ({len(legacy):,} symbols)")
+
+        targets = ["helper", "util.helper", "join"] + [f"step_{i}" for i in range(args.lookups)]
+        start = time.perf_counter()
+        indexed = [warm.get_callers(symbols, t) for t in targets]
+        indexed_s = time.perf_counter() - start
+        print(f"get_callers (indexed):      {indexed_s / len(targets) * 1e6:8.1f}us/lookup "
+              f"(index build included)")
+
+        start = time.perf_counter()
+        scanned = [legacy_get_callers(symbols, t) for t in targets]
+        scan_s = time.perf_counter() - start
+        print(f"get_callers (linear scan):  {scan_s / len(targets) * 1e6:8.1f}us/lookup")
+        assert indexed == scanned
+        warm.close()
+        cold.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark BeadsStore at scale: 100k beads with deep dependency chains.
+
+Measures bulk creation (one transaction), ready-set queries, and the
+cost of completing a bead in the middle of a long chain.
+
+Usage:
+    python scripts/benchmark_beads_store.py [--beads 100000] [--chain-depth 1000]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.memory.agent_memory import BeadsStore, BeadStatus, BeadPriority
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--beads", type=int, default=100_000)
+    parser.add_argument("--chain-depth", type=int, default=1_000)
+    parser.add_argument("--export-jsonl", action="store_true")
+    args = parser.parse_args()
+
+    priorities = list(BeadPriority)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = BeadsStore(Path(tmpdir) / "beads", export_jsonl=args.export_jsonl)
+
+        # Build chains: each bead is blocked by the previous bead in its chain
+        start = time.perf_counter()
+        chain_heads = []
+        with store.transaction():
+            previous = None
+            for i in range(args.beads):
+                if i % args.chain_depth == 0:
+                    previous = None
+                bead = store.create(
+                    f"task {i}",
+                    priority=priorities[i % len(priorities)],
+                    blocked_by=[previous.id] if previous else None,
+                )
+                if previous is None:
+                    chain_heads.append(bead)
+                previous = bead
+        create_s = time.perf_counter() - start
+        print(f"create {args.beads:,} beads:      {create_s:8.2f}s "
+              f"({args.beads / create_s:,.0f} beads/s)")
+
+        runs = 100
+        start = time.perf_counter()
+        for _ in range(runs):
+            ready = store.get_ready_set()
+        ready_ms = (time.perf_counter() - start) / runs * 1000
+        print(f"get_ready_set ({len(ready):,} ready): {ready_ms:8.3f}ms")
+
+        start = time.perf_counter()
+        for _ in range(runs):
+            store.select_next()
+        next_ms = (time.perf_counter() - start) / runs * 1000
+        print(f"select_next:                {next_ms:8.3f}ms")
+
+        # Walk one chain to completion: each step unblocks exactly one bead
+        head = chain_heads[0]
+        steps = 0
+        start = time.perf_counter()
+        current = head
+        while current is not None:
+            store.update_status(current.id, BeadStatus.DONE)
+            steps += 1
+            current = store.beads[current.blocks[0]] if current.blocks else None
+        walk_s = time.perf_counter() - start
+        print(f"complete chain of {steps:,}:     {walk_s:8.2f}s "
+              f"({walk_s / steps * 1000:.3f}ms/update)")
+
+        store.close()
+
+        start = time.perf_counter()
+        reopened = BeadsStore(Path(tmpdir) / "beads", export_jsonl=False)
+        load_s = time.perf_counter() - start
+        print(f"reload {len(reopened.beads):,} beads:      {load_s:8.2f}s")
+        reopened.close()
+
+
+if __name__ == "__main__":
+    main()
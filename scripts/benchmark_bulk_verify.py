@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Benchmark streaming bulk verification (``verify --batch``).
+
+Builds a synthetic repository and CodeWiki symbol catalog, then measures:
+- warm in-process throughput of DirectDependencyRetriever.retrieve_stream
+  (ordered and unordered, for several worker counts)
+- the end-to-end CLI: one ``verify --batch`` process over an NDJSON file,
+  compared with one ``verify`` process per query
+
+Usage:
+    python scripts/benchmark_bulk_verify.py [--modules 300] [--queries 5000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.verify.ddr import DirectDependencyRetriever, HallMetric
+
+
+def build_repo(root: Path, modules: int) -> tuple[Path, Path, list[str]]:
+    """Write a package of modules plus a matching symbol_catalog.md."""
+    repo = root / "repo"
+    pkg = repo / "pkg"
+    pkg.mkdir(parents=True)
+    catalog = ["# Symbol Catalog", ""]
+    names = []
+    for m in range(modules):
+        catalog.append(f"### `pkg/mod{m}.py`")
+        lines = []
+        for c in range(5):
+            name = f"Widget{m}_{c}"
+            catalog.append(f"- Line {len(lines) + 1}: `{name}` (class)")
+            lines.append(f"class {name}:")
+            lines.append(f'    """Widget {m}.{c}."""')
+            lines.append("    def run(self, x):")
+            lines.append("        return x")
+            lines.append("")
+            names.append(name)
+        (pkg / f"mod{m}.py").write_text("\n".join(lines))
+    codewiki = root / "codewiki"
+    codewiki.mkdir()
+    (codewiki / "symbol_catalog.md").write_text("\n".join(catalog) + "\n")
+    return repo, codewiki, names
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=300)
+    parser.add_argument("--queries", type=int, default=5_000)
+    parser.add_argument("--single-runs", type=int, default=10,
+                        help="per-query CLI processes to time for comparison")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        repo, codewiki, names = build_repo(root, args.modules)
+        queries = [names[i % len(names)] for i in range(args.queries)]
+        # Every tenth query names a symbol that does not exist
+        queries = [q if i % 10 else f"Missing{i}" for i, q in enumerate(queries)]
+
+        ddr = DirectDependencyRetriever(
+            codewiki_path=codewiki, repo_path=repo,
+            hall_metric=HallMetric(log_all=False, log_threshold_exceeded=False),
+        )
+        start = time.perf_counter()
+        ddr.retrieve(names[0], 1)
+        for name in names:
+            ddr.retrieve(name, 1, False)
+        print(f"warm-up ({len(names):,} symbols): {time.perf_counter() - start:8.2f}s")
+
+        for workers in (1, 4):
+            for ordered in (True, False):
+                start = time.perf_counter()
+                count = sum(1 for _ in ddr.retrieve_stream(
+                    queries, max_results_per_query=1,
+                    max_workers=workers, ordered=ordered,
+                ))
+                seconds = time.perf_counter() - start
+                label = "ordered" if ordered else "unordered"
+                print(f"retrieve_stream workers={workers} {label:9s}: "
+                      f"{count / seconds:10,.0f} queries/s")
+        ddr.close()
+
+        batch_file = root / "queries.ndjson"
+        with open(batch_file, "w") as f:
+            for i, query in enumerate(queries):
+                f.write(json.dumps({"id": i, "query": query}) + "\n")
+
+        env = dict(os.environ, PYTHONPATH=str(src_path))
+        common = ["--codewiki", str(codewiki), "--repo", str(repo), "-n", "1", "-q"]
+
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-m", "skills_fabric", "--no-daemon", "verify",
+             "--batch", str(batch_file), *common],
+            env=env, capture_output=True, text=True,
+        )
+        batch_s = time.perf_counter() - start
+        summary = json.loads(result.stdout.strip().splitlines()[-1])
+        print(f"CLI --batch ({len(queries):,} queries): {batch_s:8.2f}s total, "
+              f"{summary['per_second']:,.0f} queries/s in-stream, "
+              f"Hall_m {summary['hall_m']:.4f}")
+
+        start = time.perf_counter()
+        for query in queries[:args.single_runs]:
+            subprocess.run(
+                [sys.executable, "-m", "skills_fabric", "--no-daemon", "verify",
+                 query, *common],
+                env=env, capture_output=True, text=True,
+            )
+        single_s = (time.perf_counter() - start) / args.single_runs
+        print(f"CLI one process per query:     {single_s * 1000:8.1f}ms/query "
+              f"({1 / single_s:,.1f} queries/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Benchmark CallGraph indexing and reachability queries on a synthetic graph.
+
+Builds a layered call graph in memory (plus some back edges, so there are
+cycles), then times:
+- index build (name index, CSR adjacency, SCC condensation) and called_by
+- impact_analysis and find_dead_code, cold and repeated
+- the previous nested-loop _build_callers and BFS queries, on a subset
+- build_from_directory over generated files, serial and in worker processes
+
+Usage:
+    python scripts/benchmark_call_graph.py [--functions 100000] [--calls 4] [--files 400]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.intelligence.call_graph import CallGraph, CallNode
+
+
+def build_graph(functions: int, calls: int, seed: int = 0) -> CallGraph:
+    rng = random.Random(seed)
+    graph = CallGraph()
+    for i in range(functions):
+        targets = {f"f{rng.randrange(i + 1, functions)}" for _ in range(calls) if i + 1 < functions}
+        if rng.random() < 0.02 and i > 0:
+            targets.add(f"f{rng.randrange(0, i)}")  # back edge
+        if rng.random() < 0.1:
+            targets.add("print")
+        node = CallNode(name=f"f{i}", file_path=f"pkg/mod{i // 50}.py", line=i % 50 + 1,
+                        kind="function", calls=targets)
+        graph.nodes[node.id] = node
+    return graph
+
+
+def legacy_build_callers(graph: CallGraph) -> None:
+    """The previous algorithm: scan every node for every called name."""
+    for node in graph.nodes.values():
+        for called_name in node.calls:
+            for other in graph.nodes.values():
+                if other.name == called_name:
+                    other.called_by.add(node.id)
+
+
+def legacy_impact(graph: CallGraph, changed: str) -> set:
+    """The previous algorithm: pop-limited BFS with linear get_node scans."""
+    def get_node(name):
+        for node in graph.nodes.values():
+            if node.name == name:
+                return node
+        return None
+
+    affected, to_check, depth = set(), {changed}, 0
+    while to_check and depth < 20:
+        current = to_check.pop()
+        if current in affected:
+            continue
+        affected.add(current)
+        node = get_node(current)
+        if node:
+            for caller_id in node.called_by:
+                caller = graph.nodes.get(caller_id)
+                if caller:
+                    to_check.add(caller.name)
+        depth += 1
+    affected.discard(changed)
+    return affected
+
+
+def timed(label: str, fn, repeat: int = 1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    unit = f"{elapsed * 1000:9.2f}ms" if elapsed < 1 else f"{elapsed:9.2f}s "
+    print(f"{label:<38}{unit}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--functions", type=int, default=100_000)
+    parser.add_argument("--calls", type=int, default=4, help="calls per function")
+    parser.add_argument("--legacy-functions", type=int, default=3_000)
+    parser.add_argument("--files", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    graph = build_graph(args.functions, args.calls)
+    print(f"{args.functions:,} functions x ~{args.calls} calls")
+    timed("index build + called_by", graph._build_callers)
+
+    rng = random.Random(1)
+    targets = [f"f{rng.randrange(args.functions)}" for _ in range(20)]
+    deep = f"f{args.functions - 1}"
+    timed("impact_analysis (deepest, cold)", lambda: graph.impact_analysis(deep))
+    timed("impact_analysis (deepest, repeated)", lambda: graph.impact_analysis(deep), repeat=5)
+    timed("impact_analysis (20 random, cold)", lambda: [graph.impact_analysis(t) for t in targets])
+    dead = timed("find_dead_code (cold)", lambda: graph.find_dead_code(["f0", "f1"]))
+    timed("find_dead_code (repeated)", lambda: graph.find_dead_code(["f0", "f1"]), repeat=5)
+    print(f"  {len(dead):,} unreachable functions")
+
+    small = build_graph(args.legacy_functions, args.calls)
+    print(f"\nlegacy comparison on {args.legacy_functions:,} functions")
+    timed("legacy _build_callers", lambda: legacy_build_callers(small))
+    timed("indexed _build_callers", small._build_callers)
+    probe = f"f{args.legacy_functions - 1}"
+    timed("legacy impact_analysis", lambda: legacy_impact(small, probe))
+    timed("indexed impact_analysis (cold)", lambda: small.impact_analysis(probe))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir)
+        for i in range(args.files):
+            lines = []
+            for f in range(25):
+                lines.append(f"def func_{i}_{f}(x):")
+                lines.append(f"    return func_{(i + 1) % args.files}_{f}(helper(x))")
+            (repo / f"mod{i}.py").write_text("\n".join(lines) + "\n")
+        print(f"\nbuild_from_directory on {args.files} files")
+        timed("serial", lambda: CallGraph().build_from_directory(repo, max_workers=1))
+        timed("worker processes", lambda: CallGraph().build_from_directory(repo, max_workers=args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark citation injection on large generated documents.
+
+Builds a ~1 MB markdown document with thousands of backticked symbol
+references (most resolvable, some not) and times:
+- the previous per-match string rebuild (quadratic baseline)
+- CitationSystem.add_citations (single pass)
+- CitationStream fed in LLM-sized chunks
+
+Usage:
+    python scripts/benchmark_citations.py [--size-mb 1] [--symbols 500] [--chunk 64]
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.generate.citations import CitationSystem
+from skills_fabric.verify.ddr import SourceRef
+
+
+def build_document(size: int, symbols: list[str], rng: random.Random) -> str:
+    words = ["graph", "state", "node", "edge", "the", "a", "returns", "value", "with"]
+    parts = []
+    length = 0
+    while length < size:
+        if rng.random() < 0.08:
+            piece = f"`{rng.choice(symbols)}`"
+        else:
+            piece = rng.choice(words)
+        parts.append(piece)
+        length += len(piece) + 1
+    return " ".join(parts)
+
+
+def legacy_add_citations(system: CitationSystem, content: str) -> str:
+    """The previous implementation: rebuild the string for every match."""
+    pattern = r'`([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)`'
+    cited_content = content
+    uncited_symbols = []
+    for match in reversed(list(re.finditer(pattern, content))):
+        symbol = match.group(1)
+        ref = system._refs_by_symbol.get(symbol.lower())
+        if ref:
+            citation = system._format_citation(symbol, ref)
+            start, end = match.span()
+            cited_content = cited_content[:start] + citation + cited_content[end:]
+        elif symbol not in uncited_symbols:
+            uncited_symbols.append(symbol)
+    return cited_content
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=float, default=1.0)
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--chunk", type=int, default=64, help="stream chunk size in chars")
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    symbols = [f"Symbol{i}" for i in range(args.symbols)]
+    refs = [
+        SourceRef(symbol_name=name, file_path=f"pkg/mod{i % 50}.py", line_number=i + 1)
+        for i, name in enumerate(symbols)
+        if i % 10  # every tenth symbol stays uncited
+    ]
+    content = build_document(int(args.size_mb * 1_000_000), symbols, rng)
+
+    system = CitationSystem()
+    system.register_refs(refs)
+
+    start = time.perf_counter()
+    result = system.add_citations(content)
+    single_s = time.perf_counter() - start
+    print(f"document: {len(content) / 1e6:.2f} MB, {result.citations_added:,} citations, "
+          f"{len(result.uncited_symbols):,} uncited symbols")
+    print(f"add_citations (single pass): {single_s * 1000:10.1f}ms")
+
+    chunks = [content[i:i + args.chunk] for i in range(0, len(content), args.chunk)]
+    start = time.perf_counter()
+    streamed = "".join(system.cite_chunks(chunks))
+    stream_s = time.perf_counter() - start
+    assert streamed == result.cited_content
+    print(f"cite_chunks ({len(chunks):,} chunks):   {stream_s * 1000:10.1f}ms")
+
+    if not args.skip_legacy:
+        start = time.perf_counter()
+        legacy = legacy_add_citations(system, content)
+        legacy_s = time.perf_counter() - start
+        assert legacy == result.cited_content
+        print(f"legacy per-match rebuild:    {legacy_s * 1000:10.1f}ms "
+              f"({legacy_s / single_s:.0f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Benchmark cold CLI invocations against the warm serve daemon.
+
+Builds a synthetic repository and CodeWiki symbol catalog, then times
+``verify`` and ``analyze`` run as separate processes three ways:
+cold (``--no-daemon``), forwarded to a warm daemon over the socket, and
+the in-daemon execution time alone.
+
+Usage:
+    python scripts/benchmark_cli_daemon.py [--modules 300] [--runs 20]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.cli_daemon import CLIDaemon, shutdown
+
+
+def build_repo(root: Path, modules: int) -> Path:
+    """Write a package of modules plus a matching symbol_catalog.md."""
+    pkg = root / "repo" / "pkg"
+    pkg.mkdir(parents=True)
+    catalog = ["# Symbol Catalog", ""]
+    for m in range(modules):
+        lines = []
+        for c in range(5):
+            line = len(lines) + 1
+            lines.append(f"class Widget{m}_{c}:")
+            lines.append(f'    """Widget {m}.{c}."""')
+            lines.append("    def run(self, x):")
+            lines.append("        return x")
+            lines.append("")
+            catalog.append(
+                f"- [`Widget{m}_{c}`](https://github.com/org/repo/blob/main/pkg/mod{m}.py#L{line})"
+            )
+        (pkg / f"mod{m}.py").write_text("\n".join(lines))
+    codewiki = root / "codewiki"
+    codewiki.mkdir()
+    (codewiki / "symbol_catalog.md").write_text("\n".join(catalog) + "\n")
+    return root
+
+
+def time_cli(argv: list[str], env: dict, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-m", "skills_fabric", *argv],
+            env=env, capture_output=True, text=True,
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+        if result.returncode not in (0, 1):
+            raise RuntimeError(result.stderr)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = build_repo(Path(tmpdir), args.modules)
+        socket_path = Path("/tmp") / f"sf-bench-{os.getpid()}.sock"
+        env = dict(os.environ, PYTHONPATH=str(src_path), SKILLS_FABRIC_SOCKET=str(socket_path))
+
+        commands = {
+            "verify": ["-q", "verify", f"Widget{args.modules // 2}_1",
+                       "--codewiki", str(root / "codewiki"), "--repo", str(root / "repo")],
+            "analyze": ["-q", "analyze", str(root / "repo" / "pkg"), "--analyzer", "ast"],
+        }
+
+        cold = {
+            name: time_cli(["--no-daemon", *argv], env, args.runs)
+            for name, argv in commands.items()
+        }
+
+        daemon = CLIDaemon(socket_path=socket_path)
+        daemon.bind()
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+        try:
+            # One call per command to warm the daemon
+            for argv in commands.values():
+                time_cli(argv, env, 1)
+            warm = {name: time_cli(argv, env, args.runs) for name, argv in commands.items()}
+
+            in_process = {}
+            for name, argv in commands.items():
+                timings = []
+                for _ in range(args.runs):
+                    start = time.perf_counter()
+                    daemon.run_command(argv)
+                    timings.append((time.perf_counter() - start) * 1000)
+                in_process[name] = timings
+        finally:
+            shutdown(socket_path)
+            thread.join(timeout=5)
+
+        print(f"{'command':10} {'cold (ms)':>12} {'forwarded (ms)':>16} {'daemon work (ms)':>18}")
+        for name in commands:
+            print(f"{name:10} {statistics.median(cold[name]):12.1f} "
+                  f"{statistics.median(warm[name]):16.1f} "
+                  f"{statistics.median(in_process[name]):18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Benchmark CodeWiki markdown cleaning and segmentation throughput (MB/s).
+
+Reads every markdown file under a docs tree (or generates one), then times:
+- the previous clean() (one re.sub per UI pattern, then two more passes)
+  and segment() (re.split per H2, re-split per H3, regex H3 title search)
+- the combined cleaner and single-scan segmenter
+- crawl_local_docs over the tree, serial and in worker processes
+and checks that both paths produce byte-identical concepts.
+
+Usage:
+    python scripts/benchmark_codewiki.py [--docs crawl_output/langgraph] [--repeat 3] [--workers 4]
+"""
+import argparse
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.ingest.codewiki import CodeWikiCrawler, Concept, MarkdownProcessor
+
+
+class LegacyMarkdownProcessor(MarkdownProcessor):
+    """The previous clean / segment / _split_by_h3 implementation."""
+
+    def clean(self, raw_md: str) -> str:
+        cleaned = raw_md
+        for pattern in [r'copy code', r'zoom_in', r'fullscreen', r'filter_center_focus',
+                        r'\[edit\]', r'\[source\]', r'Skip to content', r'Table of contents']:
+            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+        cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
+        cleaned = re.sub(r'\[\s*\]\([^)]*\)', '', cleaned)
+        return cleaned.strip()
+
+    def segment(self, clean_md: str, source_doc: str, library: str = "") -> list:
+        concepts = []
+        parts = re.split(r'(^## .*)', clean_md, flags=re.MULTILINE)
+        if parts[0].strip():
+            concepts.append(Concept("Introduction", parts[0].strip(), source_doc, library, "Introduction"))
+        it = iter(parts[1:])
+        for header in it:
+            full_block = header + next(it, "")
+            title = header.strip().lstrip('#').strip()
+            if self._fits_limits(full_block):
+                concepts.append(Concept(title, full_block, source_doc, library, title))
+            else:
+                concepts.extend(self._legacy_split_by_h3(title, full_block, source_doc, library))
+        return concepts
+
+    def _legacy_split_by_h3(self, h2_title, h2_content, source_doc, library) -> list:
+        concepts = []
+        parts = re.split(r'(^### .*)', h2_content, flags=re.MULTILINE)
+        current_chunk = parts[0] if parts[0].strip() else ""
+        current_part = 1
+
+        def chunk():
+            match = re.search(r'^### (.+)$', current_chunk, re.MULTILINE)
+            h3_title = (match.group(1).strip() if match else None) or f"{h2_title} (Part {current_part})"
+            return Concept(h3_title, current_chunk, source_doc, library, f"{h2_title} > {h3_title}")
+
+        it = iter(parts[1:])
+        for header in it:
+            full_section = header + next(it, "")
+            if len(current_chunk) + len(full_section) > self.max_chars:
+                if current_chunk:
+                    concepts.append(chunk())
+                    current_part += 1
+                if not self._fits_limits(full_section):
+                    concepts.extend(self._split_by_paragraph(
+                        header.strip().lstrip('#').strip(), full_section, source_doc, library, h2_title
+                    ))
+                    current_chunk = ""
+                else:
+                    current_chunk = full_section
+            else:
+                current_chunk += full_section
+        if current_chunk:
+            concepts.append(chunk())
+        return concepts
+
+
+def synthetic_docs(root: Path, files: int, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    noise = ["copy code", "zoom_in", "[edit]", "[source]", "Skip to content", "[](#anchor)"]
+    (root / "docs").mkdir(parents=True)
+    for i in range(files):
+        lines = ["Skip to content", "Table of contents", f"# Page {i}", "", "Intro paragraph.", ""]
+        for h2 in range(rng.randint(2, 8)):
+            lines += [f"## Section {h2}", ""]
+            for h3 in range(rng.randint(0, 6)):
+                lines += [f"### Topic {h3} {rng.choice(noise)}", ""]
+                for _ in range(rng.randint(1, 12)):
+                    lines += [" ".join(["lorem ipsum dolor sit amet"] * rng.randint(2, 30)), "", ""]
+                lines += ["```python", "copy code", "print('hello')", "```", "", "", ""]
+        (root / "docs" / f"page{i}.md").write_text("\n".join(lines))
+
+
+def as_tuples(concepts: list) -> list:
+    return [(c.name, c.content, c.source_doc, c.library, c.section_path) for c in concepts]
+
+
+def run(processor: MarkdownProcessor, docs: list) -> list:
+    return [processor.segment(processor.clean(text), name) for name, text in docs]
+
+
+def timed(label: str, fn, megabytes: float, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<34}{best:8.3f}s  {megabytes / best:8.1f} MB/s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=Path, default=None, help="docs tree (default: synthetic)")
+    parser.add_argument("--files", type=int, default=500, help="synthetic files when --docs is not given")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = args.docs
+        if root is None:
+            root = Path(tmpdir)
+            synthetic_docs(root, args.files)
+
+        docs = []
+        for path in sorted(root.rglob("*.md")):
+            try:
+                docs.append((str(path.relative_to(root)), path.read_text(encoding="utf-8")))
+            except (OSError, UnicodeDecodeError):
+                continue
+        megabytes = sum(len(text.encode("utf-8")) for _, text in docs) / 1e6
+        print(f"{len(docs):,} markdown files, {megabytes:.1f} MB ({root})")
+
+        legacy = timed("legacy clean + segment", lambda: run(LegacyMarkdownProcessor(), docs),
+                       megabytes, args.repeat)
+        current = timed("combined clean + segment", lambda: run(MarkdownProcessor(), docs),
+                        megabytes, args.repeat)
+        assert [as_tuples(c) for c in current] == [as_tuples(c) for c in legacy]
+        print(f"  byte-identical: {sum(map(len, current)):,} concepts")
+
+        crawler = CodeWikiCrawler()
+        serial = timed("crawl_local_docs (serial)",
+                       lambda: crawler.crawl_local_docs(root, doc_patterns=["**/*.md"], max_workers=1),
+                       megabytes, args.repeat)
+        parallel = timed("crawl_local_docs (processes)",
+                         lambda: crawler.crawl_local_docs(root, doc_patterns=["**/*.md"], max_workers=args.workers),
+                         megabytes, args.repeat)
+        assert as_tuples(parallel) == as_tuples(serial)
+
+
+if __name__ == "__main__":
+    main()
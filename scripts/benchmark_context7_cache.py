@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark the Context7 SQLite response cache against the JSON directory.
+
+Writes a cache directory in the previous one-JSON-file-per-response layout,
+then times:
+- the previous load_all_cached, get_cache_stats and per-query lookups
+- the one-time migration into the SQLite store
+- lookups, per-library listing, stats and the enrichment excerpt on the store
+
+Usage:
+    python scripts/benchmark_context7_cache.py [--entries 100000] [--libraries 200] [--lookups 2000]
+"""
+import argparse
+import hashlib
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.ingest.context7 import Context7Client
+
+
+def legacy_path(cache_dir: Path, library: str, query: str) -> Path:
+    hash_id = hashlib.md5(f"{library}{query}".encode()).hexdigest()[:12]
+    return cache_dir / f"{library}_{hash_id}.json"
+
+
+def legacy_load_all(cache_dir: Path) -> list:
+    docs = []
+    for f in cache_dir.glob("*.json"):
+        with open(f, encoding="utf-8") as fp:
+            docs.append(json.load(fp))
+    return docs
+
+
+def legacy_stats(cache_dir: Path) -> dict:
+    cache_files = list(cache_dir.glob("*.json"))
+    libraries: dict[str, int] = {}
+    for f in cache_files:
+        lib = f.name.split("_")[0]
+        libraries[lib] = libraries.get(lib, 0) + 1
+    return {"total_files": len(cache_files), "total_size_bytes": sum(f.stat().st_size for f in cache_files),
+            "libraries": libraries}
+
+
+def legacy_get(cache_dir: Path, library: str, query: str):
+    path = legacy_path(cache_dir, library, query)
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return None
+
+
+def timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    unit = f"{elapsed * 1000:9.2f}ms" if elapsed < 1 else f"{elapsed:9.2f}s "
+    print(f"{label:<40}{unit}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--libraries", type=int, default=200)
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    keys = [(f"lib{i % args.libraries}", f"query {i} about feature {rng.randrange(1000)}")
+            for i in range(args.entries)]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_dir = Path(tmpdir)
+        start = time.perf_counter()
+        for library, query in keys:
+            response = f"# {library}\n\n```python\nimport {library}\n```\n" + f"Docs for {query}. " * 60
+            legacy_path(cache_dir, library, query).write_text(json.dumps({
+                "library_id": f"/org/{library}", "library_name": library, "query": query,
+                "response": response, "code_blocks": 1, "fetched_at": "2026-01-01T00:00:00",
+            }, indent=2), encoding="utf-8")
+        print(f"{args.entries:,} cached responses over {args.libraries} libraries "
+              f"(written in {time.perf_counter() - start:.1f}s)")
+
+        probes = rng.sample(keys, min(args.lookups, len(keys)))
+        if not args.skip_legacy:
+            timed("legacy load_all_cached", lambda: legacy_load_all(cache_dir))
+            legacy = timed("legacy get_cache_stats", lambda: legacy_stats(cache_dir))
+            timed(f"legacy lookups (x{len(probes)})", lambda: [legacy_get(cache_dir, library, q) for library, q in probes])
+
+        client = timed("migration (Context7Client open)", lambda: Context7Client(cache_dir=cache_dir))
+        stats = timed("get_cache_stats", client.get_cache_stats)
+        assert stats["total_files"] == args.entries
+        if not args.skip_legacy:
+            assert stats["libraries"] == legacy["libraries"]
+        print(f"  {stats['total_size_bytes'] / 1e6:.1f} MB of responses stored in "
+              f"{stats['stored_size_bytes'] / 1e6:.1f} MB")
+
+        found = timed(f"lookups (x{len(probes)})", lambda: [client._cache_get(library, q) for library, q in probes])
+        assert all(found)
+        docs = timed("load_cached_for_library", lambda: client.load_cached_for_library("lib7"))
+        assert len(docs) == sum(1 for library, _ in keys if library == "lib7")
+        timed("enrichment excerpt (first 500 chars)", lambda: next(client.iter_cached()).content[:500])
+        timed("load_all_cached", client.load_all_cached)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Benchmark Context7Client fetch transports against a local stub server.
+
+The stub adds a fixed latency per request and a handshake cost per new
+connection (standing in for TLS setup). Times a batch of queries, some of
+them duplicated, with:
+- the previous transport (a bare requests.post per call, thread pool)
+- the pooled keep-alive session with single-flight coalescing (fetch_batch)
+- the async fan-out over a pooled httpx client (fetch_batch_async)
+
+Usage:
+    python scripts/benchmark_context7_transport.py [--queries 64] [--latency 0.02] [--handshake 0.05]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.ingest.context7 import Context7Client
+
+
+class Stub(ThreadingHTTPServer):
+    daemon_threads = True
+    latency = 0.0
+    handshake = 0.0
+    requests = 0
+    connections = 0
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+        time.sleep(self.server.handshake)
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests += 1
+        time.sleep(self.server.latency)
+        args = body["params"]["arguments"]
+        if body["params"]["name"] == "resolve-library-id":
+            text = f"- Context7 ID: /org/{args['libraryName']}"
+        else:
+            text = f"# {args['query']}\n```python\nprint()\n```\n" + "docs " * 200
+        data = json.dumps({"jsonrpc": "2.0", "id": body["id"],
+                           "result": {"content": [{"type": "text", "text": text}]}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class LegacyTransportClient(Context7Client):
+    """The previous transport: a new connection per request, no coalescing."""
+
+    def _request_with_retry(self, payload, operation="request"):
+        resp = requests.post(self.url, json=payload, headers=self.headers, timeout=self.timeout)
+        resp.raise_for_status()
+        return resp.json()
+
+    def fetch_and_cache_detailed(self, library_name, query, force_refresh=False):
+        return self._fetch_and_cache(library_name, query, force_refresh)
+
+
+def run(label: str, server: Stub, client: Context7Client, fetch) -> None:
+    server.requests = server.connections = 0
+    start = time.perf_counter()
+    batch = fetch(client)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34}{elapsed:8.2f}s  {server.requests:5d} requests  {server.connections:4d} connections  "
+          f"({batch.progress.successful} fetched, {batch.progress.cached} cached)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=64)
+    parser.add_argument("--duplicates", type=int, default=2, help="times each query is repeated")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--handshake", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    server = Stub(("127.0.0.1", 0), Handler)
+    server.latency, server.handshake = args.latency, args.handshake
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/mcp"
+    queries = [f"topic {i}" for i in range(args.queries)] * args.duplicates
+    print(f"{len(queries)} queries ({args.queries} distinct), {args.latency * 1000:.0f}ms/request, "
+          f"{args.handshake * 1000:.0f}ms/connection")
+
+    def client(cls, cache_dir):
+        c = cls(cache_dir=Path(cache_dir), max_connections=args.workers)
+        c.url = url
+        return c
+
+    with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b, \
+            tempfile.TemporaryDirectory() as c:
+        run("legacy (requests.post, threads)", server, client(LegacyTransportClient, a),
+            lambda cl: cl.fetch_batch("lib", queries, max_workers=args.workers))
+        run("pooled session + coalescing", server, client(Context7Client, b),
+            lambda cl: cl.fetch_batch("lib", queries, max_workers=args.workers))
+        run("async fan-out (httpx pool)", server, client(Context7Client, c),
+            lambda cl: asyncio.run(cl.fetch_batch_async("lib", queries)))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Benchmark DeepAnalyzer on large generated modules.
+
+Generates a repository of modules with many classes and methods, then times:
+- analyze_file on the largest module, against the previous algorithm
+  (a full ast.walk per function to find its parent class)
+- a whole-repository pass (analyze_directory)
+- Level 3/4 lookups after analysis (validate_source_ref, get_semantic_info),
+  which now reuse the memoized parse
+
+Usage:
+    python scripts/benchmark_deep_analysis.py [--modules 40] [--classes 60] [--methods 20] [--functions 400]
+"""
+import argparse
+import ast
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.understanding.deep_analysis import DeepAnalyzer
+from skills_fabric.understanding.progressive_disclosure import SourceRef
+
+
+def build_module(index: int, classes: int, methods: int, functions: int) -> str:
+    lines = ["import os", "from pathlib import Path", ""]
+    for c in range(classes):
+        lines.append(f"class Service{index}_{c}:")
+        lines.append(f'    """Service {c}."""')
+        for m in range(methods):
+            lines.append(f"    def method_{m}(self, value: int) -> int:")
+            lines.append(f"        result = helper_{index}(value)")
+            lines.append("        return os.path.join(str(result), str(value))")
+        lines.append("")
+    lines.append(f"def helper_{index}(value):")
+    lines.append("    return value + 1")
+    for f in range(functions):
+        lines.append("")
+        lines.append(f"def task_{f}(value):")
+        lines.append(f"    return helper_{index}(value) * {f}")
+    return "\n".join(lines) + "\n"
+
+
+def legacy_analyze(analyzer: DeepAnalyzer, file_path: str) -> int:
+    """The previous algorithm: ast.walk the module again for every function."""
+    content = (analyzer.repo_path / file_path).read_text(encoding="utf-8")
+    tree = ast.parse(content)
+    source_lines = content.split("\n")
+    count = 0
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            analyzer._extract_class(node, file_path, source_lines)
+            count += 1
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            parent = None
+            for outer in ast.walk(tree):
+                if isinstance(outer, ast.ClassDef) and any(item is node for item in outer.body):
+                    parent = outer.name
+                    break
+            analyzer._extract_function(node, file_path, source_lines, parent)
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=40)
+    parser.add_argument("--classes", type=int, default=60)
+    parser.add_argument("--methods", type=int, default=20)
+    parser.add_argument("--functions", type=int, default=400, help="module-level functions")
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir)
+        (repo / "pkg").mkdir()
+        for i in range(args.modules):
+            (repo / "pkg" / f"mod{i}.py").write_text(build_module(i, args.classes, args.methods, args.functions))
+        module_lines = build_module(0, args.classes, args.methods, args.functions).count("\n")
+        symbols_each = args.classes * (args.methods + 1) + args.functions + 1
+        print(f"{args.modules} modules x {module_lines:,} lines ({symbols_each:,} symbols each)")
+
+        analyzer = DeepAnalyzer(repo, "main")
+        start = time.perf_counter()
+        symbols = analyzer.analyze_file("pkg/mod0.py")
+        single_s = time.perf_counter() - start
+        print(f"analyze_file (single pass):  {single_s * 1000:10.1f}ms ({len(symbols):,} symbols)")
+
+        if not args.skip_legacy:
+            start = time.perf_counter()
+            legacy_analyze(analyzer, "pkg/mod0.py")
+            legacy_s = time.perf_counter() - start
+            print(f"analyze_file (legacy):       {legacy_s * 1000:10.1f}ms "
+                  f"({legacy_s / single_s:.0f}x slower)")
+
+        analyzer = DeepAnalyzer(repo, "main")
+        start = time.perf_counter()
+        results = analyzer.analyze_directory()
+        repo_s = time.perf_counter() - start
+        total = sum(len(v) for v in results.values())
+        print(f"analyze_directory:           {repo_s:10.2f}s  ({total:,} symbols)")
+
+        start = time.perf_counter()
+        results = analyzer.analyze_directory()
+        print(f"analyze_directory (memoized):{time.perf_counter() - start:10.2f}s")
+
+        refs = [
+            SourceRef(file_path=f"pkg/mod{i}.py", line=sym.line, commit="main", repo="o/r",
+                      symbol_name=sym.name, symbol_kind=sym.kind)
+            for i in range(args.modules)
+            for sym in results[f"pkg/mod{i}.py"][:: max(1, args.classes // 5)]
+        ]
+        start = time.perf_counter()
+        for ref in refs:
+            analyzer.validate_source_ref(ref)
+            analyzer.get_semantic_info(ref)
+        lookup_s = time.perf_counter() - start
+        print(f"validate + semantic info:    {lookup_s / len(refs) * 1e6:10.1f}us/ref ({len(refs):,} refs)")
+
+
+if __name__ == "__main__":
+    main()
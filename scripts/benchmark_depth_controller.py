@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark DepthController expansion with shared parses and the caller index.
+
+Generates a repository of modules, then expands refs to every class at
+FULL_GRAPH depth and times:
+- the previous behaviour (each step re-reads and re-parses the file; each
+  caller lookup rglobs and parses the whole repository), on a subset
+- a cold pass with the shared parse cache and caller index
+- a warm pass over the same refs (memoized results)
+- a warm pass over new refs into already-indexed files
+
+Usage:
+    python scripts/benchmark_depth_controller.py [--modules 300] [--classes 4] [--legacy-refs 10]
+"""
+import argparse
+import ast
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.intelligence.depth_controller import CallInfo, CodeWikiRef, DepthController, DepthLevel
+
+
+def build_module(index: int, modules: int, classes: int) -> str:
+    lines = ["import os", f"from pkg.mod{(index + 1) % modules} import Service{(index + 1) % modules}_0", ""]
+    for c in range(classes):
+        lines.append(f"class Service{index}_{c}:")
+        lines.append(f'    """Service {c}."""')
+        for m in range(8):
+            lines.append(f"    def method_{m}(self, value: int) -> int:")
+            lines.append(f"        helper = Service{(index + 1) % modules}_0()")
+            lines.append("        return os.path.join(str(helper.method_0(value)), str(value))")
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+class LegacyDepthController(DepthController):
+    """The previous behaviour: no retained sources, parses or results."""
+
+    def __init__(self, repo_path):
+        super().__init__(repo_path, cache_size=0, result_cache_size=0)
+
+    def expand(self, ref, depth):
+        return self._expand(ref, depth)
+
+    def _find_callers(self, ref):
+        callers = []
+        for py_file in self.repo_path.rglob("*.py"):
+            try:
+                tree = ast.parse(py_file.read_text(encoding="utf-8"))
+                for node in ast.walk(tree):
+                    if isinstance(node, ast.Call):
+                        callee = self._get_name(node.func)
+                        if callee and ref.concept in callee:
+                            callers.append(CallInfo(
+                                caller=str(py_file.relative_to(self.repo_path)),
+                                callee=ref.concept,
+                                line=node.lineno,
+                            ))
+            except Exception:
+                continue
+        return callers[:50]
+
+
+def timed(label: str, controller: DepthController, refs: list) -> list:
+    start = time.perf_counter()
+    results = [controller.expand(r, DepthLevel.FULL_GRAPH) for r in refs]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34}{elapsed:8.2f}s  {elapsed / len(refs) * 1000:9.2f}ms/ref ({len(refs)} refs)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=300)
+    parser.add_argument("--classes", type=int, default=4)
+    parser.add_argument("--legacy-refs", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir)
+        (repo / "pkg").mkdir()
+        for i in range(args.modules):
+            (repo / "pkg" / f"mod{i}.py").write_text(build_module(i, args.modules, args.classes))
+
+        class_refs, method_refs = [], []
+        for i in range(args.modules):
+            for c in range(args.classes):
+                line = 4 + c * 26
+                class_refs.append(CodeWikiRef(f"Service{i}_{c}", f"pkg/mod{i}.py", line))
+                method_refs.append(CodeWikiRef("method_3", f"pkg/mod{i}.py", line + 2 + 3 * 3))
+        print(f"{args.modules} modules, {len(class_refs)} class refs, FULL_GRAPH depth")
+
+        legacy = timed("legacy", LegacyDepthController(repo), class_refs[:args.legacy_refs])
+
+        controller = DepthController(repo)
+        cold = timed("cold (parse + caller index)", controller, class_refs)
+        timed("warm, same refs (memoized)", controller, class_refs)
+        timed("warm, new refs (shared parses)", controller, method_refs)
+
+        for a, b in zip(legacy, cold):
+            assert (a.symbol, a.methods, a.calls) == (b.symbol, b.methods, b.calls)
+            assert sorted((c.caller, c.line) for c in a.called_by) == sorted((c.caller, c.line) for c in b.called_by)
+
+
+if __name__ == "__main__":
+    main()
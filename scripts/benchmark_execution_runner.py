@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Benchmark the isolated execution runner on many property checks.
+
+Generates property tests (each doing a little CPU work and printing
+PASS/FAIL) and times:
+- the previous path: in-process exec, one at a time, swapping sys.stdout
+- ExecutionRunner.run_many across a worker pool (cold, then warm workers)
+
+Usage:
+    python scripts/benchmark_execution_runner.py [--checks 2000] [--work 20000] [--workers N] [--batch 32]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.understanding.runner import ExecutionRunner
+
+
+def build_checks(count: int, work: int) -> list[str]:
+    return [
+        f"total = sum(i * i for i in range({work}))\n"
+        f"print('PASS' if total % 7 != {i % 7} else 'FAIL')"
+        for i in range(count)
+    ]
+
+
+def legacy_run(code: str) -> str:
+    """The previous path: exec in-process with global stdout swapped."""
+    old_stdout = sys.stdout
+    sys.stdout = io.StringIO()
+    try:
+        exec(code, {})
+        return sys.stdout.getvalue()
+    finally:
+        sys.stdout = old_stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--checks", type=int, default=2000)
+    parser.add_argument("--work", type=int, default=20000, help="loop iterations per check")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch", type=int, default=32, help="jobs per worker round-trip")
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    checks = build_checks(args.checks, args.work)
+    print(f"{len(checks):,} checks, {args.workers} workers, batch {args.batch}")
+
+    legacy_s = None
+    if not args.skip_legacy:
+        start = time.perf_counter()
+        expected = [legacy_run(code) for code in checks]
+        legacy_s = time.perf_counter() - start
+        print(f"in-process exec (serial): {legacy_s:8.2f}s")
+
+    with ExecutionRunner(max_workers=args.workers, batch_size=args.batch) as runner:
+        for label in ("cold", "warm"):
+            start = time.perf_counter()
+            results = runner.run_many(checks)
+            elapsed = time.perf_counter() - start
+            ratio = f" ({legacy_s / elapsed:.1f}x)" if legacy_s else ""
+            print(f"run_many ({label}):         {elapsed:8.2f}s{ratio}")
+            if legacy_s:
+                assert [r.stdout for r in results] == expected
+
+
+if __name__ == "__main__":
+    main()
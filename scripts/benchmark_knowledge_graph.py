@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark KnowledgeGraph similarity retrieval, decay and pruning.
+
+Compares single-query get_similar_memories against the old N+1 pattern
+(fetch IDs, then get_memory per candidate) at 10k and 100k memories.
+
+Usage:
+    python scripts/benchmark_knowledge_graph.py [--sizes 10000 100000]
+"""
+import argparse
+import csv
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.core.database import KuzuDatabase
+from skills_fabric.memory.knowledge_graph import KnowledgeGraph, Memory, MemoryType
+
+NEIGHBOURS = 20
+CHUNK = 10_000
+
+
+def populate(kg: KnowledgeGraph, size: int, rng: random.Random):
+    now = datetime.now()
+    for offset in range(0, size, CHUNK):
+        kg.add_memories([
+            Memory(
+                id=f"m{i}",
+                content=f"memory {i}",
+                memory_type=MemoryType.SKILL,
+                last_accessed=now - timedelta(hours=rng.randint(0, 96)),
+                decay_factor=rng.uniform(0.05, 1.0),
+            )
+            for i in range(offset, min(offset + CHUNK, size))
+        ])
+
+    # Relationship bulk load goes through COPY FROM a CSV file
+    edges_csv = Path(kg.db.db_path).parent / "similar_to.csv"
+    with open(edges_csv, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["from", "to", "similarity"])
+        for i in range(size):
+            for _ in range(NEIGHBOURS if i < 1000 else 1):
+                writer.writerow([f"m{i}", f"m{rng.randrange(size)}", rng.random()])
+    kg.db.execute(f"COPY SIMILAR_TO FROM '{edges_csv}' (header=true)")
+
+
+def n_plus_one(kg: KnowledgeGraph, memory_id: str, limit: int):
+    """The previous implementation: one query for IDs, one per memory."""
+    res = kg.db.execute(
+        """
+        MATCH (m:Memory {id: $id})-[r:SIMILAR_TO]->(s:Memory)
+        RETURN s.id, r.similarity
+        ORDER BY r.similarity DESC
+        LIMIT $limit
+        """,
+        {"id": memory_id, "limit": limit},
+    )
+    results = []
+    while res.has_next():
+        row = res.get_next()
+        results.append((kg.get_memory(row[0]), row[1]))
+    return results
+
+
+def bench(size: int):
+    rng = random.Random(size)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        kg = KnowledgeGraph(KuzuDatabase(Path(tmpdir) / "kg"))
+
+        start = time.perf_counter()
+        populate(kg, size, rng)
+        print(f"[{size:,}] populate: {time.perf_counter() - start:.2f}s")
+
+        ids = [f"m{i}" for i in range(100)]
+        variants = (
+            ("single query", kg.get_similar_memories),
+            ("N+1", lambda memory_id, limit: n_plus_one(kg, memory_id, limit)),
+        )
+        for name, fn in variants:
+            start = time.perf_counter()
+            for memory_id in ids:
+                fn(memory_id, NEIGHBOURS)
+            elapsed = (time.perf_counter() - start) / len(ids) * 1000
+            print(f"[{size:,}] get_similar_memories ({name}): {elapsed:.2f}ms")
+
+        start = time.perf_counter()
+        decayed = kg.apply_decay(hours_threshold=24)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"[{size:,}] apply_decay: {elapsed:.1f}ms ({decayed:,} rows)")
+
+        start = time.perf_counter()
+        pruned = kg.prune_forgotten(min_decay=0.1)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"[{size:,}] prune_forgotten: {elapsed:.1f}ms ({pruned:,} rows)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+    for size in args.sizes:
+        bench(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Benchmark sketch-backed histograms in MetricsRegistry.
+
+Records millions of observations across threads, then reports per-record
+overhead, read latency, and percentile error against exact values
+computed from a sample. Also records from many short-lived threads to
+show the shard count (and read cost) stays fixed under thread churn.
+
+Usage:
+    python scripts/benchmark_metrics.py [--observations 10000000] [--threads 4]
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.observability.metrics import MetricsRegistry, QuantileSketch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--observations", type=int, default=10_000_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--accuracy-sample", type=int, default=1_000_000)
+    parser.add_argument("--churn-threads", type=int, default=2_000)
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+    per_thread = args.observations // args.threads
+
+    def record(seed: int):
+        rng = random.Random(seed)
+        histogram = registry.histogram
+        for _ in range(per_thread):
+            histogram("latency_ms", rng.lognormvariate(3, 1), {"stage": "generate"})
+
+    threads = [threading.Thread(target=record, args=(i,)) for i in range(args.threads)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    record_s = time.perf_counter() - start
+    total = per_thread * args.threads
+    print(f"record {total:,} observations ({args.threads} threads): {record_s:8.2f}s "
+          f"({record_s / total * 1e9:,.0f}ns/record incl. RNG)")
+
+    runs = 100
+    start = time.perf_counter()
+    for _ in range(runs):
+        stats = registry.get_histogram_stats("latency_ms", {"stage": "generate"})
+    read_ms = (time.perf_counter() - start) / runs * 1000
+    print(f"get_histogram_stats:  {read_ms:8.3f}ms (count={stats['count']:,})")
+
+    for i in range(args.churn_threads):
+        t = threading.Thread(target=registry.histogram, args=("churn_ms", float(i), {"stage": "generate"}))
+        t.start()
+        t.join()
+    start = time.perf_counter()
+    for _ in range(runs):
+        registry.get_histogram_stats("churn_ms", {"stage": "generate"})
+    read_ms = (time.perf_counter() - start) / runs * 1000
+    shards = len(registry._sketches["histogram"]["churn_ms"]["stage=generate"])
+    print(f"{args.churn_threads:,} short-lived threads: {shards} shards, get_histogram_stats {read_ms:8.3f}ms")
+
+    # Accuracy against exact percentiles on a separate sample
+    rng = random.Random(42)
+    values = [rng.lognormvariate(3, 1) for _ in range(args.accuracy_sample)]
+    sketch = QuantileSketch()
+    for v in values:
+        sketch.add(v)
+    values.sort()
+    for q in (0.5, 0.95, 0.99, 0.999):
+        exact = values[min(int(len(values) * q), len(values) - 1)]
+        estimate = sketch.quantile(q)
+        print(f"p{q * 100:g}: exact={exact:10.4f} sketch={estimate:10.4f} "
+              f"rel_err={abs(estimate - exact) / exact:.4%}")
+    print(f"sketch buckets: {len(sketch._positive):,}")
+
+
+if __name__ == "__main__":
+    main()
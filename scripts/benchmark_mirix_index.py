@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmark MIRIX topic retrieval: FTS5 trigram index vs linear scan.
+
+Usage:
+    python scripts/benchmark_mirix_index.py [--memories 100000]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.memory.agent_memory import MIRIXMemory, MemoryType
+
+WORDS = [
+    "graph", "kuzu", "langgraph", "docling", "parser", "session", "request",
+    "retriever", "citation", "symbol", "bead", "sandbox", "verifier", "tracer",
+]
+
+
+def populate(mirix: MIRIXMemory, count: int, seed: int = 0):
+    rng = random.Random(seed)
+    types = list(MemoryType)
+    for i in range(count):
+        topic = f"{rng.choice(WORDS)}_{i % 5000}"
+        content = " ".join(rng.choice(WORDS) for _ in range(12)) + f" note {i}"
+        mirix.add(types[i % len(types)], content, topic)
+
+
+def time_queries(mirix: MIRIXMemory, queries, **kwargs) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        mirix.retrieve_by_topic(query, **kwargs)
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--memories", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # Selective queries (rare topics) and one broad one
+    queries = [f"_{n}" for n in (17, 423, 2999, 4100)] + ["note 99999", "docling"]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "mirix"
+        scanned = MIRIXMemory(path, use_index=False)
+        start = time.perf_counter()
+        populate(scanned, args.memories)
+        print(f"add {args.memories:,} memories (JSONL only): {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        indexed = MIRIXMemory(path)
+        print(f"build index from JSONL: {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        for i in range(1000):
+            indexed.add_semantic(f"incremental fact {i}", topic="incremental")
+        print(f"incremental add: {(time.perf_counter() - start) / 1000 * 1000:.3f}ms/memory")
+
+        scanned = MIRIXMemory(path, use_index=False)
+        for query in queries:
+            idx_ms = time_queries(indexed, [query] * 20)
+            scan_ms = time_queries(scanned, [query] * 3)
+            print(f"{query!r:>14}: index {idx_ms:8.3f}ms   scan {scan_ms:8.2f}ms")
+
+        filtered = time_queries(
+            indexed, queries * 5, memory_types=[MemoryType.SEMANTIC]
+        )
+        print(f"type-filtered (index): {filtered:.3f}ms/query")
+        indexed.close()
+
+
+if __name__ == "__main__":
+    main()
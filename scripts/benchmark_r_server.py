@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark the R MCP server symbol index.
+
+Generates a synthetic R package, then measures a cold index (process
+pool), an incremental re-index with nothing changed, a restart against
+the persisted index, and symbol lookups.
+
+Usage:
+    python scripts/benchmark_r_server.py [--files 2000] [--functions 50]
+"""
+import argparse
+import asyncio
+import importlib.util
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Load the module standalone (as scripts/test_r_server.py does) so pool
+# workers can import it without the full package
+src_path = Path(__file__).parent.parent / "src"
+_spec = importlib.util.spec_from_file_location(
+    "r_server", src_path / "skills_fabric" / "mcp" / "r_server.py"
+)
+r_server = importlib.util.module_from_spec(_spec)
+sys.modules["r_server"] = r_server
+_spec.loader.exec_module(r_server)
+
+
+def write_package(root: Path, files: int, functions: int) -> None:
+    r_dir = root / "R"
+    r_dir.mkdir(parents=True)
+    for f in range(files):
+        lines = []
+        for i in range(functions):
+            lines.append(f"#' Function {i} in file {f}")
+            lines.append(f"fn_{f}_{i} <- function(x, y = {i}) {{")
+            lines.append("  x + y")
+            lines.append("}")
+        # Same helper name in every file
+        lines.append("helper <- function() NULL")
+        (r_dir / f"file_{f}.R").write_text("\n".join(lines) + "\n")
+
+
+async def run(args) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pkg = Path(tmpdir) / "pkg"
+        db = Path(tmpdir) / "r_symbols.db"
+        write_package(pkg, args.files, args.functions)
+
+        server = r_server.RMCPServer(index_path=db)
+        tools = server.mcp._tools
+
+        start = time.perf_counter()
+        stats = await tools["index_r_directory"](str(pkg))
+        print(f"cold index {stats['total_files']:,} files / {stats['total_symbols']:,} symbols: "
+              f"{time.perf_counter() - start:8.2f}s")
+
+        start = time.perf_counter()
+        stats = await tools["index_r_directory"](str(pkg))
+        print(f"re-index (unchanged={stats['unchanged_files']:,}): "
+              f"{time.perf_counter() - start:8.2f}s")
+
+        runs = 200
+        for label, query, exact in (
+            ("exact lookup", f"fn_{args.files // 2}_3", True),
+            ("substring (trigram)", f"_{args.files // 2}_1", False),
+            ("duplicate name", "helper", True),
+        ):
+            start = time.perf_counter()
+            for _ in range(runs):
+                found = await tools["search_r_symbol"](query, exact=exact)
+            ms = (time.perf_counter() - start) / runs * 1000
+            print(f"{label:22s} {ms:8.3f}ms ({len(found):,} results)")
+        server.close()
+
+        start = time.perf_counter()
+        restarted = r_server.RMCPServer(index_path=db)
+        count = len(restarted.index)
+        print(f"restart with {count:,} symbols: {time.perf_counter() - start:8.3f}s")
+        restarted.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2_000)
+    parser.add_argument("--functions", type=int, default=50)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark SelfImprovingFactory on many concepts.
+
+Generates a repository of modules and improves one concept per symbol
+(a third of them deliberately ungrounded, so they explore every cycle).
+Times:
+- the previous behaviour: asyncio.gather over generate_with_improvement,
+  with DepthController.expand called directly on the event loop, uncached
+- improve_many with a thread pool and the shared expansion cache
+- improve_many with a process pool (scales with cores)
+
+Usage:
+    python scripts/benchmark_self_improving.py [--concepts 500] [--cycles 5] [--workers N]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.intelligence.depth_controller import CodeWikiRef
+from skills_fabric.orchestration.self_improving_loop import SelfImprovingFactory
+
+
+def build_module(index: int, symbols: int) -> str:
+    lines = ['"""Generated module."""', "import os", "from pkg.core import Base", ""]
+    for s in range(symbols):
+        lines.append(f"class Symbol{index}_{s}(Base):")
+        lines.append(f'    """Symbol {s}."""')
+        for m in range(8):
+            lines.append(f"    def method_{m}(self, value):")
+            lines.append(f"        return os.path.join(str(value), '{m}')")
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+class _Uncached:
+    """The previous expansion path: synchronous and uncached."""
+
+    def __init__(self, controller):
+        self.controller = controller
+
+    async def expand(self, ref, depth):
+        return self.controller.expand(ref, depth)
+
+
+async def legacy_run(factory: SelfImprovingFactory, refs: list, cycles: int) -> int:
+    cache = _Uncached(factory.depth_controller)
+    results = await asyncio.gather(*(factory._improve(ref, cycles, "how_works", cache) for ref in refs))
+    return sum(r.cycles_completed for r in results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concepts", type=int, default=500)
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    per_module = 25
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir)
+        (repo / "pkg").mkdir()
+        modules = max(1, args.concepts // per_module)
+        for i in range(modules):
+            (repo / "pkg" / f"mod{i}.py").write_text(build_module(i, per_module))
+
+        refs = []
+        for n in range(args.concepts):
+            i, s = (n // per_module) % modules, n % per_module
+            line = 5 + s * 18
+            # Every third ref points at the wrong line, so it stays ungrounded
+            refs.append(CodeWikiRef(concept=f"Symbol{i}_{s}", file_path=f"pkg/mod{i}.py",
+                                    line=line if n % 3 else 1, repo="pkg"))
+
+        print(f"{len(refs):,} concepts, {args.cycles} max cycles, {args.workers} workers")
+        factory = SelfImprovingFactory(repo, "pkg")
+
+        if not args.skip_legacy:
+            start = time.perf_counter()
+            cycles = asyncio.run(legacy_run(factory, refs, args.cycles))
+            seconds = time.perf_counter() - start
+            print(f"legacy (on-loop, uncached): {seconds:7.2f}s {cycles / seconds:9.0f} cycles/s")
+
+        for label, use_processes in (("threads", False), ("processes", True)):
+            asyncio.run(factory.improve_many(refs, args.cycles, "how_works",
+                                             max_workers=args.workers, use_processes=use_processes))
+            stats = factory.last_run_stats
+            print(f"improve_many ({label + '):':<11}   {stats.seconds:7.2f}s {stats.cycles_per_second:9.0f} cycles/s "
+                  f"({stats.expansions:,} expansions, {stats.cache_hits:,} cache hits)")
+
+
+if __name__ == "__main__":
+    main()
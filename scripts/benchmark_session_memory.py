@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Benchmark journaled SessionMemory: recording time vs number of events.
+
+Per-event cost should stay flat as the session grows (linear total time).
+
+Usage:
+    python scripts/benchmark_session_memory.py [--events 100000]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.memory.session import SessionMemory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--sync-every", type=int, default=64)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "sessions.json"
+        memory = SessionMemory(path, sync_every=args.sync_every)
+        session = memory.start_session("benchmark")
+        sid = session.session_id
+
+        checkpoint = max(args.events // 10, 1)
+        start = last = time.perf_counter()
+        for i in range(1, args.events + 1):
+            if i % 10 == 0:
+                memory.record_failure(sid, f"error {i}")
+            else:
+                memory.record_skill_created(sid)
+            if i % checkpoint == 0:
+                now = time.perf_counter()
+                print(f"{i:>9,} events: {(now - last) / checkpoint * 1e6:7.2f}us/event")
+                last = now
+        total = time.perf_counter() - start
+        print(f"recorded {args.events:,} events in {total:.2f}s "
+              f"({args.events / total:,.0f} events/s)")
+
+        start = time.perf_counter()
+        memory.close()
+        print(f"close (final compaction): {time.perf_counter() - start:.3f}s")
+
+        start = time.perf_counter()
+        reopened = SessionMemory(path)
+        print(f"reload: {time.perf_counter() - start:.3f}s "
+              f"({reopened.get_session(sid).skills_created:,} skills)")
+        reopened.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Benchmark SkillFactory symbol staging, enrichment and generation stages.
+
+Times each stage against the previous implementation:
+- staging: one CREATE per symbol vs chunked UNWIND (_stage_symbols)
+- enrichment: one source read per proven link vs one per file (_node_enrich)
+- generation: serial generate_question calls vs the bounded thread pool
+  (_node_generate), against a stub LLM with fixed latency
+and checks both paths produce the same symbols and candidates.
+
+Usage:
+    python scripts/benchmark_skill_factory.py [--symbols 20000] [--links 20000] [--files 500] [--latency 0.02]
+"""
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.core.database import KuzuDatabase
+from skills_fabric.generate import llm_client
+from skills_fabric.generate.skill_factory import SkillCandidate, SkillFactory
+from skills_fabric.ingest import context7
+
+
+def legacy_stage(database: KuzuDatabase, symbols: list) -> int:
+    """The previous _node_link staging: one CREATE round-trip per symbol."""
+    stored = 0
+    for symbol in symbols:
+        try:
+            database.execute(
+                "CREATE (s:Symbol {name: $name, file_path: $file_path, line: $line})",
+                {"name": symbol["name"], "file_path": symbol["file_path"], "line": symbol["line"]},
+            )
+            stored += 1
+        except Exception:
+            pass
+    return stored
+
+
+def legacy_enrich(repo_path: Path, proven_links: list, context7_text: str) -> list:
+    """The previous _node_enrich loop: one read per link."""
+    candidates = []
+    for link in proven_links:
+        source_file = repo_path / link["file_path"]
+        if source_file.exists():
+            with open(source_file, "r", errors="ignore") as f:
+                source_code = f.read()[:2000]
+        else:
+            source_code = ""
+        candidates.append(SkillCandidate(link["concept"], link["symbol"], link["file_path"],
+                                         source_code, context7_text[:500]))
+    return candidates
+
+
+class StubContext7:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def fetch_and_cache(self, library_name, query):
+        return None
+
+    def iter_cached(self):
+        return iter([context7.Context7Doc(title="lib", content="docs " * 200, source_url="", code_blocks=0)])
+
+    def get_cache_stats(self):
+        return {"total_files": 1}
+
+
+class StubGLM:
+    latency = 0.02
+
+    def generate_question(self, source_code: str, context: str = "") -> str:
+        time.sleep(self.latency)
+        return f"How is {context} used?"
+
+
+def timed(label: str, fn, items: int):
+    # The stages print progress lines; keep them out of the table
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+    print(f"{label:<34}{elapsed:8.2f}s  {items / elapsed:10.1f} items/s")
+    return result
+
+
+def fresh_db(root: Path, name: str) -> KuzuDatabase:
+    database = KuzuDatabase(root / name)
+    database.init_schema()
+    return database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--symbols", type=int, default=20_000)
+    parser.add_argument("--links", type=int, default=20_000)
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--candidates", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        symbols = [{"name": f"sym{i}", "file_path": f"pkg/m{i % args.files}.py", "line": i}
+                   for i in range(args.symbols)]
+        print(f"{args.symbols:,} symbols, {args.links:,} links over {args.files} files, "
+              f"{args.candidates} candidates at {args.latency * 1000:.0f}ms/request")
+
+        legacy_db = fresh_db(root, "legacy")
+        timed("staging: CREATE per symbol", lambda: legacy_stage(legacy_db, symbols), args.symbols)
+        factory = SkillFactory()
+        factory.db = fresh_db(root, "bulk")
+        timed("staging: chunked UNWIND", lambda: factory._stage_symbols(symbols), args.symbols)
+        assert legacy_db.count("Symbol") == factory.db.count("Symbol") == args.symbols
+
+        repo = root / "repo"
+        (repo / "pkg").mkdir(parents=True)
+        for i in range(args.files):
+            (repo / "pkg" / f"m{i}.py").write_text(f"def f{i}():\n    return {i}\n" * 200)
+        links = [{"concept": f"c{i}", "symbol": f"sym{i}", "file_path": f"pkg/m{i % args.files}.py"}
+                 for i in range(args.links)]
+        context7.Context7Client = StubContext7
+        legacy = timed("enrich: read per link", lambda: legacy_enrich(repo, links, ("docs " * 200)[:500]),
+                       args.links)
+        grouped = timed("enrich: read per file", lambda: factory._node_enrich(
+            {"library_name": "lib", "repo_path": str(repo), "proven_links": links}), args.links)
+        assert [(c.symbol_name, c.source_code) for c in grouped["candidates"]] == \
+            [(c.symbol_name, c.source_code) for c in legacy]
+
+        StubGLM.latency = args.latency
+        llm_client.GLMClient = StubGLM
+        candidates = grouped["candidates"][:args.candidates]
+        for label, workers in (("generate: serial", 1), (f"generate: pool of {args.workers}", args.workers)):
+            factory.config.max_generate_workers = workers
+            result = timed(label, lambda: factory._node_generate({"candidates": candidates}), len(candidates))
+            assert len(result["candidates"]) == len(candidates)
+
+
+if __name__ == "__main__":
+    main()
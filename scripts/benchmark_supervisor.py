@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark the supervisor's skill stages on a library with thousands of links.
+
+Runs writing → auditing → verifying → storing with stand-in agents (each
+with a small simulated latency, like an LLM or sandbox call) and reports
+time-to-first-stored-skill and total wall time for:
+- the previous barrier workflow with linear snippet and link scans
+- SupervisorAgent in barrier mode (streaming=False, indexed lookups)
+- SupervisorAgent streaming (bounded queues, per-stage workers)
+
+Usage:
+    python scripts/benchmark_supervisor.py [--links 3000] [--latency-ms 0.5]
+"""
+import argparse
+import sys
+import time
+import types
+from dataclasses import dataclass
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.agents.base import AgentResult, AgentRole, AgentStatus
+from skills_fabric.agents.supervisor import SupervisorAgent, WorkflowState
+from skills_fabric.verify.ddr import SourceRef
+
+LATENCY_S = 0.0005
+
+
+@dataclass
+class Skill:
+    content: str
+    audited: bool = False
+    verified: bool = False
+    hallucination_rate: float = 0.0
+
+
+def ok(role, **output) -> AgentResult:
+    return AgentResult(agent=role, status=AgentStatus.SUCCESS, output=types.SimpleNamespace(**output))
+
+
+class Writer:
+    def execute(self, task, context=None):
+        time.sleep(LATENCY_S)
+        return ok(AgentRole.WRITER, skill=Skill(f"Use `{task.symbol_name}`.\n{task.source_code}"))
+
+
+class Auditor:
+    def execute(self, task, context=None):
+        time.sleep(LATENCY_S)
+        return ok(AgentRole.AUDITOR, passed=True, hallucination_rate=0.0)
+
+
+class Verifier:
+    def execute(self, task, context=None):
+        time.sleep(LATENCY_S)
+        return ok(AgentRole.VERIFIER, passed=True)
+
+
+class Store:
+    first = None
+
+    def create_skill(self, skill):
+        if Store.first is None:
+            Store.first = time.perf_counter()
+
+
+def make_state(links: int) -> WorkflowState:
+    names = [f"Symbol{i}" for i in range(links)]
+    return WorkflowState(
+        library_name="lib",
+        mined_snippets=[{"snippet": f"class {name}:\n    pass"} for name in names],
+        proven_links=[{"concept_name": name.lower(), "symbol_name": name,
+                       "file_path": f"pkg/mod{i % 50}.py", "line_number": i}
+                      for i, name in enumerate(names)],
+    )
+
+
+def legacy_run(state: WorkflowState) -> None:
+    """The previous barrier stages with per-link and per-skill linear scans."""
+    writer, auditor, verifier, store = Writer(), Auditor(), Verifier(), Store()
+    skills = []
+    for link in state.proven_links:
+        symbol_name = link.get('symbol_name', '')
+        snippet = next((s for s in state.mined_snippets if symbol_name in s.get('snippet', '')), None)
+        task = types.SimpleNamespace(symbol_name=symbol_name, source_code=snippet['snippet'] if snippet else "")
+        skills.append(writer.execute(task).output.skill)
+    audited = []
+    for skill in skills:
+        refs = [SourceRef(symbol_name=link['symbol_name'], file_path=link['file_path'],
+                          line_number=link['line_number'], validated=True)
+                for link in state.proven_links if link.get('symbol_name') in skill.content]
+        if auditor.execute(types.SimpleNamespace(content=skill.content, source_refs=refs)).output.passed:
+            audited.append(skill)
+    verified = [s for s in audited if verifier.execute(types.SimpleNamespace(skill=s)).output.passed]
+    for skill in verified:
+        store.create_skill(skill)
+
+
+def main():
+    global LATENCY_S
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--links", type=int, default=3000)
+    parser.add_argument("--latency-ms", type=float, default=0.5, help="simulated agent call latency")
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+    LATENCY_S = args.latency_ms / 1000
+
+    sys.modules["skills_fabric.store.kuzu_store"] = types.SimpleNamespace(KuzuSkillStore=Store)
+
+    def supervisor(streaming: bool) -> SupervisorAgent:
+        agent = SupervisorAgent(streaming=streaming)
+        agent.writer, agent.auditor, agent.verifier = Writer(), Auditor(), Verifier()
+        return agent
+
+    print(f"{args.links:,} proven links, {args.links:,} snippets, {args.latency_ms}ms per agent call")
+    quiet = open("/dev/null", "w")
+    stdout, sys.stdout = sys.stdout, quiet
+    try:
+        results = []
+        if not args.skip_legacy:
+            results.append(("legacy barrier + scans", legacy_run))
+        results.append(("barrier + indexes", supervisor(False)._run_skill_stages))
+        results.append(("streaming + indexes", supervisor(True)._run_skill_stages))
+        for label, run in results:
+            Store.first = None
+            state = make_state(args.links)
+            start = time.perf_counter()
+            run(state)
+            total = time.perf_counter() - start
+            sys.stdout = stdout
+            print(f"{label:<24} first stored {(Store.first - start) * 1000:9.1f}ms   total {total:7.2f}s")
+            sys.stdout = quiet
+    finally:
+        sys.stdout = stdout
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Benchmark span recording with batched background export.
+
+Records spans from several threads with a JSON lines exporter attached
+and reports per-span cost on the caller's thread, time to drain the
+export queue, and the drop counter.
+
+Usage:
+    python scripts/benchmark_tracing.py [--spans 200000] [--threads 4] [--sample-rate 1.0]
+"""
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.observability.tracing import TracerProvider, json_exporter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--spans", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--sample-rate", type=float, default=1.0)
+    parser.add_argument("--queue-size", type=int, default=2048)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output = Path(tmpdir) / "spans.jsonl"
+        provider = TracerProvider(max_queue_size=args.queue_size)
+        provider.add_exporter(json_exporter(str(output)))
+        tracer = provider.get_tracer("bench", sample_rate=args.sample_rate)
+        per_thread = args.spans // args.threads
+
+        def work():
+            for i in range(per_thread):
+                with tracer.start_span("op", attributes={"i": i}):
+                    pass
+
+        threads = [threading.Thread(target=work) for _ in range(args.threads)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        record_s = time.perf_counter() - start
+        total = per_thread * args.threads
+        print(f"record {total:,} spans ({args.threads} threads): {record_s:8.2f}s "
+              f"({record_s / total * 1e6:.1f}us/span)")
+
+        start = time.perf_counter()
+        provider.shutdown()
+        flush_s = time.perf_counter() - start
+        lines = sum(1 for _ in open(output)) if output.exists() else 0
+        print(f"final flush:             {flush_s:8.3f}s")
+        print(f"exported={lines:,} dropped={provider.dropped_spans:,} "
+              f"retained={len(provider.get_all_spans()):,}")
+
+
+if __name__ == "__main__":
+    main()
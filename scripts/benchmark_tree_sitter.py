@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Benchmark TreeSitterParser symbol extraction on a generated monorepo.
+
+Generates packages of TypeScript and Python modules (plus a vendored
+node_modules tree that should be skipped) and times:
+- the previous extraction: recursive Python traversal of every node,
+  one rglob pass per extension
+- capture-query extraction, in-process and across worker processes
+- extraction alone on an already-parsed large file (queries also
+  collect calls and imports, which the traversal did not)
+- re-parsing a large file after a one-line edit: from scratch vs
+  incrementally from the retained tree
+
+Usage:
+    python scripts/benchmark_tree_sitter.py [--packages 40] [--modules 25] [--classes 12] [--workers N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.analyze.tree_sitter import TreeSitterParser
+
+SKIP = ["__pycache__", ".venv", "node_modules", ".git", "dist", "build"]
+
+
+def ts_module(index: int, classes: int) -> str:
+    lines = [f'import {{ Base }} from "../core/base{index % 5}";', 'import * as util from "util";', ""]
+    for c in range(classes):
+        lines.append(f"export class Service{index}_{c} extends Base {{")
+        for m in range(6):
+            lines.append(f"  method{m}(value: number): number {{")
+            lines.append(f"    return this.helper(util.format(value), {m});")
+            lines.append("  }")
+        lines.append("}")
+        lines.append(f"export const handler{index}_{c} = (x: number) => x * {c};")
+        lines.append(f"export function build{index}_{c}(): Service{index}_{c} {{ return new Service{index}_{c}(); }}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def py_module(index: int, classes: int) -> str:
+    lines = ["import os", "from pkg.core import Base", ""]
+    for c in range(classes):
+        lines.append(f"class Model{index}_{c}(Base):")
+        for m in range(6):
+            lines.append(f"    def method_{m}(self, value):")
+            lines.append(f"        return os.path.join(str(value), self.helper({m}))")
+        lines.append("")
+        lines.append(f"def build_{index}_{c}():")
+        lines.append(f"    return Model{index}_{c}()")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def legacy_parse_file(parser: TreeSitterParser, file_path: Path) -> list:
+    """The previous per-node recursive traversal."""
+    language = parser._get_language_for_file(file_path)
+    tree = parser._parsers[language].parse(file_path.read_bytes())
+    return legacy_traverse(tree)
+
+
+def legacy_traverse(tree) -> list:
+    symbols = []
+
+    def identifier(node, types):
+        for child in node.children:
+            if child.type in types:
+                return child.text.decode()
+        return None
+
+    def traverse(node):
+        if node.type in ("class_declaration", "class_definition"):
+            name = identifier(node, ["identifier", "type_identifier"])
+            if name:
+                symbols.append((name, "class", node.start_point[0] + 1))
+        elif node.type in ("function_declaration", "function_definition",
+                           "method_definition", "generator_function_declaration"):
+            name = identifier(node, ["identifier", "property_identifier"])
+            if name:
+                symbols.append((name, "function", node.start_point[0] + 1))
+        elif node.type == "lexical_declaration":
+            for child in node.children:
+                if child.type == "variable_declarator":
+                    name_node, has_arrow = None, False
+                    for sub in child.children:
+                        if sub.type == "identifier":
+                            name_node = sub
+                        elif sub.type == "arrow_function":
+                            has_arrow = True
+                    if name_node and has_arrow:
+                        symbols.append((name_node.text.decode(), "function", child.start_point[0] + 1))
+        for child in node.children:
+            traverse(child)
+
+    traverse(tree.root_node)
+    return symbols
+
+
+def legacy_parse_directory(parser: TreeSitterParser, dir_path: Path) -> list:
+    symbols = []
+    for ext in parser.SUPPORTED_EXTENSIONS:
+        for source_file in dir_path.rglob(f"*{ext}"):
+            if any(skip in str(source_file) for skip in SKIP):
+                continue
+            symbols.extend(legacy_parse_file(parser, source_file))
+    return symbols
+
+
+def timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    return result, seconds
+
+
+def best_of(fn, runs: int = 5) -> float:
+    return min(timed("", fn)[1] for _ in range(runs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--packages", type=int, default=40)
+    parser.add_argument("--modules", type=int, default=25, help="modules per package and language")
+    parser.add_argument("--classes", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir) / "monorepo"
+        total_bytes = 0
+        for p in range(args.packages):
+            src = repo / "packages" / f"pkg{p}" / "src"
+            src.mkdir(parents=True)
+            for m in range(args.modules):
+                for name, text in ((f"mod{m}.ts", ts_module(m, args.classes)),
+                                   (f"mod{m}.py", py_module(m, args.classes))):
+                    (src / name).write_text(text)
+                    total_bytes += len(text)
+            vendored = repo / "packages" / f"pkg{p}" / "node_modules" / "dep" / "lib"
+            vendored.mkdir(parents=True)
+            for v in range(20):
+                (vendored / f"v{v}.js").write_text(f"function vendored{v}() {{}}\n")
+        files = args.packages * args.modules * 2
+        print(f"{files:,} source files ({total_bytes / 1e6:.1f} MB), "
+              f"{args.packages * 20:,} vendored files to skip")
+
+        legacy, legacy_s = timed("legacy", lambda: legacy_parse_directory(TreeSitterParser(), repo))
+        print(f"legacy traversal:     {legacy_s:7.2f}s {len(legacy) / legacy_s:10,.0f} symbols/s")
+
+        symbols, seq_s = timed("query", lambda: TreeSitterParser().parse_directory(repo, max_workers=1))
+        assert len(symbols) == len(legacy)
+        print(f"queries (1 process):  {seq_s:7.2f}s {len(symbols) / seq_s:10,.0f} symbols/s "
+              f"({legacy_s / seq_s:.1f}x)")
+
+        if args.workers > 1:
+            symbols, par_s = timed("parallel", lambda: TreeSitterParser().parse_directory(repo, args.workers))
+            print(f"queries ({args.workers} processes): {par_s:6.2f}s {len(symbols) / par_s:10,.0f} symbols/s "
+                  f"({legacy_s / par_s:.1f}x)")
+
+        big = repo / "big.ts"
+        big.write_text("\n".join(ts_module(i, args.classes) for i in range(40)))
+        ts_parser = TreeSitterParser()
+        index = ts_parser.extract_file(big)
+        tree = ts_parser._trees[str(big)][2]
+        legacy_x = best_of(lambda: legacy_traverse(tree))
+        query_x = best_of(lambda: ts_parser._run_query(tree, "typescript", str(big)))
+        print(f"extraction only:      traversal {legacy_x * 1000:.1f}ms ({len(legacy_traverse(tree)):,} symbols), "
+              f"queries {query_x * 1000:.1f}ms ({len(index.symbols):,} symbols + "
+              f"{len(index.calls) + len(index.imports):,} references)")
+
+        source = big.read_text()
+        edited = source.replace("return this.helper(util.format(value), 3);",
+                                "return this.helper(util.format(value + 1), 3);", 1)
+        full_s = best_of(lambda: TreeSitterParser().extract_source(big, edited))
+
+        def incremental():
+            ts_parser.extract_source(big, source)  # back to the retained original
+            start = time.perf_counter()
+            ts_parser.extract_source(big, edited)
+            return time.perf_counter() - start
+
+        inc_s = min(incremental() for _ in range(5))
+        print(f"one-line edit, {len(source) / 1e6:.1f} MB file: from scratch {full_s * 1000:.1f}ms, "
+              f"incremental {inc_s * 1000:.1f}ms (parse + extraction)")
+
+if __name__ == "__main__":
+    main()
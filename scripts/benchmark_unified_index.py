@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Benchmark UnifiedAPI.index_code against simulated Voyage and Qdrant services.
+
+The embedder and vector store sleep per call and per item, standing in for
+network round-trips. Times:
+- the previous single embed call + single upsert (blocking the event loop;
+  a real Voyage request is capped at 128 documents, so this is a lower bound)
+- chunked indexing with bounded concurrency (first run, all new)
+- re-indexing after a 1% edit (content-hash IDs skip unchanged documents)
+
+Usage:
+    python scripts/benchmark_unified_index.py [--documents 5000] [--chunk 128] [--concurrency 4]
+"""
+import argparse
+import asyncio
+import sys
+import time
+import types
+from pathlib import Path
+
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from skills_fabric.integrations.unified_api import APIConfig, UnifiedAPI
+
+CALL_S = 0.03        # per-request latency
+EMBED_ITEM_S = 0.001
+UPSERT_ITEM_S = 0.00005
+
+
+class Embedder:
+    def embed(self, texts, model, input_type):
+        time.sleep(CALL_S + EMBED_ITEM_S * len(texts))
+        return types.SimpleNamespace(embeddings=[[float(len(t)), 1.0] for t in texts])
+
+
+class Store:
+    def __init__(self):
+        self.points = {}
+
+    def get_collections(self):
+        return types.SimpleNamespace(collections=[types.SimpleNamespace(name="code")])
+
+    def retrieve(self, collection_name, ids, with_payload=True, with_vectors=False):
+        time.sleep(CALL_S)
+        return [types.SimpleNamespace(id=i) for i in ids if i in self.points]
+
+    def upsert(self, collection_name, points):
+        time.sleep(CALL_S + UPSERT_ITEM_S * len(points))
+        for point in points:
+            self.points[point.id] = point
+
+
+def install_models() -> None:
+    try:
+        import qdrant_client.models  # noqa: F401
+    except ImportError:
+        models = types.ModuleType("qdrant_client.models")
+        models.VectorParams = lambda size, distance: None
+        models.Distance = types.SimpleNamespace(COSINE="Cosine")
+        models.PointStruct = lambda id, vector, payload: types.SimpleNamespace(id=id, vector=vector, payload=payload)
+        sys.modules["qdrant_client"] = types.SimpleNamespace(models=models)
+        sys.modules["qdrant_client.models"] = models
+
+
+async def legacy_index(api: UnifiedAPI, documents: list) -> None:
+    """The previous implementation: one embed call, positional IDs, one upsert."""
+    embeddings = api._voyage.embed([d["content"] for d in documents], model="voyage-code-3", input_type="document")
+    points = [types.SimpleNamespace(id=i, vector=v, payload=d)
+              for i, (d, v) in enumerate(zip(documents, embeddings.embeddings))]
+    api._qdrant.upsert(collection_name="code", points=points)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=5000)
+    parser.add_argument("--chunk", type=int, default=128)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    install_models()
+
+    documents = [{"content": f"def f{i}(x):\n    return x + {i}", "file_path": f"pkg/mod{i % 40}.py", "line": i}
+                 for i in range(args.documents)]
+
+    def make_api() -> UnifiedAPI:
+        api = UnifiedAPI(APIConfig())
+        api.status = {"qdrant": True, "voyage": True}
+        api._voyage, api._qdrant = Embedder(), Store()
+        return api
+
+    print(f"{args.documents:,} documents, chunk {args.chunk}, concurrency {args.concurrency}")
+
+    start = time.perf_counter()
+    asyncio.run(legacy_index(make_api(), documents))
+    print(f"legacy single call:      {time.perf_counter() - start:7.2f}s (event loop blocked throughout)")
+
+    api = make_api()
+    options = dict(chunk_size=args.chunk, max_concurrency=args.concurrency)
+    asyncio.run(api.index_code("code", documents, **options))
+    stats = api.last_index_stats
+    print(f"chunked, first run:      {stats.seconds:7.2f}s ({stats.chunks} chunks, {stats.embedded:,} embedded)")
+
+    step = 100
+    edited = [dict(d, content=d["content"] + "  # edited") if i % step == 0 else d
+              for i, d in enumerate(documents)]
+    asyncio.run(api.index_code("code", edited, **options))
+    stats = api.last_index_stats
+    print(f"re-index after 1% edit:  {stats.seconds:7.2f}s ({stats.embedded:,} embedded, {stats.skipped:,} skipped)")
+
+
+if __name__ == "__main__":
+    main()
@@ -44,61 +44,58 @@ Advanced Usage:
 __version__ = "0.3.0"
 __author__ = "Skills Fabric Team"
 
-# Core exports
-from .core import db, KuzuDatabase
-from .core.exceptions import SkillsFabricError
-
-# Trust hierarchy
-from .trust import (
-    TrustLevel,
-    verify_skill_trust,
-    quick_trust_check,
-)
-
-# Orchestration
-from .orchestration import (
-    RalphWiggumLoop,
-    AutonomousSkillFactory,
-    run_with_retry,
-)
-
-# Agents
-from .agents import (
-    SupervisorAgent,
-    AgentRole,
-)
+# Public API, imported lazily (PEP 562) so that light entry points such as
+# ``python -m skills_fabric`` and the serve-daemon client don't pay for
+# kuzu, langgraph and the ingest stack on every start.
+_LAZY_EXPORTS = {
+    # Core
+    "db": ".core",
+    "KuzuDatabase": ".core",
+    "SkillsFabricError": ".core.exceptions",
+    # Trust hierarchy
+    "TrustLevel": ".trust",
+    "verify_skill_trust": ".trust",
+    "quick_trust_check": ".trust",
+    # Orchestration
+    "RalphWiggumLoop": ".orchestration",
+    "AutonomousSkillFactory": ".orchestration",
+    "run_with_retry": ".orchestration",
+    # Agents
+    "SupervisorAgent": ".agents",
+    "AgentRole": ".agents",
+    # Memory
+    "KnowledgeGraph": ".memory",
+    "SemanticSearch": ".memory",
+    # Patterns
+    "PatternExecutor": ".patterns",
+    "PatternRegistry": ".patterns",
+    # Intelligence
+    "CodeSimilaritySearch": ".intelligence",
+    "CallGraph": ".intelligence",
+    # Observability
+    "SkillsMetrics": ".observability",
+    "SkillsLogger": ".observability",
+    "configure_logging": ".observability",
+    # Ingest
+    "GitCloner": ".ingest",
+    "CodeWikiCrawler": ".ingest",
+    "IntegratedIngestor": ".ingest",
+}
 
-# Memory
-from .memory import (
-    KnowledgeGraph,
-    SemanticSearch,
-)
 
-# Patterns
-from .patterns import (
-    PatternExecutor,
-    PatternRegistry,
-)
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Intelligence
-from .intelligence import (
-    CodeSimilaritySearch,
-    CallGraph,
-)
 
-# Observability
-from .observability import (
-    SkillsMetrics,
-    SkillsLogger,
-    configure_logging,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# Ingest
-from .ingest import (
-    GitCloner,
-    CodeWikiCrawler,
-    IntegratedIngestor,
-)
 
 __all__ = [
     # Version
@@ -5,6 +5,7 @@ Main entry point for the skills_fabric command-line interface.
 Usage:
     python -m skills_fabric generate <library> --depth <level>
     python -m skills_fabric verify <query>
+    python -m skills_fabric verify --batch <queries.ndjson|->
     python -m skills_fabric analyze <file>
 
 Commands:
@@ -13,6 +14,7 @@ Commands:
     analyze   - Analyze source files using AST/Tree-sitter
     research  - Research a topic using Perplexity
     search    - Search documentation using Brave
+    serve     - Keep verify/analyze state warm in a local daemon
 
 Examples:
     # Generate understanding for langgraph at depth 2
@@ -21,6 +23,9 @@ Examples:
     # Verify a symbol exists in source
     python -m skills_fabric verify StateGraph --codewiki ./codewiki
 
+    # Verify many queries or skill files, streaming NDJSON results
+    python -m skills_fabric verify --batch queries.ndjson --codewiki ./codewiki
+
     # Analyze a Python file
     python -m skills_fabric analyze src/example.py
 
@@ -32,10 +37,15 @@ Examples:
 
     # Search documentation
     python -m skills_fabric search "LangGraph tutorial" --technical
+
+    # Start the warm daemon; verify/analyze calls are forwarded to it
+    python -m skills_fabric serve &
 """
 
 import argparse
+import contextlib
 import json
+import re
 import sys
 from pathlib import Path
 from typing import Optional
@@ -223,13 +233,187 @@ def cmd_generate(args: argparse.Namespace) -> int:
         return 1
 
 
-def cmd_verify(args: argparse.Namespace) -> int:
+def _ddr_result_to_dict(result) -> dict:
+    """Serialize a DDRResult for JSON/NDJSON output."""
+    return {
+        "query": result.query,
+        "validated_count": result.validated_count,
+        "rejected_count": result.rejected_count,
+        "hallucination_rate": result.hallucination_rate,
+        "success": result.success,
+        "elements": [
+            {
+                "symbol_name": e.source_ref.symbol_name,
+                "symbol_type": e.source_ref.symbol_type,
+                "file_path": e.source_ref.file_path,
+                "line_number": e.source_ref.line_number,
+                "citation": e.source_ref.citation,
+                "signature": e.source_ref.signature,
+                "validated": e.source_ref.validated,
+            }
+            for e in result.elements
+        ],
+    }
+
+
+# Backticked identifiers in skill prose: `Name`, `mod.attr`, `func()`
+_BACKTICK_SYMBOL = re.compile(r"`([A-Za-z_][\w.]*)(?:\(\))?`")
+
+
+def _skill_symbols(content: str) -> list[str]:
+    """Collect the unique symbols a skill document refers to.
+
+    Cited symbols ([`Sym`](path#L1) or `Sym` (path:1)) come first, then any
+    other backticked identifiers, in order of first appearance.
+    """
+    from skills_fabric.generate.citations import extract_cited_symbols
+
+    symbols = [symbol for symbol, _ in extract_cited_symbols(content)]
+    symbols.extend(_BACKTICK_SYMBOL.findall(content))
+    return list(dict.fromkeys(symbols))
+
+
+def _iter_verify_batch(stream, on_error):
+    """Parse NDJSON verify records into (record, query) pairs.
+
+    Each non-blank line is one of:
+    - a JSON object with "query" (and optional "id")
+    - a JSON object with "skill_file" or "content" (and optional "id"),
+      expanded to one query per referenced symbol
+    - a JSON string, or any other non-JSON text, used as the query itself
+
+    Malformed records are reported through on_error(line_number, message)
+    and skipped.
+    """
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = line
+        if isinstance(record, str):
+            record = {"query": record}
+        if not isinstance(record, dict):
+            on_error(line_number, "expected a JSON object or string")
+            continue
+
+        meta = {"id": record.get("id", line_number)}
+        if "query" in record:
+            yield meta, str(record["query"])
+            continue
+
+        if "skill_file" in record:
+            meta["skill_file"] = record["skill_file"]
+            try:
+                content = Path(record["skill_file"]).read_text()
+            except OSError as e:
+                on_error(line_number, f"cannot read skill file: {e}")
+                continue
+        elif "content" in record:
+            content = str(record["content"])
+        else:
+            on_error(line_number, 'record needs "query", "skill_file" or "content"')
+            continue
+
+        for symbol in _skill_symbols(content):
+            yield dict(meta), symbol
+
+
+def _verify_batch(args: argparse.Namespace, ddr) -> int:
+    """Stream NDJSON verify records through one shared retriever.
+
+    Results are written as NDJSON lines as they finish (in input order unless
+    --unordered), followed by one summary line with aggregate Hall_m and
+    throughput.
+    """
+    import time
+
+    out = sys.stdout
+    records: dict[int, dict] = {}
+    counts = {"queries": 0, "failed": 0, "invalid": 0, "validated": 0, "rejected": 0}
+
+    def emit(payload: dict) -> None:
+        out.write(json.dumps(payload) + "\n")
+        out.flush()
+
+    def on_error(line_number: int, message: str) -> None:
+        counts["invalid"] += 1
+        emit({"type": "error", "line": line_number, "error": message})
+
+    def queries(stream):
+        for index, (meta, query) in enumerate(_iter_verify_batch(stream, on_error)):
+            records[index] = meta
+            yield query
+
+    metric = ddr.hall_metric
+    log_all, log_exceeded = metric.log_all, metric.log_threshold_exceeded
+    # Per-query Hall_m logging would dominate a bulk run; the summary covers it
+    metric.log_all = metric.log_threshold_exceeded = False
+
+    stream = sys.stdin if args.batch == "-" else open(args.batch)
+    start = time.perf_counter()
+    try:
+        for index, query, result, error in ddr.retrieve_stream(
+            queries(stream),
+            max_results_per_query=args.max_results,
+            max_workers=args.workers,
+            ordered=not args.unordered,
+        ):
+            counts["queries"] += 1
+            payload = {"type": "result", "index": index, **records.pop(index)}
+            if error is not None:
+                counts["failed"] += 1
+                payload.update(query=query, error=str(error))
+            else:
+                counts["validated"] += result.validated_count
+                counts["rejected"] += result.rejected_count
+                payload.update(_ddr_result_to_dict(result))
+            emit(payload)
+    finally:
+        metric.log_all, metric.log_threshold_exceeded = log_all, log_exceeded
+        if stream is not sys.stdin:
+            stream.close()
+
+    seconds = time.perf_counter() - start
+    attempted = counts["validated"] + counts["rejected"]
+    hall_m = counts["rejected"] / attempted if attempted else 0.0
+    summary = {
+        "type": "summary",
+        **counts,
+        "hall_m": hall_m,
+        "threshold": metric.threshold,
+        "seconds": round(seconds, 6),
+        "per_second": round(counts["queries"] / seconds, 1) if seconds > 0 else 0.0,
+    }
+    emit(summary)
+
+    if not args.quiet:
+        status = "PASS" if hall_m < metric.threshold else "FAIL"
+        print(
+            f"Verified {counts['queries']} queries in {seconds:.2f}s "
+            f"({summary['per_second']:.0f}/s): Hall_m {hall_m:.4f} [{status}], "
+            f"{counts['validated']} validated, {counts['rejected']} rejected, "
+            f"{counts['failed']} failed, {counts['invalid']} invalid records",
+            file=sys.stderr,
+        )
+
+    if counts["failed"] or counts["invalid"]:
+        return 1
+    if args.strict and hall_m >= metric.threshold:
+        return 1
+    return 0
+
+
+def cmd_verify(args: argparse.Namespace, warm=None) -> int:
     """Execute the verify command.
 
     Verifies symbols using the DDR (Direct Dependency Retriever).
 
     Args:
         args: Parsed command-line arguments.
+        warm: Optional daemon WarmState supplying a long-lived retriever.
 
     Returns:
         Exit code (0 for success, 1 for error).
@@ -242,7 +426,11 @@ def cmd_verify(args: argparse.Namespace) -> int:
     query = args.query
     output_format = "json" if args.json else "text"
 
-    if not args.quiet:
+    if args.batch is None and not query:
+        print("Error: verify needs a query or --batch", file=sys.stderr)
+        return 2
+
+    if not args.quiet and args.batch is None:
         print(f"Verifying symbol: {query}", file=sys.stderr)
 
     try:
@@ -250,37 +438,31 @@ def cmd_verify(args: argparse.Namespace) -> int:
         codewiki_path = Path(args.codewiki).resolve() if args.codewiki else None
         repo_path = Path(args.repo).resolve() if args.repo else None
 
-        ddr = DirectDependencyRetriever(
-            codewiki_path=codewiki_path,
-            repo_path=repo_path,
-            use_multi_source=not args.no_multi_source,
-            use_lsp=args.use_lsp,
-            fail_on_hall_m_exceed=args.strict,
-        )
+        if warm is not None:
+            ddr = warm.ddr(
+                codewiki_path=codewiki_path,
+                repo_path=repo_path,
+                use_multi_source=not args.no_multi_source,
+                use_lsp=args.use_lsp,
+                fail_on_hall_m_exceed=args.strict,
+            )
+        else:
+            ddr = DirectDependencyRetriever(
+                codewiki_path=codewiki_path,
+                repo_path=repo_path,
+                use_multi_source=not args.no_multi_source,
+                use_lsp=args.use_lsp,
+                fail_on_hall_m_exceed=args.strict,
+            )
 
         try:
+            if args.batch is not None:
+                return _verify_batch(args, ddr)
+
             result = ddr.retrieve(query, args.max_results)
 
             if output_format == "json":
-                output = {
-                    "query": result.query,
-                    "validated_count": result.validated_count,
-                    "rejected_count": result.rejected_count,
-                    "hallucination_rate": result.hallucination_rate,
-                    "success": result.success,
-                    "elements": [
-                        {
-                            "symbol_name": e.source_ref.symbol_name,
-                            "symbol_type": e.source_ref.symbol_type,
-                            "file_path": e.source_ref.file_path,
-                            "line_number": e.source_ref.line_number,
-                            "citation": e.source_ref.citation,
-                            "signature": e.source_ref.signature,
-                            "validated": e.source_ref.validated,
-                        }
-                        for e in result.elements
-                    ],
-                }
+                output = _ddr_result_to_dict(result)
                 print(json.dumps(output, indent=2))
             else:
                 # Text output
@@ -319,7 +501,8 @@ def cmd_verify(args: argparse.Namespace) -> int:
             return 0
 
         finally:
-            ddr.close()
+            if warm is None:
+                ddr.close()
 
     except HallMetricExceededException as e:
         if args.json:
@@ -346,13 +529,14 @@ def cmd_verify(args: argparse.Namespace) -> int:
         return 1
 
 
-def cmd_analyze(args: argparse.Namespace) -> int:
+def cmd_analyze(args: argparse.Namespace, warm=None) -> int:
     """Execute the analyze command.
 
     Analyzes source files using AST or Tree-sitter.
 
     Args:
         args: Parsed command-line arguments.
+        warm: Optional daemon WarmState supplying long-lived parsers.
 
     Returns:
         Exit code (0 for success, 1 for error).
@@ -395,7 +579,13 @@ def cmd_analyze(args: argparse.Namespace) -> int:
         if analyzer_mode == "auto":
             # Use unified CodeAnalyzer with fallback
             project_path = path if is_directory else path.parent
-            with CodeAnalyzer(project_path=project_path, try_lsp=not args.no_lsp) as analyzer:
+            if warm is not None:
+                analyzer_context = contextlib.nullcontext(
+                    warm.code_analyzer(project_path, try_lsp=not args.no_lsp)
+                )
+            else:
+                analyzer_context = CodeAnalyzer(project_path=project_path, try_lsp=not args.no_lsp)
+            with analyzer_context as analyzer:
                 if is_directory:
                     result = analyzer.analyze_directory(path)
                 else:
@@ -418,7 +608,7 @@ def cmd_analyze(args: argparse.Namespace) -> int:
                     file=sys.stderr
                 )
                 return 1
-            parser = ASTParser()
+            parser = warm.ast_parser(path) if warm is not None else ASTParser()
             if is_directory:
                 symbols = parser.parse_directory(path)
             else:
@@ -426,7 +616,7 @@ def cmd_analyze(args: argparse.Namespace) -> int:
 
         elif analyzer_mode == "tree-sitter":
             # Tree-sitter (multi-language)
-            parser = TreeSitterParser()
+            parser = warm.tree_sitter_parser(path) if warm is not None else TreeSitterParser()
             if is_directory:
                 ts_symbols = parser.parse_directory(path)
             else:
@@ -730,6 +920,59 @@ def cmd_search(args: argparse.Namespace) -> int:
         return 1
 
 
+def cmd_serve(args: argparse.Namespace) -> int:
+    """Execute the serve command.
+
+    Runs the warm CLI daemon in the foreground, or queries/stops a
+    running one.
+
+    Args:
+        args: Parsed command-line arguments.
+
+    Returns:
+        Exit code (0 for success, 1 for error).
+    """
+    from skills_fabric.cli_daemon import CLIDaemon, ping, shutdown
+
+    socket_path = Path(args.socket) if args.socket else None
+
+    if args.status:
+        status = ping(socket_path)
+        if args.json:
+            print(json.dumps(status or {"ok": False}))
+        elif status:
+            print(f"Daemon running (pid {status['pid']}, {status['requests']} requests, "
+                  f"{status['warm_objects']} warm objects)")
+        else:
+            print("Daemon not running")
+        return 0 if status else 1
+
+    if args.stop:
+        stopped = shutdown(socket_path)
+        if not args.quiet:
+            print("Daemon stopped" if stopped else "Daemon not running", file=sys.stderr)
+        return 0 if stopped else 1
+
+    daemon = CLIDaemon(
+        socket_path=socket_path,
+        watch_interval=args.watch_interval,
+        idle_timeout=args.idle_timeout,
+    )
+    try:
+        daemon.bind()
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(f"Serving on {daemon.socket_path}", file=sys.stderr)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
 def cmd_version(args: argparse.Namespace) -> int:
     """Show version information.
 
@@ -752,11 +995,11 @@ def cmd_version(args: argparse.Namespace) -> int:
     return 0
 
 
-def main() -> int:
-    """Main entry point for the skills_fabric CLI.
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (shared with the serve daemon).
 
     Returns:
-        Exit code (0 for success, 1 for error).
+        Configured ArgumentParser.
     """
     parser = argparse.ArgumentParser(
         prog="python -m skills_fabric",
@@ -769,6 +1012,7 @@ Commands:
   analyze     Analyze source files with AST/Tree-sitter
   research    Research a topic using Perplexity
   search      Search documentation using Brave
+  serve       Keep verify/analyze state warm in a local daemon
   version     Show version information
 
 Examples:
@@ -800,6 +1044,11 @@ For more help on a specific command:
         action="store_true",
         help="Output as JSON"
     )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run locally even if a serve daemon is running"
+    )
 
     # Subcommands
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -877,12 +1126,22 @@ Examples:
   python -m skills_fabric verify StateGraph
   python -m skills_fabric verify StateGraph --codewiki ./codewiki
   python -m skills_fabric verify StateGraph --strict --json
+  python -m skills_fabric verify --batch queries.ndjson --codewiki ./codewiki
+  cat skills.ndjson | python -m skills_fabric verify --batch - --unordered
+
+Batch input is NDJSON, one record per line:
+  {"id": 1, "query": "StateGraph"}
+  {"id": "skill-a", "skill_file": "skills/a/SKILL.md"}
+  {"content": "Use `StateGraph` with `add_node`"}
+Results stream back as NDJSON, followed by a summary line with Hall_m
+and throughput.
         """
     )
     verify_parser.add_argument(
         "query",
         type=str,
-        help="Symbol or concept to verify"
+        nargs="?",
+        help="Symbol or concept to verify (omit with --batch)"
     )
     verify_parser.add_argument(
         "--codewiki", "-c",
@@ -920,6 +1179,22 @@ Examples:
         action="store_true",
         help="Enable LSP validation (richer but slower)"
     )
+    verify_parser.add_argument(
+        "--batch", "-b",
+        metavar="PATH",
+        help="Verify NDJSON records from PATH ('-' for stdin), streaming NDJSON results"
+    )
+    verify_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=4,
+        help="Worker threads sharing the retriever in --batch mode (default: 4)"
+    )
+    verify_parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="In --batch mode, emit results as they finish instead of in input order"
+    )
     verify_parser.add_argument(
         "--show-metrics",
         action="store_true",
@@ -1109,6 +1384,72 @@ Examples:
     )
     version_parser.set_defaults(func=cmd_version)
 
+    # === serve command ===
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Keep verify/analyze state warm in a local daemon",
+        description=(
+            "Run a resident process on a Unix socket that keeps retrievers and "
+            "parsers warm. verify/analyze invocations are forwarded to it while "
+            "it runs and fall back to local execution otherwise."
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m skills_fabric serve &
+  python -m skills_fabric serve --status
+  python -m skills_fabric serve --stop
+        """
+    )
+    serve_parser.add_argument(
+        "--socket",
+        type=str,
+        help="Socket path (default: $SKILLS_FABRIC_SOCKET or ~/skills_fabric/run/cli.sock)"
+    )
+    serve_parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=2.0,
+        help="Seconds between checks of watched paths (default: 2.0)"
+    )
+    serve_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        help="Exit after this many seconds without requests"
+    )
+    serve_parser.add_argument(
+        "--status",
+        action="store_true",
+        help="Report whether a daemon is running"
+    )
+    serve_parser.add_argument(
+        "--stop",
+        action="store_true",
+        help="Stop a running daemon"
+    )
+    serve_parser.add_argument(
+        "--json", "-j",
+        action="store_true",
+        help="Output as JSON"
+    )
+    serve_parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Suppress informational messages"
+    )
+    serve_parser.set_defaults(func=cmd_serve)
+
+    return parser
+
+
+def main() -> int:
+    """Main entry point for the skills_fabric CLI.
+
+    Returns:
+        Exit code (0 for success, 1 for error).
+    """
+    parser = build_parser()
+
     # Parse arguments
     args = parser.parse_args()
 
@@ -1117,6 +1458,21 @@ Examples:
         parser.print_help()
         return 0
 
+    # Forward to a warm serve daemon when one is running
+    # (batches stay local so results stream as each query finishes)
+    if (
+        args.command in ("verify", "analyze")
+        and not args.no_daemon
+        and getattr(args, "batch", None) is None
+    ):
+        from skills_fabric.cli_daemon import forward
+
+        response = forward(sys.argv[1:])
+        if response is not None:
+            sys.stdout.write(response["stdout"])
+            sys.stderr.write(response["stderr"])
+            return response["exit_code"]
+
     # Execute the command
     return args.func(args)
 
@@ -15,6 +15,10 @@ Uses StateGraph for structured workflow management.
 
 Model: Sonnet (orchestration and routing)
 """
+import queue
+import re
+import threading
+import time
 from dataclasses import dataclass, field
 from typing import Any, Optional, Callable
 from enum import Enum
@@ -31,6 +35,11 @@ from .writer import WriterAgent, WritingTask
 from .auditor import AuditorAgent, AuditTask
 
 
+_IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+# Marks the end of a stage's input queue
+_DONE = object()
+
 class WorkflowStage(Enum):
     """Stages in the multi-agent workflow."""
     INIT = "init"
@@ -66,6 +75,7 @@ class WorkflowState:
     skills_verified: int = 0
     skills_rejected: int = 0
     hallucination_rate: float = 0.0
+    first_stored_ms: float = 0.0  # Time from writing start to first stored skill
 
     # Messages
     messages: list[AgentMessage] = field(default_factory=list)
@@ -81,6 +91,66 @@ class SupervisorResult:
     total_duration_ms: float
 
 
+class SnippetIndex:
+    """First mined snippet mentioning each identifier.
+
+    Built once per workflow so the writing stage looks up a link's snippet
+    instead of scanning every mined snippet per link. Symbols match as
+    whole identifiers; names that are not a single identifier (dotted
+    paths) fall back to a memoized substring scan.
+    """
+
+    def __init__(self, snippets: list[dict]):
+        self._snippets = snippets
+        self._by_identifier: dict[str, dict] = {}
+        for snippet in snippets:
+            for name in set(_IDENTIFIER.findall(snippet.get('snippet', ''))):
+                self._by_identifier.setdefault(name, snippet)
+        self._scanned: dict[str, Optional[dict]] = {}
+
+    def find(self, symbol_name: str) -> Optional[dict]:
+        """Get the first snippet mentioning symbol_name, or None."""
+        snippet = self._by_identifier.get(symbol_name)
+        if snippet is not None or _IDENTIFIER.fullmatch(symbol_name or ''):
+            return snippet
+        if symbol_name not in self._scanned:
+            self._scanned[symbol_name] = next(
+                (s for s in self._snippets if symbol_name in s.get('snippet', '')),
+                None
+            )
+        return self._scanned[symbol_name]
+
+
+class LinkIndex:
+    """Proven links keyed by symbol name.
+
+    Built once per workflow so the auditing stage finds the links a skill
+    mentions from the identifiers in its content, instead of testing every
+    proven link against every skill.
+    """
+
+    def __init__(self, links: list[dict]):
+        self._links = links
+        self._by_symbol: dict[str, list[int]] = {}
+        self._other: list[tuple[int, str]] = []  # symbols that aren't one identifier
+        for position, link in enumerate(links):
+            symbol = link.get('symbol_name')
+            if symbol is None:
+                continue
+            if _IDENTIFIER.fullmatch(symbol):
+                self._by_symbol.setdefault(symbol, []).append(position)
+            else:
+                self._other.append((position, symbol))
+
+    def links_in(self, content: str) -> list[dict]:
+        """Get the links whose symbol appears in content, in link order."""
+        positions = []
+        for name in set(_IDENTIFIER.findall(content)):
+            positions.extend(self._by_symbol.get(name, ()))
+        positions.extend(p for p, symbol in self._other if symbol in content)
+        return [self._links[p] for p in sorted(positions)]
+
+
 class SupervisorAgent(BaseAgent[SupervisorResult]):
     """Orchestrates multi-agent skill generation workflow.
 
@@ -88,17 +158,40 @@ class SupervisorAgent(BaseAgent[SupervisorResult]):
     1. MINING: Miner searches for relevant code
     2. LINKING: Linker creates PROVEN relationships
     3. WRITING: Writer generates skill content
-    4. VERIFYING: Verifier checks trust hierarchy
-    5. STORING: Store verified skills
+    4. AUDITING: Auditor checks for hallucinations
+    5. VERIFYING: Verifier checks trust hierarchy
+    6. STORING: Store verified skills
 
     Coordination Pattern:
-    - Sequential execution with state passing
-    - Message routing between agents
+    - Mining and linking run once over the whole library
+    - Writing → auditing → verifying → storing stream: each skill moves
+      to the next stage as soon as it is ready, through bounded queues,
+      with a worker limit per stage (streaming=False runs them as barriers)
     - Failure escalation and recovery
     - Progress tracking and reporting
     """
 
-    def __init__(self):
+    # Workers per streamed stage. Agents keep per-call state, so each extra
+    # worker gets its own agent instance.
+    STAGE_CONCURRENCY = {
+        WorkflowStage.WRITING: 2,
+        WorkflowStage.AUDITING: 2,
+        WorkflowStage.VERIFYING: 2,
+        WorkflowStage.STORING: 1,
+    }
+
+    def __init__(
+        self,
+        streaming: bool = True,
+        stage_concurrency: Optional[dict[WorkflowStage, int]] = None,
+        queue_size: int = 64,
+    ):
+        """
+        Args:
+            streaming: Stream skills between stages (False: barrier per stage)
+            stage_concurrency: Workers per stage, overriding STAGE_CONCURRENCY
+            queue_size: Capacity of the queue in front of each stage
+        """
         super().__init__(AgentRole.SUPERVISOR)
 
         # Initialize sub-agents
@@ -108,6 +201,11 @@ class SupervisorAgent(BaseAgent[SupervisorResult]):
         self.writer = WriterAgent()
         self.auditor = AuditorAgent()  # Zero-hallucination auditor
 
+        self.streaming = streaming
+        self.stage_concurrency = {**self.STAGE_CONCURRENCY, **(stage_concurrency or {})}
+        self.queue_size = max(1, queue_size)
+        self._worker_agents: dict[tuple[str, int], BaseAgent] = {}
+
         # Agent configs
         self.configs = {
             AgentRole.MINER: AgentConfig.for_role(AgentRole.MINER),
@@ -165,42 +263,12 @@ class SupervisorAgent(BaseAgent[SupervisorResult]):
                 else:
                     self._collect_messages(linking_result)
 
-            # Stage 3: Writing
+            # Stages 3-6: Writing → Auditing (zero-hallucination) → Verifying → Storing
             if state.stage != WorkflowStage.FAILED:
-                print(f"[Supervisor] Stage 3: Writing skills...")
-                state, writing_result = self._run_writing(state)
-                agent_results[AgentRole.WRITER] = writing_result
-
-                if not writing_result.success:
-                    state.errors.append(f"Writing warning: {writing_result.error}")
-                else:
-                    self._collect_messages(writing_result)
-
-            # Stage 4: Auditing (Zero-Hallucination)
-            if state.stage != WorkflowStage.FAILED and state.skills:
-                print(f"[Supervisor] Stage 4: Auditing {len(state.skills)} skills (zero-hallucination)...")
-                state, audit_result = self._run_auditing(state)
-                agent_results[AgentRole.AUDITOR] = audit_result
-
-                if audit_result.success:
-                    self._collect_messages(audit_result)
-                    print(f"  Hall_m rate: {state.hallucination_rate:.4f}")
-                else:
-                    state.errors.append(f"Auditing warning: {audit_result.error}")
-
-            # Stage 5: Verifying
-            if state.stage != WorkflowStage.FAILED and state.audited_skills:
-                print(f"[Supervisor] Stage 5: Verifying {len(state.audited_skills)} audited skills...")
-                state, verify_result = self._run_verification(state)
-                agent_results[AgentRole.VERIFIER] = verify_result
-
-                if verify_result.success:
-                    self._collect_messages(verify_result)
-
-            # Stage 6: Storing
-            if state.verified_skills:
-                print(f"[Supervisor] Stage 5: Storing {len(state.verified_skills)} verified skills...")
-                state = self._run_storing(state)
+                mode = "Streaming" if self.streaming else "Processing"
+                print(f"[Supervisor] Stages 3-6: {mode} {len(state.proven_links)} proven links "
+                      f"through writing, auditing, verifying and storing...")
+                agent_results.update(self._run_skill_stages(state))
 
             # Final state
             state.stage = WorkflowStage.COMPLETE if state.skills_created > 0 else WorkflowStage.FAILED
@@ -282,179 +350,297 @@ class SupervisorAgent(BaseAgent[SupervisorResult]):
 
         return state, result
 
-    def _run_writing(
-        self,
-        state: WorkflowState
-    ) -> tuple[WorkflowState, AgentResult]:
-        """Run writing stage."""
+    def _run_skill_stages(self, state: WorkflowState) -> dict[AgentRole, AgentResult]:
+        """Run writing, auditing, verifying and storing over all proven links.
+
+        Each proven link becomes at most one skill, which flows through the
+        stages on its own. With more than one worker per stage, skills are
+        recorded in completion order. state.stage tracks the furthest stage
+        that has received a skill.
+        """
+        from pathlib import Path
+
         state.stage = WorkflowStage.WRITING
+        started = time.perf_counter()
+        snippets = SnippetIndex(state.mined_snippets)
+        links = LinkIndex(state.proven_links)
+        codewiki_path = Path(state.codewiki_path) if state.codewiki_path else None
+        repo_path = Path(state.repo_path) if state.repo_path else None
 
-        # Generate skills from ALL proven links - NO [:20] LIMIT
-        skills = []
-        proven_links = state.proven_links
-        total_links = len(proven_links)
+        total_links = len(state.proven_links)
+        lock = threading.Lock()
+        counts = {'written': 0, 'audit_rejected': 0, 'hall_total': 0.0, 'verify_rejected': 0}
+        stores = []
 
         print(f"  Processing ALL {total_links} proven links for skill generation...")
 
-        for i, link in enumerate(proven_links):
-            # Find matching snippet
-            symbol_name = link.get('symbol_name', '')
-            file_path = link.get('file_path', '')
-
-            snippet = next(
-                (s for s in state.mined_snippets if symbol_name in s.get('snippet', '')),
-                None
+        def write(link: dict, worker: int):
+            skill = self._write_skill(state, link, snippets, self._stage_agent('writer', worker))
+            with lock:
+                counts['written'] += 1
+                if skill is not None:
+                    state.skills.append(skill)
+                done = counts['written']
+                # Progress update for large batches
+                if done % 50 == 0 or done == total_links:
+                    print(f"    Writing progress: {done}/{total_links} ({len(state.skills)} skills created)")
+            return skill
+
+        def audit(skill, worker: int):
+            passed = self._audit_skill(
+                skill, links, codewiki_path, repo_path, self._stage_agent('auditor', worker)
             )
-
-            source_code = snippet['snippet'] if snippet else ""
-
-            task = WritingTask(
-                concept_name=link.get('concept_name', ''),
-                symbol_name=symbol_name,
-                source_code=source_code,
-                file_path=file_path,
-                library=state.library_name
+            with lock:
+                if passed:
+                    state.audited_skills.append(skill)
+                    counts['hall_total'] += skill.hallucination_rate
+                else:
+                    counts['audit_rejected'] += 1
+            return skill if passed else None
+
+        def verify(skill, worker: int):
+            passed = self._verify_skill(skill, self._stage_agent('verifier', worker))
+            with lock:
+                if passed:
+                    state.verified_skills.append(skill)
+                else:
+                    counts['verify_rejected'] += 1
+            return skill if passed else None
+
+        def store(skill, worker: int):
+            with lock:
+                if not stores:
+                    from ..store.kuzu_store import KuzuSkillStore
+                    stores.append(KuzuSkillStore())
+            try:
+                stores[0].create_skill(skill)
+            except Exception:
+                return None
+            with lock:
+                state.skills_created += 1
+                if state.first_stored_ms == 0.0:
+                    state.first_stored_ms = (time.perf_counter() - started) * 1000
+            return None
+
+        def enter(stage: WorkflowStage) -> None:
+            state.stage = stage
+
+        self._run_pipeline(state.proven_links, [
+            (WorkflowStage.WRITING, write),
+            (WorkflowStage.AUDITING, audit),
+            (WorkflowStage.VERIFYING, verify),
+            (WorkflowStage.STORING, store),
+        ], on_stage=enter)
+
+        state.skills_audited = len(state.audited_skills)
+        state.hallucination_rate = (
+            counts['hall_total'] / state.skills_audited if state.skills_audited else 0.0
+        )
+        state.skills_verified = len(state.verified_skills)
+        state.skills_rejected += counts['verify_rejected']  # Add to any already rejected in audit
+
+        print(f"  Generated {len(state.skills)} skills from ALL {total_links} proven links")
+        agent_results = {
+            AgentRole.WRITER: AgentResult(
+                agent=AgentRole.WRITER,
+                status=AgentStatus.SUCCESS,
+                output={'skills_count': len(state.skills)}
             )
+        }
+        if state.skills:
+            print(f"  Audited: {state.skills_audited}, Rejected: {counts['audit_rejected']}")
+            print(f"  Hall_m rate: {state.hallucination_rate:.4f}")
+            agent_results[AgentRole.AUDITOR] = AgentResult(
+                agent=AgentRole.AUDITOR,
+                status=AgentStatus.SUCCESS,
+                output={
+                    'audited': state.skills_audited,
+                    'rejected': counts['audit_rejected'],
+                    'hallucination_rate': state.hallucination_rate
+                }
+            )
+        if state.audited_skills:
+            print(f"  Verified: {state.skills_verified}, Rejected: {counts['verify_rejected']}")
+            agent_results[AgentRole.VERIFIER] = AgentResult(
+                agent=AgentRole.VERIFIER,
+                status=AgentStatus.SUCCESS,
+                output={'verified': state.skills_verified, 'rejected': counts['verify_rejected']}
+            )
+        if state.verified_skills:
+            print(f"  Stored: {state.skills_created} skills "
+                  f"(first after {state.first_stored_ms:.0f}ms)")
 
-            result = self.writer.execute(task)
-
-            if result.success:
-                skills.append(result.output.skill)
-
-            # Progress update for large batches
-            if (i + 1) % 50 == 0 or i + 1 == total_links:
-                print(f"    Writing progress: {i + 1}/{total_links} ({len(skills)} skills created)")
+        return agent_results
 
-        state.skills = skills
-        print(f"  Generated {len(skills)} skills from ALL {total_links} proven links")
+    def _run_pipeline(
+        self,
+        items: list,
+        stages: list[tuple[WorkflowStage, Callable[[Any, int], Any]]],
+        on_stage: Optional[Callable[[WorkflowStage], None]] = None
+    ) -> None:
+        """Push items through stages; a handler returning None drops the item.
+
+        Streaming: each stage has its own worker threads and a bounded input
+        queue, so items move on as soon as they are processed. Otherwise each
+        stage finishes all items before the next starts. The first error in
+        any stage stops the run and is re-raised.
+
+        on_stage is called when a later stage than any before receives its
+        first item (in barrier mode: when each non-empty stage starts).
+        """
+        if not self.streaming:
+            for stage, handler in stages:
+                if items and on_stage is not None:
+                    on_stage(stage)
+                items = [out for out in (handler(item, 0) for item in items) if out is not None]
+            return
+
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in stages]
+        workers = [max(1, self.stage_concurrency.get(stage, 1)) for stage, _ in stages]
+        errors: list[BaseException] = []
+        threads = []
+        reached = [-1]  # Index of the furthest stage that has received an item
+        reached_lock = threading.Lock()
+
+        def arrived(index: int) -> None:
+            with reached_lock:
+                if index <= reached[0]:
+                    return
+                reached[0] = index
+                if on_stage is not None:
+                    on_stage(stages[index][0])
+
+        for i, (stage, handler) in enumerate(stages):
+            inbox = queues[i]
+            outbox = queues[i + 1] if i + 1 < len(stages) else None
+            remaining = [workers[i]]
+            stage_lock = threading.Lock()
+
+            def work(worker, handler=handler, inbox=inbox, outbox=outbox,
+                     remaining=remaining, stage_lock=stage_lock, index=i):
+                downstream = index + 1
+                while True:
+                    item = inbox.get()
+                    if item is _DONE:
+                        break
+                    if errors:
+                        continue  # Keep draining so upstream never blocks
+                    if reached[0] < index:
+                        arrived(index)
+                    try:
+                        out = handler(item, worker)
+                    except BaseException as e:
+                        errors.append(e)
+                        continue
+                    if out is not None and outbox is not None:
+                        outbox.put(out)
+                with stage_lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                if last and outbox is not None:
+                    for _ in range(workers[downstream]):
+                        outbox.put(_DONE)
+
+            for worker in range(workers[i]):
+                thread = threading.Thread(
+                    target=work, args=(worker,),
+                    name=f"supervisor-{stage.value}-{worker}", daemon=True
+                )
+                thread.start()
+                threads.append(thread)
 
-        # Return last result (or create summary)
-        return state, AgentResult(
-            agent=AgentRole.WRITER,
-            status=AgentStatus.SUCCESS,
-            output={'skills_count': len(skills)}
+        try:
+            for item in items:
+                if errors:
+                    break
+                queues[0].put(item)
+        finally:
+            for _ in range(workers[0]):
+                queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+
+    def _stage_agent(self, name: str, worker: int) -> BaseAgent:
+        """Get the agent for one stage worker (worker 0 uses the shared one)."""
+        if worker == 0:
+            return getattr(self, name)
+        key = (name, worker)
+        agent = self._worker_agents.get(key)
+        if agent is None:
+            agent = self._worker_agents[key] = type(getattr(self, name))()
+        return agent
+
+    def _write_skill(
+        self,
+        state: WorkflowState,
+        link: dict,
+        snippets: SnippetIndex,
+        writer: BaseAgent
+    ) -> Optional[Any]:
+        """Write one skill from a proven link."""
+        symbol_name = link.get('symbol_name', '')
+        snippet = snippets.find(symbol_name)
+
+        task = WritingTask(
+            concept_name=link.get('concept_name', ''),
+            symbol_name=symbol_name,
+            source_code=snippet['snippet'] if snippet else "",
+            file_path=link.get('file_path', ''),
+            library=state.library_name
         )
 
-    def _run_auditing(
+        result = writer.execute(task)
+        return result.output.skill if result.success else None
+
+    def _audit_skill(
         self,
-        state: WorkflowState
-    ) -> tuple[WorkflowState, AgentResult]:
-        """Run zero-hallucination auditing stage."""
-        from pathlib import Path
+        skill: Any,
+        links: LinkIndex,
+        codewiki_path,
+        repo_path,
+        auditor: BaseAgent
+    ) -> bool:
+        """Audit one skill for hallucinations against its proven links."""
         from ..verify.ddr import SourceRef
 
-        state.stage = WorkflowStage.AUDITING
-
-        audited = []
-        rejected = 0
-        total_hall_rate = 0.0
-
-        codewiki_path = Path(state.codewiki_path) if state.codewiki_path else None
-        repo_path = Path(state.repo_path) if state.repo_path else None
-
-        for skill in state.skills:
-            # Build source refs from proven links
-            source_refs = []
-            for link in state.proven_links:
-                if link.get('symbol_name') in str(getattr(skill, 'content', '')):
-                    source_refs.append(SourceRef(
-                        symbol_name=link.get('symbol_name', ''),
-                        file_path=link.get('file_path', ''),
-                        line_number=link.get('line_number', 0),
-                        validated=True,
-                    ))
-
-            # Create audit task
-            content = getattr(skill, 'content', str(skill))
-            task = AuditTask(
-                content=content,
-                source_refs=source_refs,
-                codewiki_path=codewiki_path,
-                repo_path=repo_path,
-                strict_mode=False,  # Allow up to 2% hallucination
+        # Build source refs from proven links
+        source_refs = [
+            SourceRef(
+                symbol_name=link.get('symbol_name', ''),
+                file_path=link.get('file_path', ''),
+                line_number=link.get('line_number', 0),
+                validated=True,
             )
-
-            result = self.auditor.execute(task)
-
-            if result.success and result.output.passed:
-                skill.audited = True
-                skill.hallucination_rate = result.output.hallucination_rate
-                audited.append(skill)
-                total_hall_rate += result.output.hallucination_rate
-            else:
-                rejected += 1
-
-        state.audited_skills = audited
-        state.skills_audited = len(audited)
-        state.hallucination_rate = total_hall_rate / len(audited) if audited else 0.0
-
-        print(f"  Audited: {len(audited)}, Rejected: {rejected}")
-
-        return state, AgentResult(
-            agent=AgentRole.AUDITOR,
-            status=AgentStatus.SUCCESS,
-            output={
-                'audited': len(audited),
-                'rejected': rejected,
-                'hallucination_rate': state.hallucination_rate
-            }
+            for link in links.links_in(str(getattr(skill, 'content', '')))
+        ]
+
+        task = AuditTask(
+            content=getattr(skill, 'content', str(skill)),
+            source_refs=source_refs,
+            codewiki_path=codewiki_path,
+            repo_path=repo_path,
+            strict_mode=False,  # Allow up to 2% hallucination
         )
 
-    def _run_verification(
-        self,
-        state: WorkflowState
-    ) -> tuple[WorkflowState, AgentResult]:
-        """Run verification stage on audited skills."""
-        state.stage = WorkflowStage.VERIFYING
-
-        verified = []
-        rejected = 0
-
-        # Use audited_skills (already passed zero-hallucination check)
-        skills_to_verify = state.audited_skills or state.skills
+        result = auditor.execute(task)
 
-        for skill in skills_to_verify:
-            task = VerificationTask(skill=skill)
-            result = self.verifier.execute(task)
-
-            if result.success and result.output.passed:
-                skill.verified = True
-                verified.append(skill)
-            else:
-                rejected += 1
-
-        state.verified_skills = verified
-        state.skills_verified = len(verified)
-        state.skills_rejected += rejected  # Add to any already rejected in audit
-
-        print(f"  Verified: {len(verified)}, Rejected: {rejected}")
-
-        return state, AgentResult(
-            agent=AgentRole.VERIFIER,
-            status=AgentStatus.SUCCESS,
-            output={'verified': len(verified), 'rejected': rejected}
-        )
-
-    def _run_storing(self, state: WorkflowState) -> WorkflowState:
-        """Store verified skills."""
-        state.stage = WorkflowStage.STORING
-
-        from ..store.kuzu_store import KuzuSkillStore
-
-        store = KuzuSkillStore()
-        stored = 0
-
-        for skill in state.verified_skills:
-            try:
-                store.create_skill(skill)
-                stored += 1
-            except Exception:
-                pass
+        if result.success and result.output.passed:
+            skill.audited = True
+            skill.hallucination_rate = result.output.hallucination_rate
+            return True
+        return False
 
-        state.skills_created = stored
-        print(f"  Stored: {stored} skills")
+    def _verify_skill(self, skill: Any, verifier: BaseAgent) -> bool:
+        """Verify one audited skill against the trust hierarchy."""
+        result = verifier.execute(VerificationTask(skill=skill))
 
-        return state
+        if result.success and result.output.passed:
+            skill.verified = True
+            return True
+        return False
 
     def _collect_messages(self, result: AgentResult):
         """Collect messages from agent result."""
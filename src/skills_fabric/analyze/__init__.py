@@ -37,6 +37,7 @@ Usage:
 
 from skills_fabric.analyze.ast_parser import (
     ASTParser,
+    DirectoryParseStats,
     EnhancedSymbol,
     Parameter,
     Symbol,
@@ -63,6 +64,7 @@ from skills_fabric.analyze.code_analyzer import (
 __all__ = [
     # AST Parser
     "ASTParser",
+    "DirectoryParseStats",
     "EnhancedSymbol",
     "Parameter",
     "Symbol",
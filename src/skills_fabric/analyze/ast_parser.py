@@ -7,12 +7,30 @@ Enhanced Python AST parser that extracts:
 - Decorators
 - Call graphs (which functions call which)
 
+Directory parsing fans files out across worker processes and keeps
+per-file results keyed by (path, mtime, size, parser version): in memory
+for the parser's lifetime and, given a cache_dir, in an on-disk SQLite
+cache, so re-parsing an unchanged tree only stats its files. get_callers
+answers from a reverse call index built once per symbol list.
+
 Usage:
     parser = ASTParser()
     symbols = parser.parse_file(Path("example.py"))
     # Returns list of EnhancedSymbol with full metadata
+
+    parser = ASTParser(cache_dir=Path(".ast_cache"))
+    symbols = parser.parse_directory(Path("src"), max_workers=8)
+    callers = parser.get_callers(symbols, "helper")
 """
 import ast
+import gc
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional, Union
@@ -21,6 +39,17 @@ from skills_fabric.observability.logging import get_logger
 
 logger = get_logger("analyze.ast_parser")
 
+# Bump when extraction output changes; older cache entries are then ignored
+PARSER_VERSION = "1"
+
+# Directories never descended into by parse_directory
+SKIP_DIRS = {"__pycache__", ".venv", "node_modules", ".git", "dist", "build"}
+
+# Directories with fewer files to parse than this are parsed in-process
+PARALLEL_MIN_FILES = 32
+
+_FUNCTION_KINDS = ("function", "method", "async_function", "async_method")
+
 
 @dataclass
 class Parameter:
@@ -111,6 +140,21 @@ class EnhancedSymbol:
         )
 
 
+@dataclass
+class DirectoryParseStats:
+    """Work done by the last parse_directory() call."""
+    files: int = 0
+    parsed: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    symbols: int = 0
+    seconds: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.seconds if self.seconds > 0 else 0.0
+
+
 class CallGraphVisitor(ast.NodeVisitor):
     """AST visitor that extracts function/method calls."""
 
@@ -155,9 +199,32 @@ class ASTParser:
     decorators, and call graphs.
     """
 
-    def __init__(self):
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS files (
+        path TEXT NOT NULL,
+        enhanced INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        size INTEGER NOT NULL,
+        version TEXT NOT NULL,
+        symbols TEXT NOT NULL,
+        PRIMARY KEY (path, enhanced)
+    );
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            cache_dir: Directory for the on-disk parse cache shared across
+                processes and runs (None keeps results in memory only).
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.last_parse_stats = DirectoryParseStats()
         self._call_graph: dict[str, list[str]] = {}  # symbol -> [calls]
-        self._callers: dict[str, list[str]] = {}  # symbol -> [callers]
+        self._callers: dict[str, list[str]] = {}  # call name -> [callers]
+        self._callers_for: Optional[tuple[list, int]] = None  # (symbols, len) indexed
+        self._memo: dict[tuple[str, bool], tuple[int, int, list]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
 
     def parse_file(self, file_path: Path, enhanced: bool = True) -> Union[list[Symbol], list[EnhancedSymbol]]:
         """Parse a Python file and extract symbols.
@@ -525,33 +592,180 @@ class ASTParser:
     def parse_directory(
         self,
         dir_path: Path,
-        enhanced: bool = True
+        enhanced: bool = True,
+        max_workers: Optional[int] = None
     ) -> Union[list[Symbol], list[EnhancedSymbol]]:
         """Parse all Python files in a directory.
 
+        Unchanged files are served from the memory or disk cache; the rest
+        are parsed across worker processes.
+
         Args:
             dir_path: Path to the directory to scan.
             enhanced: If True, return EnhancedSymbol with full metadata.
+            max_workers: Worker processes (default: CPU count; 1 parses
+                in-process).
 
         Returns:
-            List of symbols from all Python files in the directory.
+            List of symbols from all Python files in the directory, in
+            file path order.
         """
-        all_symbols = []
-
-        for py_file in dir_path.rglob("*.py"):
-            # Skip test files and common non-source dirs
-            path_str = str(py_file)
-            if any(skip in path_str for skip in [
-                "__pycache__", ".venv", "node_modules", ".git", "dist", "build"
-            ]):
+        start_time = time.perf_counter()
+        stats = DirectoryParseStats()
+        files = self.find_python_files(dir_path)
+        stats.files = len(files)
+
+        results: dict[str, list] = {}
+        keys: dict[str, tuple[int, int]] = {}
+        for path in files:
+            try:
+                st = os.stat(path)
+            except OSError:
                 continue
+            keys[path] = (st.st_mtime_ns, st.st_size)
+            memo = self._memo.get((path, enhanced))
+            if memo is not None and memo[:2] == keys[path]:
+                results[path] = memo[2]
+                stats.memory_hits += 1
+
+        missing = [p for p in keys if p not in results]
+        if missing and self.cache_dir is not None:
+            with _gc_paused():
+                for path, symbols in self._cache_load(missing, keys, enhanced).items():
+                    results[path] = symbols
+                    self._memo[(path, enhanced)] = (*keys[path], symbols)
+                    stats.disk_hits += 1
+
+        missing = [p for p in keys if p not in results]
+        if missing:
+            parsed = self._parse_files(missing, enhanced, max_workers)
+            stats.parsed = len(parsed)
+            for path, symbols in parsed.items():
+                results[path] = symbols
+                self._memo[(path, enhanced)] = (*keys[path], symbols)
+            if self.cache_dir is not None:
+                self._cache_store(parsed, keys, enhanced)
 
-            symbols = self.parse_file(py_file, enhanced=enhanced)
-            all_symbols.extend(symbols)
-
-        logger.info(f"Parsed {len(all_symbols)} symbols from {dir_path}")
+        all_symbols = []
+        for path in files:
+            all_symbols.extend(results.get(path, ()))
+
+        stats.symbols = len(all_symbols)
+        stats.seconds = time.perf_counter() - start_time
+        self.last_parse_stats = stats
+        logger.info(
+            f"Parsed {len(all_symbols)} symbols from {dir_path} "
+            f"({stats.parsed} parsed, {stats.memory_hits + stats.disk_hits} cached)"
+        )
         return all_symbols
 
+    def find_python_files(self, dir_path: Path) -> list[str]:
+        """List Python files under dir_path in one walk, sorted.
+
+        Directories in SKIP_DIRS are pruned rather than descended into.
+        """
+        files = []
+        for root, dirs, names in os.walk(dir_path):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for name in names:
+                if name.endswith(".py"):
+                    files.append(str(Path(root) / name))
+        files.sort()
+        return files
+
+    def _parse_files(
+        self, files: list[str], enhanced: bool, max_workers: Optional[int]
+    ) -> dict[str, list]:
+        """Parse files in-process or across a process pool."""
+        workers = max(1, max_workers or os.cpu_count() or 1)
+        if workers == 1 or len(files) < PARALLEL_MIN_FILES:
+            return {path: self.parse_file(Path(path), enhanced=enhanced) for path in files}
+
+        # Interleave files across batches so large and small files mix
+        batches = [files[i::workers * 4] for i in range(workers * 4)]
+        batches = [b for b in batches if b]
+        parsed = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for batch in pool.map(_parse_batch, batches, [enhanced] * len(batches)):
+                parsed.update(batch)
+        return parsed
+
+    def _cache_connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.cache_dir / "ast_cache.sqlite3",
+                check_same_thread=False,
+                timeout=30,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self._SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _cache_load(
+        self, files: list[str], keys: dict[str, tuple[int, int]], enhanced: bool
+    ) -> dict[str, list]:
+        """Load cached symbols for files whose mtime and size still match."""
+        by_key = {os.path.abspath(path): path for path in files}
+        prefix = os.path.commonpath(list(by_key))
+        found = {}
+        try:
+            with self._lock:
+                rows = self._cache_connection().execute(
+                    "SELECT path, mtime_ns, size, symbols FROM files "
+                    "WHERE path >= ? AND path < ? AND enhanced = ? AND version = ?",
+                    (prefix, prefix + "\uffff", int(enhanced), PARSER_VERSION),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"AST cache unavailable: {e}")
+            return found
+
+        for key, mtime_ns, size, data in rows:
+            path = by_key.get(key)
+            if path is not None and keys[path] == (mtime_ns, size):
+                found[path] = _decode_symbols(json.loads(data), path, enhanced)
+        return found
+
+    def _cache_store(
+        self, parsed: dict[str, list], keys: dict[str, tuple[int, int]], enhanced: bool
+    ) -> None:
+        rows = [
+            (os.path.abspath(path), int(enhanced), *keys[path], PARSER_VERSION,
+             json.dumps(_encode_symbols(symbols, enhanced)))
+            for path, symbols in parsed.items()
+        ]
+        try:
+            with self._lock:
+                conn = self._cache_connection()
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO files "
+                        "(path, enhanced, mtime_ns, size, version, symbols) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not update AST cache: {e}")
+
+    def clear_cache(self) -> None:
+        """Drop cached parse results, in memory and on disk."""
+        with self._lock:
+            self._memo.clear()
+            self._callers.clear()
+            self._callers_for = None
+            if self.cache_dir is not None:
+                with self._cache_connection() as conn:
+                    conn.execute("DELETE FROM files")
+
+    def close(self) -> None:
+        """Close the on-disk cache connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def build_call_graph(
         self,
         symbols: list[EnhancedSymbol]
@@ -567,9 +781,10 @@ class ASTParser:
         call_graph = {}
 
         for symbol in symbols:
-            if symbol.kind in ("function", "method", "async_function", "async_method"):
+            if symbol.kind in _FUNCTION_KINDS:
                 call_graph[symbol.qualified_name] = symbol.calls
 
+        self._call_graph = call_graph
         return call_graph
 
     def get_callers(
@@ -579,6 +794,11 @@ class ASTParser:
     ) -> list[str]:
         """Find all functions/methods that call a specific symbol.
 
+        A call matches when it is the target name or ends with ".target"
+        (so "helper" matches "self.helper" and "utils.helper"). The reverse
+        call index is built on the first lookup against a symbol list and
+        reused while that list is unchanged.
+
         Args:
             symbols: List of EnhancedSymbol to search.
             target_name: Name of the function/method to find callers for.
@@ -586,17 +806,83 @@ class ASTParser:
         Returns:
             List of qualified names of symbols that call the target.
         """
-        callers = []
-
+        with self._lock:
+            indexed = self._callers_for
+            if indexed is None or indexed[0] is not symbols or indexed[1] != len(symbols):
+                self._callers = self._build_caller_index(symbols)
+                self._callers_for = (symbols, len(symbols))
+            return list(self._callers.get(target_name, ()))
+
+    @staticmethod
+    def _build_caller_index(symbols: list[EnhancedSymbol]) -> dict[str, list[str]]:
+        """Map every dotted suffix of every call to the symbols making it."""
+        index: dict[str, list[str]] = {}
         for symbol in symbols:
-            if symbol.kind in ("function", "method", "async_function", "async_method"):
-                # Check if target_name appears in the calls (full match or suffix)
-                for call in symbol.calls:
-                    if call == target_name or call.endswith(f".{target_name}"):
-                        callers.append(symbol.qualified_name)
-                        break
-
-        return callers
+            if symbol.kind not in _FUNCTION_KINDS:
+                continue
+            names = set()
+            for call in symbol.calls:
+                names.add(call)
+                dot = call.find(".")
+                while dot != -1:
+                    names.add(call[dot + 1:])
+                    dot = call.find(".", dot + 1)
+            caller = symbol.qualified_name
+            for name in names:
+                index.setdefault(name, []).append(caller)
+        return index
+
+
+@contextmanager
+def _gc_paused():
+    """Pause the cyclic GC while bulk-loading cached symbols.
+
+    Decoding allocates many small objects that all survive; with the GC
+    running, each allocation burst rescans everything loaded so far.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _encode_symbols(symbols: list, enhanced: bool) -> list:
+    """Compact JSON rows for the disk cache (file_path is implied by the key)."""
+    if not enhanced:
+        return [[s.name, s.kind, s.line] for s in symbols]
+    return [
+        [s.name, s.kind, s.line, s.end_line,
+         [[p.name, p.type_annotation, p.default_value] for p in s.parameters],
+         s.return_type, s.docstring, s.decorators, s.calls, s.parent_class,
+         s.is_async, s.is_static, s.is_classmethod, s.is_property]
+        for s in symbols
+    ]
+
+
+def _decode_symbols(rows: list, file_path: str, enhanced: bool) -> list:
+    if not enhanced:
+        return [Symbol(name, kind, file_path, line) for name, kind, line in rows]
+    return [
+        EnhancedSymbol(
+            name, kind, file_path, line, end_line,
+            [Parameter(*p) for p in params], *rest
+        )
+        for name, kind, line, end_line, params, *rest in rows
+    ]
+
+
+# Each worker process parses with its own ASTParser
+_worker_parser: Optional[ASTParser] = None
+
+
+def _parse_batch(paths: list[str], enhanced: bool) -> dict[str, list]:
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ASTParser()
+    return {path: _worker_parser.parse_file(Path(path), enhanced=enhanced) for path in paths}
 
 
 def parse_python_file(file_path: Path) -> list[EnhancedSymbol]:
@@ -3,6 +3,11 @@
 Supports Python, TypeScript, JavaScript, and JSX parsing with graceful
 error handling. All parse errors are logged rather than raising exceptions.
 
+Extraction runs tree-sitter's compiled query engine over per-language
+capture queries (queries/*.scm) instead of walking nodes in Python.
+Parsed trees are retained per file, so re-parsing an edited file applies
+the edit to the old tree and re-parses incrementally.
+
 Usage:
     from skills_fabric.analyze.tree_sitter import TreeSitterParser, TSSymbol
 
@@ -10,19 +15,45 @@ Usage:
     symbols = parser.parse_file(Path("example.py"))
     # Returns list of TSSymbol with name, kind, file_path, line
 
+    index = parser.extract_file(Path("example.py"))
+    # TSFileIndex with symbols, calls and imports
+
+    # Whole directory, across worker processes
+    symbols = parser.parse_directory(Path("src"), max_workers=8)
+
 CLI Usage:
     python -m skills_fabric.analyze.tree_sitter --file example.py
     python -m skills_fabric.analyze.tree_sitter --directory src/
 """
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from skills_fabric.observability.logging import get_logger
 
 logger = get_logger("analyze.tree_sitter")
 
-__all__ = ["TSSymbol", "TreeSitterParser"]
+__all__ = ["TSSymbol", "TSReference", "TSFileIndex", "TreeSitterParser"]
+
+QUERY_DIR = Path(__file__).parent / "queries"
+
+# Capture query file per language
+QUERY_FILES = {
+    "python": "python.scm",
+    "typescript": "typescript.scm",
+    "tsx": "typescript.scm",
+    "javascript": "javascript.scm",
+}
+
+# Directories never descended into by parse_directory
+SKIP_DIRS = {"__pycache__", ".venv", "node_modules", ".git", "dist", "build"}
+
+# Directories smaller than this are parsed in-process
+PARALLEL_MIN_FILES = 32
 
 
 @dataclass
@@ -66,6 +97,34 @@ class TSSymbol:
         )
 
 
+@dataclass
+class TSReference:
+    """A call or import found via Tree-sitter.
+
+    Attributes:
+        name: Called name (last component for attribute/member calls)
+            or imported module path
+        kind: 'call' or 'import'
+        file_path: Path to the source file
+        line: Line number of the call or import statement (1-indexed)
+    """
+    name: str
+    kind: str
+    file_path: str
+    line: int
+
+
+@dataclass
+class TSFileIndex:
+    """Everything extracted from one file in a single query pass."""
+    file_path: str
+    language: str
+    symbols: list[TSSymbol] = field(default_factory=list)
+    calls: list[TSReference] = field(default_factory=list)
+    imports: list[TSReference] = field(default_factory=list)
+    has_errors: bool = False
+
+
 class TreeSitterParser:
     """Multi-language parser using Tree-sitter.
 
@@ -79,9 +138,19 @@ class TreeSitterParser:
 
     SUPPORTED_EXTENSIONS = {".py", ".ts", ".tsx", ".js", ".jsx"}
 
-    def __init__(self):
+    def __init__(self, max_retained_trees: int = 1024):
+        """
+        Args:
+            max_retained_trees: Parsed trees kept for incremental
+                re-parsing (least recently used are dropped; 0 disables)
+        """
         self._parsers = {}
         self._languages = {}
+        self._queries = {}
+        self.max_retained_trees = max_retained_trees
+        # path -> (language, source, tree, index)
+        self._trees: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
 
     def _init_python(self) -> bool:
         """Initialize Python parser.
@@ -181,6 +250,15 @@ class TreeSitterParser:
 
         return None
 
+    def _get_query(self, language: str):
+        """Compile (once) the capture query for a language."""
+        query = self._queries.get(language)
+        if query is None:
+            from tree_sitter import Query
+            source = (QUERY_DIR / QUERY_FILES[language]).read_text(encoding="utf-8")
+            query = self._queries[language] = Query(self._languages[language], source)
+        return query
+
     def parse_file(self, file_path: Path) -> list[TSSymbol]:
         """Parse a source file and extract symbols.
 
@@ -191,23 +269,23 @@ class TreeSitterParser:
             List of extracted symbols. Empty list if parsing fails or
             file type is not supported.
         """
-        symbols = []
+        index = self.extract_file(file_path)
+        return list(index.symbols) if index else []
+
+    def extract_file(self, file_path: Path) -> Optional[TSFileIndex]:
+        """Parse a source file and extract symbols, calls and imports.
 
+        Args:
+            file_path: Path to the source file to parse.
+
+        Returns:
+            TSFileIndex, or None if the file can't be read or its type
+            is not supported.
+        """
         # Check file extension
         if file_path.suffix.lower() not in self.SUPPORTED_EXTENSIONS:
             logger.debug(f"Unsupported file extension: {file_path.suffix}")
-            return symbols
-
-        # Initialize appropriate language parser
-        language = self._get_language_for_file(file_path)
-        if language is None:
-            logger.warning(f"Could not initialize parser for: {file_path}")
-            return symbols
-
-        parser = self._parsers.get(language)
-        if parser is None:
-            logger.warning(f"No parser available for language: {language}")
-            return symbols
+            return None
 
         # Read file as bytes (required by tree-sitter)
         try:
@@ -215,131 +293,188 @@ class TreeSitterParser:
                 source = f.read()
         except FileNotFoundError:
             logger.warning(f"File not found: {file_path}")
-            return symbols
+            return None
         except IOError as e:
             logger.warning(f"IO error reading {file_path}: {e}")
-            return symbols
-
-        # Parse with tree-sitter, handling ParseError gracefully
-        try:
-            tree = parser.parse(source)
-        except Exception as e:
-            # Handle tree_sitter.ParseError and any other parsing exceptions
-            error_type = type(e).__name__
-            logger.warning(
-                f"Tree-sitter parse error for {file_path}: [{error_type}] {e}"
-            )
-            return symbols
-
-        rel_path = str(file_path)
-
-        # Traverse the AST and extract symbols
-        def traverse(node, depth=0):
-            """Recursively traverse the AST to extract symbols."""
-            # Python: class_definition, function_definition
-            # TypeScript/JavaScript: class_declaration, function_declaration,
-            #                        method_definition, arrow_function
-
-            if node.type in ("class_declaration", "class_definition"):
-                name = self._extract_identifier(node, ["identifier", "type_identifier"])
-                if name:
-                    symbols.append(TSSymbol(
-                        name=name,
-                        kind="class",
-                        file_path=rel_path,
-                        line=node.start_point[0] + 1,
-                        end_line=node.end_point[0] + 1
-                    ))
-
-            elif node.type in (
-                "function_declaration",
-                "function_definition",
-                "method_definition",
-                "generator_function_declaration",
-            ):
-                name = self._extract_identifier(node, ["identifier", "property_identifier"])
-                if name:
-                    symbols.append(TSSymbol(
-                        name=name,
-                        kind="function",
-                        file_path=rel_path,
-                        line=node.start_point[0] + 1,
-                        end_line=node.end_point[0] + 1
-                    ))
-
-            # Handle arrow functions assigned to variables (common in JS/JSX)
-            elif node.type == "lexical_declaration":
-                for child in node.children:
-                    if child.type == "variable_declarator":
-                        name_node = None
-                        has_arrow = False
-                        for subchild in child.children:
-                            if subchild.type == "identifier":
-                                name_node = subchild
-                            elif subchild.type == "arrow_function":
-                                has_arrow = True
-                        if name_node and has_arrow:
-                            symbols.append(TSSymbol(
-                                name=name_node.text.decode(),
-                                kind="function",
-                                file_path=rel_path,
-                                line=child.start_point[0] + 1,
-                                end_line=child.end_point[0] + 1
-                            ))
-
-            # Recurse into children
-            for child in node.children:
-                traverse(child, depth + 1)
+            return None
 
-        try:
-            traverse(tree.root_node)
-        except Exception as e:
-            logger.warning(f"Error traversing AST for {file_path}: {e}")
+        return self.extract_source(file_path, source)
 
-        logger.debug(f"Extracted {len(symbols)} symbols from {file_path}")
-        return symbols
+    def extract_source(self, file_path: Path, source: bytes | str) -> Optional[TSFileIndex]:
+        """Extract from in-memory source (e.g. an unsaved editor buffer).
 
-    def _extract_identifier(self, node, identifier_types: list[str]) -> Optional[str]:
-        """Extract the identifier name from a node.
+        If a tree for file_path is retained from an earlier parse, the
+        difference between the old and new source is applied with
+        tree.edit() and the file is re-parsed incrementally; unchanged
+        source returns the earlier result without re-parsing.
 
         Args:
-            node: The tree-sitter node.
-            identifier_types: List of node types to look for.
+            file_path: Path the source belongs to (selects the language).
+            source: File contents.
 
         Returns:
-            The identifier name or None.
+            TSFileIndex, or None if the language is unsupported or
+            parsing fails.
         """
-        for child in node.children:
-            if child.type in identifier_types:
-                return child.text.decode()
-        return None
+        if isinstance(source, str):
+            source = source.encode("utf-8")
+
+        # Initialize appropriate language parser
+        language = self._get_language_for_file(file_path)
+        if language is None:
+            logger.warning(f"Could not initialize parser for: {file_path}")
+            return None
+
+        parser = self._parsers.get(language)
+        if parser is None:
+            logger.warning(f"No parser available for language: {language}")
+            return None
+
+        key = str(file_path)
+        with self._lock:
+            retained = self._trees.get(key)
+            old_tree = None
+            if retained is not None and retained[0] == language:
+                if retained[1] == source:
+                    self._trees.move_to_end(key)
+                    return retained[3]
+                old_tree = retained[2]
+                _apply_edit(old_tree, retained[1], source)
+
+            # Parse with tree-sitter, handling ParseError gracefully
+            try:
+                tree = parser.parse(source, old_tree) if old_tree else parser.parse(source)
+            except Exception as e:
+                # Handle tree_sitter.ParseError and any other parsing exceptions
+                error_type = type(e).__name__
+                logger.warning(
+                    f"Tree-sitter parse error for {file_path}: [{error_type}] {e}"
+                )
+                self._trees.pop(key, None)
+                return None
+
+            try:
+                index = self._run_query(tree, language, key)
+            except Exception as e:
+                logger.warning(f"Error querying AST for {file_path}: {e}")
+                index = TSFileIndex(file_path=key, language=language, has_errors=True)
+
+            if self.max_retained_trees > 0:
+                self._trees[key] = (language, source, tree, index)
+                self._trees.move_to_end(key)
+                while len(self._trees) > self.max_retained_trees:
+                    self._trees.popitem(last=False)
+
+        logger.debug(f"Extracted {len(index.symbols)} symbols from {file_path}")
+        return index
+
+    def _run_query(self, tree, language: str, file_path: str) -> TSFileIndex:
+        """Collect definitions, calls and imports from one query pass."""
+        from tree_sitter import QueryCursor
+
+        index = TSFileIndex(
+            file_path=file_path,
+            language=language,
+            has_errors=tree.root_node.has_error,
+        )
+        definitions = []
+        captures = QueryCursor(self._get_query(language)).captures(tree.root_node)
+        for capture, nodes in captures.items():
+            category, _, kind = capture.partition(".")
+            if category == "definition":
+                for node in nodes:
+                    name = node.child_by_field_name("name").text.decode("utf-8", errors="replace")
+                    definitions.append((node.start_byte, -node.end_byte, TSSymbol(
+                        name=name,
+                        kind=kind,
+                        file_path=file_path,
+                        line=node.start_point[0] + 1,
+                        end_line=node.end_point[0] + 1,
+                    )))
+            elif category == "reference":
+                references = index.calls if kind == "call" else index.imports
+                references.extend(
+                    TSReference(
+                        name=node.text.decode("utf-8", errors="replace"),
+                        kind=kind,
+                        file_path=file_path,
+                        line=node.start_point[0] + 1,
+                    )
+                    for node in nodes
+                )
+
+        # Outer definitions before the ones nested in them (document order)
+        definitions.sort(key=lambda d: (d[0], d[1]))
+        index.symbols = [d[2] for d in definitions]
+        return index
 
-    def parse_directory(self, dir_path: Path) -> list[TSSymbol]:
+    def clear_trees(self) -> None:
+        """Drop all retained trees."""
+        with self._lock:
+            self._trees.clear()
+
+    def parse_directory(self, dir_path: Path, max_workers: Optional[int] = None) -> list[TSSymbol]:
         """Parse all supported files in a directory.
 
         Args:
             dir_path: Path to the directory to scan.
+            max_workers: Worker processes (default: CPU count; 1 parses
+                in-process and retains trees for incremental re-parsing).
 
         Returns:
             List of all extracted symbols from supported files.
         """
         all_symbols = []
-
-        for ext in self.SUPPORTED_EXTENSIONS:
-            for source_file in dir_path.rglob(f"*{ext}"):
-                # Skip common non-source directories
-                path_str = str(source_file)
-                if any(skip in path_str for skip in [
-                    "__pycache__", ".venv", "node_modules", ".git", "dist", "build"
-                ]):
-                    continue
-
-                symbols = self.parse_file(source_file)
-                all_symbols.extend(symbols)
+        for index in self.extract_directory(dir_path, max_workers):
+            all_symbols.extend(index.symbols)
 
         logger.info(f"Parsed {len(all_symbols)} symbols from {dir_path}")
         return all_symbols
 
+    def extract_directory(
+        self, dir_path: Path, max_workers: Optional[int] = None
+    ) -> list[TSFileIndex]:
+        """Extract symbols, calls and imports from every supported file.
+
+        Args:
+            dir_path: Path to the directory to scan.
+            max_workers: Worker processes (default: CPU count).
+
+        Returns:
+            One TSFileIndex per parsed file, in path order.
+        """
+        files = self.find_source_files(dir_path)
+        workers = max(1, max_workers or os.cpu_count() or 1)
+
+        if workers == 1 or len(files) < PARALLEL_MIN_FILES:
+            indexes = [self.extract_file(f) for f in files]
+        else:
+            # Interleave files across batches so large and small files mix
+            batches = [[str(f) for f in files[i::workers * 4]] for i in range(workers * 4)]
+            batches = [b for b in batches if b]
+            by_path = {}
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for batch in pool.map(_extract_batch, batches):
+                    for index in batch:
+                        by_path[index.file_path] = index
+            indexes = [by_path.get(str(f)) for f in files]
+
+        return [index for index in indexes if index is not None]
+
+    def find_source_files(self, dir_path: Path) -> list[Path]:
+        """List supported files under dir_path in one walk, sorted.
+
+        Directories in SKIP_DIRS are pruned rather than descended into.
+        """
+        files = []
+        for root, dirs, names in os.walk(dir_path):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for name in names:
+                if os.path.splitext(name)[1].lower() in self.SUPPORTED_EXTENSIONS:
+                    files.append(Path(root) / name)
+        files.sort()
+        return files
+
     def is_supported(self, file_path: Path) -> bool:
         """Check if a file type is supported by this parser.
 
@@ -350,3 +485,65 @@ class TreeSitterParser:
             True if the file extension is supported.
         """
         return file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS
+
+
+def _line_and_column(source: bytes, offset: int) -> tuple[int, int]:
+    row = source.count(b"\n", 0, offset)
+    return row, offset - (source.rfind(b"\n", 0, offset) + 1)
+
+
+def _common_prefix(a: bytes, b: bytes) -> int:
+    # Binary search over slice comparisons: memcmp speed, not a Python loop
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[:mid] == b[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix(a: bytes, b: bytes, limit: int) -> int:
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:] == b[len(b) - mid:]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _apply_edit(tree, old: bytes, new: bytes) -> None:
+    """Describe the change from old to new source to tree.edit().
+
+    The edit spans everything between the common prefix and common suffix.
+    """
+    start = _common_prefix(old, new)
+    suffix = _common_suffix(old, new, min(len(old), len(new)) - start)
+    tree.edit(
+        start_byte=start,
+        old_end_byte=len(old) - suffix,
+        new_end_byte=len(new) - suffix,
+        start_point=_line_and_column(old, start),
+        old_end_point=_line_and_column(old, len(old) - suffix),
+        new_end_point=_line_and_column(new, len(new) - suffix),
+    )
+
+
+# Each worker process parses with its own TreeSitterParser
+_worker_parser: Optional[TreeSitterParser] = None
+
+
+def _extract_batch(paths: list[str]) -> list[TSFileIndex]:
+    global _worker_parser
+    if _worker_parser is None:
+        # Trees can't leave the worker, so don't retain them
+        _worker_parser = TreeSitterParser(max_retained_trees=0)
+    indexes = []
+    for path in paths:
+        index = _worker_parser.extract_file(Path(path))
+        if index is not None:
+            indexes.append(index)
+    return indexes
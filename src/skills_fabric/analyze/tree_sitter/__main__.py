@@ -102,6 +102,9 @@ Examples:
   # Parse all supported files in a directory
   %(prog)s --directory src/
 
+  # ... across 8 worker processes
+  %(prog)s --directory src/ --workers 8
+
   # Output as JSON
   %(prog)s --file example.py --output json
 
@@ -143,6 +146,14 @@ Supported file types:
         help="Filter symbols by kind (class or function)"
     )
 
+    # Directory parsing
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=None,
+        help="Worker processes for --directory (default: CPU count)"
+    )
+
     # Verbosity
     parser.add_argument(
         "--quiet", "-q",
@@ -196,7 +207,7 @@ Supported file types:
         if not args.quiet:
             print(f"Scanning directory: {dir_path}", file=sys.stderr)
 
-        symbols = ts_parser.parse_directory(dir_path)
+        symbols = ts_parser.parse_directory(dir_path, max_workers=args.workers)
 
     # Apply filters
     if args.kind:
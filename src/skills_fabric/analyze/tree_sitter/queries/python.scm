@@ -0,0 +1,29 @@
+; Symbol extraction for Python.
+; Definitions capture the whole node as @definition.<kind>; the symbol
+; name is read from its `name` field. References capture the called or
+; imported name itself as @reference.<kind>. Captures starting with _ are
+; only used by predicates.
+
+(class_definition
+  name: (identifier)) @definition.class
+
+(function_definition
+  name: (identifier)) @definition.function
+
+(call
+  function: [
+    (identifier) @reference.call
+    (attribute attribute: (identifier) @reference.call)
+  ])
+
+(import_statement
+  name: [
+    (dotted_name) @reference.import
+    (aliased_import name: (dotted_name) @reference.import)
+  ])
+
+(import_from_statement
+  module_name: [
+    (dotted_name)
+    (relative_import)
+  ] @reference.import)
@@ -0,0 +1,37 @@
+; Symbol extraction for TypeScript and TSX.
+; Definitions capture the whole node as @definition.<kind>; the symbol
+; name is read from its `name` field. References capture the called or
+; imported name itself as @reference.<kind>. Captures starting with _ are
+; only used by predicates.
+
+(class_declaration
+  name: (type_identifier)) @definition.class
+
+(function_declaration
+  name: (identifier)) @definition.function
+
+(generator_function_declaration
+  name: (identifier)) @definition.function
+
+(method_definition
+  name: (property_identifier)) @definition.function
+
+; Arrow functions assigned with const/let
+(lexical_declaration
+  (variable_declarator
+    name: (identifier)
+    value: (arrow_function)) @definition.function)
+
+(call_expression
+  function: [
+    (identifier) @reference.call
+    (member_expression property: (property_identifier) @reference.call)
+  ])
+
+(import_statement
+  source: (string (string_fragment) @reference.import))
+
+(call_expression
+  function: (identifier) @_require
+  arguments: (arguments . (string (string_fragment) @reference.import))
+  (#eq? @_require "require"))
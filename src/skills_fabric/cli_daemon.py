@@ -0,0 +1,529 @@
+"""Resident CLI daemon - keeps verify/analyze state warm between invocations.
+
+Each ``python -m skills_fabric verify`` or ``analyze`` call normally builds
+a fresh DirectDependencyRetriever (re-parsing the CodeWiki symbol catalog)
+or fresh parsers, uses them once and throws them away. Editor hooks and CI
+scripts that call the CLI thousands of times pay that cold start each time.
+
+``python -m skills_fabric serve`` starts a local process that listens on a
+Unix socket and keeps those objects alive. Thin CLI invocations forward
+their argv to it when it is running and fall back to running locally when
+it is not. Warm objects are tied to the repo/CodeWiki/source paths they
+were built from; a polling watcher drops them when files under those paths
+change.
+
+Protocol: one JSON request line per connection, one JSON response line.
+    {"op": "run", "argv": [...], "cwd": "..."}
+        -> {"exit_code": 0, "stdout": "...", "stderr": "..."}
+    {"op": "ping"}      -> {"ok": true, "pid": ..., "requests": ...}
+    {"op": "shutdown"}  -> {"ok": true}
+
+Usage:
+    python -m skills_fabric serve &
+    python -m skills_fabric verify StateGraph --codewiki ./codewiki   # forwarded
+    python -m skills_fabric --no-daemon verify StateGraph             # local
+    python -m skills_fabric serve --stop
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from skills_fabric.observability.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Environment overrides
+SOCKET_ENV = "SKILLS_FABRIC_SOCKET"
+NO_DAEMON_ENV = "SKILLS_FABRIC_NO_DAEMON"
+
+# Commands the daemon can serve from warm state
+FORWARDED_COMMANDS = frozenset({"verify", "analyze"})
+
+# Directories never worth watching
+_IGNORED_DIRS = frozenset({".git", "__pycache__", "node_modules", ".venv", ".mypy_cache"})
+
+_MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
+def default_socket_path() -> Path:
+    """Socket location: $SKILLS_FABRIC_SOCKET or ~/skills_fabric/run/cli.sock."""
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+    return Path.home() / "skills_fabric" / "run" / "cli.sock"
+
+
+def _send(sock: socket.socket, message: dict) -> None:
+    sock.sendall(json.dumps(message).encode() + b"\n")
+
+
+def _receive(sock: socket.socket) -> Optional[dict]:
+    buffer = bytearray()
+    while b"\n" not in buffer:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        buffer.extend(chunk)
+        if len(buffer) > _MAX_MESSAGE_BYTES:
+            raise ValueError("Message too large")
+    line = bytes(buffer).split(b"\n", 1)[0]
+    return json.loads(line) if line else None
+
+
+# =============================================================================
+# Path watching
+# =============================================================================
+
+
+def path_fingerprint(path: Path) -> tuple[int, int, int]:
+    """Cheap change signature for a file or tree: (files, max mtime_ns, total size)."""
+    try:
+        if path.is_file():
+            stat = path.stat()
+            return (1, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return (0, 0, 0)
+
+    count = latest = total = 0
+    stack = [str(path)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _IGNORED_DIRS:
+                                stack.append(entry.path)
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    count += 1
+                    total += stat.st_size
+                    if stat.st_mtime_ns > latest:
+                        latest = stat.st_mtime_ns
+        except OSError:
+            continue
+        # Directory mtimes catch deletions and renames
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+            if mtime > latest:
+                latest = mtime
+        except OSError:
+            pass
+    return (count, latest, total)
+
+
+class PathWatcher:
+    """Polls watched paths and reports the ones whose fingerprint changed.
+
+    Polling keeps the daemon dependency-free; a tree walk every few
+    seconds is cheap next to re-parsing a catalog on every invocation.
+    """
+
+    def __init__(self, on_change: Callable[[Path], None], interval: float = 2.0):
+        self.interval = interval
+        self._on_change = on_change
+        self._fingerprints: dict[Path, tuple[int, int, int]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, path: Path) -> None:
+        """Start watching a path (no-op if already watched)."""
+        with self._lock:
+            if path in self._fingerprints:
+                return
+        fingerprint = path_fingerprint(path)
+        with self._lock:
+            self._fingerprints.setdefault(path, fingerprint)
+
+    def unwatch(self, path: Path) -> None:
+        with self._lock:
+            self._fingerprints.pop(path, None)
+
+    @property
+    def watched(self) -> list[Path]:
+        with self._lock:
+            return list(self._fingerprints)
+
+    def check(self) -> list[Path]:
+        """Re-fingerprint every watched path and notify on changes."""
+        changed = []
+        for path in self.watched:
+            fingerprint = path_fingerprint(path)
+            with self._lock:
+                previous = self._fingerprints.get(path)
+                if previous is None or previous == fingerprint:
+                    continue
+                self._fingerprints[path] = fingerprint
+            changed.append(path)
+        for path in changed:
+            try:
+                self._on_change(path)
+            except Exception as e:
+                logger.warning(f"Invalidation for {path} failed: {e}")
+        return changed
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="cli-daemon-watcher", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+
+
+# =============================================================================
+# Warm state
+# =============================================================================
+
+
+@dataclass
+class _WarmEntry:
+    value: Any
+    roots: tuple[Path, ...]
+    close: Optional[Callable[[], None]] = None
+    hits: int = 0
+
+
+@dataclass
+class WarmState:
+    """Long-lived retrievers and parsers keyed by their configuration.
+
+    Entries remember the paths they were built from; ``invalidate`` drops
+    (and closes) every entry rooted at or below a changed path. Commands
+    run while holding ``lock`` so invalidation never closes an object in
+    use.
+    """
+
+    watcher: Optional[PathWatcher] = None
+    lock: threading.RLock = field(default_factory=threading.RLock)
+    _entries: dict[tuple, _WarmEntry] = field(default_factory=dict)
+
+    def get(
+        self,
+        key: tuple,
+        roots: tuple[Optional[Path], ...],
+        factory: Callable[[], Any],
+        close: Optional[Callable[[Any], None]] = None,
+    ) -> Any:
+        """Return the cached object for ``key``, building it on first use."""
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                value = factory()
+                watched = tuple(Path(r) for r in roots if r is not None)
+                entry = _WarmEntry(
+                    value=value,
+                    roots=watched,
+                    close=(lambda: close(value)) if close else None,
+                )
+                self._entries[key] = entry
+                if self.watcher is not None:
+                    for root in watched:
+                        self.watcher.watch(root)
+            entry.hits += 1
+            return entry.value
+
+    def invalidate(self, path: Path) -> int:
+        """Drop entries built from ``path`` or anything beneath/above it."""
+        path = Path(path)
+        with self.lock:
+            stale = [
+                key for key, entry in self._entries.items()
+                if any(_related(path, root) for root in entry.roots)
+            ]
+            for key in stale:
+                self._close_entry(self._entries.pop(key))
+        if stale:
+            logger.info(f"Invalidated {len(stale)} warm object(s) for {path}")
+        return len(stale)
+
+    def clear(self) -> None:
+        with self.lock:
+            for entry in self._entries.values():
+                self._close_entry(entry)
+            self._entries.clear()
+
+    @staticmethod
+    def _close_entry(entry: _WarmEntry) -> None:
+        if entry.close is not None:
+            try:
+                entry.close()
+            except Exception:
+                pass
+
+    def roots(self) -> set[Path]:
+        """Every path some warm entry depends on."""
+        with self.lock:
+            return {root for entry in self._entries.values() for root in entry.roots}
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self._entries)
+
+    # -- Typed accessors used by the CLI commands ------------------------
+
+    def ddr(
+        self,
+        codewiki_path: Optional[Path],
+        repo_path: Optional[Path],
+        use_multi_source: bool,
+        use_lsp: bool,
+        fail_on_hall_m_exceed: bool,
+    ):
+        """A warm DirectDependencyRetriever with per-request metrics reset."""
+        from skills_fabric.verify.ddr import DirectDependencyRetriever
+
+        key = ("ddr", codewiki_path, repo_path, use_multi_source, use_lsp, fail_on_hall_m_exceed)
+        ddr = self.get(
+            key,
+            (codewiki_path, repo_path),
+            lambda: DirectDependencyRetriever(
+                codewiki_path=codewiki_path,
+                repo_path=repo_path,
+                use_multi_source=use_multi_source,
+                use_lsp=use_lsp,
+                fail_on_hall_m_exceed=fail_on_hall_m_exceed,
+            ),
+            close=lambda d: d.close(),
+        )
+        # Each invocation reports its own Hall_m, as a cold run would
+        ddr.reset_hall_m_metrics()
+        ddr.reset_validation_stats()
+        return ddr
+
+    def ast_parser(self, root: Path):
+        from skills_fabric.analyze import ASTParser
+        return self.get(("ast", root), (root,), ASTParser)
+
+    def tree_sitter_parser(self, root: Path):
+        from skills_fabric.analyze import TreeSitterParser
+        return self.get(("tree-sitter", root), (root,), TreeSitterParser)
+
+    def code_analyzer(self, project_path: Path, try_lsp: bool):
+        from skills_fabric.analyze import CodeAnalyzer
+        return self.get(
+            ("analyzer", project_path, try_lsp),
+            (project_path,),
+            lambda: CodeAnalyzer(project_path=project_path, try_lsp=try_lsp),
+            close=lambda a: a.close(),
+        )
+
+
+def _related(changed: Path, root: Path) -> bool:
+    return changed == root or root in changed.parents or changed in root.parents
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+
+class CLIDaemon:
+    """Unix-socket server that runs forwarded CLI commands on warm state.
+
+    Requests are handled one at a time: commands write to process-wide
+    stdout/stderr (captured per request) and may chdir to the caller's
+    working directory, so serial execution keeps them isolated.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        watch_interval: float = 2.0,
+        idle_timeout: Optional[float] = None,
+    ):
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path()
+        self.idle_timeout = idle_timeout
+        self.watcher = PathWatcher(self._invalidate, interval=watch_interval)
+        self.state = WarmState(watcher=self.watcher)
+        self.requests_served = 0
+        self._server: Optional[socket.socket] = None
+        self._running = False
+
+    def _invalidate(self, path: Path) -> None:
+        self.state.invalidate(path)
+        # Stop watching roots that no warm entry needs any more
+        live = self.state.roots()
+        for watched in self.watcher.watched:
+            if watched not in live:
+                self.watcher.unwatch(watched)
+
+    def bind(self) -> None:
+        """Create the listening socket, replacing a stale one."""
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            if ping(self.socket_path) is not None:
+                raise RuntimeError(f"Daemon already running on {self.socket_path}")
+            self.socket_path.unlink()
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+        server.listen(64)
+        server.settimeout(1.0)
+        self._server = server
+
+    def serve_forever(self) -> None:
+        """Accept and handle requests until shutdown or idle timeout."""
+        if self._server is None:
+            self.bind()
+        self.watcher.start()
+        self._running = True
+        last_request = time.monotonic()
+        logger.info(f"CLI daemon listening on {self.socket_path}")
+        try:
+            while self._running:
+                try:
+                    conn, _ = self._server.accept()
+                except socket.timeout:
+                    if self.idle_timeout and time.monotonic() - last_request > self.idle_timeout:
+                        logger.info("CLI daemon idle timeout reached")
+                        break
+                    continue
+                with conn:
+                    conn.settimeout(None)
+                    self._handle(conn)
+                last_request = time.monotonic()
+        finally:
+            self.close()
+
+    def _handle(self, conn: socket.socket) -> None:
+        try:
+            request = _receive(conn)
+        except Exception as e:
+            _send(conn, {"error": f"Bad request: {e}"})
+            return
+        if not request:
+            return
+
+        op = request.get("op", "run")
+        if op == "ping":
+            _send(conn, {
+                "ok": True,
+                "pid": os.getpid(),
+                "requests": self.requests_served,
+                "warm_objects": len(self.state),
+                "watched_paths": [str(p) for p in self.watcher.watched],
+            })
+        elif op == "shutdown":
+            self._running = False
+            _send(conn, {"ok": True})
+        elif op == "run":
+            _send(conn, self.run_command(request.get("argv", []), request.get("cwd")))
+        else:
+            _send(conn, {"error": f"Unknown op: {op}"})
+
+    def run_command(self, argv: list[str], cwd: Optional[str] = None) -> dict:
+        """Parse and run a CLI command in-process against warm state."""
+        from skills_fabric.__main__ import build_parser
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        previous_cwd = os.getcwd()
+        exit_code = 1
+        with self.state.lock, contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                args = build_parser().parse_args(argv)
+                if getattr(args, "command", None) not in FORWARDED_COMMANDS:
+                    print(f"Error: command not served by daemon: {args.command}", file=sys.stderr)
+                else:
+                    exit_code = args.func(args, warm=self.state)
+            except SystemExit as e:
+                # argparse errors and --help
+                exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            except Exception as e:
+                print(f"Error: {e}", file=sys.stderr)
+            finally:
+                os.chdir(previous_cwd)
+        self.requests_served += 1
+        return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+    def stop(self) -> None:
+        self._running = False
+
+    def close(self) -> None:
+        self.watcher.stop()
+        self.state.clear()
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+
+def _request(socket_path: Path, message: dict, timeout: Optional[float]) -> Optional[dict]:
+    """Send one request; None if no daemon is reachable."""
+    if not socket_path.exists():
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            _send(sock, message)
+            return _receive(sock)
+    except (OSError, ValueError):
+        return None
+
+
+def ping(socket_path: Optional[Path] = None, timeout: float = 1.0) -> Optional[dict]:
+    """Daemon status, or None if it is not running."""
+    return _request(socket_path or default_socket_path(), {"op": "ping"}, timeout)
+
+
+def shutdown(socket_path: Optional[Path] = None, timeout: float = 5.0) -> bool:
+    """Ask a running daemon to exit."""
+    response = _request(socket_path or default_socket_path(), {"op": "shutdown"}, timeout)
+    return bool(response and response.get("ok"))
+
+
+def forward(
+    argv: list[str],
+    socket_path: Optional[Path] = None,
+    cwd: Optional[str] = None,
+) -> Optional[dict]:
+    """Run a CLI command on the daemon.
+
+    Returns:
+        {"exit_code", "stdout", "stderr"}, or None when no daemon answered
+        (the caller then runs the command locally).
+    """
+    if os.environ.get(NO_DAEMON_ENV):
+        return None
+    response = _request(
+        socket_path or default_socket_path(),
+        {"op": "run", "argv": argv, "cwd": cwd or os.getcwd()},
+        timeout=None,
+    )
+    if response is None or "exit_code" not in response:
+        return None
+    return response
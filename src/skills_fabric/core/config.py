@@ -12,6 +12,10 @@ class Config:
     data_dir: Path = field(default_factory=lambda: Path.home() / "skills_fabric" / "data")
     kuzu_db_path: Path = field(default_factory=lambda: Path.home() / "skills_fabric" / "data" / "kuzu_db")
     context7_cache_dir: Path = field(default_factory=lambda: Path.home() / "skills_fabric" / "data" / "context7_cache")
+    # Per-file ASTParser results, keyed by (path, mtime, size, parser version)
+    ast_cache_dir: Path = field(default_factory=lambda: Path.home() / "skills_fabric" / "data" / "ast_cache")
+    # Persistent R symbol index served by the R MCP server
+    r_index_path: Path = field(default_factory=lambda: Path.home() / "skills_fabric" / "data" / "r_symbols.db")
     
     # API Keys
     zai_api_key: str = field(default_factory=lambda: os.environ.get("ZAI_API_KEY", ""))
@@ -19,6 +23,10 @@ class Config:
     
     # Context7 API
     context7_url: str = "https://mcp.context7.com/mcp"
+    # Context7 response cache: entry lifetime in seconds and stored-size
+    # budget in bytes (0 means no expiry / unbounded)
+    context7_cache_ttl: int = 0
+    context7_cache_max_bytes: int = 0
     
     # GLM-4.7 API
     glm_api_url: str = "https://api.z.ai/api/coding/paas/v4/chat/completions"
@@ -28,6 +36,10 @@ class Config:
     # max_context7_files: 0 means no limit (use ALL available files)
     max_context7_files: int = 0
     max_skills_per_run: int = 100
+
+    # Concurrency
+    # Bounded worker pool for LLM question generation in SkillFactory
+    max_generate_workers: int = 8
     
     def __post_init__(self):
         """Ensure directories exist."""
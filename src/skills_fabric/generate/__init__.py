@@ -9,6 +9,7 @@ from .citations import (
     CitationSystem,
     CitationConfig,
     CitationResult,
+    CitationStream,
     add_citations,
     extract_cited_symbols,
     verify_citations,
@@ -18,6 +19,7 @@ __all__ = [
     "CitationSystem",
     "CitationConfig",
     "CitationResult",
+    "CitationStream",
     "add_citations",
     "extract_cited_symbols",
     "verify_citations",
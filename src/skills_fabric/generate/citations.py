@@ -12,15 +12,23 @@ Integration:
 - Works with DDR SourceRef objects
 - Adds citations after verification
 - Supports multiple output formats
+- Cites streamed LLM output chunk by chunk (CitationStream)
 """
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 from pathlib import Path
 import re
 
 from ..verify.ddr import SourceRef
 
 
+# Code references: `SymbolName`, `symbol_name` or `module.Symbol`
+_SYMBOL_PATTERN = re.compile(r'`([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)`')
+
+# A backtick followed only by characters that could still complete a reference
+_OPEN_REFERENCE = re.compile(r'`[A-Za-z0-9_.]*')
+
+
 @dataclass
 class CitationConfig:
     """Configuration for citation formatting."""
@@ -82,43 +90,94 @@ class CitationSystem:
         if refs:
             self.register_refs(refs)
 
-        cited_content = content
-        citations_added = 0
-        uncited_symbols = []
-        citation_map = {}
+        citation_map: dict[str, str] = {}
+        uncited: dict[str, None] = {}  # insertion-ordered set
+        cited_content, citations_added = self._rewrite(
+            content, _SYMBOL_PATTERN.finditer(content), len(content), citation_map, uncited
+        )
+
+        return CitationResult(
+            original_content=content,
+            cited_content=cited_content,
+            citations_added=citations_added,
+            uncited_symbols=list(uncited),
+            citation_map=citation_map,
+        )
 
-        # Find all code references: `SymbolName` or `symbol_name`
-        pattern = r'`([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)`'
-        matches = list(re.finditer(pattern, content))
+    def stream(self, refs: list[SourceRef] = None) -> "CitationStream":
+        """Start citing content that arrives in chunks (e.g. from an LLM).
 
-        # Process in reverse order to preserve positions
-        for match in reversed(matches):
-            symbol = match.group(1)
-            symbol_lower = symbol.lower()
+        Args:
+            refs: Source references to use for citations
 
-            # Look up source reference
-            ref = self._refs_by_symbol.get(symbol_lower)
+        Returns:
+            CitationStream whose feed()/finish() return cited text
+        """
+        if refs:
+            self.register_refs(refs)
+        return CitationStream(self)
 
-            if ref:
+    def cite_chunks(
+        self,
+        chunks: Iterable[str],
+        refs: list[SourceRef] = None,
+    ) -> Iterator[str]:
+        """Cite an iterable of text chunks, yielding cited text as it is safe.
+
+        Concatenating the yielded pieces gives the same text as
+        add_citations() on the concatenated input.
+        """
+        stream = self.stream(refs)
+        for chunk in chunks:
+            cited = stream.feed(chunk)
+            if cited:
+                yield cited
+        tail = stream.finish()
+        if tail:
+            yield tail
+
+    def _rewrite(
+        self,
+        text: str,
+        matches: Iterable[re.Match],
+        end: int,
+        citation_map: dict[str, str],
+        uncited: dict[str, None],
+    ) -> tuple[str, int]:
+        """Replace matched references in text[:end] in a single pass.
+
+        Output is assembled from slices with one join; citations are formatted
+        once per symbol via citation_map.
+
+        Returns:
+            Tuple of (cited text, citations added)
+        """
+        parts = []
+        position = 0
+        citations_added = 0
+
+        for match in matches:
+            symbol = match.group(1)
+            citation = citation_map.get(symbol)
+            if citation is None:
+                if symbol in uncited:
+                    continue
+                ref = self._refs_by_symbol.get(symbol.lower())
+                if ref is None:
+                    # Track uncited symbols (potential hallucinations)
+                    uncited[symbol] = None
+                    continue
                 citation = self._format_citation(symbol, ref)
                 citation_map[symbol] = citation
 
-                # Replace the match with cited version
-                start, end = match.span()
-                cited_content = cited_content[:start] + citation + cited_content[end:]
-                citations_added += 1
-            else:
-                # Track uncited symbols (potential hallucinations)
-                if symbol not in uncited_symbols:
-                    uncited_symbols.append(symbol)
+            start, stop = match.span()
+            parts.append(text[position:start])
+            parts.append(citation)
+            position = stop
+            citations_added += 1
 
-        return CitationResult(
-            original_content=content,
-            cited_content=cited_content,
-            citations_added=citations_added,
-            uncited_symbols=uncited_symbols,
-            citation_map=citation_map,
-        )
+        parts.append(text[position:end])
+        return "".join(parts), citations_added
 
     def _format_citation(self, symbol: str, ref: SourceRef) -> str:
         """Format a citation based on config."""
@@ -157,6 +216,69 @@ class CitationSystem:
         return '\n'.join(lines)
 
 
+class CitationStream:
+    """Incremental citation of streamed text.
+
+    Each feed() returns the cited form of everything that can no longer be
+    affected by later chunks; a trailing, possibly incomplete `reference is
+    held back until the next chunk (or finish()). Only that short tail is
+    buffered, never the whole response.
+
+    Usage:
+        stream = CitationSystem(config).stream(refs)
+        for chunk in llm_chunks:
+            emit(stream.feed(chunk))
+        emit(stream.finish())
+        stream.uncited_symbols  # symbols without a source reference
+    """
+
+    def __init__(self, system: CitationSystem):
+        self._system = system
+        self._pending = ""
+        self._finished = False
+        self.citations_added = 0
+        self.citation_map: dict[str, str] = {}
+        self._uncited: dict[str, None] = {}
+
+    @property
+    def uncited_symbols(self) -> list[str]:
+        """Uncited symbols seen so far, in order of first appearance."""
+        return list(self._uncited)
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk and return the cited text that is now final."""
+        if self._finished:
+            raise ValueError("CitationStream already finished")
+
+        buffer = self._pending + chunk
+        matches = list(_SYMBOL_PATTERN.finditer(buffer))
+        last_end = matches[-1].end() if matches else 0
+
+        # Hold back an opening backtick whose reference may continue next chunk
+        cut = len(buffer)
+        tick = buffer.rfind("`")
+        if tick >= last_end and _OPEN_REFERENCE.fullmatch(buffer, tick):
+            cut = tick
+
+        self._pending = buffer[cut:]
+        return self._cite(buffer, matches, cut)
+
+    def finish(self) -> str:
+        """Flush the held-back tail once the stream has ended."""
+        if self._finished:
+            return ""
+        self._finished = True
+        buffer, self._pending = self._pending, ""
+        return self._cite(buffer, _SYMBOL_PATTERN.finditer(buffer), len(buffer))
+
+    def _cite(self, text: str, matches: Iterable[re.Match], end: int) -> str:
+        cited, added = self._system._rewrite(
+            text, matches, end, self.citation_map, self._uncited
+        )
+        self.citations_added += added
+        return cited
+
+
 def add_citations(
     content: str,
     refs: list[SourceRef],
@@ -17,6 +17,11 @@ BMAD C.O.R.E. Principles:
 from typing import TypedDict, Annotated, Literal
 from dataclasses import dataclass
 import operator
+import time
+
+from ..observability.logging import get_logger
+
+logger = get_logger("generate.skill_factory")
 
 
 @dataclass
@@ -46,6 +51,7 @@ class FactoryState(TypedDict):
     # Output
     skills_created: int
     errors: Annotated[list[str], operator.add]
+    stage_stats: Annotated[list[dict], operator.add]
     
     # Control
     current_step: str
@@ -65,6 +71,20 @@ class SkillFactory:
         self.db = db
         self.config = config
         self._graph = None
+
+    # Rows per UNWIND statement when staging symbols
+    SYMBOL_STAGE_CHUNK = 10_000
+
+    @staticmethod
+    def _stage_stat(stage: str, items: int, started: float) -> dict:
+        """Throughput record for one pipeline stage."""
+        seconds = time.perf_counter() - started
+        return {
+            'stage': stage,
+            'items': items,
+            'seconds': round(seconds, 3),
+            'items_per_sec': round(items / seconds, 1) if seconds > 0 else 0.0,
+        }
     
     def _build_graph(self):
         """Build the LangGraph workflow."""
@@ -99,6 +119,7 @@ class SkillFactory:
         from ..ingest.gitclone import GitCloner
         
         print(f"[Ingest] Processing {state['library_name']}...")
+        started = time.perf_counter()
         
         cloner = GitCloner()
         repo_path = cloner.get_repo(state['library_name'])
@@ -112,6 +133,7 @@ class SkillFactory:
         
         return {
             'repo_path': str(repo_path),
+            'stage_stats': [self._stage_stat('ingest', len(files), started)],
             'current_step': 'ingest_complete'
         }
     
@@ -122,13 +144,15 @@ class SkillFactory:
         from pathlib import Path
         
         print('[Analyze] Extracting symbols...')
+        started = time.perf_counter()
         
         repo_path = Path(state['repo_path'])
         all_symbols = []
         
         # Use AST for Python
-        ast_parser = ASTParser()
+        ast_parser = ASTParser(cache_dir=self.config.ast_cache_dir)
         py_symbols = ast_parser.parse_directory(repo_path)
+        ast_parser.close()
         all_symbols.extend([{'name': s.name, 'file_path': s.file_path, 'line': s.line} for s in py_symbols])
         
         # Use Tree-sitter for TypeScript
@@ -142,6 +166,7 @@ class SkillFactory:
         
         return {
             'symbols': all_symbols,
+            'stage_stats': [self._stage_stat('analyze', len(all_symbols), started)],
             'current_step': 'analyze_complete'
         }
     
@@ -150,39 +175,10 @@ class SkillFactory:
         from ..link.proven_linker import ProvenLinker
 
         print('[Link] Creating PROVEN links...')
+        started = time.perf_counter()
 
         # Store ALL symbols in database - NO LIMIT
-        # Process in batches to avoid memory issues
-        symbols = state['symbols']
-        batch_size = 100
-        total_stored = 0
-
-        for i in range(0, len(symbols), batch_size):
-            batch = symbols[i:i + batch_size]
-            for symbol in batch:
-                try:
-                    self.db.execute(
-                        """
-                        CREATE (s:Symbol {
-                            name: $name,
-                            file_path: $file_path,
-                            line: $line
-                        })
-                        """,
-                        {
-                            "name": symbol["name"],
-                            "file_path": symbol["file_path"],
-                            "line": symbol["line"]
-                        }
-                    )
-                    total_stored += 1
-                except Exception:
-                    pass  # Already exists
-
-            # Progress update for large batches
-            if len(symbols) > batch_size:
-                print(f'  [Link] Stored {min(i + batch_size, len(symbols))}/{len(symbols)} symbols...')
-
+        total_stored = self._stage_symbols(state['symbols'])
         print(f'[Link] Stored {total_stored} symbols in database')
 
         linker = ProvenLinker()
@@ -199,8 +195,78 @@ class SkillFactory:
 
         return {
             'proven_links': proven,
+            'stage_stats': [self._stage_stat('link', len(state['symbols']), started)],
             'current_step': 'link_complete'
         }
+
+    def _stage_symbols(self, symbols: list) -> int:
+        """Bulk-load symbols into the Symbol table.
+
+        Existing names are fetched once and skipped (Symbol.name is the
+        primary key, first occurrence wins), then the new rows go in
+        with chunked UNWIND ... CREATE statements instead of one CREATE
+        round-trip per symbol. A chunk that fails is retried row by row,
+        skipping the rows that still fail.
+        """
+        existing = set()
+        res = self.db.execute('MATCH (s:Symbol) RETURN s.name')
+        while res.has_next():
+            existing.add(res.get_next()[0])
+
+        rows = []
+        for symbol in symbols:
+            if symbol['name'] in existing:
+                continue
+            existing.add(symbol['name'])
+            rows.append({
+                'name': symbol['name'],
+                'file_path': symbol['file_path'],
+                'line': symbol['line'],
+            })
+
+        stored = 0
+        for i in range(0, len(rows), self.SYMBOL_STAGE_CHUNK):
+            chunk = rows[i:i + self.SYMBOL_STAGE_CHUNK]
+            try:
+                self.db.execute(
+                    """
+                    UNWIND $rows AS row
+                    CREATE (s:Symbol {
+                        name: row.name,
+                        file_path: row.file_path,
+                        line: row.line
+                    })
+                    """,
+                    {'rows': chunk}
+                )
+                stored += len(chunk)
+            except Exception as e:
+                logger.warning(f"Symbol chunk of {len(chunk)} failed, retrying row by row: {e}")
+                stored += self._stage_rows(chunk)
+            if len(rows) > self.SYMBOL_STAGE_CHUNK:
+                print(f'  [Link] Stored {stored}/{len(rows)} symbols...')
+
+        return stored
+
+    def _stage_rows(self, rows: list[dict]) -> int:
+        """Insert symbols one CREATE at a time, skipping rows that fail."""
+        stored = 0
+        for row in rows:
+            try:
+                self.db.execute(
+                    """
+                    CREATE (s:Symbol {
+                        name: $name,
+                        file_path: $file_path,
+                        line: $line
+                    })
+                    """,
+                    row
+                )
+                stored += 1
+            except Exception:
+                pass  # Already exists
+        return stored
     
     def _node_enrich(self, state: FactoryState) -> dict:
         """Enrich with Context7 documentation."""
@@ -208,6 +274,7 @@ class SkillFactory:
         from pathlib import Path
 
         print('[Enrich] Fetching Context7 documentation...')
+        started = time.perf_counter()
 
         c7 = Context7Client()
 
@@ -220,76 +287,111 @@ class SkillFactory:
         if cache_file:
             print(f'[Enrich] Cached to {cache_file}')
 
-        # Load ALL cached docs - no [:5] limit
-        cached_docs = c7.load_all_cached()
-        context7_text = '\n'.join([d.get('response', '')[:500] for d in cached_docs])
-        print(f'[Enrich] Loaded {len(cached_docs)} Context7 documents')
+        # Candidates carry the first 500 chars of the joined cached docs, so
+        # read only as many docs as that takes rather than the whole cache
+        excerpts: list[str] = []
+        excerpt_len = -1
+        for doc in c7.iter_cached():
+            excerpts.append(doc.content[:500])
+            excerpt_len += len(excerpts[-1]) + 1
+            if excerpt_len >= 500:
+                break
+        context7_text = '\n'.join(excerpts)
+        print(f'[Enrich] {c7.get_cache_stats()["total_files"]} Context7 documents cached')
 
         # Create candidates from ALL proven links - NO [:20] LIMIT!
-        candidates = []
         repo_path = Path(state['repo_path'])
         proven_links = state['proven_links']
 
         print(f'[Enrich] Processing ALL {len(proven_links)} proven links...')
 
-        # Process in batches with progress tracking
-        batch_size = 50
-        for i in range(0, len(proven_links), batch_size):
-            batch = proven_links[i:i + batch_size]
-            for link in batch:
-                try:
-                    source_file = repo_path / link['file_path']
-                    if source_file.exists():
-                        with open(source_file, 'r', errors='ignore') as f:
-                            source_code = f.read()[:2000]
-                    else:
-                        source_code = ''
-
-                    candidates.append(SkillCandidate(
-                        concept_name=link['concept'],
-                        symbol_name=link['symbol'],
-                        file_path=link['file_path'],
-                        source_code=source_code,
-                        context7_docs=context7_text[:500]
-                    ))
-                except Exception:
-                    pass  # Skip problematic files
-
-            # Progress update for large batches
-            if len(proven_links) > batch_size:
-                print(f'  [Enrich] Processed {min(i + batch_size, len(proven_links))}/{len(proven_links)} links...')
+        # Group by file so each source file is read once, however many
+        # links point into it
+        links_by_file: dict[str, list[dict]] = {}
+        for link in proven_links:
+            links_by_file.setdefault(link['file_path'], []).append(link)
+
+        source_by_file: dict[str, str] = {}
+        for file_path in links_by_file:
+            source_file = repo_path / file_path
+            try:
+                with open(source_file, 'r', errors='ignore') as f:
+                    source_by_file[file_path] = f.read(2000)
+            except OSError:
+                source_by_file[file_path] = ''
+
+        candidates = [
+            SkillCandidate(
+                concept_name=link['concept'],
+                symbol_name=link['symbol'],
+                file_path=link['file_path'],
+                source_code=source_by_file[link['file_path']],
+                context7_docs=context7_text[:500]
+            )
+            for link in proven_links
+        ]
 
         print(f'[Enrich] Created {len(candidates)} skill candidates from ALL proven links')
 
         return {
             'candidates': candidates,
+            'stage_stats': [self._stage_stat('enrich', len(proven_links), started)],
             'current_step': 'enrich_complete'
         }
     
     def _node_generate(self, state: FactoryState) -> dict:
-        """Generate questions using LLM."""
+        """Generate questions using LLM.
+
+        Requests run on a bounded thread pool (config.max_generate_workers);
+        candidate order is preserved in the output. A candidate whose
+        request raises is logged, dropped and reported in ``errors``.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
         from ..generate.llm_client import GLMClient
         
         print('[Generate] Generating questions with GLM-4.7...')
+        started = time.perf_counter()
         
         llm = GLMClient()
+        candidates = state['candidates']
+        questions: list[str] = [''] * len(candidates)
+        failures: list[tuple[int, str]] = []
+        workers = max(1, self.config.max_generate_workers)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    llm.generate_question,
+                    candidate.source_code,
+                    context=f'Concept: {candidate.concept_name}'
+                ): i
+                for i, candidate in enumerate(candidates)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    questions[i] = future.result()
+                except Exception as e:
+                    logger.warning(f"Question generation failed for {candidates[i].symbol_name}: {e}")
+                    failures.append((i, f'Generate failed for {candidates[i].symbol_name}: {e}'))
+                    continue
+                if questions[i]:
+                    print(f'  ✓ {candidates[i].symbol_name}: {questions[i][:50]}...')
+
         updated_candidates = []
-        
-        for candidate in state['candidates']:
-            question = llm.generate_question(
-                candidate.source_code,
-                context=f'Concept: {candidate.concept_name}'
-            )
-            
+        for candidate, question in zip(candidates, questions):
             if question:
                 candidate.question = question
                 updated_candidates.append(candidate)
-                print(f'  ✓ {candidate.symbol_name}: {question[:50]}...')
         
         print(f'[Generate] Generated {len(updated_candidates)} questions')
+        if failures:
+            print(f'[Generate] {len(failures)} candidates failed')
         
         return {
             'candidates': updated_candidates,
+            'errors': [message for _, message in sorted(failures)],
+            'stage_stats': [self._stage_stat('generate', len(candidates), started)],
             'current_step': 'generate_complete'
         }
     
@@ -298,6 +400,7 @@ class SkillFactory:
         from ..verify.sandbox import BubblewrapSandbox
         
         print('[Verify] Testing in Bubblewrap sandbox...')
+        started = time.perf_counter()
         
         sandbox = BubblewrapSandbox()
         verified_candidates = []
@@ -319,6 +422,7 @@ class SkillFactory:
         
         return {
             'candidates': verified_candidates,
+            'stage_stats': [self._stage_stat('verify', len(state['candidates']), started)],
             'current_step': 'verify_complete'
         }
     
@@ -327,6 +431,7 @@ class SkillFactory:
         from ..store.kuzu_store import KuzuSkillStore, SkillRecord
         
         print('[Store] Saving skills to KuzuDB...')
+        started = time.perf_counter()
         
         store = KuzuSkillStore()
         created = 0
@@ -355,6 +460,7 @@ class SkillFactory:
         
         return {
             'skills_created': created,
+            'stage_stats': [self._stage_stat('store', len(state['candidates']), started)],
             'current_step': 'complete'
         }
     
@@ -376,6 +482,7 @@ class SkillFactory:
             'candidates': [],
             'skills_created': 0,
             'errors': [],
+            'stage_stats': [],
             'current_step': 'start'
         }
         
@@ -383,6 +490,11 @@ class SkillFactory:
         
         print('='*60)
         print(f'COMPLETE: {result["skills_created"]} skills created')
+        for stat in result['stage_stats']:
+            print(
+                f"  {stat['stage']:<10} {stat['items']:>8} items "
+                f"{stat['seconds']:>8.2f}s {stat['items_per_sec']:>10.1f}/s"
+            )
         if result['errors']:
             print(f'Errors: {result["errors"]}')
         print('='*60)
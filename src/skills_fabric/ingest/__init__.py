@@ -39,6 +39,7 @@ from .codewiki import (
     crawl_local_and_store,
 )
 from .context7 import (
+    Context7Cache,
     Context7Client,
     Context7Doc,
     FetchStatus,
@@ -64,6 +65,7 @@ __all__ = [
     "crawl_and_store",
     "crawl_local_and_store",
     # Context7
+    "Context7Cache",
     "Context7Client",
     "Context7Doc",
     "FetchStatus",
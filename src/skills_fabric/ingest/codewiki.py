@@ -27,9 +27,10 @@ import asyncio
 import re
 import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
 from datetime import datetime
 
 from ..core.config import config
@@ -43,6 +44,21 @@ from ..core.database import db
 MAX_CHARS = 24000  # Max characters per concept chunk
 MAX_LINES = 500    # Max lines per concept chunk
 
+# UI artifacts removed by MarkdownProcessor.clean(), in the order applied
+UI_NOISE = [
+    'copy code',
+    'zoom_in',
+    'fullscreen',
+    'filter_center_focus',
+    '[edit]',
+    '[source]',
+    'Skip to content',
+    'Table of contents',
+]
+
+# Fewer local doc files than this are processed in-process
+PARALLEL_MIN_FILES = 16
+
 
 # =============================================================================
 # Data Models
@@ -84,6 +100,68 @@ class CrawlResult:
 # Markdown Processing
 # =============================================================================
 
+_UI_NOISE_PATTERNS = [re.compile(re.escape(p), re.IGNORECASE) for p in UI_NOISE]
+_UI_NOISE_LOWER = [p.lower() for p in UI_NOISE]
+_UI_NOISE_MAX_LEN = max(len(p) for p in UI_NOISE)
+
+# Removing one artifact can join text into another (e.g. "Skip to con[edit]tent"),
+# and each pattern pass can extend that by one artifact length, so artifacts
+# further apart than this never interact
+_UI_NOISE_REACH = (len(UI_NOISE) + 1) * _UI_NOISE_MAX_LEN
+
+_BLANK_RUNS = re.compile(r'\n{3,}')
+_EMPTY_LINK = re.compile(r'\[\s*\]\([^)]*\)')
+_HEADER = re.compile(r'^##(#?) (.*)', re.MULTILINE)  # H2 and H3 header lines
+_PARAGRAPH_BREAK = re.compile(r'(\n{2,})')
+
+
+def _strip_ui_noise(text: str) -> str:
+    """Remove UI_NOISE artifacts, as if each pattern were removed in turn.
+
+    For ASCII text, artifacts are located with str.find on the lowercased
+    text (case-insensitive matching is plain lowercasing there), and only
+    windows around them are cleaned pattern by pattern; the text in between
+    is copied untouched. Other text is cleaned pattern by pattern throughout.
+    """
+    if not text.isascii():
+        return _strip_ui_noise_window(text)
+
+    lowered = text.lower()
+    starts = []
+    for literal in _UI_NOISE_LOWER:
+        index = lowered.find(literal)
+        while index >= 0:
+            starts.append(index)
+            index = lowered.find(literal, index + 1)
+    if not starts:
+        return text
+    starts.sort()
+
+    pieces = []
+    pos = 0
+    window_start = window_end = -1
+    for index in starts:
+        start = max(0, index - _UI_NOISE_REACH)
+        if start > window_end:
+            if window_end >= 0:
+                pieces.append(text[pos:window_start])
+                pieces.append(_strip_ui_noise_window(text[window_start:window_end]))
+                pos = window_end
+            window_start = start
+        window_end = min(len(text), index + _UI_NOISE_MAX_LEN + _UI_NOISE_REACH)
+
+    pieces.append(text[pos:window_start])
+    pieces.append(_strip_ui_noise_window(text[window_start:window_end]))
+    pieces.append(text[window_end:])
+    return ''.join(pieces)
+
+
+def _strip_ui_noise_window(window: str) -> str:
+    for pattern in _UI_NOISE_PATTERNS:
+        window = pattern.sub('', window)
+    return window
+
+
 class MarkdownProcessor:
     """Clean and segment markdown documentation.
 
@@ -105,30 +183,22 @@ class MarkdownProcessor:
         - Excessive whitespace
         - Common navigation elements
         """
-        cleaned = raw_md
-
-        # Remove UI artifacts
-        ui_patterns = [
-            r'copy code',
-            r'zoom_in',
-            r'fullscreen',
-            r'filter_center_focus',
-            r'\[edit\]',
-            r'\[source\]',
-            r'Skip to content',
-            r'Table of contents',
-        ]
-        for pattern in ui_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+        cleaned = _strip_ui_noise(raw_md)
 
         # Normalize whitespace (3+ newlines → 2)
-        cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
+        if '\n\n\n' in cleaned:
+            cleaned = _BLANK_RUNS.sub('\n\n', cleaned)
 
         # Remove empty links
-        cleaned = re.sub(r'\[\s*\]\([^)]*\)', '', cleaned)
+        if '](' in cleaned:
+            cleaned = _EMPTY_LINK.sub('', cleaned)
 
         return cleaned.strip()
 
+    def process(self, raw_md: str, source_doc: str, library: str = "") -> list[Concept]:
+        """Clean raw markdown and segment it into concepts."""
+        return self.segment(self.clean(raw_md), source_doc, library)
+
     def segment(self, clean_md: str, source_doc: str, library: str = "") -> list[Concept]:
         """Segment markdown into concept chunks.
 
@@ -140,47 +210,53 @@ class MarkdownProcessor:
         Returns:
             List of Concept objects
         """
-        concepts = []
+        return list(self.iter_segments(clean_md, source_doc, library))
 
-        # Split by H2 headers
-        parts = re.split(r'(^## .*)', clean_md, flags=re.MULTILINE)
+    def iter_segments(self, clean_md: str, source_doc: str, library: str = "") -> Iterator[Concept]:
+        """Yield concept chunks in document order (see segment()).
+
+        H2 and H3 header lines are found in one scan of the document; blocks
+        and sections are then cut by position rather than re-split.
+        """
+        headers = [
+            (m.start(), bool(m.group(1)), m.group(0), m.group(2))
+            for m in _HEADER.finditer(clean_md)
+        ]
+        h2_starts = [i for i, h in enumerate(headers) if not h[1]]
 
         # Handle introduction (content before first ##)
-        if parts[0].strip():
-            concepts.append(Concept(
+        intro = clean_md[:headers[h2_starts[0]][0]] if h2_starts else clean_md
+        if intro.strip():
+            yield Concept(
                 name="Introduction",
-                content=parts[0].strip(),
+                content=intro.strip(),
                 source_doc=source_doc,
                 library=library,
                 section_path="Introduction"
-            ))
+            )
 
         # Process H2 sections
-        it = iter(parts[1:])
-        for header in it:
-            try:
-                content = next(it)
-            except StopIteration:
-                content = ""
+        for n, i in enumerate(h2_starts):
+            start, _, header, _ = headers[i]
+            j = h2_starts[n + 1] if n + 1 < len(h2_starts) else len(headers)
+            end = headers[j][0] if j < len(headers) else len(clean_md)
 
-            full_block = header + content
+            full_block = clean_md[start:end]
             title = header.strip().lstrip('#').strip()
 
             if self._fits_limits(full_block):
-                concepts.append(Concept(
+                yield Concept(
                     name=title,
                     content=full_block,
                     source_doc=source_doc,
                     library=library,
                     section_path=title
-                ))
+                )
             else:
                 # Split by H3
-                concepts.extend(self._split_by_h3(
-                    title, full_block, source_doc, library
-                ))
-
-        return concepts
+                yield from self._split_by_h3(
+                    title, clean_md, start, end, headers[i + 1:j], source_doc, library
+                )
 
     def _fits_limits(self, text: str) -> bool:
         """Check if text fits within size limits."""
@@ -189,67 +265,85 @@ class MarkdownProcessor:
     def _split_by_h3(
         self,
         h2_title: str,
-        h2_content: str,
+        text: str,
+        start: int,
+        end: int,
+        h3_headers: list[tuple],
         source_doc: str,
         library: str
-    ) -> list[Concept]:
-        """Split an H2 section by H3 headers."""
-        concepts = []
-        parts = re.split(r'(^### .*)', h2_content, flags=re.MULTILINE)
+    ) -> Iterator[Concept]:
+        """Split the H2 section text[start:end] at its H3 headers.
 
-        current_chunk = ""
+        Sections are merged into chunks of up to max_chars; each chunk is
+        named after its first titled H3 header.
+        """
+        # Current chunk is text[chunk_start:chunk_end]; its title is the
+        # first non-empty "### title" in it (None until one is seen)
+        chunk_start = chunk_end = start
+        chunk_title: Optional[str] = None
         current_part = 1
 
         # Handle preamble
-        if parts[0].strip():
-            current_chunk = parts[0]
-
-        it = iter(parts[1:])
-        for header in it:
-            try:
-                content = next(it)
-            except StopIteration:
-                content = ""
+        preamble_end = h3_headers[0][0] if h3_headers else end
+        if text[start:preamble_end].strip():
+            chunk_end = preamble_end
 
-            full_section = header + content
+        for k, (section_start, _, header, rest) in enumerate(h3_headers):
+            section_end = h3_headers[k + 1][0] if k + 1 < len(h3_headers) else end
+            section_title = rest.strip() if rest else None
 
-            if len(current_chunk) + len(full_section) > self.max_chars:
+            if (chunk_end - chunk_start) + (section_end - section_start) > self.max_chars:
                 # Save current chunk
-                if current_chunk:
-                    h3_title = self._extract_h3_title(current_chunk) or f"{h2_title} (Part {current_part})"
-                    concepts.append(Concept(
-                        name=h3_title,
-                        content=current_chunk,
-                        source_doc=source_doc,
-                        library=library,
-                        section_path=f"{h2_title} > {h3_title}"
-                    ))
+                if chunk_end > chunk_start:
+                    yield self._h3_chunk(
+                        h2_title, chunk_title, current_part,
+                        text[chunk_start:chunk_end], source_doc, library
+                    )
                     current_part += 1
 
                 # Check if single section is too big
+                full_section = text[section_start:section_end]
                 if not self._fits_limits(full_section):
-                    concepts.extend(self._split_by_paragraph(
+                    yield from self._split_by_paragraph(
                         header.strip().lstrip('#').strip(),
                         full_section, source_doc, library, h2_title
-                    ))
-                    current_chunk = ""
+                    )
+                    chunk_start = chunk_end = section_end
+                    chunk_title = None
                 else:
-                    current_chunk = full_section
+                    chunk_start, chunk_end = section_start, section_end
+                    chunk_title = section_title
             else:
-                current_chunk += full_section
+                if chunk_end == chunk_start:
+                    chunk_start = section_start
+                chunk_end = section_end
+                if chunk_title is None:
+                    chunk_title = section_title
 
         # Save remainder
-        if current_chunk:
-            h3_title = self._extract_h3_title(current_chunk) or f"{h2_title} (Part {current_part})"
-            concepts.append(Concept(
-                name=h3_title,
-                content=current_chunk,
-                source_doc=source_doc,
-                library=library,
-                section_path=f"{h2_title} > {h3_title}"
-            ))
+        if chunk_end > chunk_start:
+            yield self._h3_chunk(
+                h2_title, chunk_title, current_part,
+                text[chunk_start:chunk_end], source_doc, library
+            )
 
-        return concepts
+    def _h3_chunk(
+        self,
+        h2_title: str,
+        chunk_title: Optional[str],
+        part: int,
+        content: str,
+        source_doc: str,
+        library: str
+    ) -> Concept:
+        h3_title = chunk_title or f"{h2_title} (Part {part})"
+        return Concept(
+            name=h3_title,
+            content=content,
+            source_doc=source_doc,
+            library=library,
+            section_path=f"{h2_title} > {h3_title}"
+        )
 
     def _split_by_paragraph(
         self,
@@ -261,7 +355,7 @@ class MarkdownProcessor:
     ) -> list[Concept]:
         """Split content by paragraphs as last resort."""
         concepts = []
-        paragraphs = re.split(r'(\n{2,})', content)
+        paragraphs = _PARAGRAPH_BREAK.split(content)
 
         current_chunk = ""
         current_part = 1
@@ -302,11 +396,6 @@ class MarkdownProcessor:
 
         return concepts
 
-    def _extract_h3_title(self, content: str) -> Optional[str]:
-        """Extract first H3 title from content."""
-        match = re.search(r'^### (.+)$', content, re.MULTILINE)
-        return match.group(1).strip() if match else None
-
 
 # =============================================================================
 # CodeWiki Crawler
@@ -411,7 +500,8 @@ class CodeWikiCrawler:
         self,
         repo_path: Path,
         library: str = "",
-        doc_patterns: list[str] = None
+        doc_patterns: list[str] = None,
+        max_workers: Optional[int] = None
     ) -> list[Concept]:
         """Crawl documentation from a local repository.
 
@@ -425,15 +515,16 @@ class CodeWikiCrawler:
             repo_path: Path to cloned repository
             library: Library name for metadata
             doc_patterns: Additional glob patterns for docs
+            max_workers: Worker processes for cleaning and segmenting
+                (default: CPU count; 1 processes in-process)
 
         Returns:
-            List of Concept objects
+            List of Concept objects, in file path order
         """
-        concepts = []
         repo_path = Path(repo_path)
 
         if not repo_path.exists():
-            return concepts
+            return []
 
         # Default patterns
         patterns = doc_patterns or [
@@ -457,28 +548,28 @@ class CodeWikiCrawler:
             "venv", "env", ".venv", "dist", "build",
             "CHANGELOG", "CONTRIBUTING", "LICENSE"
         ]
+        jobs = [
+            (str(doc_file), str(doc_file.relative_to(repo_path)))
+            for doc_file in sorted(doc_files)
+            if not any(excl in str(doc_file) for excl in exclude_patterns)
+        ]
 
-        for doc_file in sorted(doc_files):
-            # Skip excluded paths
-            if any(excl in str(doc_file) for excl in exclude_patterns):
-                continue
-
-            try:
-                content = doc_file.read_text(encoding='utf-8')
-                if len(content.strip()) < 100:  # Skip tiny files
-                    continue
-
-                # Clean and segment
-                clean_md = self.processor.clean(content)
-                source_doc = str(doc_file.relative_to(repo_path))
-
-                file_concepts = self.processor.segment(clean_md, source_doc, library)
-                concepts.extend(file_concepts)
+        processor = self.processor
+        workers = max(1, max_workers or os.cpu_count() or 1)
+        if workers == 1 or len(jobs) < PARALLEL_MIN_FILES:
+            results = [_process_doc_file(processor, path, source_doc, library) for path, source_doc in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(
+                    _process_doc_file,
+                    [processor] * len(jobs),
+                    [path for path, _ in jobs],
+                    [source_doc for _, source_doc in jobs],
+                    [library] * len(jobs),
+                    chunksize=max(1, len(jobs) // (workers * 4)),
+                ))
 
-            except Exception:
-                continue  # Skip files that can't be read
-
-        return concepts
+        return [concept for file_concepts in results for concept in file_concepts]
 
     async def crawl_github_wiki(self, repo_url: str) -> CrawlResult:
         """Crawl a GitHub repository's wiki.
@@ -561,6 +652,21 @@ class CodeWikiCrawler:
         return result[0]["cnt"] if result else 0
 
 
+def _process_doc_file(
+    processor: MarkdownProcessor, path: str, source_doc: str, library: str
+) -> list[Concept]:
+    """Read, clean and segment one local doc file (in a worker process)."""
+    try:
+        content = Path(path).read_text(encoding='utf-8')
+        if len(content.strip()) < 100:  # Skip tiny files
+            return []
+
+        # Clean and segment
+        return processor.process(content, source_doc, library)
+    except Exception:
+        return []  # Skip files that can't be read
+
+
 # =============================================================================
 # Integrated Ingestion Pipeline
 # =============================================================================
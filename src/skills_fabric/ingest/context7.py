@@ -31,22 +31,40 @@ BMAD C.O.R.E. Principles:
 - Reflection: Honest error reporting, graceful fallbacks
 - Engine: Systematic API interaction with retries
 """
+import asyncio
+import contextlib
+import contextvars
 import json
 import hashlib
 import requests
 import re
+import sqlite3
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Iterator, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from requests.adapters import HTTPAdapter
+
 from skills_fabric.observability.logging import get_logger
 
 logger = get_logger("ingest.context7")
 
+# Try to import httpx for the async fetch path, fall back to requests in threads
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Pooled httpx client for the async call in progress (set by _async_session)
+_ASYNC_CLIENT: contextvars.ContextVar = contextvars.ContextVar("context7_async_client", default=None)
+
 
 class FetchStatus(Enum):
     """Status of a fetch operation."""
@@ -130,7 +148,7 @@ class FetchResult:
     query: str
     status: FetchStatus
     doc: Optional[Context7Doc] = None
-    cache_file: Optional[Path] = None
+    cache_file: Optional[Path] = None  # The cache store holding the response
     error: Optional[str] = None
     duration_ms: float = 0.0
 
@@ -227,6 +245,357 @@ class BatchFetchResult:
         return f"Library '{library_name}' is not available in Context7. This is expected for libraries not in the Context7 index."
 
 
+class Context7Cache:
+    """SQLite store for cached Context7 responses.
+
+    One row per (library_name, query hash), with the response text
+    zlib-compressed. A per-library summary table is kept up to date by
+    triggers, so statistics never scan the responses. Entries older than
+    ``ttl`` seconds are dropped, and once stored (compressed) bytes exceed
+    ``max_bytes`` the oldest entries are evicted first.
+    """
+
+    FILENAME = "context7_cache.sqlite3"
+    _PAGE_SIZE = 256
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            library_name TEXT NOT NULL,
+            query_hash TEXT NOT NULL,
+            query TEXT NOT NULL,
+            library_id TEXT,
+            code_blocks INTEGER NOT NULL DEFAULT 0,
+            fetched_at TEXT,
+            stored_at REAL NOT NULL,
+            size INTEGER NOT NULL,
+            stored_size INTEGER NOT NULL,
+            payload BLOB NOT NULL,
+            UNIQUE (library_name, query_hash)
+        );
+        CREATE INDEX IF NOT EXISTS idx_responses_stored_at ON responses(stored_at);
+        CREATE TABLE IF NOT EXISTS libraries (
+            library_name TEXT PRIMARY KEY,
+            entries INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            stored_size INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS library_ids (
+            cache_key TEXT PRIMARY KEY,
+            library_id TEXT NOT NULL,
+            stored_at REAL NOT NULL
+        );
+        CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN
+            INSERT INTO libraries VALUES (NEW.library_name, 1, NEW.size, NEW.stored_size)
+            ON CONFLICT (library_name) DO UPDATE SET
+                entries = entries + 1,
+                size = size + excluded.size,
+                stored_size = stored_size + excluded.stored_size;
+        END;
+        CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE ON responses BEGIN
+            UPDATE libraries SET
+                size = size - OLD.size + NEW.size,
+                stored_size = stored_size - OLD.stored_size + NEW.stored_size
+            WHERE library_name = NEW.library_name;
+        END;
+        CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN
+            UPDATE libraries SET
+                entries = entries - 1,
+                size = size - OLD.size,
+                stored_size = stored_size - OLD.stored_size
+            WHERE library_name = OLD.library_name;
+            DELETE FROM libraries WHERE library_name = OLD.library_name AND entries <= 0;
+        END;
+    """
+
+    _COLUMNS = "library_name, query_hash, query, library_id, code_blocks, fetched_at"
+
+    def __init__(self, path: Path, ttl: float = 0, max_bytes: int = 0):
+        """Open (or create) the store.
+
+        Args:
+            path: SQLite database file
+            ttl: Seconds an entry stays valid (0 means no expiry)
+            max_bytes: Stored-size budget in bytes (0 means unbounded)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        with self._lock, self._conn:
+            self._expire()
+
+    @staticmethod
+    def query_hash(query: str) -> str:
+        return hashlib.md5(query.encode()).hexdigest()
+
+    def get(self, library_name: str, query: str) -> Optional[dict]:
+        """Return the cached entry for (library_name, query), if still valid."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS}, payload FROM responses "
+                "WHERE library_name = ? AND query_hash = ? AND stored_at >= ?",
+                (library_name, self.query_hash(query), self._cutoff()),
+            ).fetchone()
+        return self._entry(row) if row else None
+
+    def put(self, entry: dict) -> None:
+        """Store an entry (the same keys get() returns), replacing any existing one."""
+        with self._lock, self._conn:
+            self._insert([self._row(entry, time.time())], replace=True)
+            self._expire()
+            self._evict()
+
+    def iter_entries(self, library_name: Optional[str] = None) -> Iterator[dict]:
+        """Yield valid entries in (library_name, query hash) order.
+
+        Entries are read a page at a time, each page resuming from the last
+        key with an index seek; the lock is not held between pages.
+        """
+        if library_name is None:
+            scope, resume_key, params = "", "(library_name, query_hash)", ()
+        else:
+            scope, resume_key, params = "library_name = ? AND ", "query_hash", (library_name,)
+        last: tuple = ()
+        while True:
+            resume = f"{resume_key} > ({', '.join('?' * len(last))}) AND " if last else ""
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {self._COLUMNS}, payload FROM responses "
+                    f"WHERE {scope}{resume}stored_at >= ? "
+                    "ORDER BY library_name, query_hash LIMIT ?",
+                    (*params, *last, self._cutoff(), self._PAGE_SIZE),
+                ).fetchall()
+            for row in rows:
+                yield self._entry(row)
+            if len(rows) < self._PAGE_SIZE:
+                return
+            last = rows[-1][:2] if library_name is None else rows[-1][1:2]
+
+    def get_library_id(self, cache_key: str) -> Optional[str]:
+        """Return a persisted library ID resolution, if still valid."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT library_id FROM library_ids WHERE cache_key = ? AND stored_at >= ?",
+                (cache_key, self._cutoff()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put_library_id(self, cache_key: str, library_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO library_ids (cache_key, library_id, stored_at) VALUES (?, ?, ?)",
+                (cache_key, library_id, time.time()),
+            )
+
+    def stats(self) -> dict:
+        """Entry count and sizes, overall and per library (from the summary table)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT library_name, entries, size, stored_size FROM libraries"
+            ).fetchall()
+        return {
+            "entries": sum(r[1] for r in rows),
+            "size_bytes": sum(r[2] for r in rows),
+            "stored_size_bytes": sum(r[3] for r in rows),
+            "libraries": {r[0]: r[1] for r in rows},
+        }
+
+    def delete(self, library_name: Optional[str] = None) -> int:
+        """Delete all entries, or those for one library. Returns the number deleted."""
+        with self._lock, self._conn:
+            if library_name is None:
+                cursor = self._conn.execute("DELETE FROM responses")
+            else:
+                cursor = self._conn.execute(
+                    "DELETE FROM responses WHERE library_name = ?", (library_name,)
+                )
+            return cursor.rowcount
+
+    def migrate_json(self, directory: Path) -> int:
+        """Import legacy one-file-per-response JSON caches from directory.
+
+        Imported files are deleted once the import has committed; entries
+        already in the store are kept. Unreadable files are left in place.
+
+        Returns:
+            Number of files imported
+        """
+        rows, migrated = [], []
+        for f in sorted(Path(directory).glob("*.json")):
+            try:
+                with open(f, encoding="utf-8") as fp:
+                    data = json.load(fp)
+                rows.append(self._row(data, f.stat().st_mtime))
+                migrated.append(f)
+            except (json.JSONDecodeError, IOError, KeyError, TypeError, AttributeError) as e:
+                logger.warning(f"Could not migrate cache file {f.name}: {e}")
+        if not rows:
+            return 0
+
+        with self._lock, self._conn:
+            self._insert(rows, replace=False)
+            self._expire()
+            self._evict()
+        for f in migrated:
+            try:
+                f.unlink()
+            except OSError as e:
+                logger.warning(f"Could not remove migrated cache file {f.name}: {e}")
+        logger.info(f"Migrated {len(rows)} cached Context7 responses into {self.path.name}")
+        return len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _row(self, entry: dict, stored_at: float) -> tuple:
+        response = (entry.get("response") or "").encode("utf-8")
+        payload = zlib.compress(response)
+        return (
+            entry["library_name"], self.query_hash(entry["query"]), entry["query"],
+            entry.get("library_id"), entry.get("code_blocks", 0), entry.get("fetched_at"),
+            stored_at, len(response), len(payload), payload,
+        )
+
+    def _entry(self, row: tuple) -> dict:
+        library_name, _, query, library_id, code_blocks, fetched_at, payload = row
+        return {
+            "library_id": library_id,
+            "library_name": library_name,
+            "query": query,
+            "response": zlib.decompress(payload).decode("utf-8"),
+            "code_blocks": code_blocks,
+            "fetched_at": fetched_at,
+        }
+
+    def _insert(self, rows: list[tuple], replace: bool) -> None:
+        conflict = (
+            "DO UPDATE SET query = excluded.query, library_id = excluded.library_id, "
+            "code_blocks = excluded.code_blocks, fetched_at = excluded.fetched_at, "
+            "stored_at = excluded.stored_at, size = excluded.size, "
+            "stored_size = excluded.stored_size, payload = excluded.payload"
+            if replace else "DO NOTHING"
+        )
+        self._conn.executemany(
+            f"INSERT INTO responses ({self._COLUMNS}, stored_at, size, stored_size, payload) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            f"ON CONFLICT (library_name, query_hash) {conflict}",
+            rows,
+        )
+
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl if self.ttl > 0 else float("-inf")
+
+    def _expire(self) -> None:
+        if self.ttl > 0:
+            self._conn.execute("DELETE FROM responses WHERE stored_at < ?", (self._cutoff(),))
+            self._conn.execute("DELETE FROM library_ids WHERE stored_at < ?", (self._cutoff(),))
+
+    def _evict(self) -> None:
+        """Drop the oldest entries while stored bytes exceed max_bytes."""
+        if self.max_bytes <= 0:
+            return
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(stored_size), 0) FROM libraries"
+        ).fetchone()
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        cursor = self._conn.execute("SELECT rowid, stored_size FROM responses ORDER BY stored_at")
+        while excess > 0:
+            rows = cursor.fetchmany(self._PAGE_SIZE)
+            if not rows:
+                break
+            for rowid, stored_size in rows:
+                victims.append((rowid,))
+                excess -= stored_size
+                if excess <= 0:
+                    break
+        cursor.close()
+        self._conn.executemany("DELETE FROM responses WHERE rowid = ?", victims)
+
+
+class _AdaptiveLimit:
+    """Concurrency limit for Context7 requests that backs off on rate limits.
+
+    AIMD: a 429 halves the limit, and each run of ``limit`` successful
+    requests raises it by one, up to ``maximum``. acquire() returns the
+    current decrease epoch; a 429 on a request that started before the
+    last decrease is part of the same burst and does not halve again.
+    Threads wait in acquire(); coroutines wait in acquire_async() and are
+    woken thread-safely.
+    """
+
+    def __init__(self, maximum: int):
+        self.maximum = max(1, maximum)
+        self.limit = self.maximum
+        self._in_flight = 0
+        self._successes = 0
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def acquire(self) -> int:
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+            return self._epoch
+
+    async def acquire_async(self) -> int:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return self._epoch
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+                raise
+
+    def release(self, epoch: int, throttled: bool = False) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if throttled:
+                if epoch == self._epoch:
+                    self.limit = max(1, self.limit // 2)
+                    self._epoch += 1
+                self._successes = 0
+            else:
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.maximum:
+                    self.limit += 1
+                    self._successes = 0
+            self._cond.notify_all()
+            waiters, self._waiters = self._waiters, []
+        for loop, waiter in waiters:
+            if loop.is_closed():
+                continue
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                pass  # Loop closed since the check
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 class Context7Client:
     """HTTP client for Context7 MCP API.
 
@@ -251,6 +620,9 @@ class Context7Client:
         # Iterate over all cached docs (memory-efficient)
         for doc in client.iter_cached():
             process(doc)
+
+        # Async fan-out over pooled connections
+        results = await client.fetch_batch_async("langgraph", queries)
     """
 
     # Default queries for comprehensive coverage
@@ -271,6 +643,9 @@ class Context7Client:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         timeout: int = 30,
+        cache_ttl: Optional[float] = None,
+        max_cache_bytes: Optional[int] = None,
+        max_connections: int = 8,
     ):
         from ..core.config import config
         self.url = config.context7_url
@@ -287,9 +662,35 @@ class Context7Client:
         # Ensure cache directory exists
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Track resolved library IDs for caching
+        # Cached responses live in one SQLite store; older clients wrote one
+        # JSON file per response, which are imported (once) on open
+        self._cache = Context7Cache(
+            self.cache_dir / Context7Cache.FILENAME,
+            ttl=config.context7_cache_ttl if cache_ttl is None else cache_ttl,
+            max_bytes=config.context7_cache_max_bytes if max_cache_bytes is None else max_cache_bytes,
+        )
+        self._cache.migrate_json(self.cache_dir)
+
+        # Track resolved library IDs for caching (resolved IDs are also
+        # persisted in the cache store)
         self._library_id_cache: dict[str, Optional[str]] = {}
 
+        # Keep-alive connection pool, shared by all threads; in-flight
+        # requests are capped by an adaptive limit that backs off on 429s
+        self.max_connections = max_connections
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._limit = _AdaptiveLimit(max_connections)
+
+        # Identical concurrent fetches share one call: (library, query,
+        # force_refresh) -> Future (threads) or Task (coroutines)
+        self._in_flight: dict[tuple, Future] = {}
+        self._in_flight_lock = threading.Lock()
+        self._async_in_flight: dict[tuple, asyncio.Task] = {}
+
         # Statistics
         self._stats = {
             "requests": 0,
@@ -299,6 +700,17 @@ class Context7Client:
             "cache_hits": 0,
         }
 
+    def close(self) -> None:
+        """Close pooled connections and the cache store."""
+        self._session.close()
+        self._cache.close()
+
+    def __enter__(self) -> "Context7Client":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _request_with_retry(
         self,
         payload: dict,
@@ -317,65 +729,163 @@ class Context7Client:
 
         for attempt in range(self.max_retries):
             self._stats["requests"] += 1
+            status = None
 
+            epoch = self._limit.acquire()
             try:
-                resp = requests.post(
-                    self.url,
-                    json=payload,
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
-
-                # Handle rate limiting
-                if resp.status_code == 429:
-                    retry_after = int(resp.headers.get("Retry-After", self.retry_delay * (attempt + 1)))
-                    logger.warning(
-                        f"Rate limited on {operation}, waiting {retry_after}s",
-                        extra={"attempt": attempt + 1}
-                    )
-                    time.sleep(retry_after)
-                    self._stats["retries"] += 1
-                    continue
-
-                resp.raise_for_status()
-                data = resp.json()
-
-                if "error" in data:
-                    last_error = data["error"].get("message", "Unknown error")
-                    logger.warning(
-                        f"API error on {operation}: {last_error}",
-                        extra={"attempt": attempt + 1}
+                resp = self._session.post(self.url, json=payload, timeout=self.timeout)
+                status = resp.status_code
+                if status == 429:
+                    outcome = self._attempt_outcome(
+                        attempt, operation, rate_limited=True, retry_after=resp.headers.get("Retry-After")
                     )
-                    if attempt < self.max_retries - 1:
-                        time.sleep(self.retry_delay * (attempt + 1))
-                        self._stats["retries"] += 1
-                        continue
-                    return None
+                else:
+                    resp.raise_for_status()
+                    outcome = self._attempt_outcome(attempt, operation, data=resp.json())
+            except requests.exceptions.Timeout:
+                outcome = self._attempt_outcome(attempt, operation, error="Request timeout")
+            except requests.exceptions.RequestException as e:
+                outcome = self._attempt_outcome(attempt, operation, error=str(e))
+            finally:
+                self._limit.release(epoch, throttled=status == 429)
 
-                self._stats["successful"] += 1
+            done, data, wait, error = outcome
+            if done:
                 return data
+            last_error = error or last_error
+            if wait:
+                time.sleep(wait)
 
-            except requests.exceptions.Timeout:
-                last_error = "Request timeout"
-                logger.warning(
-                    f"Timeout on {operation}",
-                    extra={"attempt": attempt + 1}
-                )
-            except requests.exceptions.RequestException as e:
-                last_error = str(e)
-                logger.warning(
-                    f"Request error on {operation}: {e}",
-                    extra={"attempt": attempt + 1}
-                )
+        self._stats["failed"] += 1
+        logger.error(f"Failed {operation} after {self.max_retries} attempts: {last_error}")
+        return None
+
+    async def _request_with_retry_async(
+        self,
+        payload: dict,
+        operation: str = "request"
+    ) -> Optional[dict]:
+        """Async counterpart of _request_with_retry() on the pooled httpx client.
+
+        Without httpx, the blocking request runs in a worker thread.
+        """
+        client = _ASYNC_CLIENT.get()
+        if client is None:
+            return await asyncio.to_thread(self._request_with_retry, payload, operation)
+
+        last_error = None
 
-            if attempt < self.max_retries - 1:
-                time.sleep(self.retry_delay * (attempt + 1))
-                self._stats["retries"] += 1
+        for attempt in range(self.max_retries):
+            self._stats["requests"] += 1
+            status = None
+
+            epoch = await self._limit.acquire_async()
+            try:
+                resp = await client.post(self.url, json=payload)
+                status = resp.status_code
+                if status == 429:
+                    outcome = self._attempt_outcome(
+                        attempt, operation, rate_limited=True, retry_after=resp.headers.get("Retry-After")
+                    )
+                else:
+                    resp.raise_for_status()
+                    outcome = self._attempt_outcome(attempt, operation, data=resp.json())
+            except httpx.TimeoutException:
+                outcome = self._attempt_outcome(attempt, operation, error="Request timeout")
+            except (httpx.HTTPError, ValueError) as e:
+                outcome = self._attempt_outcome(attempt, operation, error=str(e))
+            finally:
+                self._limit.release(epoch, throttled=status == 429)
+
+            done, data, wait, error = outcome
+            if done:
+                return data
+            last_error = error or last_error
+            if wait:
+                await asyncio.sleep(wait)
 
         self._stats["failed"] += 1
         logger.error(f"Failed {operation} after {self.max_retries} attempts: {last_error}")
         return None
 
+    def _attempt_outcome(
+        self,
+        attempt: int,
+        operation: str,
+        data: Optional[dict] = None,
+        error: Optional[str] = None,
+        rate_limited: bool = False,
+        retry_after: Optional[str] = None,
+    ) -> tuple[bool, Optional[dict], float, Optional[str]]:
+        """Apply the retry policy to one attempt, for either transport.
+
+        The attempt either got a 429 (rate_limited, with its Retry-After
+        header if any), failed in transport (error), or returned data.
+
+        Returns:
+            (done, data, seconds to wait before the next attempt, error)
+        """
+        last_attempt = attempt >= self.max_retries - 1
+        backoff = self.retry_delay * (attempt + 1)
+
+        # Handle rate limiting
+        if rate_limited:
+            try:
+                wait = float(retry_after) if retry_after is not None else backoff
+            except ValueError:
+                wait = backoff
+            logger.warning(
+                f"Rate limited on {operation}, waiting {wait}s",
+                extra={"attempt": attempt + 1}
+            )
+            self._stats["retries"] += 1
+            return False, None, wait, "Rate limited"
+
+        if error is not None:
+            logger.warning(
+                f"Request error on {operation}: {error}",
+                extra={"attempt": attempt + 1}
+            )
+            if last_attempt:
+                return False, None, 0.0, error
+            self._stats["retries"] += 1
+            return False, None, backoff, error
+
+        if isinstance(data, dict) and "error" in data:
+            error = data["error"].get("message", "Unknown error")
+            logger.warning(
+                f"API error on {operation}: {error}",
+                extra={"attempt": attempt + 1}
+            )
+            if last_attempt:
+                return True, None, 0.0, error
+            self._stats["retries"] += 1
+            return False, None, backoff, error
+
+        self._stats["successful"] += 1
+        return True, data, 0.0, None
+
+    @contextlib.asynccontextmanager
+    async def _async_session(self):
+        """Make a pooled httpx client current for the async calls inside.
+
+        Reuses the client of an enclosing call; tasks started inside inherit
+        it through the context.
+        """
+        if _ASYNC_CLIENT.get() is not None or not HTTPX_AVAILABLE:
+            yield
+            return
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+        )
+        async with httpx.AsyncClient(headers=self.headers, timeout=self.timeout, limits=limits) as client:
+            token = _ASYNC_CLIENT.set(client)
+            try:
+                yield
+            finally:
+                _ASYNC_CLIENT.reset(token)
+
     def resolve_library_id_detailed(
         self,
         library_name: str,
@@ -393,7 +903,33 @@ class Context7Client:
         Returns:
             LibraryResolutionResult with status and library_id (if found)
         """
-        # Check cache first
+        cached = self._cached_resolution(library_name, query)
+        if cached is not None:
+            return cached
+
+        data = self._request_with_retry(
+            self._resolve_payload(library_name, query), f"resolve-library-id({library_name})"
+        )
+        return self._interpret_resolution(library_name, query, data)
+
+    async def resolve_library_id_async(
+        self,
+        library_name: str,
+        query: str = "documentation"
+    ) -> LibraryResolutionResult:
+        """Async version of resolve_library_id_detailed()."""
+        cached = self._cached_resolution(library_name, query)
+        if cached is not None:
+            return cached
+
+        async with self._async_session():
+            data = await self._request_with_retry_async(
+                self._resolve_payload(library_name, query), f"resolve-library-id({library_name})"
+            )
+        return self._interpret_resolution(library_name, query, data)
+
+    def _cached_resolution(self, library_name: str, query: str) -> Optional[LibraryResolutionResult]:
+        """Resolution from the in-memory or persisted library ID cache, if any."""
         cache_key = f"{library_name}:{query}"
         if cache_key in self._library_id_cache:
             cached = self._library_id_cache[cache_key]
@@ -416,7 +952,26 @@ class Context7Client:
                     message="Library not found (cached result)"
                 )
 
-        payload = {
+        try:
+            lib_id = self._cache.get_library_id(cache_key)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to load persisted library ID for {library_name}: {e}")
+            return None
+        if lib_id is None:
+            return None
+        self._library_id_cache[cache_key] = lib_id
+        self._stats["cache_hits"] += 1
+        logger.debug(f"Library ID cache hit (persisted): {library_name} -> {lib_id}")
+        return LibraryResolutionResult(
+            library_name=library_name,
+            status=LibraryResolutionStatus.CACHED,
+            library_id=lib_id,
+            query=query,
+            message="Retrieved from cache"
+        )
+
+    def _resolve_payload(self, library_name: str, query: str) -> dict:
+        return {
             "jsonrpc": "2.0",
             "method": "tools/call",
             "params": {
@@ -426,7 +981,14 @@ class Context7Client:
             "id": 1
         }
 
-        data = self._request_with_retry(payload, f"resolve-library-id({library_name})")
+    def _interpret_resolution(
+        self,
+        library_name: str,
+        query: str,
+        data: Optional[dict]
+    ) -> LibraryResolutionResult:
+        """Turn a resolve-library-id response (None on failure) into a result."""
+        cache_key = f"{library_name}:{query}"
 
         # Handle API errors (network, timeout, etc.)
         if data is None:
@@ -510,6 +1072,10 @@ class Context7Client:
             if match:
                 lib_id = match.group()
                 self._library_id_cache[cache_key] = lib_id
+                try:
+                    self._cache.put_library_id(cache_key, lib_id)
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not persist library ID for {library_name}: {e}")
                 logger.info(
                     f"Resolved library: {library_name} -> {lib_id}",
                     extra={"library": library_name, "library_id": lib_id}
@@ -593,11 +1159,32 @@ class Context7Client:
         Returns:
             Documentation content or None
         """
+        data = self._request_with_retry(
+            self._docs_payload(library_id, query, max_tokens),
+            f"get-library-docs({library_id}, {query[:30]}...)"
+        )
+        return self._interpret_docs(data)
+
+    async def get_library_docs_async(
+        self,
+        library_id: str,
+        query: str,
+        max_tokens: Optional[int] = None
+    ) -> Optional[str]:
+        """Async version of get_library_docs()."""
+        async with self._async_session():
+            data = await self._request_with_retry_async(
+                self._docs_payload(library_id, query, max_tokens),
+                f"get-library-docs({library_id}, {query[:30]}...)"
+            )
+        return self._interpret_docs(data)
+
+    def _docs_payload(self, library_id: str, query: str, max_tokens: Optional[int] = None) -> dict:
         arguments = {"libraryId": library_id, "query": query}
         if max_tokens:
             arguments["maxTokens"] = max_tokens
 
-        payload = {
+        return {
             "jsonrpc": "2.0",
             "method": "tools/call",
             "params": {
@@ -607,8 +1194,7 @@ class Context7Client:
             "id": 2
         }
 
-        data = self._request_with_retry(payload, f"get-library-docs({library_id}, {query[:30]}...)")
-
+    def _interpret_docs(self, data: Optional[dict]) -> Optional[str]:
         if data and "result" in data:
             try:
                 return data["result"]["content"][0]["text"]
@@ -665,7 +1251,7 @@ class Context7Client:
                 extra={
                     "library": library_name,
                     "status": resolution.status.value,
-                    "message": resolution.message
+                    "resolution_message": resolution.message
                 }
             )
             return resolution, None
@@ -800,91 +1386,165 @@ class Context7Client:
             query: Query string
             force_refresh: If True, bypass cache and re-fetch
 
+        Concurrent calls for the same (library_name, query) share one fetch.
+
         Returns:
             FetchResult with status and detailed information
         """
-        start_time = time.time()
-
-        # Check if already cached
-        hash_id = hashlib.md5(f"{library_name}{query}".encode()).hexdigest()[:12]
-        filename = f"{library_name}_{hash_id}.json"
-        cache_file = self.cache_dir / filename
+        key = (library_name, query, force_refresh)
+        with self._in_flight_lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = Future()
+        if not leader:
+            return call.result()
 
-        if cache_file.exists() and not force_refresh:
-            self._stats["cache_hits"] += 1
-            logger.debug(f"Cache hit: {cache_file.name}")
-            try:
-                with open(cache_file, encoding="utf-8") as f:
-                    data = json.load(f)
-                doc = Context7Doc(
-                    title=f"{library_name}: {query}",
-                    content=data.get("response", ""),
-                    source_url=f"context7://{library_name}/{query}",
-                    code_blocks=data.get("code_blocks", 0),
-                    library_id=data.get("library_id"),
-                    query=query,
-                    fetched_at=data.get("fetched_at")
-                )
-                return FetchResult(
-                    library_name=library_name,
-                    query=query,
-                    status=FetchStatus.CACHED,
-                    doc=doc,
-                    cache_file=cache_file,
-                    duration_ms=(time.time() - start_time) * 1000
-                )
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to load cached file {cache_file.name}: {e}")
-                # Continue to fetch fresh
+        try:
+            result = self._fetch_and_cache(library_name, query, force_refresh)
+            call.set_result(result)
+            return result
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+    def _fetch_and_cache(self, library_name: str, query: str, force_refresh: bool) -> FetchResult:
+        start_time = time.time()
+        if not force_refresh:
+            cached = self._cached_fetch(library_name, query, start_time)
+            if cached is not None:
+                return cached
 
         # Resolve library ID with detailed status
         resolution = self.resolve_library_id_detailed(library_name, query)
-
-        # Handle library not found gracefully
         if not resolution.is_success:
-            duration_ms = (time.time() - start_time) * 1000
+            return self._unresolved_fetch(library_name, query, resolution, start_time)
 
-            # Determine appropriate status
-            if resolution.is_not_found:
-                logger.warning(
-                    f"Library not found in Context7: {library_name}",
-                    extra={
-                        "library": library_name,
-                        "query": query,
-                        "resolution_status": resolution.status.value,
-                        "message": resolution.message
-                    }
-                )
-                return FetchResult(
-                    library_name=library_name,
-                    query=query,
-                    status=FetchStatus.LIBRARY_NOT_FOUND,
-                    error=resolution.message,
-                    duration_ms=duration_ms
-                )
-            else:
-                # API error or invalid response
-                logger.error(
-                    f"Failed to resolve library: {library_name}",
-                    extra={
-                        "library": library_name,
-                        "query": query,
-                        "resolution_status": resolution.status.value,
-                        "message": resolution.message
-                    }
-                )
-                return FetchResult(
-                    library_name=library_name,
-                    query=query,
-                    status=FetchStatus.FAILED,
-                    error=resolution.message,
-                    duration_ms=duration_ms
-                )
+        # Get docs using get-library-docs (per spec requirement)
+        docs = self.get_library_docs(resolution.library_id, query)
+        return self._stored_fetch(library_name, query, resolution.library_id, docs, start_time)
 
-        lib_id = resolution.library_id
+    async def fetch_and_cache_async(
+        self,
+        library_name: str,
+        query: str,
+        force_refresh: bool = False
+    ) -> FetchResult:
+        """Async version of fetch_and_cache_detailed().
 
-        # Get docs using get-library-docs (per spec requirement)
-        docs = self.get_library_docs(lib_id, query)
+        Concurrent calls for the same (library_name, query) on one event loop
+        share one fetch.
+        """
+        loop = asyncio.get_running_loop()
+        key = (library_name, query, force_refresh, loop)
+        task = self._async_in_flight.get(key)
+        if task is None:
+            task = loop.create_task(self._fetch_and_cache_async(library_name, query, force_refresh))
+            self._async_in_flight[key] = task
+            task.add_done_callback(lambda _: self._async_in_flight.pop(key, None))
+        # Shielded, so one caller's cancellation does not cancel the others
+        return await asyncio.shield(task)
+
+    async def _fetch_and_cache_async(self, library_name: str, query: str, force_refresh: bool) -> FetchResult:
+        start_time = time.time()
+        if not force_refresh:
+            cached = self._cached_fetch(library_name, query, start_time)
+            if cached is not None:
+                return cached
+
+        async with self._async_session():
+            resolution = await self.resolve_library_id_async(library_name, query)
+            if not resolution.is_success:
+                return self._unresolved_fetch(library_name, query, resolution, start_time)
+
+            docs = await self.get_library_docs_async(resolution.library_id, query)
+        return self._stored_fetch(library_name, query, resolution.library_id, docs, start_time)
+
+    def _cached_fetch(self, library_name: str, query: str, start_time: float) -> Optional[FetchResult]:
+        """CACHED result for (library_name, query), or None on a cache miss."""
+        data = self._cache_get(library_name, query)
+        if data is not None:
+            self._stats["cache_hits"] += 1
+            logger.debug(f"Cache hit: {library_name}/{query[:50]}")
+            doc = Context7Doc(
+                title=f"{library_name}: {query}",
+                content=data.get("response", ""),
+                source_url=f"context7://{library_name}/{query}",
+                code_blocks=data.get("code_blocks", 0),
+                library_id=data.get("library_id"),
+                query=query,
+                fetched_at=data.get("fetched_at")
+            )
+            return FetchResult(
+                library_name=library_name,
+                query=query,
+                status=FetchStatus.CACHED,
+                doc=doc,
+                cache_file=self._cache.path,
+                duration_ms=(time.time() - start_time) * 1000
+            )
+
+        return None
+
+    def _unresolved_fetch(
+        self,
+        library_name: str,
+        query: str,
+        resolution: LibraryResolutionResult,
+        start_time: float
+    ) -> FetchResult:
+        """Result for a library that could not be resolved."""
+        duration_ms = (time.time() - start_time) * 1000
+
+        # Determine appropriate status
+        if resolution.is_not_found:
+            logger.warning(
+                f"Library not found in Context7: {library_name}",
+                extra={
+                    "library": library_name,
+                    "query": query,
+                    "resolution_status": resolution.status.value,
+                    "resolution_message": resolution.message
+                }
+            )
+            return FetchResult(
+                library_name=library_name,
+                query=query,
+                status=FetchStatus.LIBRARY_NOT_FOUND,
+                error=resolution.message,
+                duration_ms=duration_ms
+            )
+        else:
+            # API error or invalid response
+            logger.error(
+                f"Failed to resolve library: {library_name}",
+                extra={
+                    "library": library_name,
+                    "query": query,
+                    "resolution_status": resolution.status.value,
+                    "resolution_message": resolution.message
+                }
+            )
+            return FetchResult(
+                library_name=library_name,
+                query=query,
+                status=FetchStatus.FAILED,
+                error=resolution.message,
+                duration_ms=duration_ms
+            )
+
+    def _stored_fetch(
+        self,
+        library_name: str,
+        query: str,
+        lib_id: str,
+        docs: Optional[str],
+        start_time: float
+    ) -> FetchResult:
+        """Cache fetched docs and build the result (NOT_FOUND if too short)."""
         if not docs or len(docs) < 100:
             duration_ms = (time.time() - start_time) * 1000
             logger.warning(
@@ -913,12 +1573,11 @@ class Context7Client:
         }
 
         try:
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, indent=2)
+            self._cache.put(cache_data)
 
             duration_ms = (time.time() - start_time) * 1000
             logger.info(
-                f"Cached documentation: {cache_file.name}",
+                f"Cached documentation: {library_name}/{query[:50]}",
                 extra={
                     "library": library_name,
                     "query": query[:50],
@@ -943,13 +1602,13 @@ class Context7Client:
                 query=query,
                 status=FetchStatus.SUCCESS,
                 doc=doc,
-                cache_file=cache_file,
+                cache_file=self._cache.path,
                 duration_ms=duration_ms
             )
 
-        except IOError as e:
+        except sqlite3.Error as e:
             duration_ms = (time.time() - start_time) * 1000
-            logger.error(f"Failed to write cache file: {e}")
+            logger.error(f"Failed to write cache entry: {e}")
             return FetchResult(
                 library_name=library_name,
                 query=query,
@@ -975,7 +1634,7 @@ class Context7Client:
             force_refresh: If True, bypass cache and re-fetch
 
         Returns:
-            Path to cached file or None on failure
+            Path to the cache store or None on failure
         """
         result = self.fetch_and_cache_detailed(library_name, query, force_refresh)
         return result.cache_file if result.status in (FetchStatus.SUCCESS, FetchStatus.CACHED) else None
@@ -1017,25 +1676,7 @@ class Context7Client:
                 # Use detailed method to get proper status (LIBRARY_NOT_FOUND, etc.)
                 return self.fetch_and_cache_detailed(library_name, query)
             except Exception as e:
-                return FetchResult(
-                    library_name=library_name,
-                    query=query,
-                    status=FetchStatus.FAILED,
-                    error=str(e),
-                    duration_ms=0.0
-                )
-
-        def update_progress(result: FetchResult) -> None:
-            """Update progress based on fetch result status."""
-            progress.completed += 1
-            if result.status == FetchStatus.SUCCESS:
-                progress.successful += 1
-            elif result.status == FetchStatus.CACHED:
-                progress.cached += 1
-            elif result.status == FetchStatus.LIBRARY_NOT_FOUND:
-                progress.library_not_found += 1
-            else:
-                progress.failed += 1
+                return self._failed_fetch(library_name, query, e)
 
         if parallel and len(queries) > 1:
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -1044,7 +1685,7 @@ class Context7Client:
                 for future in as_completed(futures):
                     result = future.result()
                     results.append(result)
-                    update_progress(result)
+                    self._update_progress(progress, result)
 
                     if on_progress:
                         on_progress(progress)
@@ -1052,11 +1693,87 @@ class Context7Client:
             for query in queries:
                 result = fetch_single(query)
                 results.append(result)
-                update_progress(result)
+                self._update_progress(progress, result)
+
+                if on_progress:
+                    on_progress(progress)
+
+        self._log_batch(library_name, progress)
+        return BatchFetchResult(results=results, progress=progress)
+
+    async def fetch_batch_async(
+        self,
+        library_name: str,
+        queries: Optional[list[str]] = None,
+        on_progress: Optional[Callable[[FetchProgress], None]] = None
+    ) -> BatchFetchResult:
+        """Fetch multiple queries for a library concurrently on the event loop.
+
+        Every query is in flight at once over one pooled connection set; the
+        number of concurrent requests follows the adaptive limit, which
+        halves on rate limiting. Results are in completion order, as with
+        fetch_batch(parallel=True).
+
+        Args:
+            library_name: Library to fetch docs for
+            queries: List of queries (uses DEFAULT_QUERIES if None)
+            on_progress: Callback for progress updates
+
+        Returns:
+            BatchFetchResult with all fetched documents
+        """
+        queries = queries or self.DEFAULT_QUERIES
+        progress = FetchProgress(total=len(queries))
+        results: list[FetchResult] = []
+
+        logger.info(
+            f"Starting async batch fetch for {library_name}",
+            extra={"query_count": len(queries)}
+        )
+
+        async def fetch_single(query: str) -> FetchResult:
+            try:
+                return await self.fetch_and_cache_async(library_name, query)
+            except Exception as e:
+                return self._failed_fetch(library_name, query, e)
+
+        async with self._async_session():
+            for next_result in asyncio.as_completed([fetch_single(q) for q in queries]):
+                result = await next_result
+                results.append(result)
+                self._update_progress(progress, result)
 
                 if on_progress:
                     on_progress(progress)
 
+        self._log_batch(library_name, progress)
+        return BatchFetchResult(results=results, progress=progress)
+
+    @staticmethod
+    def _failed_fetch(library_name: str, query: str, error: Exception) -> FetchResult:
+        return FetchResult(
+            library_name=library_name,
+            query=query,
+            status=FetchStatus.FAILED,
+            error=str(error),
+            duration_ms=0.0
+        )
+
+    @staticmethod
+    def _update_progress(progress: FetchProgress, result: FetchResult) -> None:
+        """Update progress based on fetch result status."""
+        progress.completed += 1
+        if result.status == FetchStatus.SUCCESS:
+            progress.successful += 1
+        elif result.status == FetchStatus.CACHED:
+            progress.cached += 1
+        elif result.status == FetchStatus.LIBRARY_NOT_FOUND:
+            progress.library_not_found += 1
+        else:
+            progress.failed += 1
+
+    @staticmethod
+    def _log_batch(library_name: str, progress: FetchProgress) -> None:
         # Log with appropriate level based on results
         if progress.library_not_found > 0 and progress.successful == 0:
             # All queries failed due to library not found - graceful fallback
@@ -1079,8 +1796,6 @@ class Context7Client:
                 }
             )
 
-        return BatchFetchResult(results=results, progress=progress)
-
     def fetch_comprehensive(
         self,
         library_name: str,
@@ -1133,19 +1848,7 @@ class Context7Client:
         Returns:
             List of all cached documentation dictionaries
         """
-        docs = []
-        cache_files = list(self.cache_dir.glob("*.json"))
-
-        logger.debug(f"Loading {len(cache_files)} cached documents")
-
-        for f in cache_files:
-            try:
-                with open(f, encoding="utf-8") as fp:
-                    data = json.load(fp)
-                docs.append(data)
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to load cache file {f.name}: {e}")
-
+        docs = list(self._cache.iter_entries())
         logger.info(f"Loaded {len(docs)} cached Context7 documents")
         return docs
 
@@ -1158,24 +1861,16 @@ class Context7Client:
         Yields:
             Context7Doc for each cached document
         """
-        cache_files = list(self.cache_dir.glob("*.json"))
-
-        for f in cache_files:
-            try:
-                with open(f, encoding="utf-8") as fp:
-                    data = json.load(fp)
-
-                yield Context7Doc(
-                    title=f"{data.get('library_name', 'unknown')}: {data.get('query', '')}",
-                    content=data.get("response", ""),
-                    source_url=f"context7://{data.get('library_id', 'unknown')}",
-                    code_blocks=data.get("code_blocks", 0),
-                    library_id=data.get("library_id"),
-                    query=data.get("query"),
-                    fetched_at=data.get("fetched_at")
-                )
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to load cache file {f.name}: {e}")
+        for data in self._cache.iter_entries():
+            yield Context7Doc(
+                title=f"{data.get('library_name', 'unknown')}: {data.get('query', '')}",
+                content=data.get("response", ""),
+                source_url=f"context7://{data.get('library_id', 'unknown')}",
+                code_blocks=data.get("code_blocks", 0),
+                library_id=data.get("library_id"),
+                query=data.get("query"),
+                fetched_at=data.get("fetched_at")
+            )
 
     def load_cached_for_library(self, library_name: str) -> list[Context7Doc]:
         """Load all cached documents for a specific library.
@@ -1186,25 +1881,18 @@ class Context7Client:
         Returns:
             List of Context7Doc for the library
         """
-        docs = []
-        pattern = f"{library_name}_*.json"
-
-        for f in self.cache_dir.glob(pattern):
-            try:
-                with open(f, encoding="utf-8") as fp:
-                    data = json.load(fp)
-
-                docs.append(Context7Doc(
-                    title=f"{library_name}: {data.get('query', '')}",
-                    content=data.get("response", ""),
-                    source_url=f"context7://{data.get('library_id', 'unknown')}",
-                    code_blocks=data.get("code_blocks", 0),
-                    library_id=data.get("library_id"),
-                    query=data.get("query"),
-                    fetched_at=data.get("fetched_at")
-                ))
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to load cache file {f.name}: {e}")
+        docs = [
+            Context7Doc(
+                title=f"{library_name}: {data.get('query', '')}",
+                content=data.get("response", ""),
+                source_url=f"context7://{data.get('library_id', 'unknown')}",
+                code_blocks=data.get("code_blocks", 0),
+                library_id=data.get("library_id"),
+                query=data.get("query"),
+                fetched_at=data.get("fetched_at")
+            )
+            for data in self._cache.iter_entries(library_name)
+        ]
 
         logger.info(f"Loaded {len(docs)} cached documents for {library_name}")
         return docs
@@ -1213,23 +1901,20 @@ class Context7Client:
         """Get cache statistics.
 
         Returns:
-            Dictionary with cache statistics
+            Dictionary with cache statistics (sizes are uncompressed
+            response bytes; stored_size_bytes is what the store holds)
         """
-        cache_files = list(self.cache_dir.glob("*.json"))
-        total_size = sum(f.stat().st_size for f in cache_files)
-
-        # Count by library
-        libraries: dict[str, int] = {}
-        for f in cache_files:
-            lib = f.name.split("_")[0]
-            libraries[lib] = libraries.get(lib, 0) + 1
+        stats = self._cache.stats()
+        total_size = stats["size_bytes"]
 
         return {
-            "total_files": len(cache_files),
+            "total_files": stats["entries"],
             "total_size_bytes": total_size,
             "total_size_mb": total_size / (1024 * 1024),
-            "libraries": libraries,
+            "stored_size_bytes": stats["stored_size_bytes"],
+            "libraries": stats["libraries"],
             "cache_dir": str(self.cache_dir),
+            "cache_path": str(self._cache.path),
         }
 
     def get_client_stats(self) -> dict:
@@ -1241,6 +1926,7 @@ class Context7Client:
         return {
             **self._stats,
             "library_id_cache_size": len(self._library_id_cache),
+            "concurrency_limit": self._limit.limit,
             "success_rate": (
                 self._stats["successful"] / self._stats["requests"]
                 if self._stats["requests"] > 0 else 0.0
@@ -1254,20 +1940,15 @@ class Context7Client:
             library_name: If provided, only clear cache for this library
 
         Returns:
-            Number of files deleted
+            Number of cached responses deleted
         """
-        if library_name:
-            pattern = f"{library_name}_*.json"
-        else:
-            pattern = "*.json"
-
-        deleted = 0
-        for f in self.cache_dir.glob(pattern):
-            try:
-                f.unlink()
-                deleted += 1
-            except IOError as e:
-                logger.warning(f"Failed to delete cache file {f.name}: {e}")
-
-        logger.info(f"Cleared {deleted} cache files")
+        deleted = self._cache.delete(library_name)
+        logger.info(f"Cleared {deleted} cached responses")
         return deleted
+
+    def _cache_get(self, library_name: str, query: str) -> Optional[dict]:
+        try:
+            return self._cache.get(library_name, query)
+        except (sqlite3.Error, zlib.error, UnicodeDecodeError) as e:
+            logger.warning(f"Failed to load cached response {library_name}/{query[:50]}: {e}")
+            return None  # Fetch fresh
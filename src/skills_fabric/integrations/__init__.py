@@ -41,6 +41,8 @@ from .unified_api import (
     SearchResult,
     MemoryEntry,
     ExecutionResult,
+    IndexStats,
+    point_id,
 )
 
 __all__ = [
@@ -59,4 +61,6 @@ __all__ = [
     "SearchResult",
     "MemoryEntry",
     "ExecutionResult",
+    "IndexStats",
+    "point_id",
 ]
@@ -35,8 +35,12 @@ Usage:
 
 import os
 import asyncio
+import hashlib
+import time
+import uuid
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Union
+from itertools import islice
+from typing import List, Dict, Optional, Any, Union, Iterable, Iterator
 from pathlib import Path
 from datetime import datetime
 import json
@@ -128,6 +132,46 @@ class ExecutionResult:
     execution_time_ms: int = 0
 
 
+@dataclass
+class IndexStats:
+    """Outcome of the last index_code() call."""
+    documents: int = 0
+    chunks: int = 0
+    embedded: int = 0
+    skipped: int = 0      # Unchanged documents already in the collection
+    failed_chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.documents / self.seconds if self.seconds > 0 else 0.0
+
+
+def point_id(document: Dict[str, Any]) -> str:
+    """Content-hash point ID for a document.
+
+    Derived from the content, location and metadata, so re-indexing an
+    unchanged document yields the same ID and any edit yields a new one.
+    """
+    key = json.dumps(
+        [
+            document["content"],
+            document.get("file_path", ""),
+            document.get("line", 0),
+            document.get("metadata", {}),
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return str(uuid.UUID(bytes=hashlib.sha256(key.encode()).digest()[:16], version=5))
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
 class UnifiedAPI:
     """
     Unified interface to all skill development tools.
@@ -154,6 +198,7 @@ class UnifiedAPI:
 
         # Status tracking
         self.status: Dict[str, bool] = {}
+        self.last_index_stats = IndexStats()
 
     async def initialize(self) -> Dict[str, bool]:
         """
@@ -463,7 +508,9 @@ class UnifiedAPI:
             return []
 
         try:
-            result = self._voyage.embed(
+            # The Voyage client is blocking; keep it off the event loop
+            result = await asyncio.to_thread(
+                self._voyage.embed,
                 texts,
                 model="voyage-code-3",
                 input_type=input_type
@@ -476,67 +523,145 @@ class UnifiedAPI:
     async def index_code(
         self,
         collection_name: str,
-        documents: List[Dict[str, Any]],
-        vector_size: int = 2048
+        documents: Iterable[Dict[str, Any]],
+        vector_size: int = 2048,
+        chunk_size: int = 64,
+        max_concurrency: int = 4,
+        skip_unchanged: bool = True,
     ) -> bool:
         """
         Index code documents in Qdrant.
 
+        Documents are consumed lazily in chunks; each chunk is embedded and
+        upserted on its own, with up to max_concurrency chunks in flight so
+        embedding one chunk overlaps upserting another. Point IDs are
+        content hashes (see point_id), so unchanged documents keep their
+        points and, with skip_unchanged, are not re-embedded at all.
+
         Args:
             collection_name: Name of the collection
-            documents: List of dicts with 'content', 'file_path', 'line', etc.
+            documents: Dicts with 'content', 'file_path', 'line', etc.
+                (any iterable, including a generator)
             vector_size: Embedding dimension
+            chunk_size: Documents per embedding/upsert call
+            max_concurrency: Chunks processed at once
+            skip_unchanged: Skip documents whose point already exists
 
         Returns:
-            Success status
+            Success status (False if any chunk failed; the others are kept).
+            Counts are in last_index_stats.
         """
         if not self.status.get("qdrant") or not self.status.get("voyage"):
             return False
 
+        start_time = time.perf_counter()
+        stats = IndexStats()
+        self.last_index_stats = stats
+
         try:
-            from qdrant_client.models import VectorParams, Distance, PointStruct
+            from qdrant_client.models import VectorParams, Distance
 
             # Create collection if needed
-            collections = self._qdrant.get_collections().collections
-            exists = any(c.name == collection_name for c in collections)
+            response = await asyncio.to_thread(self._qdrant.get_collections)
+            exists = any(c.name == collection_name for c in response.collections)
 
             if not exists:
-                self._qdrant.create_collection(
+                await asyncio.to_thread(
+                    self._qdrant.create_collection,
                     collection_name=collection_name,
                     vectors_config=VectorParams(
                         size=vector_size,
                         distance=Distance.COSINE
                     )
                 )
+        except Exception as e:
+            logger.error(f"Index error: {e}")
+            return False
 
-            # Embed documents
-            contents = [d["content"] for d in documents]
-            embeddings = await self.embed_code(contents, input_type="document")
-
-            if not embeddings:
-                return False
-
-            # Upload points
-            points = [
-                PointStruct(
-                    id=i,
-                    vector=embeddings[i],
-                    payload={
-                        "content": documents[i]["content"],
-                        "file_path": documents[i].get("file_path", ""),
-                        "line": documents[i].get("line", 0),
-                        **documents[i].get("metadata", {})
-                    }
-                )
-                for i in range(len(documents))
-            ]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        tasks = []
+        seen: set = set()
 
-            self._qdrant.upsert(collection_name=collection_name, points=points)
-            return True
+        async def run(chunk: List[tuple]) -> None:
+            try:
+                await self._index_chunk(collection_name, chunk, skip_unchanged, stats)
+            except Exception as e:
+                logger.error(f"Index error: {e}")
+                stats.failed_chunks += 1
+            finally:
+                semaphore.release()
 
+        ok = True
+        try:
+            for chunk in _chunked(documents, max(1, chunk_size)):
+                stats.documents += len(chunk)
+                stats.chunks += 1
+                keyed = []
+                for document in chunk:
+                    pid = point_id(document)
+                    if pid in seen:
+                        stats.skipped += 1
+                    else:
+                        seen.add(pid)
+                        keyed.append((pid, document))
+                if not keyed:
+                    continue
+                # Bounds both concurrency and how much of the input is held in memory
+                await semaphore.acquire()
+                tasks.append(asyncio.create_task(run(keyed)))
         except Exception as e:
             logger.error(f"Index error: {e}")
-            return False
+            ok = False
+        finally:
+            await asyncio.gather(*tasks)
+            stats.seconds = time.perf_counter() - start_time
+
+        return ok and stats.failed_chunks == 0
+
+    async def _index_chunk(
+        self,
+        collection_name: str,
+        chunk: List[tuple],
+        skip_unchanged: bool,
+        stats: IndexStats,
+    ) -> None:
+        """Embed and upsert one chunk of (point_id, document) pairs."""
+        from qdrant_client.models import PointStruct
+
+        if skip_unchanged:
+            existing = await asyncio.to_thread(
+                self._qdrant.retrieve,
+                collection_name=collection_name,
+                ids=[pid for pid, _ in chunk],
+                with_payload=False,
+                with_vectors=False,
+            )
+            present = {str(point.id) for point in existing}
+            stats.skipped += sum(1 for pid, _ in chunk if pid in present)
+            chunk = [(pid, d) for pid, d in chunk if pid not in present]
+            if not chunk:
+                return
+
+        embeddings = await self.embed_code([d["content"] for _, d in chunk], input_type="document")
+        if len(embeddings) != len(chunk):
+            raise RuntimeError(f"got {len(embeddings)} embeddings for {len(chunk)} documents")
+
+        points = [
+            PointStruct(
+                id=pid,
+                vector=embedding,
+                payload={
+                    "content": document["content"],
+                    "file_path": document.get("file_path", ""),
+                    "line": document.get("line", 0),
+                    **document.get("metadata", {})
+                }
+            )
+            for (pid, document), embedding in zip(chunk, embeddings)
+        ]
+
+        await asyncio.to_thread(self._qdrant.upsert, collection_name=collection_name, points=points)
+        stats.embedded += len(points)
 
     async def search_code(
         self,
@@ -567,7 +692,8 @@ class UnifiedAPI:
                 return []
 
             # Search Qdrant
-            results = self._qdrant.search(
+            results = await asyncio.to_thread(
+                self._qdrant.search,
                 collection_name=collection_name,
                 query_vector=query_embedding[0],
                 limit=top_k * 2 if rerank else top_k  # Get more for reranking
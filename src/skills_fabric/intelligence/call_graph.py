@@ -5,11 +5,31 @@ Builds and analyzes call graphs from source code:
 - Dependency ordering
 - Dead code detection
 - Impact analysis (what's affected by a change)
+
+Queries run against an index built once per graph: a name -> node lookup,
+CSR adjacency (offsets + targets arrays) in both directions, and the
+strongly-connected-component condensation. Reachability is computed on
+the condensed DAG and memoized per component, so repeated impact and
+dead-code queries reuse earlier traversals.
 """
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, Set
+from typing import Iterable, Optional, Set
 from pathlib import Path
 import ast
+import os
+
+
+# Directories never descended into by build_from_directory
+SKIP_DIRS = {"node_modules", ".git", "__pycache__", "venv", ".venv"}
+
+# Directories with fewer files than this are parsed in-process
+PARALLEL_MIN_FILES = 32
+
+# Memoized reachability sets are evicted beyond this many members in total
+MAX_CACHED_REACH = 2_000_000
 
 
 @dataclass
@@ -82,9 +102,201 @@ class CallGraphBuilder(ast.NodeVisitor):
         return None
 
 
+class _CallIndex:
+    """Read-only query structures for one snapshot of CallGraph.nodes.
+
+    Node i is the i-th entry of nodes; a call from i to name resolves to
+    every node with that name. Edges are stored CSR-style: the targets of
+    node i are targets[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(self, nodes: dict[str, CallNode]):
+        self.ids = list(nodes)
+        self.names = [node.name for node in nodes.values()]
+        self.by_name: dict[str, list[int]] = {}
+        for i, name in enumerate(self.names):
+            self.by_name.setdefault(name, []).append(i)
+
+        # Forward adjacency; unresolved call names are kept per node
+        self.external: list[tuple[str, ...]] = []
+        offsets, targets = array("l", [0]), array("l")
+        for node in nodes.values():
+            unresolved = []
+            for called in node.calls:
+                found = self.by_name.get(called)
+                if found:
+                    targets.extend(found)
+                else:
+                    unresolved.append(called)
+            self.external.append(tuple(unresolved))
+            offsets.append(len(targets))
+        self.offsets, self.targets = offsets, targets
+        self.rev_offsets, self.rev_targets = _transpose(len(self.ids), offsets, targets)
+
+        # Condensation: components are numbered sinks-first (Tarjan order)
+        self.component, count = _strongly_connected(len(self.ids), offsets, targets)
+        self.members = [[] for _ in range(count)]
+        for v, c in enumerate(self.component):
+            self.members[c].append(v)
+        dag = [set() for _ in range(count)]
+        for v, c in enumerate(self.component):
+            for w in targets[offsets[v]:offsets[v + 1]]:
+                cw = self.component[w]
+                if cw != c:
+                    dag[c].add(cw)
+        self.dag_offsets, self.dag_targets = _csr(dag)
+        self.rev_dag_offsets, self.rev_dag_targets = _transpose(
+            count, self.dag_offsets, self.dag_targets
+        )
+
+        # Memoized reachable components per start component, per direction
+        self._reach: tuple[OrderedDict, OrderedDict] = (OrderedDict(), OrderedDict())
+        self._reach_size = [0, 0]
+
+    def lookup(self, name: str) -> list[int]:
+        return self.by_name.get(name, [])
+
+    def reachable(self, nodes: Iterable[int], reverse: bool = False) -> list[int]:
+        """Nodes reachable from nodes (which are included), in no fixed order."""
+        components = set()
+        for c in {self.component[v] for v in nodes}:
+            components |= self._reach_component(c, reverse)
+        members = self.members
+        return [v for c in components for v in members[c]]
+
+    def _reach_component(self, start: int, reverse: bool) -> frozenset:
+        memo = self._reach[reverse]
+        cached = memo.get(start)
+        if cached is not None:
+            memo.move_to_end(start)
+            return cached
+
+        if reverse:
+            offsets, targets = self.rev_dag_offsets, self.rev_dag_targets
+        else:
+            offsets, targets = self.dag_offsets, self.dag_targets
+        seen = set()
+        stack = [start]
+        while stack:
+            c = stack.pop()
+            if c in seen:
+                continue
+            known = memo.get(c)
+            if known is not None:
+                seen |= known
+                continue
+            seen.add(c)
+            stack.extend(targets[offsets[c]:offsets[c + 1]])
+
+        result = frozenset(seen)
+        memo[start] = result
+        self._reach_size[reverse] += len(result)
+        while self._reach_size[reverse] > MAX_CACHED_REACH and len(memo) > 1:
+            _, evicted = memo.popitem(last=False)
+            self._reach_size[reverse] -= len(evicted)
+        return result
+
+
+def _csr(adjacency: list) -> tuple[array, array]:
+    offsets, targets = array("l", [0]), array("l")
+    for neighbours in adjacency:
+        targets.extend(neighbours)
+        offsets.append(len(targets))
+    return offsets, targets
+
+
+def _transpose(n: int, offsets: array, targets: array) -> tuple[array, array]:
+    """Reverse every edge of a CSR graph."""
+    counts = [0] * (n + 1)
+    for w in targets:
+        counts[w + 1] += 1
+    for i in range(n):
+        counts[i + 1] += counts[i]
+    rev_offsets = array("l", counts)
+    rev_targets = array("l", bytes(rev_offsets.itemsize * len(targets)))
+    fill = counts[:n]
+    for v in range(n):
+        for w in targets[offsets[v]:offsets[v + 1]]:
+            rev_targets[fill[w]] = v
+            fill[w] += 1
+    return rev_offsets, rev_targets
+
+
+def _strongly_connected(n: int, offsets: array, targets: array) -> tuple[list[int], int]:
+    """Iterative Tarjan SCC; components are numbered in reverse topological order."""
+    index = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    component = [-1] * n
+    stack: list[int] = []
+    counter = count = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [[root, offsets[root]]]
+        while work:
+            frame = work[-1]
+            v, pos = frame
+            if pos < offsets[v + 1]:
+                frame[1] = pos + 1
+                w = targets[pos]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append([w, offsets[w]])
+                elif on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+            work.pop()
+            if work:
+                u = work[-1][0]
+                if low[v] < low[u]:
+                    low[u] = low[v]
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    component[w] = count
+                    if w == v:
+                        break
+                count += 1
+    return component, count
+
+
+def _parse_call_nodes(file_path: Path) -> Optional[dict[str, CallNode]]:
+    """Run CallGraphBuilder over one file (None if it can't be parsed)."""
+    try:
+        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        tree = ast.parse(content)
+        builder = CallGraphBuilder(str(file_path))
+        builder.visit(tree)
+        return builder.nodes
+    except Exception:
+        return None
+
+
+def _parse_batch(paths: list[str]) -> list[list[CallNode]]:
+    results = []
+    for path in paths:
+        nodes = _parse_call_nodes(Path(path))
+        results.append(list(nodes.values()) if nodes else [])
+    return results
+
+
 class CallGraph:
     """Manages call graph for a codebase.
 
+    Names passed to queries resolve to every node with that name, the same
+    way calls do when called_by is built. Query structures are built on
+    first use and rebuilt after the graph changes.
+
     Usage:
         graph = CallGraph()
         graph.build_from_directory("/path/to/repo")
@@ -101,54 +313,78 @@ class CallGraph:
 
     def __init__(self):
         self.nodes: dict[str, CallNode] = {}
+        self._index: Optional[_CallIndex] = None
 
     def build_from_file(self, file_path: Path) -> int:
         """Build call graph from a single file."""
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            tree = ast.parse(content)
+        nodes = _parse_call_nodes(Path(file_path))
+        if nodes is None:
+            return 0
+        self._merge(nodes.values())
+        return len(nodes)
 
-            builder = CallGraphBuilder(str(file_path))
-            builder.visit(tree)
+    def build_from_directory(self, directory: Path, max_workers: Optional[int] = None) -> int:
+        """Build call graph from all Python files in directory.
 
-            # Merge nodes
-            for name, node in builder.nodes.items():
-                self.nodes[node.id] = node
+        Args:
+            directory: Root to scan; directories in SKIP_DIRS are pruned.
+            max_workers: Worker processes (default: CPU count; 1 parses
+                in-process).
 
-            return len(builder.nodes)
-        except Exception:
-            return 0
+        Returns:
+            Number of functions found.
+        """
+        files = []
+        for root, dirs, names in os.walk(directory):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            files.extend(os.path.join(root, n) for n in names if n.endswith(".py"))
+        files.sort()
 
-    def build_from_directory(self, directory: Path) -> int:
-        """Build call graph from all Python files in directory."""
-        directory = Path(directory)
         total = 0
-
-        for py_file in directory.rglob("*.py"):
-            skip_dirs = ['node_modules', '.git', '__pycache__', 'venv', '.venv']
-            if not any(d in str(py_file) for d in skip_dirs):
-                total += self.build_from_file(py_file)
+        workers = max(1, max_workers or os.cpu_count() or 1)
+        if workers == 1 or len(files) < PARALLEL_MIN_FILES:
+            for path in files:
+                total += self.build_from_file(Path(path))
+        else:
+            # Contiguous batches, merged in file order
+            size = -(-len(files) // (workers * 4))
+            batches = [files[i:i + size] for i in range(0, len(files), size)]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for batch in pool.map(_parse_batch, batches):
+                    for nodes in batch:
+                        self._merge(nodes)
+                        total += len(nodes)
 
         # Build reverse relationships
         self._build_callers()
 
         return total
 
+    def _merge(self, nodes: Iterable[CallNode]) -> None:
+        for node in nodes:
+            self.nodes[node.id] = node
+        self._index = None
+
+    def _graph_index(self) -> _CallIndex:
+        """The query index, rebuilt if nodes changed since it was built."""
+        index = self._index
+        if index is None or len(index.ids) != len(self.nodes):
+            index = self._index = _CallIndex(self.nodes)
+        return index
+
     def _build_callers(self):
         """Build the called_by relationships."""
-        for node in self.nodes.values():
-            for called_name in node.calls:
-                # Find the called node
-                for other in self.nodes.values():
-                    if other.name == called_name:
-                        other.called_by.add(node.id)
+        index = self._graph_index()
+        ids = index.ids
+        offsets, targets = index.rev_offsets, index.rev_targets
+        for w, node in enumerate(self.nodes.values()):
+            node.called_by = {ids[v] for v in targets[offsets[w]:offsets[w + 1]]}
 
     def get_node(self, name: str) -> Optional[CallNode]:
         """Get a node by name (searches all files)."""
-        for node in self.nodes.values():
-            if node.name == name:
-                return node
-        return None
+        index = self._graph_index()
+        found = index.lookup(name)
+        return self.nodes[index.ids[found[0]]] if found else None
 
     def get_calls(self, function_name: str) -> Set[str]:
         """Get all functions called by the given function."""
@@ -163,61 +399,65 @@ class CallGraph:
     def get_transitive_calls(
         self,
         function_name: str,
-        max_depth: int = 10
+        max_depth: Optional[int] = 10
     ) -> Set[str]:
-        """Get all functions called directly or indirectly."""
-        visited = set()
-        to_visit = {function_name}
-        depth = 0
-
-        while to_visit and depth < max_depth:
-            current = to_visit.pop()
-            if current in visited:
-                continue
-            visited.add(current)
+        """Get all functions called directly or indirectly.
 
-            calls = self.get_calls(current)
-            to_visit.update(calls - visited)
-            depth += 1
+        Args:
+            function_name: Function to start from.
+            max_depth: Maximum call depth in hops (None for unlimited,
+                which is answered from the memoized reachability sets).
 
-        visited.discard(function_name)
-        return visited
+        Returns:
+            Names called within max_depth hops, including calls that
+            don't resolve to a node in the graph.
+        """
+        index = self._graph_index()
+        start = index.lookup(function_name)
+        names, external = index.names, index.external
+
+        called = set()
+        if max_depth is None:
+            for v in index.reachable(start):
+                called.add(names[v])
+                called.update(external[v])
+        else:
+            offsets, targets = index.offsets, index.targets
+            seen = set(start)
+            frontier = start
+            for _ in range(max_depth):
+                if not frontier:
+                    break
+                next_frontier = []
+                for v in frontier:
+                    called.update(external[v])
+                    for w in targets[offsets[v]:offsets[v + 1]]:
+                        called.add(names[w])
+                        if w not in seen:
+                            seen.add(w)
+                            next_frontier.append(w)
+                frontier = next_frontier
+
+        called.discard(function_name)
+        return called
 
     def find_dead_code(self, entry_points: list[str]) -> Set[str]:
         """Find functions not reachable from entry points."""
-        reachable = set()
-
-        for entry in entry_points:
-            reachable.add(entry)
-            reachable.update(self.get_transitive_calls(entry))
+        index = self._graph_index()
+        start = [v for entry in entry_points for v in index.lookup(entry)]
+        reachable = {index.names[v] for v in index.reachable(start)}
+        reachable.update(entry_points)
 
-        all_functions = {node.name for node in self.nodes.values()}
-        return all_functions - reachable
+        return set(index.by_name) - reachable
 
     def impact_analysis(self, changed_function: str) -> Set[str]:
         """Find all functions affected by a change.
 
         Returns functions that directly or indirectly call the changed function.
         """
-        affected = set()
-        to_check = {changed_function}
-        depth = 0
-
-        while to_check and depth < 20:
-            current = to_check.pop()
-            if current in affected:
-                continue
-            affected.add(current)
-
-            # Get callers
-            node = self.get_node(current)
-            if node:
-                for caller_id in node.called_by:
-                    caller_node = self.nodes.get(caller_id)
-                    if caller_node:
-                        to_check.add(caller_node.name)
-
-            depth += 1
+        index = self._graph_index()
+        start = index.lookup(changed_function)
+        affected = {index.names[v] for v in index.reachable(start, reverse=True)}
 
         affected.discard(changed_function)
         return affected
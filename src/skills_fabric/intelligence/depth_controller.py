@@ -32,16 +32,31 @@ Usage:
     print(f"Symbol: {result.symbol}")
     print(f"Methods: {result.methods}")
     print(f"Dependencies: {result.dependencies}")
+
+Expansion shares work across steps and calls: each file is read and parsed
+once (re-read when its mtime or size changes), callers come from a
+repository-wide index built on first use, and DepthResults are memoized by
+(ref, depth) for as long as the files they were computed from are unchanged.
 """
 import ast
+import copy
+import io
 import re
 import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Any, Optional, Callable
 from enum import IntEnum
 from datetime import datetime
 
+from .call_graph import SKIP_DIRS
+
+# Callers reported per symbol at Level 4
+MAX_CALLERS = 50
+
 
 class DepthLevel(IntEnum):
     """Progressive deepening levels.
@@ -171,6 +186,28 @@ class DepthResult:
     duration_ms: float = 0
 
 
+@dataclass
+class _SourceFile:
+    """A repository file as read from disk (source is None if unreadable)."""
+    stamp: tuple[int, int]
+    source: Optional[str]
+    _lines: Optional[list[str]] = None
+
+    @property
+    def lines(self) -> list[str]:
+        """Lines with endings, split as file iteration would."""
+        if self._lines is None:
+            self._lines = io.StringIO(self.source or "").readlines()
+        return self._lines
+
+
+@dataclass
+class _ParsedSource:
+    """One parse of a source text; nodes is the ast.walk order."""
+    tree: Optional[ast.Module]
+    nodes: list[ast.AST]
+
+
 class DepthController:
     """Progressive deepening controller for code analysis.
 
@@ -178,21 +215,55 @@ class DepthController:
     - Each level validates the level above
     - Each level is grounded in the level below
     - Git clone is the foundation (immutable truth)
+
+    Safe to share between threads; ExpansionCache runs expansions on a
+    worker pool.
     """
 
-    def __init__(self, repo_path: Path | str):
+    def __init__(
+        self,
+        repo_path: Path | str,
+        cache_size: int = 512,
+        result_cache_size: int = 4096,
+        refresh_interval: float = 2.0,
+    ):
         """Initialize with path to cloned repository.
 
         Args:
             repo_path: Path to the git-cloned repository
+            cache_size: Files whose source and parse are kept in memory
+            result_cache_size: Memoized DepthResults (0 disables memoization)
+            refresh_interval: Seconds between checks of the repository for
+                changed files when answering Level 4 caller lookups
         """
         self.repo_path = Path(repo_path)
         if not self.repo_path.exists():
             raise ValueError(f"Repository path does not exist: {repo_path}")
+        self.cache_size = cache_size
+        self.result_cache_size = result_cache_size
+        self.refresh_interval = refresh_interval
+
+        self._lock = threading.Lock()
+        self._files: OrderedDict[str, _SourceFile] = OrderedDict()
+        self._parses: OrderedDict[str, _ParsedSource] = OrderedDict()
+        self._results: OrderedDict[tuple, tuple] = OrderedDict()
+
+        # Repository caller index: per file, callee name -> [(walk position, line)]
+        self._index_lock = threading.Lock()
+        self._index_stamps: dict[str, tuple[int, int]] = {}
+        self._index_calls: dict[str, dict[str, list[tuple[int, int]]]] = {}
+        self._callee_files: dict[str, set[str]] = {}
+        self._index_generation = 0
+        self._index_checked = float("-inf")
+        self._callers_memo: dict[str, list[CallInfo]] = {}
 
     def expand(self, ref: CodeWikiRef, depth: DepthLevel) -> DepthResult:
         """Expand a CodeWiki reference to the specified depth.
 
+        Results are memoized by (ref, depth); a memoized result is reused
+        while the referenced file (and, from Level 4, the repository) is
+        unchanged. Each call returns its own shallow copy.
+
         Args:
             ref: CodeWiki reference with file path and line
             depth: How deep to analyze (0-5)
@@ -200,6 +271,27 @@ class DepthController:
         Returns:
             DepthResult with information at the requested depth
         """
+        key = (ref.concept, ref.file_path, ref.line, ref.repo, ref.commit, ref.url, int(depth))
+        file = self._load(ref.file_path)
+        generation = self._refresh_caller_index() if depth >= DepthLevel.FULL_GRAPH else 0
+        validity = (file.stamp if file else None, generation)
+
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None and cached[0] == validity:
+                self._results.move_to_end(key)
+                return copy.copy(cached[1])
+
+        result = self._expand(ref, depth)
+
+        if self.result_cache_size > 0:
+            with self._lock:
+                self._results[key] = (validity, result)
+                while len(self._results) > self.result_cache_size:
+                    self._results.popitem(last=False)
+        return copy.copy(result)
+
+    def _expand(self, ref: CodeWikiRef, depth: DepthLevel) -> DepthResult:
         start = datetime.now()
         result = DepthResult(ref=ref, level=depth)
 
@@ -220,13 +312,11 @@ class DepthController:
             result.dependencies = self._find_dependencies(ref)
             result.imports = self._extract_imports(ref)
 
-        # Level 3: Call graph (1 level)
+        # Level 3: Call graph (1 level); Level 4: full recursive expansion
         if depth >= DepthLevel.CALL_GRAPH:
-            result.calls = self._build_call_graph(ref, recursive=False)
+            result.calls = self._build_call_graph(ref, recursive=depth >= DepthLevel.FULL_GRAPH)
 
-        # Level 4: Full recursive expansion
         if depth >= DepthLevel.FULL_GRAPH:
-            result.calls = self._build_call_graph(ref, recursive=True)
             result.called_by = self._find_callers(ref)
 
         # Level 5: Execution trace
@@ -239,200 +329,310 @@ class DepthController:
         result.duration_ms = (datetime.now() - start).total_seconds() * 1000
         return result
 
-    def _validate(self, ref: CodeWikiRef) -> bool:
-        """Level 0: Validate that the reference exists and is correct."""
-        file_path = self.repo_path / ref.file_path
-        if not file_path.exists():
-            return False
+    def clear_cache(self) -> None:
+        """Drop cached sources, parses, results and the caller index."""
+        with self._lock:
+            self._files.clear()
+            self._parses.clear()
+            self._results.clear()
+        with self._index_lock:
+            self._index_stamps.clear()
+            self._index_calls.clear()
+            self._callee_files.clear()
+            self._callers_memo.clear()
+            self._index_generation += 1
+            self._index_checked = float("-inf")
+
+    def _load(self, rel_path: str, cache: bool = True) -> Optional[_SourceFile]:
+        """Read a repository file, reusing the cached copy while unchanged.
+
+        Returns None if the file doesn't exist. With cache=False a fresh
+        read isn't retained (used for whole-repository scans).
+        """
+        path = self.repo_path / rel_path
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        key = str(path)
+
+        with self._lock:
+            file = self._files.get(key)
+            if file is not None and file.stamp == stamp:
+                self._files.move_to_end(key)
+                return file
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                if ref.line > 0 and ref.line <= len(lines):
-                    # Check if the concept name appears near the line
-                    context = ''.join(lines[max(0, ref.line-3):ref.line+3])
-                    return ref.concept.lower() in context.lower()
-                return True  # Line 0 means just file existence
+            with open(path, 'r', encoding='utf-8') as f:
+                source = f.read()
         except Exception:
+            source = None
+        file = _SourceFile(stamp=stamp, source=source)
+
+        if cache and self.cache_size > 0:
+            with self._lock:
+                self._files[key] = file
+                while len(self._files) > self.cache_size:
+                    self._files.popitem(last=False)
+        return file
+
+    def _parse(self, source: str, cache: bool = True) -> _ParsedSource:
+        """Parse source once; later steps on the same text reuse the walk."""
+        with self._lock:
+            parsed = self._parses.get(source)
+            if parsed is not None:
+                self._parses.move_to_end(source)
+                return parsed
+
+        try:
+            tree = ast.parse(source)
+            parsed = _ParsedSource(tree=tree, nodes=list(ast.walk(tree)))
+        except (SyntaxError, ValueError):
+            parsed = _ParsedSource(tree=None, nodes=[])
+
+        if cache and self.cache_size > 0:
+            with self._lock:
+                self._parses[source] = parsed
+                while len(self._parses) > self.cache_size:
+                    self._parses.popitem(last=False)
+        return parsed
+
+    def _validate(self, ref: CodeWikiRef) -> bool:
+        """Level 0: Validate that the reference exists and is correct."""
+        file = self._load(ref.file_path)
+        if file is None or file.source is None:
             return False
 
+        lines = file.lines
+        if ref.line > 0 and ref.line <= len(lines):
+            # Check if the concept name appears near the line
+            context = ''.join(lines[max(0, ref.line-3):ref.line+3])
+            return ref.concept.lower() in context.lower()
+        return True  # Line 0 means just file existence
+
     def _read_source(self, ref: CodeWikiRef) -> str:
         """Read source code from the reference location."""
-        file_path = self.repo_path / ref.file_path
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except Exception:
-            return ""
+        file = self._load(ref.file_path)
+        return (file.source or "") if file else ""
 
     def _parse_symbol(self, ref: CodeWikiRef, source: str) -> Optional[SymbolInfo]:
         """Level 1: Parse the symbol at the referenced line."""
-        try:
-            tree = ast.parse(source)
-
-            for node in ast.walk(tree):
-                # Check if this node is at or near our target line
-                if hasattr(node, 'lineno') and abs(node.lineno - ref.line) <= 2:
-                    if isinstance(node, ast.ClassDef):
-                        return SymbolInfo(
-                            name=node.name,
-                            kind="class",
-                            line=node.lineno,
-                            end_line=node.end_lineno or node.lineno,
-                            docstring=ast.get_docstring(node) or "",
-                            bases=[self._get_name(b) for b in node.bases],
-                            decorators=[self._get_name(d) for d in node.decorator_list]
-                        )
-                    elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        return SymbolInfo(
-                            name=node.name,
-                            kind="async_function" if isinstance(node, ast.AsyncFunctionDef) else "function",
-                            line=node.lineno,
-                            end_line=node.end_lineno or node.lineno,
-                            docstring=ast.get_docstring(node) or "",
-                            signature=self._get_signature(node),
-                            decorators=[self._get_name(d) for d in node.decorator_list]
-                        )
-
-            return None
-        except SyntaxError:
-            return None
+        for node in self._parse(source).nodes:
+            # Check if this node is at or near our target line
+            if hasattr(node, 'lineno') and abs(node.lineno - ref.line) <= 2:
+                if isinstance(node, ast.ClassDef):
+                    return SymbolInfo(
+                        name=node.name,
+                        kind="class",
+                        line=node.lineno,
+                        end_line=node.end_lineno or node.lineno,
+                        docstring=ast.get_docstring(node) or "",
+                        bases=[self._get_name(b) for b in node.bases],
+                        decorators=[self._get_name(d) for d in node.decorator_list]
+                    )
+                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    return SymbolInfo(
+                        name=node.name,
+                        kind="async_function" if isinstance(node, ast.AsyncFunctionDef) else "function",
+                        line=node.lineno,
+                        end_line=node.end_lineno or node.lineno,
+                        docstring=ast.get_docstring(node) or "",
+                        signature=self._get_signature(node),
+                        decorators=[self._get_name(d) for d in node.decorator_list]
+                    )
+
+        return None
 
     def _extract_methods(self, source: str, class_line: int) -> list[MethodInfo]:
         """Extract methods from a class definition."""
         methods = []
-        try:
-            tree = ast.parse(source)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef) and abs(node.lineno - class_line) <= 2:
-                    for item in node.body:
-                        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                            methods.append(MethodInfo(
-                                name=item.name,
-                                parameters=self._get_parameters(item),
-                                return_type=self._get_return_type(item),
-                                docstring=ast.get_docstring(item) or "",
-                                is_async=isinstance(item, ast.AsyncFunctionDef),
-                                decorators=[self._get_name(d) for d in item.decorator_list]
-                            ))
-        except SyntaxError:
-            pass
+        for node in self._parse(source).nodes:
+            if isinstance(node, ast.ClassDef) and abs(node.lineno - class_line) <= 2:
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        methods.append(MethodInfo(
+                            name=item.name,
+                            parameters=self._get_parameters(item),
+                            return_type=self._get_return_type(item),
+                            docstring=ast.get_docstring(item) or "",
+                            is_async=isinstance(item, ast.AsyncFunctionDef),
+                            decorators=[self._get_name(d) for d in item.decorator_list]
+                        ))
 
         return methods
 
     def _find_dependencies(self, ref: CodeWikiRef) -> list[DependencyInfo]:
         """Level 2: Find immediate dependencies (imports)."""
         deps = []
-        file_path = self.repo_path / ref.file_path
-
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                source = f.read()
-
-            tree = ast.parse(source)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        deps.append(DependencyInfo(
-                            name=alias.name,
-                            module=alias.name,
-                            alias=alias.asname or "",
-                            is_from_import=False
-                        ))
-                elif isinstance(node, ast.ImportFrom):
-                    module = node.module or ""
-                    for alias in node.names:
-                        deps.append(DependencyInfo(
-                            name=alias.name,
-                            module=module,
-                            alias=alias.asname or "",
-                            is_from_import=True
-                        ))
-        except Exception:
-            pass
+        file = self._load(ref.file_path)
+        if file is None or file.source is None:
+            return deps
+
+        for node in self._parse(file.source).nodes:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    deps.append(DependencyInfo(
+                        name=alias.name,
+                        module=alias.name,
+                        alias=alias.asname or "",
+                        is_from_import=False
+                    ))
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                for alias in node.names:
+                    deps.append(DependencyInfo(
+                        name=alias.name,
+                        module=module,
+                        alias=alias.asname or "",
+                        is_from_import=True
+                    ))
 
         return deps
 
     def _extract_imports(self, ref: CodeWikiRef) -> list[str]:
         """Extract import statements as strings."""
         imports = []
-        file_path = self.repo_path / ref.file_path
-
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    stripped = line.strip()
-                    if stripped.startswith(('import ', 'from ')):
-                        imports.append(stripped)
-                    elif imports and not stripped.startswith(('#', '"""', "'''")):
-                        # Stop at first non-import, non-comment line
-                        if stripped and not stripped.startswith(('import ', 'from ')):
-                            if not line[0].isspace():  # Not a continuation
-                                break
-        except Exception:
-            pass
+        file = self._load(ref.file_path)
+        if file is None or file.source is None:
+            return imports
+
+        for line in file.lines:
+            stripped = line.strip()
+            if stripped.startswith(('import ', 'from ')):
+                imports.append(stripped)
+            elif imports and not stripped.startswith(('#', '"""', "'''")):
+                # Stop at first non-import, non-comment line
+                if stripped and not stripped.startswith(('import ', 'from ')):
+                    if not line[0].isspace():  # Not a continuation
+                        break
 
         return imports
 
     def _build_call_graph(self, ref: CodeWikiRef, recursive: bool = False) -> list[CallInfo]:
         """Level 3-4: Build call graph from the symbol."""
         calls = []
-        source = self._read_source(ref)
-
-        try:
-            tree = ast.parse(source)
-
-            # Find the target function/method
-            target_node = None
-            for node in ast.walk(tree):
-                if hasattr(node, 'lineno') and abs(node.lineno - ref.line) <= 2:
-                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                        target_node = node
-                        break
 
-            if target_node:
-                for node in ast.walk(target_node):
-                    if isinstance(node, ast.Call):
-                        callee = self._get_name(node.func)
-                        if callee:
-                            calls.append(CallInfo(
-                                caller=ref.concept,
-                                callee=callee,
-                                line=node.lineno if hasattr(node, 'lineno') else 0,
-                                arguments=[self._get_name(arg) for arg in node.args]
-                            ))
-        except Exception:
-            pass
+        # Find the target function/method
+        target_node = None
+        for node in self._parse(self._read_source(ref)).nodes:
+            if hasattr(node, 'lineno') and abs(node.lineno - ref.line) <= 2:
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    target_node = node
+                    break
+
+        if target_node:
+            for node in ast.walk(target_node):
+                if isinstance(node, ast.Call):
+                    callee = self._get_name(node.func)
+                    if callee:
+                        calls.append(CallInfo(
+                            caller=ref.concept,
+                            callee=callee,
+                            line=node.lineno if hasattr(node, 'lineno') else 0,
+                            arguments=[self._get_name(arg) for arg in node.args]
+                        ))
 
         return calls
 
     def _find_callers(self, ref: CodeWikiRef) -> list[CallInfo]:
-        """Find functions that call the target symbol."""
-        callers = []
-        # Search all Python files in the repo
-        for py_file in self.repo_path.rglob("*.py"):
-            try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    source = f.read()
-                tree = ast.parse(source)
-
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Call):
-                        callee = self._get_name(node.func)
-                        if callee and ref.concept in callee:
-                            # Find the enclosing function
-                            # (simplified - just record the call)
-                            callers.append(CallInfo(
-                                caller=str(py_file.relative_to(self.repo_path)),
-                                callee=ref.concept,
-                                line=node.lineno if hasattr(node, 'lineno') else 0
-                            ))
-            except Exception:
-                continue
-
-        return callers[:50]  # Limit to 50 callers
+        """Find calls to the target symbol anywhere in the repository.
+
+        Answered from the repository caller index: a call matches when the
+        concept appears in the called name. Files are searched in path order.
+        """
+        self._refresh_caller_index()
+        with self._index_lock:
+            memo = self._callers_memo.get(ref.concept)
+            if memo is not None:
+                return list(memo)
+
+            files: set[str] = set()
+            callees = [c for c in self._callee_files if ref.concept in c]
+            for callee in callees:
+                files.update(self._callee_files[callee])
+
+            callers = []
+            for rel_path in sorted(files):
+                calls = self._index_calls[rel_path]
+                found = sorted(pos_line for c in callees for pos_line in calls.get(c, ()))
+                for _, line in found:
+                    callers.append(CallInfo(caller=rel_path, callee=ref.concept, line=line))
+                if len(callers) >= MAX_CALLERS:
+                    break
+            callers = callers[:MAX_CALLERS]
+            self._callers_memo[ref.concept] = callers
+        return list(callers)
+
+    def _refresh_caller_index(self, force: bool = False) -> int:
+        """Bring the caller index up to date with the repository.
+
+        The repository is re-scanned at most every refresh_interval seconds;
+        only files whose mtime or size changed are re-parsed.
+
+        Returns:
+            Index generation, bumped whenever the index changes.
+        """
+        with self._index_lock:
+            now = time.monotonic()
+            if not force and now - self._index_checked < self.refresh_interval:
+                return self._index_generation
+
+            seen = set()
+            changed = False
+            for root, dirs, names in os.walk(self.repo_path):
+                dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+                for name in names:
+                    if not name.endswith(".py"):
+                        continue
+                    path = os.path.join(root, name)
+                    rel_path = str(Path(path).relative_to(self.repo_path))
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    seen.add(rel_path)
+                    stamp = (st.st_mtime_ns, st.st_size)
+                    if self._index_stamps.get(rel_path) != stamp:
+                        self._index_file(rel_path, stamp)
+                        changed = True
+
+            for rel_path in set(self._index_stamps) - seen:
+                self._unindex_file(rel_path)
+                changed = True
+
+            if changed:
+                self._callers_memo.clear()
+                self._index_generation += 1
+            self._index_checked = time.monotonic()
+            return self._index_generation
+
+    def _index_file(self, rel_path: str, stamp: tuple[int, int]) -> None:
+        self._unindex_file(rel_path)
+        # Files already being expanded keep their parse; others aren't retained
+        with self._lock:
+            retain = str(self.repo_path / rel_path) in self._files
+        file = self._load(rel_path, cache=retain)
+        calls: dict[str, list[tuple[int, int]]] = {}
+        if file is not None and file.source is not None:
+            for pos, node in enumerate(self._parse(file.source, cache=retain).nodes):
+                if isinstance(node, ast.Call):
+                    callee = self._get_name(node.func)
+                    if callee:
+                        calls.setdefault(callee, []).append((pos, node.lineno))
+        self._index_stamps[rel_path] = stamp
+        self._index_calls[rel_path] = calls
+        for callee in calls:
+            self._callee_files.setdefault(callee, set()).add(rel_path)
+
+    def _unindex_file(self, rel_path: str) -> None:
+        self._index_stamps.pop(rel_path, None)
+        for callee in self._index_calls.pop(rel_path, {}):
+            files = self._callee_files.get(callee)
+            if files is not None:
+                files.discard(rel_path)
+                if not files:
+                    del self._callee_files[callee]
 
     def _execute_and_trace(self, ref: CodeWikiRef) -> dict:
         """Level 5: Execute code in sandbox and capture trace."""
@@ -8,12 +8,23 @@ Features:
 - Extract symbols and documentation
 - CRAN/Bioconductor package metadata
 - R-specific code patterns
+
+Symbols live in a persistent SQLite index (RSymbolIndex) that keeps every
+definition, with exact, case-folded and trigram substring lookups.
+Directory indexing parses changed files in a process pool off the event
+loop and skips files whose mtime and size are unchanged.
 """
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional, Any
 from pathlib import Path
+import asyncio
+import bisect
+import os
 import re
 import json
+import sqlite3
+import threading
 
 # Try to import MCP SDK (FastMCP for decorator API)
 try:
@@ -162,12 +173,13 @@ class RCodeParser:
         # Also use regex for comprehensive extraction
         symbols.extend(self._parse_with_regex(code, file_path))
 
-        # Deduplicate by name
+        # Deduplicate definitions found by both passes; keep redefinitions
         seen = set()
         unique = []
         for sym in symbols:
-            if sym.name not in seen:
-                seen.add(sym.name)
+            key = (sym.name, sym.line_number)
+            if key not in seen:
+                seen.add(key)
                 unique.append(sym)
 
         return unique
@@ -176,6 +188,10 @@ class RCodeParser:
         """Fallback regex-based parsing."""
         symbols = []
         lines = code.split('\n')
+        newlines = [m.start() for m in re.finditer('\n', code)]
+
+        def line_of(offset: int) -> int:
+            return bisect.bisect_left(newlines, offset) + 1
 
         # Pattern: name <- function(params) or name = function(params)
         func_pattern = re.compile(
@@ -186,7 +202,7 @@ class RCodeParser:
         for match in func_pattern.finditer(code):
             name = match.group(1)
             params_str = match.group(3)
-            line_num = code[:match.start()].count('\n') + 1
+            line_num = line_of(match.start())
 
             # Check for roxygen comments above
             doc = self._extract_roxygen(lines, line_num - 1)
@@ -204,7 +220,7 @@ class RCodeParser:
         s4_pattern = re.compile(r'setClass\s*\(\s*["\']([^"\']+)["\']')
         for match in s4_pattern.finditer(code):
             name = match.group(1)
-            line_num = code[:match.start()].count('\n') + 1
+            line_num = line_of(match.start())
             symbols.append(RSymbol(
                 name=name,
                 kind='s4_class',
@@ -216,7 +232,7 @@ class RCodeParser:
         r6_pattern = re.compile(r'R6Class\s*\(\s*["\']([^"\']+)["\']')
         for match in r6_pattern.finditer(code):
             name = match.group(1)
-            line_num = code[:match.start()].count('\n') + 1
+            line_num = line_of(match.start())
             symbols.append(RSymbol(
                 name=name,
                 kind='r6_class',
@@ -232,7 +248,7 @@ class RCodeParser:
         for match in s3_pattern.finditer(code):
             generic = match.group(1)
             classname = match.group(2)
-            line_num = code[:match.start()].count('\n') + 1
+            line_num = line_of(match.start())
             symbols.append(RSymbol(
                 name=f"{generic}.{classname}",
                 kind='s3_method',
@@ -298,19 +314,352 @@ class RCodeParser:
         )
 
 
-class RMCPServer:
-    """FastMCP server for R language support."""
+# Files handed to each worker task; amortizes pickling over many small files
+INDEX_CHUNK_SIZE = 32
+
+# Per-process parser reused across tasks
+_worker_parser: Optional["RCodeParser"] = None
+
+
+def _parse_r_files(files: list[tuple[str, str]]) -> list[tuple[str, int, int, Optional[list[RSymbol]]]]:
+    """Parse a chunk of R files in a worker process.
+
+    Args:
+        files: (absolute path, citation path) pairs
+
+    Returns:
+        (absolute path, mtime_ns, size, symbols or None if unreadable)
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = RCodeParser()
+
+    results = []
+    for source, rel_path in files:
+        try:
+            stat = os.stat(source)
+            code = Path(source).read_text(encoding='utf-8', errors='ignore')
+            symbols = _worker_parser.parse(code, rel_path)
+            results.append((source, stat.st_mtime_ns, stat.st_size, symbols))
+        except Exception:
+            results.append((source, 0, 0, None))
+    return results
+
+
+class RSymbolIndex:
+    """Persistent SQLite index of R symbol definitions.
+
+    Every definition is kept, keyed by the file it came from, so
+    redefinitions and S3 methods with the same name in different files
+    no longer overwrite each other. Lookups use a B-tree on the name and
+    on its case-folded form; substring search uses an FTS5 trigram
+    index (queries shorter than three characters fall back to a scan).
+    Files are recorded with mtime and size for incremental re-indexing.
+    """
+
+    MIN_SUBSTRING_LENGTH = 3
+
+    def __init__(self, db_path: str | Path = ":memory:"):
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(db_path), isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS files (
+                source TEXT PRIMARY KEY,
+                root TEXT,
+                mtime_ns INTEGER,
+                size INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS symbols (
+                id INTEGER PRIMARY KEY,
+                source TEXT NOT NULL,
+                name TEXT NOT NULL,
+                name_fold TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                line_number INTEGER NOT NULL,
+                documentation TEXT,
+                parameters TEXT NOT NULL,
+                returns TEXT,
+                package TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_symbols_name ON symbols(name);
+            CREATE INDEX IF NOT EXISTS idx_symbols_fold ON symbols(name_fold);
+            CREATE INDEX IF NOT EXISTS idx_symbols_source ON symbols(source);
+            CREATE INDEX IF NOT EXISTS idx_files_root ON files(root);
+            CREATE VIRTUAL TABLE IF NOT EXISTS symbol_names USING fts5(
+                name_fold, content='symbols', content_rowid='id', tokenize='trigram'
+            );
+        """)
+
+    def _delete_sources(self, sources: list[str]) -> None:
+        """Delete symbols of the given sources (caller holds a transaction)."""
+        for source in sources:
+            # External-content FTS needs the old values to remove postings
+            self._conn.execute(
+                "INSERT INTO symbol_names(symbol_names, rowid, name_fold) "
+                "SELECT 'delete', id, name_fold FROM symbols WHERE source = ?",
+                (source,),
+            )
+            self._conn.execute("DELETE FROM symbols WHERE source = ?", (source,))
+
+    # Columns read back into RSymbol, in constructor order
+    _SYMBOL_COLUMNS = (
+        "name, kind, file_path, line_number, documentation, parameters, returns, package"
+    )
+
+    @staticmethod
+    def _row_to_symbol(row: tuple) -> RSymbol:
+        name, kind, file_path, line_number, documentation, parameters, returns, package = row
+        return RSymbol(
+            name=name,
+            kind=kind,
+            file_path=file_path,
+            line_number=line_number,
+            documentation=documentation,
+            # R parameter names cannot contain commas
+            parameters=parameters.split(",") if parameters else [],
+            returns=returns,
+            package=package,
+        )
+
+    def _query(self, sql: str, params: tuple = ()) -> list[RSymbol]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._row_to_symbol(row) for row in rows]
+
+    def file_states(self, root: str) -> dict[str, tuple[int, int]]:
+        """Recorded (mtime_ns, size) for every indexed file under a root."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source, mtime_ns, size FROM files WHERE root = ?", (root,)
+            ).fetchall()
+        return {source: (mtime_ns, size) for source, mtime_ns, size in rows}
+
+    def replace_files(
+        self,
+        files: list[tuple[str, Optional[str], int, int, list[RSymbol]]],
+    ) -> int:
+        """Replace the symbols of several files in one transaction.
+
+        Args:
+            files: (source, root, mtime_ns, size, symbols) tuples
+
+        Returns:
+            Number of symbols written
+        """
+        written = 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._delete_sources([source for source, *_ in files])
+                last_id = self._conn.execute(
+                    "SELECT COALESCE(MAX(id), 0) FROM symbols"
+                ).fetchone()[0]
+                for source, root, mtime_ns, size, symbols in files:
+                    self._conn.executemany(
+                        "INSERT INTO symbols (source, name_fold, " + self._SYMBOL_COLUMNS + ") "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        [
+                            (source, sym.name.casefold(), sym.name, sym.kind,
+                             sym.file_path, sym.line_number, sym.documentation,
+                             ",".join(sym.parameters), sym.returns, sym.package)
+                            for sym in symbols
+                        ],
+                    )
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO files (source, root, mtime_ns, size) "
+                        "VALUES (?, ?, ?, ?)",
+                        (source, root, mtime_ns, size),
+                    )
+                    written += len(symbols)
+                # Index names in bulk; per-row FTS inserts are ~10x slower
+                self._conn.execute(
+                    "INSERT INTO symbol_names(rowid, name_fold) "
+                    "SELECT id, name_fold FROM symbols WHERE id > ?",
+                    (last_id,),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return written
+
+    def replace_file(self, source: str, symbols: list[RSymbol]) -> int:
+        """Replace the symbols recorded for a single (unstamped) source."""
+        return self.replace_files([(source, None, 0, 0, symbols)])
+
+    def remove_files(self, sources: list[str]) -> None:
+        """Drop files and their symbols from the index."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._delete_sources(sources)
+                for source in sources:
+                    self._conn.execute("DELETE FROM files WHERE source = ?", (source,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def lookup(self, name: str) -> list[RSymbol]:
+        """All definitions with exactly this name."""
+        return self._query(f"SELECT {self._SYMBOL_COLUMNS} FROM symbols WHERE name = ? ORDER BY id", (name,))
+
+    def lookup_folded(self, name: str) -> list[RSymbol]:
+        """All definitions whose name matches case-insensitively."""
+        return self._query(
+            f"SELECT {self._SYMBOL_COLUMNS} FROM symbols WHERE name_fold = ? ORDER BY id", (name.casefold(),)
+        )
 
-    def __init__(self, name: str = "r-language-server"):
+    def search(self, query: str, exact: bool = False, limit: Optional[int] = None) -> list[RSymbol]:
+        """Find definitions by exact name or case-insensitive substring."""
+        if exact:
+            symbols = self.lookup(query)
+            return symbols[:limit] if limit is not None else symbols
+
+        folded = query.casefold()
+        limit_sql = " LIMIT ?" if limit is not None else ""
+        limit_params = (limit,) if limit is not None else ()
+        if len(folded) >= self.MIN_SUBSTRING_LENGTH:
+            match = '"' + folded.replace('"', '""') + '"'
+            return self._query(
+                f"SELECT {self._SYMBOL_COLUMNS} FROM symbols WHERE id IN "
+                "(SELECT rowid FROM symbol_names WHERE symbol_names MATCH ?) "
+                "ORDER BY id" + limit_sql,
+                (match, *limit_params),
+            )
+        return self._query(
+            f"SELECT {self._SYMBOL_COLUMNS} FROM symbols WHERE instr(name_fold, ?) > 0 "
+            "ORDER BY id" + limit_sql,
+            (folded, *limit_params),
+        )
+
+    def all_symbols(self) -> list[RSymbol]:
+        """Every indexed definition in insertion order."""
+        return self._query(f"SELECT {self._SYMBOL_COLUMNS} FROM symbols ORDER BY id")
+
+    def count_for_root(self, root: str) -> int:
+        """Number of definitions indexed from files under a root."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM symbols s JOIN files f ON f.source = s.source "
+                "WHERE f.root = ?", (root,)
+            ).fetchone()[0]
+
+    def count_by_kind(self) -> dict[str, int]:
+        """Count definitions by kind."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, COUNT(*) FROM symbols GROUP BY kind"
+            ).fetchall()
+        return dict(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM symbols").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _default_index_path() -> Path:
+    from skills_fabric.core.config import config
+    return config.r_index_path
+
+
+class RMCPServer:
+    """FastMCP server for R language support.
+
+    Args:
+        name: MCP server name
+        index_path: SQLite symbol index location (":memory:" for a
+            throwaway index); defaults to the skills_fabric data dir
+        max_workers: Processes used to parse files when indexing
+    """
+
+    def __init__(
+        self,
+        name: str = "r-language-server",
+        index_path: Optional[str | Path] = None,
+        max_workers: Optional[int] = None,
+    ):
         self.mcp = FastMCP(name)
         self.parser = RCodeParser()
-        self.symbols: dict[str, RSymbol] = {}  # name -> symbol
+        self.index = RSymbolIndex(index_path if index_path is not None else _default_index_path())
         self.packages: dict[str, RPackageInfo] = {}
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
 
         self._setup_tools()
         self._setup_resources()
         self._setup_prompts()
 
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Lazily start the parsing process pool."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+
+    @staticmethod
+    def _scan_directory(
+        dir_path: Path,
+        known: dict[str, tuple[int, int]],
+        force: bool,
+    ) -> tuple[list[tuple[str, str]], int, list[str], int]:
+        """Stat R files under a directory and diff against the index.
+
+        Returns:
+            (stale files to parse, unchanged count, removed sources, total files)
+        """
+        r_files = {p.resolve() for p in dir_path.rglob("*.R")}
+        r_files.update(p.resolve() for p in dir_path.rglob("*.r"))
+
+        stale = []
+        unchanged = 0
+        present = set()
+        for r_file in sorted(r_files):
+            source = str(r_file)
+            present.add(source)
+            try:
+                stat = r_file.stat()
+            except OSError:
+                continue
+            if not force and known.get(source) == (stat.st_mtime_ns, stat.st_size):
+                unchanged += 1
+                continue
+            stale.append((source, str(r_file.relative_to(dir_path))))
+
+        removed = [source for source in known if source not in present]
+        return stale, unchanged, removed, len(r_files)
+
+    async def _parse_files(
+        self, files: list[tuple[str, str]]
+    ) -> list[tuple[str, int, int, Optional[list[RSymbol]]]]:
+        """Parse files in the process pool, in chunks, without blocking the loop."""
+        if not files:
+            return []
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        chunks = [
+            files[i:i + INDEX_CHUNK_SIZE] for i in range(0, len(files), INDEX_CHUNK_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, _parse_r_files, chunk) for chunk in chunks)
+        )
+        return [item for chunk in results for item in chunk]
+
     def _setup_tools(self):
         """Register MCP tools."""
 
@@ -327,9 +676,8 @@ class RMCPServer:
             """
             symbols = self.parser.parse(code, file_path)
 
-            # Cache symbols
-            for sym in symbols:
-                self.symbols[sym.name] = sym
+            # Cache symbols (replacing any earlier parse of the same path)
+            self.index.replace_file(file_path, symbols)
 
             return [s.to_dict() for s in symbols]
 
@@ -342,20 +690,9 @@ class RMCPServer:
                 exact: If True, exact match only
 
             Returns:
-                Matching symbols
+                Matching symbols (every definition)
             """
-            results = []
-            name_lower = name.lower()
-
-            for sym_name, sym in self.symbols.items():
-                if exact:
-                    if sym_name == name:
-                        results.append(sym.to_dict())
-                else:
-                    if name_lower in sym_name.lower():
-                        results.append(sym.to_dict())
-
-            return results
+            return [s.to_dict() for s in self.index.search(name, exact=exact)]
 
         @self.mcp.tool()
         async def verify_r_symbol(symbol_name: str) -> dict:
@@ -367,23 +704,24 @@ class RMCPServer:
             Returns:
                 Verification result with citation if found
             """
-            if symbol_name in self.symbols:
-                sym = self.symbols[symbol_name]
-                return {
+            matches = self.index.lookup(symbol_name)
+            fuzzy = False
+            if not matches:
+                # Try case-insensitive match
+                matches = self.index.lookup_folded(symbol_name)
+                fuzzy = True
+
+            if matches:
+                sym = matches[0]
+                result = {
                     'exists': True,
                     'symbol': sym.to_dict(),
                     'citation': sym.to_citation(),
+                    'citations': [m.to_citation() for m in matches],
                 }
-
-            # Try fuzzy match
-            for name, sym in self.symbols.items():
-                if symbol_name.lower() == name.lower():
-                    return {
-                        'exists': True,
-                        'symbol': sym.to_dict(),
-                        'citation': sym.to_citation(),
-                        'fuzzy_match': True,
-                    }
+                if fuzzy:
+                    result['fuzzy_match'] = True
+                return result
 
             return {
                 'exists': False,
@@ -401,8 +739,7 @@ class RMCPServer:
             Returns:
                 Function signature info or None
             """
-            if name in self.symbols:
-                sym = self.symbols[name]
+            for sym in self.index.lookup(name):
                 if sym.kind in ['function', 's3_method']:
                     return {
                         'name': sym.name,
@@ -413,11 +750,15 @@ class RMCPServer:
             return None
 
         @self.mcp.tool()
-        async def index_r_directory(path: str) -> dict:
+        async def index_r_directory(path: str, force: bool = False) -> dict:
             """Index all R files in a directory.
 
+            Only files whose mtime or size changed since the last run are
+            re-parsed; parsing runs in a process pool.
+
             Args:
                 path: Directory path to index
+                force: Re-parse every file regardless of mtime
 
             Returns:
                 Indexing statistics
@@ -425,30 +766,31 @@ class RMCPServer:
             dir_path = Path(path)
             if not dir_path.exists():
                 return {'error': f'Directory not found: {path}'}
-
-            r_files = list(dir_path.rglob("*.R")) + list(dir_path.rglob("*.r"))
-
-            total_symbols = 0
-            indexed_files = 0
-
-            for r_file in r_files:
-                try:
-                    code = r_file.read_text(encoding='utf-8', errors='ignore')
-                    rel_path = str(r_file.relative_to(dir_path))
-                    symbols = self.parser.parse(code, rel_path)
-
-                    for sym in symbols:
-                        self.symbols[sym.name] = sym
-                        total_symbols += 1
-
-                    indexed_files += 1
-                except Exception:
-                    continue
+            dir_path = dir_path.resolve()
+            root = str(dir_path)
+
+            known = await asyncio.to_thread(self.index.file_states, root)
+            stale, unchanged, removed, total_files = await asyncio.to_thread(
+                self._scan_directory, dir_path, known, force
+            )
+
+            parsed = await self._parse_files(stale)
+            updates = [
+                (source, root, mtime_ns, size, symbols)
+                for source, mtime_ns, size, symbols in parsed
+                if symbols is not None
+            ]
+            parsed_symbols = await asyncio.to_thread(self.index.replace_files, updates)
+            if removed:
+                await asyncio.to_thread(self.index.remove_files, removed)
 
             return {
-                'indexed_files': indexed_files,
-                'total_files': len(r_files),
-                'total_symbols': total_symbols,
+                'indexed_files': len(updates),
+                'unchanged_files': unchanged,
+                'removed_files': len(removed),
+                'total_files': total_files,
+                'parsed_symbols': parsed_symbols,
+                'total_symbols': await asyncio.to_thread(self.index.count_for_root, root),
                 'symbol_kinds': self._count_by_kind(),
             }
 
@@ -458,13 +800,16 @@ class RMCPServer:
         @self.mcp.resource("r://symbols")
         async def list_symbols() -> str:
             """List all indexed R symbols."""
-            return json.dumps([s.to_dict() for s in self.symbols.values()], indent=2)
+            return json.dumps([s.to_dict() for s in self.index.all_symbols()], indent=2)
 
         @self.mcp.resource("r://symbol/{name}")
         async def get_symbol(name: str) -> str:
-            """Get a specific R symbol."""
-            if name in self.symbols:
-                return json.dumps(self.symbols[name].to_dict(), indent=2)
+            """Get a specific R symbol (every definition)."""
+            matches = self.index.lookup(name)
+            if matches:
+                if len(matches) == 1:
+                    return json.dumps(matches[0].to_dict(), indent=2)
+                return json.dumps([m.to_dict() for m in matches], indent=2)
             return json.dumps({'error': 'Symbol not found'})
 
     def _setup_prompts(self):
@@ -479,16 +824,23 @@ Follow tidyverse documentation style."""
 
     def _count_by_kind(self) -> dict[str, int]:
         """Count symbols by kind."""
-        counts = {}
-        for sym in self.symbols.values():
-            counts[sym.kind] = counts.get(sym.kind, 0) + 1
-        return counts
+        return self.index.count_by_kind()
+
+    def close(self) -> None:
+        """Stop the parsing pool and close the symbol index."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self.index.close()
 
     def run(self):
         """Run the MCP server."""
         if not MCP_AVAILABLE:
             raise RuntimeError("MCP SDK not available")
-        self.mcp.run()
+        try:
+            self.mcp.run()
+        finally:
+            self.close()
 
 
 # Standalone usage for testing
@@ -62,6 +62,7 @@ from .agent_memory import (
     MemoryType as AgentMemoryType,  # Avoid collision with legacy MemoryType
     MemoryEntry,
     MIRIXMemory,
+    TopicIndex,
     # ADK (Context Compilation)
     ContextTier,
     ContextBlock,
@@ -95,6 +96,7 @@ __all__ = [
     "AgentMemoryType",
     "MemoryEntry",
     "MIRIXMemory",
+    "TopicIndex",
     "ContextTier",
     "ContextBlock",
     "CompiledContext",
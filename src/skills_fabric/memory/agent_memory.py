@@ -35,8 +35,11 @@ Research Sources:
 """
 
 import json
+import queue
 import sqlite3
 import hashlib
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional, Any, Set
 from pathlib import Path
@@ -99,12 +102,23 @@ class Bead:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to serializable dict."""
-        d = asdict(self)
-        d["status"] = self.status.value
-        d["priority"] = self.priority.value
-        d["created_at"] = self.created_at.isoformat()
-        d["updated_at"] = self.updated_at.isoformat()
-        return d
+        # Built field by field: asdict() deep-copies the event trail on
+        # every save, which dominates write cost for large stores.
+        return {
+            "id": self.id,
+            "title": self.title,
+            "status": self.status.value,
+            "priority": self.priority.value,
+            "description": self.description,
+            "labels": list(self.labels),
+            "blocks": list(self.blocks),
+            "blocked_by": list(self.blocked_by),
+            "discovered_from": self.discovered_from,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "assignee": self.assignee,
+            "events": [dict(event) for event in self.events],
+        }
 
     @classmethod
     def from_dict(cls, d: Dict[str, Any]) -> "Bead":
@@ -132,81 +146,231 @@ class BeadsStore:
     Key capability: Ready-set computation
     - Returns tasks with no open blocked_by edges
     - Agents query ready set at session start
+
+    Storage:
+    - SQLite is authoritative: one persistent WAL-mode connection,
+      writes grouped into transactions (see transaction())
+    - Each bead keeps a blocked_count of unfinished blockers, updated
+      incrementally when a blocker changes status, so the ready set is
+      a partial-index query instead of a full scan
+    - JSONL is an optional export written by a background thread
+      (kept for git-friendly history; imported once into an empty DB)
     """
 
-    def __init__(self, storage_path: Path):
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS beads (
+            id TEXT PRIMARY KEY,
+            title TEXT,
+            status TEXT,
+            priority INTEGER,
+            created_at TEXT,
+            updated_at TEXT,
+            discovered_from TEXT,
+            blocked_count INTEGER NOT NULL DEFAULT 0,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS dependencies (
+            bead_id TEXT,
+            blocks_id TEXT,
+            PRIMARY KEY (bead_id, blocks_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_dependencies_blocks
+            ON dependencies(blocks_id);
+        CREATE INDEX IF NOT EXISTS idx_beads_discovered_from
+            ON beads(discovered_from);
+        CREATE INDEX IF NOT EXISTS idx_beads_ready
+            ON beads(priority, created_at)
+            WHERE status = 'open' AND blocked_count = 0;
+    """
+
+    def __init__(self, storage_path: Path, export_jsonl: bool = True):
         self.storage_path = storage_path
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self.beads_file = self.storage_path / "beads.jsonl"
-        self.cache_db = self.storage_path / "beads_cache.db"
+        self.db_path = self.storage_path / "beads.db"
 
-        # Initialize SQLite cache for fast queries
-        self._init_cache()
+        self._lock = threading.RLock()
+        self._tx_depth = 0
+        self._conn = self._init_db()
+        self._export_queue: Optional["queue.Queue[Optional[str]]"] = None
+        self._export_thread: Optional[threading.Thread] = None
 
         # Load existing beads
         self.beads: Dict[str, Bead] = {}
         self._load_beads()
 
-    def _init_cache(self):
-        """Initialize SQLite cache for fast queries."""
-        conn = sqlite3.connect(self.cache_db)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS beads (
-                id TEXT PRIMARY KEY,
-                title TEXT,
-                status TEXT,
-                priority INTEGER,
-                created_at TEXT,
-                updated_at TEXT
-            )
-        """)
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS dependencies (
-                bead_id TEXT,
-                blocks_id TEXT,
-                FOREIGN KEY (bead_id) REFERENCES beads(id)
-            )
-        """)
-        conn.commit()
-        conn.close()
+        # Optional background JSONL export
+        if export_jsonl:
+            self._start_exporter()
+
+    def _init_db(self) -> sqlite3.Connection:
+        """Open the persistent connection and create the schema."""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,  # Transactions are managed explicitly
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(self._SCHEMA)
+        return conn
 
     def _load_beads(self):
-        """Load beads from JSONL file."""
+        """Load beads from SQLite, importing the JSONL log into an empty DB."""
+        rows = self._conn.execute("SELECT data FROM beads").fetchall()
+        if rows:
+            for (data,) in rows:
+                bead = Bead.from_dict(json.loads(data))
+                self.beads[bead.id] = bead
+            return
+
         if not self.beads_file.exists():
             return
 
+        # JSONL is append-only: later lines supersede earlier ones
         with open(self.beads_file, "r") as f:
             for line in f:
                 if line.strip():
-                    data = json.loads(line)
-                    bead = Bead.from_dict(data)
+                    bead = Bead.from_dict(json.loads(line))
                     self.beads[bead.id] = bead
 
-    def _save_bead(self, bead: Bead):
-        """Append bead to JSONL file."""
-        with open(self.beads_file, "a") as f:
-            f.write(json.dumps(bead.to_dict()) + "\n")
+        with self.transaction():
+            for bead in self.beads.values():
+                self._write_bead(bead)
+            for bead in self.beads.values():
+                self._write_dependencies(bead)
+            self._recompute_blocked_counts()
 
-        # Update cache
-        conn = sqlite3.connect(self.cache_db)
-        conn.execute("""
-            INSERT OR REPLACE INTO beads VALUES (?, ?, ?, ?, ?, ?)
+    # -------------------------------------------------------------------------
+    # Transactions and persistence
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into a single SQLite transaction.
+
+        Nested calls join the outermost transaction, which commits on
+        exit (or rolls back on error).
+        """
+        with self._lock:
+            if self._tx_depth == 0:
+                self._conn.execute("BEGIN")
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self._conn.execute("ROLLBACK")
+                raise
+            else:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self._conn.execute("COMMIT")
+
+    def _write_bead(self, bead: Bead):
+        """Upsert a bead row (blocked_count is maintained separately)."""
+        data = bead.to_dict()
+        self._conn.execute("""
+            INSERT INTO beads
+                (id, title, status, priority, created_at, updated_at,
+                 discovered_from, data)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                title = excluded.title,
+                status = excluded.status,
+                priority = excluded.priority,
+                updated_at = excluded.updated_at,
+                discovered_from = excluded.discovered_from,
+                data = excluded.data
         """, (
             bead.id, bead.title, bead.status.value,
             bead.priority.value, bead.created_at.isoformat(),
-            bead.updated_at.isoformat()
+            bead.updated_at.isoformat(), bead.discovered_from,
+            json.dumps(data),
         ))
+        self._export(data)
+
+    def _write_dependencies(self, bead: Bead):
+        """Record blocker -> bead edges for a bead's known blockers."""
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO dependencies VALUES (?, ?)",
+            [(blocker_id, bead.id) for blocker_id in bead.blocked_by
+             if blocker_id in self.beads],
+        )
 
-        # Update dependencies
-        conn.execute("DELETE FROM dependencies WHERE bead_id = ?", (bead.id,))
-        for blocks_id in bead.blocks:
-            conn.execute(
-                "INSERT INTO dependencies VALUES (?, ?)",
-                (bead.id, blocks_id)
+    def _recompute_blocked_counts(self):
+        """Rebuild every blocked_count from the dependency table."""
+        self._conn.execute("""
+            UPDATE beads SET blocked_count = (
+                SELECT COUNT(*) FROM dependencies d
+                JOIN beads blocker ON blocker.id = d.bead_id
+                WHERE d.blocks_id = beads.id AND blocker.status != 'done'
             )
+        """)
 
-        conn.commit()
-        conn.close()
+    def _save_bead(self, bead: Bead):
+        """Persist a bead."""
+        with self.transaction():
+            self._write_bead(bead)
+
+    # -------------------------------------------------------------------------
+    # JSONL export
+    # -------------------------------------------------------------------------
+
+    def _start_exporter(self):
+        """Start the background thread that appends bead snapshots to JSONL."""
+        self._export_queue = queue.Queue()
+        self._export_thread = threading.Thread(
+            target=self._export_loop,
+            name="beads-jsonl-export",
+            daemon=True,
+        )
+        self._export_thread.start()
+
+    def _export(self, data: Dict[str, Any]):
+        """Queue a bead snapshot for JSONL export (no-op when disabled)."""
+        if self._export_queue is not None:
+            self._export_queue.put(json.dumps(data))
+
+    def _export_loop(self):
+        """Drain queued snapshots into the JSONL file in batches."""
+        with open(self.beads_file, "a") as f:
+            while True:
+                line = self._export_queue.get()
+                batch = [line]
+                while True:
+                    try:
+                        batch.append(self._export_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = None in batch
+                f.writelines(line + "\n" for line in batch if line is not None)
+                f.flush()
+                for _ in batch:
+                    self._export_queue.task_done()
+                if stop:
+                    return
+
+    def flush(self):
+        """Block until every queued JSONL snapshot has been written."""
+        if self._export_queue is not None:
+            self._export_queue.join()
+
+    def close(self):
+        """Flush the JSONL export and close the database connection."""
+        if self._export_thread is not None:
+            self._export_queue.put(None)
+            self._export_thread.join()
+            self._export_queue = None
+            self._export_thread = None
+        with self._lock:
+            self._conn.close()
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
 
     def create(
         self,
@@ -233,13 +397,26 @@ class BeadsStore:
 
         bead.add_event("created", {"title": title})
 
-        # Update blocks relationships
-        for blocked_id in bead.blocked_by:
-            if blocked_id in self.beads:
-                self.beads[blocked_id].blocks.append(bead_id)
-
-        self.beads[bead_id] = bead
-        self._save_bead(bead)
+        with self.transaction():
+            # Update blocks relationships
+            blockers = [
+                self.beads[blocked_id] for blocked_id in bead.blocked_by
+                if blocked_id in self.beads
+            ]
+            for blocker in blockers:
+                blocker.blocks.append(bead_id)
+                self._write_bead(blocker)
+
+            self.beads[bead_id] = bead
+            self._write_bead(bead)
+            self._write_dependencies(bead)
+
+            blocked_count = sum(1 for b in blockers if b.status != BeadStatus.DONE)
+            if blocked_count:
+                self._conn.execute(
+                    "UPDATE beads SET blocked_count = ? WHERE id = ?",
+                    (blocked_count, bead_id),
+                )
 
         return bead
 
@@ -255,39 +432,48 @@ class BeadsStore:
             "from": old_status.value,
             "to": status.value
         })
-        self._save_bead(bead)
 
-    def get_ready_set(self) -> List[Bead]:
+        with self.transaction():
+            self._write_bead(bead)
+
+            # Only transitions into or out of DONE unblock/re-block dependents
+            was_done = old_status == BeadStatus.DONE
+            is_done = status == BeadStatus.DONE
+            if was_done != is_done:
+                self._conn.execute(
+                    """
+                    UPDATE beads SET blocked_count = blocked_count + ?
+                    WHERE id IN (SELECT blocks_id FROM dependencies WHERE bead_id = ?)
+                    """,
+                    (-1 if is_done else 1, bead_id),
+                )
+
+    def get_ready_set(self, limit: Optional[int] = None) -> List[Bead]:
         """
         Get all beads ready for work.
 
         Ready = status in {OPEN} AND no open blocked_by edges
-        """
-        ready = []
-
-        for bead in self.beads.values():
-            if bead.status != BeadStatus.OPEN:
-                continue
-
-            # Check if any blocking beads are not done
-            blocked = False
-            for blocked_by_id in bead.blocked_by:
-                if blocked_by_id in self.beads:
-                    if self.beads[blocked_by_id].status != BeadStatus.DONE:
-                        blocked = True
-                        break
 
-            if not blocked:
-                ready.append(bead)
-
-        # Sort by priority, then by creation date
-        ready.sort(key=lambda b: (b.priority.value, b.created_at))
+        Answered from the partial ready index, sorted by priority, then
+        by creation date.
+        """
+        sql = """
+            SELECT id FROM beads
+            WHERE status = 'open' AND blocked_count = 0
+            ORDER BY priority, created_at, rowid
+        """
+        params: tuple = ()
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (limit,)
 
-        return ready
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self.beads[bead_id] for (bead_id,) in rows]
 
     def select_next(self) -> Optional[Bead]:
         """Select the highest priority ready bead."""
-        ready = self.get_ready_set()
+        ready = self.get_ready_set(limit=1)
         return ready[0] if ready else None
 
     def get_discovery_tree(self, bead_id: str) -> Dict[str, Any]:
@@ -296,11 +482,12 @@ class BeadsStore:
             return {}
 
         bead = self.beads[bead_id]
-        children = [
-            self.get_discovery_tree(b.id)
-            for b in self.beads.values()
-            if b.discovered_from == bead_id
-        ]
+        with self._lock:
+            child_ids = self._conn.execute(
+                "SELECT id FROM beads WHERE discovered_from = ? ORDER BY rowid",
+                (bead_id,),
+            ).fetchall()
+        children = [self.get_discovery_tree(child_id) for (child_id,) in child_ids]
 
         return {
             "id": bead.id,
@@ -342,17 +529,161 @@ class MemoryEntry:
         return d
 
 
+class TopicIndex:
+    """
+    Persistent full-text index over MIRIX memories.
+
+    Backed by an SQLite FTS5 table with the trigram tokenizer, so a
+    MATCH query answers the same case-insensitive substring question
+    as a linear scan, but from the index. Maintained incrementally as
+    memories are written.
+    """
+
+    MIN_QUERY_LENGTH = 3
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS memories (
+                rowid INTEGER PRIMARY KEY,
+                id TEXT UNIQUE NOT NULL,
+                memory_type TEXT NOT NULL,
+                ts REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_memories_ts ON memories(ts);
+            CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts USING fts5(
+                topic,
+                content,
+                tokenize = 'trigram'
+            );
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def is_available() -> bool:
+        """Whether this SQLite build supports FTS5 with trigram tokenizer."""
+        try:
+            conn = sqlite3.connect(":memory:")
+            conn.execute(
+                "CREATE VIRTUAL TABLE t USING fts5(x, tokenize = 'trigram')"
+            )
+            conn.close()
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    def count(self) -> int:
+        """Number of indexed memories."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+
+    def _upsert(self, entry: MemoryEntry):
+        # Re-inserting gives a rewritten entry the newest rowid, which keeps
+        # rowid order equal to timestamp order (see search()).
+        row = self._conn.execute(
+            "SELECT rowid FROM memories WHERE id = ?", (entry.id,)
+        ).fetchone()
+        if row is not None:
+            self._conn.execute("DELETE FROM memories WHERE rowid = ?", row)
+            self._conn.execute("DELETE FROM memory_fts WHERE rowid = ?", row)
+        rowid = self._conn.execute(
+            "INSERT INTO memories (id, memory_type, ts) VALUES (?, ?, ?)",
+            (entry.id, entry.memory_type.value, entry.timestamp.timestamp()),
+        ).lastrowid
+        self._conn.execute(
+            "INSERT INTO memory_fts (rowid, topic, content) VALUES (?, ?, ?)",
+            (rowid, entry.topic, entry.content),
+        )
+
+    def add(self, entry: MemoryEntry):
+        """Index (or re-index) a single memory."""
+        with self._lock:
+            self._upsert(entry)
+            self._conn.commit()
+
+    def rebuild(self, entries: List[MemoryEntry]):
+        """Replace the index contents in one transaction."""
+        with self._lock:
+            self._conn.execute("DELETE FROM memories")
+            self._conn.execute("DELETE FROM memory_fts")
+            for entry in sorted(entries, key=lambda e: e.timestamp):
+                self._upsert(entry)
+            self._conn.commit()
+
+    def search(
+        self,
+        topic: str,
+        memory_types: Optional[List[MemoryType]] = None,
+        since: Optional[datetime] = None,
+        limit: int = 10,
+        rank: str = "recency",
+    ) -> List[tuple]:
+        """
+        Find memories whose topic or content contains ``topic``.
+
+        Returns (memory_type, id) pairs ordered by recency (default) or
+        by BM25 relevance (``rank="bm25"``). Trigrams need at least
+        MIN_QUERY_LENGTH characters; shorter queries are the caller's job.
+        """
+        # Trigram MATCH is a substring search; quote it as one phrase
+        clauses = ["memory_fts MATCH ?"]
+        params: List[Any] = ['"' + topic.replace('"', '""') + '"']
+
+        if memory_types is not None:
+            if not memory_types:
+                return []
+            clauses.append(
+                "m.memory_type IN (%s)" % ",".join("?" * len(memory_types))
+            )
+            params.extend(mt.value for mt in memory_types)
+
+        # Recency order walks the FTS doclist newest-first and stops at
+        # ``limit``; BM25 has to score every match.
+        order = "bm25(memory_fts), f.rowid DESC" if rank == "bm25" else "f.rowid DESC"
+
+        with self._lock:
+            if since is not None:
+                # rowids follow timestamps, so recency is a rowid range
+                first = self._conn.execute(
+                    "SELECT MIN(rowid) FROM memories WHERE ts >= ?",
+                    (since.timestamp(),),
+                ).fetchone()[0]
+                if first is None:
+                    return []
+                clauses.append("f.rowid >= ?")
+                params.append(first)
+
+            sql = (
+                "SELECT m.memory_type, m.id FROM memory_fts f "
+                "JOIN memories m ON m.rowid = f.rowid WHERE "
+                + " AND ".join(clauses)
+                + f" ORDER BY {order} LIMIT ?"
+            )
+            params.append(limit)
+            rows = self._conn.execute(sql, params).fetchall()
+        return [(MemoryType(mt), entry_id) for mt, entry_id in rows]
+
+    def close(self):
+        """Close the index connection."""
+        with self._lock:
+            self._conn.close()
+
+
 class MIRIXMemory:
     """
     Multi-type memory system for agent learning.
 
     Based on MIRIX architecture:
     - 6 specialized memory types
-    - Active retrieval by topic
+    - Active retrieval by topic (FTS5 trigram index when available)
     - Cross-memory search
     """
 
-    def __init__(self, storage_path: Path):
+    def __init__(self, storage_path: Path, use_index: bool = True):
         self.storage_path = storage_path
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
@@ -363,6 +694,12 @@ class MIRIXMemory:
 
         self._load_memories()
 
+        # Topic index persisted next to the JSONL files
+        self.index: Optional[TopicIndex] = None
+        if use_index and TopicIndex.is_available():
+            self.index = TopicIndex(self.storage_path / "topic_index.db")
+            self._sync_index()
+
     def _load_memories(self):
         """Load memories from storage."""
         for memory_type in MemoryType:
@@ -377,12 +714,25 @@ class MIRIXMemory:
                             entry = MemoryEntry(**data)
                             self.memories[memory_type][entry.id] = entry
 
+    def _sync_index(self):
+        """Rebuild the index if it disagrees with the JSONL files."""
+        total = sum(len(entries) for entries in self.memories.values())
+        if self.index.count() != total:
+            self.index.rebuild([
+                entry
+                for entries in self.memories.values()
+                for entry in entries.values()
+            ])
+
     def _save_entry(self, entry: MemoryEntry):
         """Save a memory entry."""
         file_path = self.storage_path / f"{entry.memory_type.value}.jsonl"
         with open(file_path, "a") as f:
             f.write(json.dumps(entry.to_dict()) + "\n")
 
+        if self.index is not None:
+            self.index.add(entry)
+
     def add(
         self,
         memory_type: MemoryType,
@@ -413,23 +763,45 @@ class MIRIXMemory:
         topic: str,
         memory_types: List[MemoryType] = None,
         limit: int = 10,
+        since: Optional[datetime] = None,
+        rank: str = "recency",
     ) -> List[MemoryEntry]:
         """
         Retrieve memories by topic (active retrieval).
 
-        Searches across specified memory types (or all).
+        Searches across specified memory types (or all), optionally
+        restricted to memories written at or after ``since``. Results are
+        most recent first, or BM25-ranked with ``rank="bm25"`` (index only;
+        queries shorter than three characters fall back to a linear scan).
         """
+        if self.index is not None and len(topic) >= TopicIndex.MIN_QUERY_LENGTH:
+            hits = self.index.search(
+                topic,
+                memory_types=memory_types,
+                since=since,
+                limit=limit,
+                rank=rank,
+            )
+            return [
+                self.memories[mt][entry_id]
+                for mt, entry_id in hits
+                if entry_id in self.memories[mt]
+            ]
+
         if memory_types is None:
             memory_types = list(MemoryType)
 
         results = []
+        needle = topic.lower()
 
         for mt in memory_types:
             for entry in self.memories[mt].values():
+                if since is not None and entry.timestamp < since:
+                    continue
                 # Simple topic matching (could be enhanced with embeddings)
-                if topic.lower() in entry.topic.lower():
+                if needle in entry.topic.lower():
                     results.append(entry)
-                elif topic.lower() in entry.content.lower():
+                elif needle in entry.content.lower():
                     results.append(entry)
 
         # Sort by timestamp (most recent first)
@@ -437,6 +809,11 @@ class MIRIXMemory:
 
         return results[:limit]
 
+    def close(self):
+        """Close the topic index."""
+        if self.index is not None:
+            self.index.close()
+
     # Convenience methods for specific memory types
 
     def add_episodic(self, session_id: str, content: str, metadata: Dict = None):
@@ -87,11 +87,40 @@ class KnowledgeGraph:
         relevant = kg.get_relevant_memories(query="state management", limit=10)
     """
 
-    def __init__(self):
-        from ..core.database import db
-        self.db = db
+    # Columns returned for a full Memory row (see _row_to_memory)
+    _MEMORY_RETURN = (
+        "{v}.id, {v}.memory_type, {v}.content, {v}.created_at, "
+        "{v}.last_accessed, {v}.access_count, {v}.decay_factor"
+    )
+
+    def __init__(self, database=None):
+        if database is None:
+            from ..core.database import db as database
+        self.db = database
         self._ensure_schema()
 
+    @staticmethod
+    def _to_datetime(value: Any) -> datetime:
+        """Kuzu returns TIMESTAMP columns as datetime; tolerate ISO strings."""
+        if isinstance(value, datetime):
+            return value
+        if value:
+            return datetime.fromisoformat(value)
+        return datetime.now()
+
+    @classmethod
+    def _row_to_memory(cls, row: list) -> Memory:
+        """Build a Memory from a row selected with _MEMORY_RETURN."""
+        return Memory(
+            id=row[0],
+            memory_type=MemoryType(row[1]),
+            content=row[2],
+            created_at=cls._to_datetime(row[3]),
+            last_accessed=cls._to_datetime(row[4]),
+            access_count=row[5] or 1,
+            decay_factor=row[6] or 1.0
+        )
+
     def _ensure_schema(self) -> None:
         """Ensure memory schema exists in database."""
         try:
@@ -130,6 +159,18 @@ class KnowledgeGraph:
         except Exception:
             pass  # Tables may already exist
 
+    @staticmethod
+    def _memory_params(memory: Memory) -> dict:
+        return {
+            "id": memory.id,
+            "memory_type": memory.memory_type.value,
+            "content": str(memory.content)[:5000],
+            "created_at": memory.created_at,
+            "last_accessed": memory.last_accessed,
+            "access_count": memory.access_count,
+            "decay_factor": memory.decay_factor
+        }
+
     def add_memory(self, memory: Memory) -> bool:
         """Add a memory to the knowledge graph."""
         try:
@@ -145,43 +186,49 @@ class KnowledgeGraph:
                     decay_factor: $decay_factor
                 })
                 """,
-                {
-                    "id": memory.id,
-                    "memory_type": memory.memory_type.value,
-                    "content": str(memory.content)[:5000],
-                    "created_at": memory.created_at.isoformat(),
-                    "last_accessed": memory.last_accessed.isoformat(),
-                    "access_count": memory.access_count,
-                    "decay_factor": memory.decay_factor
-                }
+                self._memory_params(memory)
             )
             return True
         except Exception:
             return False
 
+    def add_memories(self, memories: list[Memory]) -> int:
+        """Add many memories with a single UNWIND ... CREATE statement."""
+        if not memories:
+            return 0
+        try:
+            self.db.execute(
+                """
+                UNWIND $rows AS row
+                CREATE (m:Memory {
+                    id: row.id,
+                    memory_type: row.memory_type,
+                    content: row.content,
+                    created_at: row.created_at,
+                    last_accessed: row.last_accessed,
+                    access_count: row.access_count,
+                    decay_factor: row.decay_factor
+                })
+                """,
+                {"rows": [self._memory_params(m) for m in memories]}
+            )
+            return len(memories)
+        except Exception:
+            return 0
+
     def get_memory(self, memory_id: str) -> Optional[Memory]:
         """Retrieve a memory by ID and update access."""
         try:
             res = self.db.execute(
-                """
-                MATCH (m:Memory {id: $id})
-                RETURN m.memory_type, m.content, m.created_at, m.last_accessed,
-                       m.access_count, m.decay_factor
+                f"""
+                MATCH (m:Memory {{id: $id}})
+                RETURN {self._MEMORY_RETURN.format(v="m")}
                 """,
                 {"id": memory_id}
             )
 
             if res.has_next():
-                row = res.get_next()
-                memory = Memory(
-                    id=memory_id,
-                    memory_type=MemoryType(row[0]),
-                    content=row[1],
-                    created_at=datetime.fromisoformat(row[2]) if row[2] else datetime.now(),
-                    last_accessed=datetime.fromisoformat(row[3]) if row[3] else datetime.now(),
-                    access_count=row[4] or 1,
-                    decay_factor=row[5] or 1.0
-                )
+                memory = self._row_to_memory(res.get_next())
 
                 # Update access
                 self._update_access(memory_id)
@@ -199,7 +246,7 @@ class KnowledgeGraph:
                 MATCH (m:Memory {id: $id})
                 SET m.last_accessed = $now, m.access_count = m.access_count + 1
                 """,
-                {"id": memory_id, "now": datetime.now().isoformat()}
+                {"id": memory_id, "now": datetime.now()}
             )
         except Exception:
             pass
@@ -246,36 +293,46 @@ class KnowledgeGraph:
         memory_id: str,
         limit: int = 10
     ) -> list[tuple[Memory, float]]:
-        """Get memories similar to the given one."""
+        """Get memories similar to the given one.
+
+        One statement selects the top neighbours with their SIMILAR_TO
+        scores, records the access on all of them and returns the full
+        rows, so the returned memories already reflect this access.
+        """
         try:
             res = self.db.execute(
-                """
-                MATCH (m:Memory {id: $id})-[r:SIMILAR_TO]->(s:Memory)
-                RETURN s.id, r.similarity
-                ORDER BY r.similarity DESC
+                f"""
+                MATCH (m:Memory {{id: $id}})-[r:SIMILAR_TO]->(s:Memory)
+                WITH s, r.similarity AS similarity
+                ORDER BY similarity DESC
                 LIMIT $limit
+                SET s.last_accessed = $now, s.access_count = s.access_count + 1
+                RETURN {self._MEMORY_RETURN.format(v="s")}, similarity
+                ORDER BY similarity DESC
                 """,
-                {"id": memory_id, "limit": limit}
+                {"id": memory_id, "limit": limit, "now": datetime.now()}
             )
 
             results = []
             while res.has_next():
                 row = res.get_next()
-                memory = self.get_memory(row[0])
-                if memory:
-                    results.append((memory, row[1]))
+                results.append((self._row_to_memory(row), row[7]))
 
             return results
         except Exception:
             return []
 
-    def apply_decay(self, hours_threshold: int = 24) -> int:
+    def apply_decay(
+        self,
+        hours_threshold: int = 24,
+        decay_rate: float = 0.95
+    ) -> int:
         """Apply decay to memories not accessed recently.
 
-        Smart Forgetting: Reduce relevance of stale memories.
+        Smart Forgetting: Reduce relevance of stale memories
+        (5% per application by default) with one set-based update.
         """
         threshold = datetime.now() - timedelta(hours=hours_threshold)
-        decay_rate = 0.95  # 5% decay per application
 
         try:
             res = self.db.execute(
@@ -285,7 +342,7 @@ class KnowledgeGraph:
                 SET m.decay_factor = m.decay_factor * $rate
                 RETURN count(m)
                 """,
-                {"threshold": threshold.isoformat(), "rate": decay_rate}
+                {"threshold": threshold, "rate": decay_rate}
             )
 
             if res.has_next():
@@ -297,15 +354,16 @@ class KnowledgeGraph:
     def prune_forgotten(self, min_decay: float = 0.1) -> int:
         """Remove memories with very low decay factor.
 
-        These memories have been "forgotten" through disuse.
+        These memories have been "forgotten" through disuse. Their
+        relationships are removed with them in the same statement.
         """
         try:
             res = self.db.execute(
                 """
                 MATCH (m:Memory)
                 WHERE m.decay_factor < $min_decay
-                DELETE m
-                RETURN count(m)
+                DETACH DELETE m
+                RETURN count(*)
                 """,
                 {"min_decay": min_decay}
             )
@@ -331,10 +389,9 @@ class KnowledgeGraph:
         try:
             if memory_type:
                 res = self.db.execute(
-                    """
-                    MATCH (m:Memory {memory_type: $type})
-                    RETURN m.id, m.memory_type, m.content, m.created_at,
-                           m.last_accessed, m.access_count, m.decay_factor
+                    f"""
+                    MATCH (m:Memory {{memory_type: $type}})
+                    RETURN {self._MEMORY_RETURN.format(v="m")}
                     ORDER BY m.last_accessed DESC, m.access_count DESC
                     LIMIT $limit
                     """,
@@ -342,10 +399,9 @@ class KnowledgeGraph:
                 )
             else:
                 res = self.db.execute(
-                    """
+                    f"""
                     MATCH (m:Memory)
-                    RETURN m.id, m.memory_type, m.content, m.created_at,
-                           m.last_accessed, m.access_count, m.decay_factor
+                    RETURN {self._MEMORY_RETURN.format(v="m")}
                     ORDER BY m.last_accessed DESC, m.access_count DESC
                     LIMIT $limit
                     """,
@@ -354,16 +410,7 @@ class KnowledgeGraph:
 
             memories = []
             while res.has_next():
-                row = res.get_next()
-                memories.append(Memory(
-                    id=row[0],
-                    memory_type=MemoryType(row[1]),
-                    content=row[2],
-                    created_at=datetime.fromisoformat(row[3]) if row[3] else datetime.now(),
-                    last_accessed=datetime.fromisoformat(row[4]) if row[4] else datetime.now(),
-                    access_count=row[5] or 1,
-                    decay_factor=row[6] or 1.0
-                ))
+                memories.append(self._row_to_memory(res.get_next()))
 
             # Sort by relevance score
             memories.sort(key=lambda m: m.relevance_score, reverse=True)
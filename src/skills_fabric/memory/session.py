@@ -5,12 +5,20 @@ Supermemory-inspired features:
 - Track failures and successful patterns
 - Resume context from previous sessions
 - Session-specific strategy adjustments
+
+Storage is a snapshot (``sessions.json``) plus an append-only journal
+(``sessions.json.journal``). Each record_* call appends one compact event
+line; fsync is group-committed, and the journal is folded into a fresh
+snapshot periodically and on close().
 """
 from dataclasses import dataclass, field
 from typing import Optional, Any
 from datetime import datetime
 import json
+import os
 from pathlib import Path
+import threading
+import time
 import uuid
 
 
@@ -65,7 +73,7 @@ class SessionMemory:
     """Manages session history and cross-session learning.
 
     Features:
-    - Persist session records to JSON file
+    - Persist session records to a JSON snapshot plus append-only journal
     - Track patterns across sessions
     - Resume from previous session context
     - Learn optimal strategies over time
@@ -87,14 +95,46 @@ class SessionMemory:
         best_strategy = memory.get_best_strategy("langgraph")
     """
 
-    def __init__(self, storage_path: Path = None):
+    # Counters that record_* calls increment
+    _COUNTERS = ("skills_created", "skills_verified", "skills_rejected", "iterations")
+
+    def __init__(
+        self,
+        storage_path: Path = None,
+        sync_every: int = 64,
+        sync_interval: float = 1.0,
+        compact_every: int = 10_000,
+    ):
+        """Open (or create) session storage.
+
+        Args:
+            storage_path: Snapshot file; the journal lives beside it.
+            sync_every: fsync the journal after this many events.
+            sync_interval: ...or when this many seconds passed since the last fsync.
+            compact_every: Fold the journal into the snapshot after this many events.
+        """
         self.storage_path = storage_path or Path.home() / ".skills_fabric" / "sessions.json"
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        self.journal_path = self.storage_path.with_name(self.storage_path.name + ".journal")
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.compact_every = compact_every
+
         self._sessions: dict[str, SessionRecord] = {}
+        self._seq = 0  # Sequence number of the last applied event
+        self._unsynced = 0
+        self._journaled = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+        self._torn_tail = False
         self._load()
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+        if self._torn_tail:
+            # Never append after a partial line; start from a clean snapshot
+            self._compact()
 
     def _load(self) -> None:
-        """Load sessions from storage."""
+        """Load the snapshot, then replay the journal tail on top of it."""
         if self.storage_path.exists():
             try:
                 with open(self.storage_path, 'r') as f:
@@ -102,19 +142,122 @@ class SessionMemory:
                     for session_data in data.get("sessions", []):
                         session = SessionRecord.from_dict(session_data)
                         self._sessions[session.session_id] = session
+                    self._seq = data.get("seq", 0)
             except Exception:
                 self._sessions = {}
-
-    def _save(self) -> None:
-        """Save sessions to storage."""
+                self._seq = 0
+
+        if self.journal_path.exists():
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Torn write at the tail: stop replay here
+                        self._torn_tail = True
+                        break
+                    # Events already folded into the snapshot are skipped, so a
+                    # crash between snapshot and journal truncation is harmless.
+                    if event["n"] > self._seq:
+                        self._apply(event)
+                        self._seq = event["n"]
+                        self._journaled += 1
+
+    def _apply(self, event: dict) -> None:
+        """Apply one journal event to in-memory state."""
+        op = event["op"]
+        if op == "start":
+            session = SessionRecord.from_dict(event["v"])
+            self._sessions[session.session_id] = session
+            return
+
+        session = self._sessions.get(event["s"])
+        if session is None:
+            return
+        if op == "inc" and event["f"] in self._COUNTERS:
+            setattr(session, event["f"], getattr(session, event["f"]) + 1)
+        elif op == "err":
+            session.errors.append(event["v"])
+        elif op == "adj":
+            session.strategy_adjustments.append(event["v"])
+        elif op == "end":
+            session.ended_at = datetime.fromisoformat(event["v"])
+
+    def _record(self, op: str, session_id: str, value: Any = None, **extra: Any) -> None:
+        """Apply an event and append it to the journal."""
+        with self._lock:
+            self._seq += 1
+            event = {"n": self._seq, "op": op, "s": session_id}
+            if value is not None:
+                event["v"] = value
+            event.update(extra)
+            self._apply(event)
+
+            # write+flush hands the line to the OS (survives a process crash);
+            # fsync is batched to bound loss on power failure.
+            self._journal.write(json.dumps(event, separators=(",", ":")) + "\n")
+            self._journal.flush()
+            self._unsynced += 1
+            self._journaled += 1
+
+            if (
+                self._unsynced >= self.sync_every
+                or time.monotonic() - self._last_sync >= self.sync_interval
+            ):
+                self._sync()
+            if self._journaled >= self.compact_every:
+                self._compact()
+
+    def _sync(self) -> None:
+        """fsync pending journal events (group commit)."""
+        if self._unsynced:
+            os.fsync(self._journal.fileno())
+            self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _compact(self) -> None:
+        """Write a snapshot atomically, then truncate the journal."""
+        self._sync()
         try:
             data = {
+                "seq": self._seq,
                 "sessions": [s.to_dict() for s in self._sessions.values()]
             }
-            with open(self.storage_path, 'w') as f:
+            tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+            with open(tmp_path, 'w') as f:
                 json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.storage_path)
         except Exception:
-            pass
+            return
+
+        self._journal.truncate(0)
+        self._journaled = 0
+
+    def _save(self) -> None:
+        """Fold the journal into the snapshot."""
+        with self._lock:
+            self._compact()
+
+    def flush(self) -> None:
+        """fsync any journal events not yet committed."""
+        with self._lock:
+            self._sync()
+
+    def close(self) -> None:
+        """Compact into the snapshot and close the journal."""
+        with self._lock:
+            if self._journal.closed:
+                return
+            self._compact()
+            self._journal.close()
+
+    def __enter__(self) -> "SessionMemory":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def start_session(self, library: str = "") -> SessionRecord:
         """Start a new generation session."""
@@ -123,17 +266,14 @@ class SessionMemory:
             started_at=datetime.now(),
             library=library
         )
-        self._sessions[session.session_id] = session
-        self._save()
-        return session
+        self._record("start", session.session_id, session.to_dict())
+        return self._sessions[session.session_id]
 
     def end_session(self, session_id: str) -> Optional[SessionRecord]:
         """End a session and save final state."""
         if session_id in self._sessions:
-            session = self._sessions[session_id]
-            session.ended_at = datetime.now()
-            self._save()
-            return session
+            self._record("end", session_id, datetime.now().isoformat())
+            return self._sessions[session_id]
         return None
 
     def get_session(self, session_id: str) -> Optional[SessionRecord]:
@@ -143,32 +283,27 @@ class SessionMemory:
     def record_skill_created(self, session_id: str) -> None:
         """Record a skill was created in this session."""
         if session_id in self._sessions:
-            self._sessions[session_id].skills_created += 1
-            self._save()
+            self._record("inc", session_id, f="skills_created")
 
     def record_skill_verified(self, session_id: str) -> None:
         """Record a skill was verified in this session."""
         if session_id in self._sessions:
-            self._sessions[session_id].skills_verified += 1
-            self._save()
+            self._record("inc", session_id, f="skills_verified")
 
     def record_skill_rejected(self, session_id: str) -> None:
         """Record a skill was rejected in this session."""
         if session_id in self._sessions:
-            self._sessions[session_id].skills_rejected += 1
-            self._save()
+            self._record("inc", session_id, f="skills_rejected")
 
     def record_failure(self, session_id: str, error: str) -> None:
         """Record a failure in this session."""
         if session_id in self._sessions:
-            self._sessions[session_id].errors.append(error)
-            self._save()
+            self._record("err", session_id, error)
 
     def record_iteration(self, session_id: str) -> None:
         """Record an iteration in this session."""
         if session_id in self._sessions:
-            self._sessions[session_id].iterations += 1
-            self._save()
+            self._record("inc", session_id, f="iterations")
 
     def record_strategy_adjustment(
         self,
@@ -177,11 +312,10 @@ class SessionMemory:
     ) -> None:
         """Record a strategy adjustment made during session."""
         if session_id in self._sessions:
-            self._sessions[session_id].strategy_adjustments.append({
+            self._record("adj", session_id, {
                 "timestamp": datetime.now().isoformat(),
                 **adjustment
             })
-            self._save()
 
     def get_recent_sessions(
         self,
@@ -42,6 +42,7 @@ from .metrics import (
     MetricType,
     MetricValue,
     MetricsRegistry,
+    QuantileSketch,
     TimerContext,
     SkillsMetrics,
     get_metrics,
@@ -63,6 +64,7 @@ from .tracing import (
     SpanEvent,
     Span,
     TracerProvider,
+    BatchSpanProcessor,
     Tracer,
     SkillsTracer,
     get_tracer,
@@ -70,6 +72,9 @@ from .tracing import (
     get_skills_tracer,
     console_exporter,
     json_exporter,
+    otlp_file_exporter,
+    JSONLinesExporter,
+    OTLPFileExporter,
 )
 
 __all__ = [
@@ -77,6 +82,7 @@ __all__ = [
     "MetricType",
     "MetricValue",
     "MetricsRegistry",
+    "QuantileSketch",
     "TimerContext",
     "SkillsMetrics",
     "get_metrics",
@@ -96,6 +102,7 @@ __all__ = [
     "SpanEvent",
     "Span",
     "TracerProvider",
+    "BatchSpanProcessor",
     "Tracer",
     "SkillsTracer",
     "get_tracer",
@@ -103,4 +110,7 @@ __all__ = [
     "get_skills_tracer",
     "console_exporter",
     "json_exporter",
+    "otlp_file_exporter",
+    "JSONLinesExporter",
+    "OTLPFileExporter",
 ]
@@ -11,12 +11,19 @@ Supports multiple backends:
 - In-memory (default)
 - Prometheus (optional)
 - StatsD (optional)
+
+Histograms and timers are stored as constant-memory quantile sketches
+(log-bucketed, DDSketch-style) striped across a fixed number of shards,
+so recording never grows memory with the number of observations or
+threads, and reads never sort.
 """
 from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
 from enum import Enum
 from collections import defaultdict
+import itertools
+import math
 import threading
 
 
@@ -38,9 +45,162 @@ class MetricValue:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
+class QuantileSketch:
+    """Mergeable, constant-memory quantile sketch.
+
+    Values are counted in logarithmic buckets of width ``gamma`` =
+    (1 + a) / (1 - a), so any quantile is returned within relative
+    error ``a`` (default 1%) of the true value, regardless of how many
+    observations were recorded. Memory is bounded by ``max_buckets``
+    per sign; beyond that the smallest-magnitude buckets are collapsed.
+    """
+
+    __slots__ = (
+        "relative_accuracy", "max_buckets", "_gamma", "_log_gamma",
+        "_positive", "_negative", "zero_count", "count", "sum", "min", "max",
+    )
+
+    # Values with smaller magnitude than this are counted as zero
+    MIN_INDEXABLE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: dict[int, int] = {}
+        self._negative: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _index(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        # Midpoint (in relative terms) of bucket (gamma^(i-1), gamma^i]
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def add(self, value: float) -> None:
+        """Record one observation."""
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if value > self.MIN_INDEXABLE:
+            buckets = self._positive
+            index = self._index(value)
+        elif value < -self.MIN_INDEXABLE:
+            buckets = self._negative
+            index = self._index(-value)
+        else:
+            self.zero_count += 1
+            return
+
+        buckets[index] = buckets.get(index, 0) + 1
+        if len(buckets) > self.max_buckets:
+            self._collapse(buckets)
+
+    def _collapse(self, buckets: dict[int, int]) -> None:
+        """Fold the two smallest-magnitude buckets together."""
+        lowest, second = sorted(buckets)[:2]
+        buckets[second] += buckets.pop(lowest)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Merge another sketch (same accuracy) into this one."""
+        if other.count == 0:
+            return
+        for mine, theirs in ((self._positive, other._positive), (self._negative, other._negative)):
+            for index, n in theirs.items():
+                mine[index] = mine.get(index, 0) + n
+            while len(mine) > self.max_buckets:
+                self._collapse(mine)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> "QuantileSketch":
+        """Independent copy of this sketch."""
+        clone = QuantileSketch(self.relative_accuracy, self.max_buckets)
+        clone.merge(self)
+        return clone
+
+    def quantiles(self, qs: list[float]) -> list[float]:
+        """Estimate several quantiles (0..1) in one pass over the buckets."""
+        if self.count == 0:
+            return [math.nan for _ in qs]
+
+        # Buckets in ascending value order: negatives (largest magnitude
+        # first), zero, positives
+        ordered = [(-self._value(i), n) for i, n in sorted(self._negative.items(), reverse=True)]
+        if self.zero_count:
+            ordered.append((0.0, self.zero_count))
+        ordered.extend((self._value(i), n) for i, n in sorted(self._positive.items()))
+
+        # Nearest-rank: the value at sorted index int(count * q)
+        ranks = sorted((min(int(self.count * q), self.count - 1), pos) for pos, q in enumerate(qs))
+        results = [0.0] * len(qs)
+        seen = 0
+        bucket = 0
+        for rank, pos in ranks:
+            while seen + ordered[bucket][1] <= rank:
+                seen += ordered[bucket][1]
+                bucket += 1
+            results[pos] = min(max(ordered[bucket][0], self.min), self.max)
+        return results
+
+    def quantile(self, q: float) -> float:
+        """Estimate a single quantile (0..1)."""
+        return self.quantiles([q])[0]
+
+    def stats(self) -> dict:
+        """Summary statistics in the registry's stats format."""
+        if self.count == 0:
+            return {"count": 0}
+        p50, p95, p99 = self.quantiles([0.5, 0.95, 0.99])
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "avg": self.sum / self.count,
+            "p50": p50,
+            "p95": p95,
+            "p99": p99,
+        }
+
+
+# Shards per histogram/timer series. Threads are assigned a stripe
+# round-robin on first use, so a series never holds more than this many
+# sketches however many threads come and go.
+SKETCH_STRIPES = 8
+
+
+class _SketchShard:
+    """One stripe's sketch for one series, guarded by its own lock."""
+
+    __slots__ = ("lock", "sketch")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sketch = QuantileSketch()
+
+
 class MetricsRegistry:
     """Thread-safe metrics registry.
 
+    Histograms and timers record into striped sketch shards: each thread
+    writes to its stripe's shard, so the hot path takes only a (rarely
+    contended) shard lock, and reads merge the SKETCH_STRIPES shards
+    outside the registry lock.
+
     Usage:
         metrics = MetricsRegistry()
 
@@ -62,8 +222,14 @@ class MetricsRegistry:
         self._lock = threading.Lock()
         self._counters: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
         self._gauges: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
-        self._histograms: dict[str, dict[str, list]] = defaultdict(lambda: defaultdict(list))
-        self._timers: dict[str, dict[str, list]] = defaultdict(lambda: defaultdict(list))
+        # kind ("histogram" | "timer") -> name -> labels key -> shards
+        self._sketches: dict[str, dict[str, dict[str, list[_SketchShard]]]] = {
+            "histogram": defaultdict(lambda: defaultdict(list)),
+            "timer": defaultdict(lambda: defaultdict(list)),
+        }
+        self._local = threading.local()
+        self._stripes = itertools.count()
+        self._generation = 0  # Bumped by reset() to drop thread-local shard lookups
 
     def _labels_key(self, labels: dict) -> str:
         """Convert labels dict to string key."""
@@ -95,6 +261,29 @@ class MetricsRegistry:
         with self._lock:
             self._gauges[name][key] = value
 
+    def _shard(self, kind: str, name: str, key: str) -> _SketchShard:
+        """This thread's stripe of a series, created with the series."""
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            local.shards = {}
+            local.generation = self._generation
+            if not hasattr(local, "stripe"):
+                local.stripe = next(self._stripes) % SKETCH_STRIPES
+        shard = local.shards.get((kind, name, key))
+        if shard is None:
+            with self._lock:
+                shards = self._sketches[kind][name][key]
+                if not shards:
+                    shards.extend(_SketchShard() for _ in range(SKETCH_STRIPES))
+            shard = shards[local.stripe]
+            local.shards[(kind, name, key)] = shard
+        return shard
+
+    def _record(self, kind: str, name: str, value: float, labels: Optional[dict]) -> None:
+        shard = self._shard(kind, name, self._labels_key(labels or {}))
+        with shard.lock:
+            shard.sketch.add(value)
+
     def histogram(
         self,
         name: str,
@@ -102,10 +291,7 @@ class MetricsRegistry:
         labels: dict = None
     ) -> None:
         """Record a value in a histogram."""
-        labels = labels or {}
-        key = self._labels_key(labels)
-        with self._lock:
-            self._histograms[name][key].append(value)
+        self._record("histogram", name, value, labels)
 
     def timer(self, name: str, labels: dict = None) -> "TimerContext":
         """Create a timer context manager."""
@@ -118,10 +304,7 @@ class MetricsRegistry:
         labels: dict = None
     ) -> None:
         """Record a duration in milliseconds."""
-        labels = labels or {}
-        key = self._labels_key(labels)
-        with self._lock:
-            self._timers[name][key].append(duration_ms)
+        self._record("timer", name, duration_ms, labels)
 
     def get_counter(self, name: str, labels: dict = None) -> float:
         """Get counter value."""
@@ -135,51 +318,54 @@ class MetricsRegistry:
         with self._lock:
             return self._gauges[name][key]
 
-    def get_histogram_stats(self, name: str, labels: dict = None) -> dict:
-        """Get histogram statistics."""
+    @staticmethod
+    def _merge_shards(shards: list[_SketchShard]) -> QuantileSketch:
+        merged = QuantileSketch()
+        for shard in shards:
+            with shard.lock:
+                merged.merge(shard.sketch)
+        return merged
+
+    def get_sketch(self, name: str, labels: dict = None, kind: str = "histogram") -> QuantileSketch:
+        """Merged sketch for one histogram (or ``kind="timer"``) series."""
         key = self._labels_key(labels or {})
         with self._lock:
-            values = self._histograms[name][key]
-            if not values:
-                return {"count": 0}
-            return {
-                "count": len(values),
-                "sum": sum(values),
-                "min": min(values),
-                "max": max(values),
-                "avg": sum(values) / len(values),
-                "p50": sorted(values)[len(values) // 2],
-                "p95": sorted(values)[int(len(values) * 0.95)] if len(values) >= 20 else max(values),
-            }
+            shards = list(self._sketches[kind].get(name, {}).get(key, ()))
+        return self._merge_shards(shards)
+
+    def get_histogram_stats(self, name: str, labels: dict = None) -> dict:
+        """Get histogram statistics."""
+        return self.get_sketch(name, labels).stats()
+
+    def get_timer_stats(self, name: str, labels: dict = None) -> dict:
+        """Get timer statistics (milliseconds)."""
+        return self.get_sketch(name, labels, kind="timer").stats()
 
     def get_all_metrics(self) -> dict:
         """Get all metrics as a dictionary."""
+        # Copy series references under the lock; merge shards outside it
         with self._lock:
-            return {
-                "counters": dict(self._counters),
-                "gauges": dict(self._gauges),
-                "histograms": {
-                    name: {k: self._compute_stats(v) for k, v in labels.items()}
-                    for name, labels in self._histograms.items()
-                },
-                "timers": {
-                    name: {k: self._compute_stats(v) for k, v in labels.items()}
-                    for name, labels in self._timers.items()
+            counters = {name: dict(values) for name, values in self._counters.items()}
+            gauges = {name: dict(values) for name, values in self._gauges.items()}
+            series = {
+                kind: {
+                    name: {key: list(shards) for key, shards in by_key.items()}
+                    for name, by_key in by_name.items()
                 }
+                for kind, by_name in self._sketches.items()
             }
 
-    def _compute_stats(self, values: list) -> dict:
-        """Compute statistics for a list of values."""
-        if not values:
-            return {"count": 0}
-        sorted_values = sorted(values)
         return {
-            "count": len(values),
-            "sum": sum(values),
-            "min": min(values),
-            "max": max(values),
-            "avg": sum(values) / len(values),
-            "p50": sorted_values[len(values) // 2],
+            "counters": counters,
+            "gauges": gauges,
+            "histograms": {
+                name: {k: self._merge_shards(v).stats() for k, v in labels.items()}
+                for name, labels in series["histogram"].items()
+            },
+            "timers": {
+                name: {k: self._merge_shards(v).stats() for k, v in labels.items()}
+                for name, labels in series["timer"].items()
+            }
         }
 
     def reset(self) -> None:
@@ -187,8 +373,9 @@ class MetricsRegistry:
         with self._lock:
             self._counters.clear()
             self._gauges.clear()
-            self._histograms.clear()
-            self._timers.clear()
+            for by_name in self._sketches.values():
+                by_name.clear()
+            self._generation += 1
 
 
 class TimerContext:
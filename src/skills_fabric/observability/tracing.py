@@ -10,14 +10,21 @@ Supports multiple backends:
 - In-memory (default, for development)
 - OpenTelemetry (production)
 - Console (debugging)
+
+Finished spans are kept in a bounded ring buffer and handed to exporters
+by a BatchSpanProcessor on a background thread, so ending a span never
+performs I/O on the caller's thread.
 """
 from dataclasses import dataclass, field
-from typing import Any, Optional, Callable
+from typing import Any, Optional
 from datetime import datetime
 from enum import Enum
 from contextlib import contextmanager
+from collections import deque
+import atexit
+import json
+import os
 import threading
-import uuid
 
 
 class SpanStatus(Enum):
@@ -52,6 +59,7 @@ class Span:
     status: SpanStatus = SpanStatus.UNSET
     attributes: dict = field(default_factory=dict)
     events: list[SpanEvent] = field(default_factory=list)
+    sampled: bool = True
 
     def set_attribute(self, key: str, value: Any) -> None:
         """Set a span attribute."""
@@ -116,12 +124,138 @@ def _set_current_span(span: Optional[Span]) -> None:
 
 def _generate_id() -> str:
     """Generate a unique ID for traces/spans."""
-    return uuid.uuid4().hex[:16]
+    return os.urandom(8).hex()
+
+
+def _trace_sampled(trace_id: str, rate: float) -> bool:
+    """Deterministic trace-ID ratio sampling.
+
+    Uses the trace ID itself so every span of a trace gets the same
+    decision, whichever tracer started it.
+    """
+    if rate >= 1.0:
+        return True
+    if rate <= 0.0:
+        return False
+    return int(trace_id[:8], 16) < rate * 0x100000000
+
+
+class BatchSpanProcessor:
+    """Queues finished spans and exports them in batches off-thread.
+
+    The queue is bounded: when it is full, new spans are dropped and
+    counted in ``dropped_spans`` rather than blocking the caller. A
+    daemon thread wakes every ``schedule_delay`` seconds, or as soon as a
+    full batch is waiting, and hands batches to each exporter.
+
+    Exporters are either per-span callables ``exporter(span)`` or objects
+    with an ``export(spans)`` method, which receive a whole batch.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 2048,
+        max_export_batch_size: int = 512,
+        schedule_delay: float = 1.0,
+    ):
+        self.max_queue_size = max_queue_size
+        self.max_export_batch_size = max_export_batch_size
+        self.schedule_delay = schedule_delay
+        self.dropped_spans = 0
+        self.exported_spans = 0
+        self._exporters: list[Any] = []
+        self._queue: deque[Span] = deque()
+        self._lock = threading.Lock()
+        self._export_lock = threading.Lock()  # Serializes exporter calls
+        self._wakeup = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._shutdown = False
+
+    def add_exporter(self, exporter: Any) -> None:
+        """Register an exporter and start the worker thread if needed."""
+        with self._lock:
+            self._exporters.append(exporter)
+            if self._worker is None and not self._shutdown:
+                self._worker = threading.Thread(
+                    target=self._run, name="span-exporter", daemon=True
+                )
+                self._worker.start()
+                atexit.register(self.shutdown)
+
+    def on_end(self, span: Span) -> None:
+        """Enqueue a finished span. Never blocks on I/O."""
+        if not self._exporters:
+            return
+        with self._lock:
+            if len(self._queue) >= self.max_queue_size or self._shutdown:
+                self.dropped_spans += 1
+                return
+            self._queue.append(span)
+            full_batch = len(self._queue) >= self.max_export_batch_size
+        if full_batch:
+            self._wakeup.set()
+
+    def _take_batch(self) -> list[Span]:
+        with self._lock:
+            count = min(len(self._queue), self.max_export_batch_size)
+            return [self._queue.popleft() for _ in range(count)]
+
+    def _export(self, batch: list[Span]) -> None:
+        for exporter in list(self._exporters):
+            try:
+                export_batch = getattr(exporter, "export", None)
+                if export_batch is not None:
+                    export_batch(batch)
+                else:
+                    for span in batch:
+                        exporter(span)
+            except Exception:
+                pass  # Don't let exporter errors affect tracing
+        self.exported_spans += len(batch)
+
+    def _drain(self) -> None:
+        with self._export_lock:
+            while True:
+                batch = self._take_batch()
+                if not batch:
+                    return
+                self._export(batch)
+
+    def _run(self) -> None:
+        while not self._shutdown:
+            self._wakeup.wait(self.schedule_delay)
+            self._wakeup.clear()
+            self._drain()
+
+    def force_flush(self) -> None:
+        """Export everything queued so far on the calling thread."""
+        self._drain()
+
+    def shutdown(self) -> None:
+        """Flush remaining spans and stop the worker thread."""
+        if self._shutdown:
+            return
+        self._shutdown = True
+        self._wakeup.set()
+        if self._worker is not None and self._worker is not threading.current_thread():
+            self._worker.join(timeout=5.0)
+        self._drain()
+        for exporter in self._exporters:
+            close = getattr(exporter, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception:
+                    pass
 
 
 class TracerProvider:
     """Tracer provider managing all tracers and spans.
 
+    Keeps the most recent ``max_spans`` finished spans in memory and
+    exports spans through a BatchSpanProcessor. Each tracer may have its
+    own sample rate; unsampled traces are neither retained nor exported.
+
     Usage:
         provider = TracerProvider()
         tracer = provider.get_tracer("skills_fabric.trust")
@@ -131,42 +265,74 @@ class TracerProvider:
             # ... do work ...
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_spans: int = 10_000,
+        sample_rate: float = 1.0,
+        max_queue_size: int = 2048,
+        max_export_batch_size: int = 512,
+        schedule_delay: float = 1.0,
+    ):
         self._tracers: dict[str, "Tracer"] = {}
-        self._spans: list[Span] = []
+        self._spans: deque[Span] = deque(maxlen=max_spans)
         self._lock = threading.Lock()
-        self._exporters: list[Callable[[Span], None]] = []
+        self.sample_rate = sample_rate
+        self.processor = BatchSpanProcessor(
+            max_queue_size=max_queue_size,
+            max_export_batch_size=max_export_batch_size,
+            schedule_delay=schedule_delay,
+        )
+
+    def get_tracer(self, name: str, sample_rate: Optional[float] = None) -> "Tracer":
+        """Get or create a tracer for the given name.
 
-    def get_tracer(self, name: str) -> "Tracer":
-        """Get or create a tracer for the given name."""
-        if name not in self._tracers:
-            self._tracers[name] = Tracer(name, self)
-        return self._tracers[name]
+        Args:
+            name: Tracer name
+            sample_rate: Fraction of traces started by this tracer to keep
+                (defaults to the provider's rate). Updates an existing tracer.
+        """
+        with self._lock:
+            tracer = self._tracers.get(name)
+            if tracer is None:
+                tracer = Tracer(name, self, sample_rate)
+                self._tracers[name] = tracer
+            elif sample_rate is not None:
+                tracer.sample_rate = sample_rate
+            return tracer
 
     def record_span(self, span: Span) -> None:
         """Record a completed span."""
-        with self._lock:
-            self._spans.append(span)
-            # Export to all registered exporters
-            for exporter in self._exporters:
-                try:
-                    exporter(span)
-                except Exception:
-                    pass  # Don't let exporter errors affect tracing
+        if not span.sampled:
+            return
+        self._spans.append(span)  # deque append is atomic; maxlen evicts oldest
+        self.processor.on_end(span)
 
-    def add_exporter(self, exporter: Callable[[Span], None]) -> None:
-        """Add a span exporter."""
-        self._exporters.append(exporter)
+    def add_exporter(self, exporter: Any) -> None:
+        """Add a span exporter (per-span callable or batch ``export`` object)."""
+        self.processor.add_exporter(exporter)
+
+    @property
+    def dropped_spans(self) -> int:
+        """Spans dropped because the export queue was full."""
+        return self.processor.dropped_spans
+
+    def force_flush(self) -> None:
+        """Export all queued spans now."""
+        self.processor.force_flush()
+
+    def shutdown(self) -> None:
+        """Flush queued spans and stop the export thread."""
+        self.processor.shutdown()
 
     def get_all_spans(self) -> list[Span]:
-        """Get all recorded spans."""
+        """Get all retained spans."""
         with self._lock:
             return list(self._spans)
 
     def get_trace(self, trace_id: str) -> list[Span]:
-        """Get all spans for a trace."""
+        """Get all retained spans for a trace."""
         with self._lock:
-            return [s for s in self._spans if s.trace_id == trace_id]
+            return [s for s in list(self._spans) if s.trace_id == trace_id]
 
     def clear(self) -> None:
         """Clear all recorded spans."""
@@ -187,9 +353,21 @@ class Tracer:
                 child.set_attribute("trust_level", 1)
     """
 
-    def __init__(self, name: str, provider: TracerProvider):
+    def __init__(
+        self,
+        name: str,
+        provider: TracerProvider,
+        sample_rate: Optional[float] = None
+    ):
         self.name = name
         self._provider = provider
+        self.sample_rate = sample_rate
+
+    def _should_sample(self, trace_id: str) -> bool:
+        rate = self.sample_rate
+        if rate is None:
+            rate = self._provider.sample_rate
+        return _trace_sampled(trace_id, rate)
 
     @contextmanager
     def start_span(
@@ -209,13 +387,16 @@ class Tracer:
             The created span
         """
         parent = _get_current_span()
+        trace_id = parent.trace_id if parent else _generate_id()
 
         span = Span(
-            trace_id=parent.trace_id if parent else _generate_id(),
+            trace_id=trace_id,
             span_id=_generate_id(),
             name=f"{self.name}.{name}",
             parent_span_id=parent.span_id if parent else None,
-            attributes={"span.kind": kind, **(attributes or {})}
+            attributes={"span.kind": kind, **(attributes or {})},
+            # Children follow the root's decision so traces stay whole
+            sampled=parent.sampled if parent else self._should_sample(trace_id),
         )
 
         _set_current_span(span)
@@ -258,16 +439,17 @@ class Tracer:
 _provider = TracerProvider()
 
 
-def get_tracer(name: str) -> Tracer:
+def get_tracer(name: str, sample_rate: Optional[float] = None) -> Tracer:
     """Get a tracer from the global provider.
 
     Args:
         name: Tracer name (e.g., "skills_fabric.trust")
+        sample_rate: Optional per-tracer sample rate (0.0-1.0)
 
     Returns:
         Tracer instance
     """
-    return _provider.get_tracer(name)
+    return _provider.get_tracer(name, sample_rate)
 
 
 def get_provider() -> TracerProvider:
@@ -289,22 +471,159 @@ def console_exporter(span: Span) -> None:
             print(f"{indent}    {key}={value}")
 
 
-def json_exporter(output_file: str) -> Callable[[Span], None]:
+class JSONLinesExporter:
+    """Appends spans to a file as JSON lines, one write per batch.
+
+    Callable with a single span for compatibility with per-span
+    exporters; the batch processor uses ``export`` instead.
+    """
+
+    def __init__(self, output_file: str):
+        self.output_file = output_file
+        self._lock = threading.Lock()
+
+    def _format(self, span: Span) -> str:
+        return json.dumps(span.to_dict())
+
+    def export(self, spans: list[Span]) -> None:
+        """Write a batch of spans with a single open/append."""
+        if not spans:
+            return
+        payload = "".join(self._format(span) + "\n" for span in spans)
+        with self._lock, open(self.output_file, "a") as f:
+            f.write(payload)
+
+    def __call__(self, span: Span) -> None:
+        self.export([span])
+
+
+def json_exporter(output_file: str) -> JSONLinesExporter:
     """Create a JSON file exporter.
 
     Args:
         output_file: Path to output file
 
     Returns:
-        Exporter function
+        Exporter (per-span callable with batch ``export``)
     """
-    import json
+    return JSONLinesExporter(output_file)
+
+
+_OTLP_SPAN_KINDS = {
+    "internal": 1,
+    "server": 2,
+    "client": 3,
+    "producer": 4,
+    "consumer": 5,
+}
+
+_OTLP_STATUS_CODES = {
+    SpanStatus.UNSET: 0,
+    SpanStatus.OK: 1,
+    SpanStatus.ERROR: 2,
+}
+
+
+def _otlp_value(value: Any) -> dict:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict) -> list[dict]:
+    return [{"key": k, "value": _otlp_value(v)} for k, v in attributes.items()]
 
-    def exporter(span: Span) -> None:
-        with open(output_file, "a") as f:
-            f.write(json.dumps(span.to_dict()) + "\n")
 
-    return exporter
+def _unix_nano(ts: Optional[datetime]) -> str:
+    return str(int(ts.timestamp() * 1_000_000_000)) if ts else "0"
+
+
+class OTLPFileExporter(JSONLinesExporter):
+    """Writes batches as OTLP/JSON ``ExportTraceServiceRequest`` lines.
+
+    Each batch becomes one line grouped by instrumentation scope (the
+    tracer name), readable by the OpenTelemetry Collector's ``otlpjson``
+    file receiver. Trace IDs are zero-padded to 128 bits.
+    """
+
+    def __init__(self, output_file: str, service_name: str = "skills-fabric"):
+        super().__init__(output_file)
+        self.service_name = service_name
+
+    @staticmethod
+    def _span_to_otlp(span: Span) -> dict:
+        attributes = dict(span.attributes)
+        kind = attributes.pop("span.kind", "internal")
+        description = attributes.pop("status.description", "")
+        otlp = {
+            "traceId": span.trace_id.rjust(32, "0"),
+            "spanId": span.span_id.rjust(16, "0"),
+            "name": span.name,
+            "kind": _OTLP_SPAN_KINDS.get(kind, 1),
+            "startTimeUnixNano": _unix_nano(span.start_time),
+            "endTimeUnixNano": _unix_nano(span.end_time),
+            "attributes": _otlp_attributes(attributes),
+            "events": [
+                {
+                    "timeUnixNano": _unix_nano(e.timestamp),
+                    "name": e.name,
+                    "attributes": _otlp_attributes(e.attributes),
+                }
+                for e in span.events
+            ],
+            "status": {"code": _OTLP_STATUS_CODES[span.status]},
+        }
+        if span.parent_span_id:
+            otlp["parentSpanId"] = span.parent_span_id.rjust(16, "0")
+        if description:
+            otlp["status"]["message"] = description
+        return otlp
+
+    def _format_batch(self, spans: list[Span]) -> str:
+        scopes: dict[str, list[dict]] = {}
+        for span in spans:
+            scope = span.name.rsplit(".", 1)[0] if "." in span.name else span.name
+            scopes.setdefault(scope, []).append(self._span_to_otlp(span))
+        request = {
+            "resourceSpans": [{
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": self.service_name})
+                },
+                "scopeSpans": [
+                    {"scope": {"name": scope}, "spans": otlp_spans}
+                    for scope, otlp_spans in scopes.items()
+                ],
+            }]
+        }
+        return json.dumps(request)
+
+    def export(self, spans: list[Span]) -> None:
+        """Write one ExportTraceServiceRequest line for the batch."""
+        if not spans:
+            return
+        payload = self._format_batch(spans) + "\n"
+        with self._lock, open(self.output_file, "a") as f:
+            f.write(payload)
+
+
+def otlp_file_exporter(output_file: str, service_name: str = "skills-fabric") -> OTLPFileExporter:
+    """Create an OTLP/JSON file exporter.
+
+    Args:
+        output_file: Path to output file
+        service_name: ``service.name`` resource attribute
+
+    Returns:
+        Batch exporter
+    """
+    return OTLPFileExporter(output_file, service_name)
 
 
 # =============================================================================
@@ -33,9 +33,18 @@ Usage:
     print(f"Cycles: {result.cycles_completed}")
     print(f"Final quality: {result.final_quality}")
     print(f"Learnings: {result.learnings}")
+
+    # Improve many concepts at once: expansion runs in a process pool and
+    # is shared across cycles and concepts through a per-run cache
+    results = await factory.improve_many(refs, max_cycles=5)
+    print(f"{factory.last_run_stats.cycles_per_second:.0f} cycles/s")
 """
+import asyncio
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Optional, Callable
+from typing import Any, Iterable, Optional, Callable
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -128,6 +137,73 @@ class ImprovementResult:
     initial_quality: float
     learnings: list[str]
     total_duration_ms: float
+    error: str = ""
+
+
+@dataclass
+class ImprovementRunStats:
+    """Throughput of the last improve_many() call."""
+    concepts: int = 0
+    cycles: int = 0
+    expansions: int = 0   # DepthController.expand calls actually run
+    cache_hits: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    @property
+    def cycles_per_second(self) -> float:
+        return self.cycles / self.seconds if self.seconds > 0 else 0.0
+
+
+# Process-pool workers keep one DepthController per repository
+_worker_controllers: dict[str, DepthController] = {}
+
+
+def _expand_in_worker(repo_path: str, ref: CodeWikiRef, depth: DepthLevel) -> DepthResult:
+    controller = _worker_controllers.get(repo_path)
+    if controller is None:
+        controller = _worker_controllers[repo_path] = DepthController(repo_path)
+    return controller.expand(ref, depth)
+
+
+class ExpansionCache:
+    """Per-run memo of DepthController.expand results, keyed by (ref, depth).
+
+    Expansion runs in an executor (the loop's default thread pool if none
+    is given), never on the event loop. Concurrent requests for the same
+    key share a single expansion.
+    """
+
+    def __init__(self, controller: DepthController, executor: Optional[Executor] = None):
+        self.controller = controller
+        self.executor = executor
+        self.hits = 0
+        self.misses = 0
+        self._futures: dict[tuple, asyncio.Future] = {}
+
+    async def expand(self, ref: CodeWikiRef, depth: DepthLevel) -> DepthResult:
+        key = (ref.concept, ref.file_path, ref.line, ref.repo, ref.commit, int(depth))
+        future = self._futures.get(key)
+        if future is None:
+            self.misses += 1
+            future = self._futures[key] = asyncio.ensure_future(self._run(ref, depth))
+        else:
+            self.hits += 1
+        try:
+            # Shielded: one cancelled waiter must not cancel the shared expansion
+            return await asyncio.shield(future)
+        except Exception:
+            if self._futures.get(key) is future:
+                del self._futures[key]  # Let a later request retry
+            raise
+
+    async def _run(self, ref: CodeWikiRef, depth: DepthLevel) -> DepthResult:
+        loop = asyncio.get_running_loop()
+        if isinstance(self.executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(
+                self.executor, _expand_in_worker, str(self.controller.repo_path), ref, depth
+            )
+        return await loop.run_in_executor(self.executor, self.controller.expand, ref, depth)
 
 
 class SelfImprovingFactory:
@@ -160,6 +236,7 @@ class SelfImprovingFactory:
         self.min_quality = min_quality
         self.max_depth = max_depth
         self.depth_controller = DepthController(repo_path)
+        self.last_run_stats = ImprovementRunStats()
         self._learnings: list[str] = []
 
     async def generate_with_improvement(
@@ -182,23 +259,98 @@ class SelfImprovingFactory:
         Returns:
             ImprovementResult with final skill and cycle history
         """
-        start_time = datetime.now()
-        cycles: list[ImprovementCycle] = []
-
-        # Create initial reference
         ref = CodeWikiRef(
             concept=concept,
             file_path=file_path,
             line=line,
             repo=self.library
         )
+        cache = ExpansionCache(self.depth_controller)
+        return await self._improve(ref, max_cycles, skill_type, cache)
+
+    async def improve_many(
+        self,
+        refs: Iterable[CodeWikiRef],
+        max_cycles: int = 5,
+        skill_type: str = "how_to_use",
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        use_processes: bool = True,
+    ) -> list[ImprovementResult]:
+        """Run the improvement loop for many concepts concurrently.
+
+        Blocking expansion runs in a worker pool, and one ExpansionCache is
+        shared by every cycle of every concept in the run, so a reference
+        (or a dependency common to many concepts) is expanded once.
+
+        Args:
+            refs: One reference per concept
+            max_cycles: Maximum improvement cycles per concept
+            skill_type: Type of skill (how_to_use, what_does, how_works, debug)
+            max_workers: Expansion workers (default: CPU count)
+            max_in_flight: Concepts being improved at once (default: 4x workers)
+            use_processes: Expand in a process pool (scales with cores);
+                False uses threads, which keeps a custom depth_controller
+
+        Returns:
+            One ImprovementResult per ref, in input order; a concept that
+            raised gets success=False and the error message.
+            Throughput is in last_run_stats.
+        """
+        refs = list(refs)
+        workers = max(1, max_workers or os.cpu_count() or 1)
+        semaphore = asyncio.Semaphore(max(1, max_in_flight or workers * 4))
+        start_time = time.perf_counter()
+        stats = ImprovementRunStats(concepts=len(refs))
+
+        executor_type = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_type(max_workers=workers) as executor:
+            cache = ExpansionCache(self.depth_controller, executor)
+
+            async def run(ref: CodeWikiRef) -> ImprovementResult:
+                async with semaphore:
+                    try:
+                        return await self._improve(ref, max_cycles, skill_type, cache)
+                    except Exception as e:
+                        stats.failed += 1
+                        return ImprovementResult(
+                            success=False,
+                            final_skill=None,
+                            cycles=[],
+                            cycles_completed=0,
+                            final_quality=0.0,
+                            initial_quality=0.0,
+                            learnings=[],
+                            total_duration_ms=0.0,
+                            error=f"{type(e).__name__}: {e}",
+                        )
+
+            results = await asyncio.gather(*(run(ref) for ref in refs))
+
+        stats.cycles = sum(r.cycles_completed for r in results)
+        stats.expansions = cache.misses
+        stats.cache_hits = cache.hits
+        stats.seconds = time.perf_counter() - start_time
+        self.last_run_stats = stats
+        return list(results)
+
+    async def _improve(
+        self,
+        ref: CodeWikiRef,
+        max_cycles: int,
+        skill_type: str,
+        cache: ExpansionCache
+    ) -> ImprovementResult:
+        """Run the improvement loop for one reference."""
+        start_time = datetime.now()
+        cycles: list[ImprovementCycle] = []
 
         # Determine initial depth
         depth = determine_depth(skill_type)
         depth = min(depth, self.max_depth)
 
         # Phase 1: Initial generation
-        current_draft = await self._generate(ref, depth)
+        current_draft = await self._generate(ref, depth, cache)
         initial_quality = self._assess_quality(current_draft)
 
         for i in range(max_cycles):
@@ -227,7 +379,7 @@ class SelfImprovingFactory:
                 break
 
             # Phase 4: Explore for better evidence
-            exploration = await self._explore(current_draft, critique)
+            exploration = await self._explore(current_draft, critique, cache)
 
             # Phase 5: Reflect on what to change
             reflection = self._reflect(current_draft, critique, exploration)
@@ -235,7 +387,7 @@ class SelfImprovingFactory:
             # Phase 6: Re-implement with improvements
             draft_before = current_draft
             current_draft = await self._reimplement(
-                current_draft, critique, exploration, reflection
+                current_draft, critique, exploration, reflection, cache
             )
 
             quality_after = self._assess_quality(current_draft)
@@ -273,10 +425,15 @@ class SelfImprovingFactory:
             total_duration_ms=total_duration
         )
 
-    async def _generate(self, ref: CodeWikiRef, depth: DepthLevel) -> SkillDraft:
+    async def _generate(
+        self,
+        ref: CodeWikiRef,
+        depth: DepthLevel,
+        cache: ExpansionCache
+    ) -> SkillDraft:
         """Phase 1: Generate initial skill draft."""
         # Use depth controller to get symbol info
-        result = self.depth_controller.expand(ref, depth)
+        result = await cache.expand(ref, depth)
 
         # Build question from concept
         question = self._generate_question(ref, result)
@@ -368,7 +525,8 @@ class SelfImprovingFactory:
     async def _explore(
         self,
         draft: SkillDraft,
-        critique: list[CritiqueFinding]
+        critique: list[CritiqueFinding],
+        cache: ExpansionCache
     ) -> ExplorationResult:
         """Phase 4: Explore for better evidence."""
         result = ExplorationResult()
@@ -376,9 +534,12 @@ class SelfImprovingFactory:
         # If grounding is weak, explore for more references
         grounding_issues = [c for c in critique if c.category == "grounding"]
         if grounding_issues:
-            # Use depth controller to find related symbols
-            for ref in draft.source_refs:
-                expanded = self.depth_controller.expand(ref, DepthLevel.DEPENDENCIES)
+            # Use depth controller to find related symbols; repeated
+            # cycles reuse the cached expansions
+            expansions = await asyncio.gather(*(
+                cache.expand(ref, DepthLevel.DEPENDENCIES) for ref in draft.source_refs
+            ))
+            for expanded in expansions:
                 for dep in expanded.dependencies:
                     if dep.is_from_import and self.library in dep.module:
                         # This is a related symbol
@@ -434,7 +595,8 @@ class SelfImprovingFactory:
         draft: SkillDraft,
         critique: list[CritiqueFinding],
         exploration: ExplorationResult,
-        reflection: Reflection
+        reflection: Reflection,
+        cache: ExpansionCache
     ) -> SkillDraft:
         """Phase 6: Re-implement with improvements."""
         new_draft = SkillDraft(
@@ -458,7 +620,7 @@ class SelfImprovingFactory:
             if finding.category == "grounding":
                 # Re-expand with deeper analysis
                 if draft.source_refs:
-                    result = self.depth_controller.expand(
+                    result = await cache.expand(
                         draft.source_refs[0],
                         new_draft.depth_level
                     )
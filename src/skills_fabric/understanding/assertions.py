@@ -23,15 +23,28 @@ Example:
 """
 import ast
 import re
-import sys
-import io
-import traceback
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional, Callable, Any
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from .runner import ExecutionRunner, RunResult, shared_runner
+except ImportError:
+    # Loaded from its file path (see scripts/): load the stdlib-only runner beside it
+    import importlib.util
+    _spec = importlib.util.spec_from_file_location(
+        "skills_fabric_runner", Path(__file__).with_name("runner.py")
+    )
+    _runner_module = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_runner_module)
+    ExecutionRunner = _runner_module.ExecutionRunner
+    RunResult = _runner_module.RunResult
+    shared_runner = _runner_module.shared_runner
+
 
 class VerificationType(Enum):
     """How a claim can be verified."""
@@ -337,16 +350,56 @@ class ClaimExtractor:
         return "?"
 
 
+@dataclass
+class MethodFacts:
+    """Signature facts for one method definition."""
+    line: int
+    params: list[str]
+    returns: Optional[str] = None
+
+
+@dataclass
+class FileFacts:
+    """Lookup tables for one source file, built from a single parse.
+
+    Each table keeps the first match in ast.walk order, which is what the
+    per-assertion walks returned.
+    """
+    file_path: str
+    mtime_ns: int = 0
+    size: int = 0
+    error: Optional[Exception] = None                              # read/parse failure
+    definitions: dict[str, int] = field(default_factory=dict)      # class/function -> line
+    classes: dict[str, tuple[int, list[str]]] = field(default_factory=dict)  # class -> (line, bases)
+    methods: dict[tuple[str, str], MethodFacts] = field(default_factory=dict)  # (class, method)
+
+
 class AssertionVerifier:
     """Verify assertions through execution and analysis.
 
     This is the core of the neuro-symbolic approach:
     - Neural: LLM generates claims
     - Symbolic: We verify them through execution/analysis
+
+    Static checks (existence, inheritance, signatures) are answered from
+    per-file lookup tables; each file is parsed once per (mtime, size).
+    Execution checks run in isolated worker processes (see runner.py).
     """
 
-    def __init__(self, repo_path: Path | str = None):
+    def __init__(
+        self,
+        repo_path: Path | str = None,
+        runner: Optional[ExecutionRunner] = None,
+    ):
         self.repo_path = Path(repo_path) if repo_path else None
+        self._runner = runner
+        self._facts: dict[str, FileFacts] = {}
+        self._facts_lock = threading.Lock()
+
+    @property
+    def runner(self) -> ExecutionRunner:
+        """The execution runner (the shared one unless given)."""
+        return self._runner or shared_runner()
 
     def verify(self, assertion: Assertion) -> Assertion:
         """Verify an assertion and update it with results."""
@@ -362,6 +415,106 @@ class AssertionVerifier:
             assertion.result = VerificationResult.INCONCLUSIVE
             return assertion
 
+    def verify_many(
+        self, assertions: list[Assertion], max_workers: int = 4
+    ) -> list[Assertion]:
+        """Verify a batch of assertions, grouped by source file.
+
+        Each file is parsed once and its assertions are answered from the
+        lookup tables; independent files are handled across a thread pool.
+        Execution assertions are sent to the runner as one batch.
+
+        Returns:
+            The assertions in input order, updated in place as verify() does
+        """
+        groups: dict[str, list[Assertion]] = {}
+        executions = []
+        for assertion in assertions:
+            if assertion.verification_type == VerificationType.EXECUTION:
+                executions.append(assertion)
+            else:
+                groups.setdefault(assertion.source_file, []).append(assertion)
+
+        def verify_group(group: list[Assertion]) -> None:
+            for assertion in group:
+                self.verify(assertion)
+
+        if max_workers > 1 and len(groups) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as pool:
+                list(pool.map(verify_group, groups.values()))
+        else:
+            for group in groups.values():
+                verify_group(group)
+
+        runnable = [a for a in executions if a.verification_code]
+        if runnable:
+            runs = self.runner.run_many(a.verification_code for a in runnable)
+            for assertion, run in zip(runnable, runs):
+                self._apply_execution(assertion, run)
+        for assertion in executions:
+            if not assertion.verification_code:
+                self._verify_execution(assertion)
+
+        return list(assertions)
+
+    def clear_cache(self) -> None:
+        """Drop all per-file lookup tables."""
+        with self._facts_lock:
+            self._facts.clear()
+
+    def _file_facts(self, source_file: str) -> FileFacts:
+        """Get the lookup tables for a file, parsing it at most once per version."""
+        file_path = self.repo_path / source_file
+        try:
+            stat = file_path.stat()
+        except OSError as e:
+            return FileFacts(source_file, error=e)
+
+        with self._facts_lock:
+            facts = self._facts.get(source_file)
+        if facts and facts.mtime_ns == stat.st_mtime_ns and facts.size == stat.st_size:
+            return facts
+
+        facts = FileFacts(source_file, stat.st_mtime_ns, stat.st_size)
+        try:
+            with open(file_path, 'r') as f:
+                tree = ast.parse(f.read())
+        except Exception as e:
+            facts.error = e.with_traceback(None)
+        else:
+            self._index_tree(tree, facts)
+
+        with self._facts_lock:
+            self._facts[source_file] = facts
+        return facts
+
+    def _index_tree(self, tree: ast.AST, facts: FileFacts) -> None:
+        """Fill the lookup tables from one ast.walk."""
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                facts.definitions.setdefault(node.name, node.lineno)
+                if node.name not in facts.classes:
+                    facts.classes[node.name] = (
+                        node.lineno, [self._get_name(b) for b in node.bases]
+                    )
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        key = (node.name, item.name)
+                        if key not in facts.methods:
+                            facts.methods[key] = self._method_facts(item)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                facts.definitions.setdefault(node.name, node.lineno)
+
+    def _method_facts(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> MethodFacts:
+        params = []
+        for arg in node.args.args:
+            param = arg.arg
+            if arg.annotation:
+                param += f": {self._get_name(arg.annotation)}"
+            params.append(param)
+        returns = self._get_name(node.returns) if node.returns else None
+        return MethodFacts(line=node.lineno, params=params, returns=returns)
+
     def _verify_existence(self, assertion: Assertion) -> Assertion:
         """Verify that something exists at the claimed location.
 
@@ -387,89 +540,67 @@ class AssertionVerifier:
             ))
             return assertion
 
-        try:
-            with open(file_path, 'r') as f:
-                content = f.read()
-
-            # Parse AST for precise verification
-            tree = ast.parse(content)
-            concept = assertion.source_concept
-
-            # Handle "Class.method" format
-            if "." in concept:
-                class_name, method_name = concept.rsplit(".", 1)
-                found = self._find_method_in_class(tree, class_name, method_name)
-
-                if found:
-                    assertion.result = VerificationResult.VERIFIED
-                    assertion.confidence = 1.0
-                    assertion.evidence.append(Evidence(
-                        type="ast_found",
-                        content=f"Found method '{method_name}' in class '{class_name}' at line {found}",
-                        source_file=assertion.source_file,
-                        source_line=found
-                    ))
-                else:
-                    assertion.result = VerificationResult.REFUTED
-                    assertion.evidence.append(Evidence(
-                        type="ast_not_found",
-                        content=f"Method '{method_name}' not found in class '{class_name}'",
-                        source_file=assertion.source_file
-                    ))
-            else:
-                # Simple class/function lookup
-                found = self._find_definition(tree, concept)
-
-                if found:
-                    assertion.result = VerificationResult.VERIFIED
-                    assertion.confidence = 1.0
-                    assertion.evidence.append(Evidence(
-                        type="ast_found",
-                        content=f"Found '{concept}' at line {found}",
-                        source_file=assertion.source_file,
-                        source_line=found
-                    ))
-                else:
-                    assertion.result = VerificationResult.REFUTED
-                    assertion.evidence.append(Evidence(
-                        type="ast_not_found",
-                        content=f"'{concept}' not found in AST",
-                        source_file=assertion.source_file
-                    ))
-
-        except SyntaxError as e:
+        facts = self._file_facts(assertion.source_file)
+        if isinstance(facts.error, SyntaxError):
             assertion.result = VerificationResult.ERROR
             assertion.evidence.append(Evidence(
                 type="parse_error",
-                content=f"Could not parse file: {e}"
+                content=f"Could not parse file: {facts.error}"
             ))
-        except Exception as e:
+            return assertion
+        if facts.error is not None:
             assertion.result = VerificationResult.ERROR
             assertion.evidence.append(Evidence(
                 type="error",
-                content=str(e)
+                content=str(facts.error)
             ))
+            return assertion
 
-        return assertion
+        concept = assertion.source_concept
 
-    def _find_method_in_class(self, tree: ast.AST, class_name: str, method_name: str) -> int | None:
-        """Find a method inside a class, return line number or None."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == class_name:
-                for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        if item.name == method_name:
-                            return item.lineno
-        return None
+        # Handle "Class.method" format
+        if "." in concept:
+            class_name, method_name = concept.rsplit(".", 1)
+            method = facts.methods.get((class_name, method_name))
 
-    def _find_definition(self, tree: ast.AST, name: str) -> int | None:
-        """Find a class or function definition, return line number or None."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == name:
-                return node.lineno
-            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == name:
-                return node.lineno
-        return None
+            if method:
+                assertion.result = VerificationResult.VERIFIED
+                assertion.confidence = 1.0
+                assertion.evidence.append(Evidence(
+                    type="ast_found",
+                    content=f"Found method '{method_name}' in class '{class_name}' at line {method.line}",
+                    source_file=assertion.source_file,
+                    source_line=method.line
+                ))
+            else:
+                assertion.result = VerificationResult.REFUTED
+                assertion.evidence.append(Evidence(
+                    type="ast_not_found",
+                    content=f"Method '{method_name}' not found in class '{class_name}'",
+                    source_file=assertion.source_file
+                ))
+        else:
+            # Simple class/function lookup
+            found = facts.definitions.get(concept)
+
+            if found:
+                assertion.result = VerificationResult.VERIFIED
+                assertion.confidence = 1.0
+                assertion.evidence.append(Evidence(
+                    type="ast_found",
+                    content=f"Found '{concept}' at line {found}",
+                    source_file=assertion.source_file,
+                    source_line=found
+                ))
+            else:
+                assertion.result = VerificationResult.REFUTED
+                assertion.evidence.append(Evidence(
+                    type="ast_not_found",
+                    content=f"'{concept}' not found in AST",
+                    source_file=assertion.source_file
+                ))
+
+        return assertion
 
     def _verify_static(self, assertion: Assertion) -> Assertion:
         """Verify through static analysis of AST."""
@@ -477,60 +608,53 @@ class AssertionVerifier:
             assertion.result = VerificationResult.INCONCLUSIVE
             return assertion
 
-        file_path = self.repo_path / assertion.source_file
-        try:
-            with open(file_path, 'r') as f:
-                source = f.read()
-
-            tree = ast.parse(source)
-
-            # Check inheritance claims
-            if "inherits from" in assertion.claim:
-                match = re.search(r'(\w+) inherits from (.+)', assertion.claim)
-                if match:
-                    class_name = match.group(1)
-                    expected_bases = [b.strip() for b in match.group(2).split(',')]
-
-                    for node in ast.walk(tree):
-                        if isinstance(node, ast.ClassDef) and node.name == class_name:
-                            actual_bases = [self._get_name(b) for b in node.bases]
-
-                            # Check if expected bases are subset of actual
-                            found = all(
-                                any(exp in act for act in actual_bases)
-                                for exp in expected_bases
-                            )
-
-                            if found:
-                                assertion.result = VerificationResult.VERIFIED
-                                assertion.confidence = 1.0
-                                assertion.evidence.append(Evidence(
-                                    type="ast_inheritance",
-                                    content=f"Bases: {actual_bases}",
-                                    source_file=assertion.source_file,
-                                    source_line=node.lineno
-                                ))
-                            else:
-                                assertion.result = VerificationResult.REFUTED
-                                assertion.evidence.append(Evidence(
-                                    type="ast_inheritance",
-                                    content=f"Expected {expected_bases}, found {actual_bases}",
-                                    source_file=assertion.source_file,
-                                    source_line=node.lineno
-                                ))
-                            break
-
-        except Exception as e:
+        facts = self._file_facts(assertion.source_file)
+        if facts.error is not None:
             assertion.result = VerificationResult.ERROR
             assertion.evidence.append(Evidence(
                 type="error",
-                content=str(e)
+                content=str(facts.error)
             ))
+            return assertion
+
+        # Check inheritance claims
+        if "inherits from" in assertion.claim:
+            match = re.search(r'(\w+) inherits from (.+)', assertion.claim)
+            if match:
+                class_name = match.group(1)
+                expected_bases = [b.strip() for b in match.group(2).split(',')]
+
+                if class_name in facts.classes:
+                    line, actual_bases = facts.classes[class_name]
+
+                    # Check if expected bases are subset of actual
+                    found = all(
+                        any(exp in act for act in actual_bases)
+                        for exp in expected_bases
+                    )
+
+                    if found:
+                        assertion.result = VerificationResult.VERIFIED
+                        assertion.confidence = 1.0
+                        assertion.evidence.append(Evidence(
+                            type="ast_inheritance",
+                            content=f"Bases: {actual_bases}",
+                            source_file=assertion.source_file,
+                            source_line=line
+                        ))
+                    else:
+                        assertion.result = VerificationResult.REFUTED
+                        assertion.evidence.append(Evidence(
+                            type="ast_inheritance",
+                            content=f"Expected {expected_bases}, found {actual_bases}",
+                            source_file=assertion.source_file,
+                            source_line=line
+                        ))
 
         return assertion
 
     def _verify_execution(self, assertion: Assertion) -> Assertion:
-        """Verify through code execution."""
+        """Verify through code execution in an isolated worker."""
         if not assertion.verification_code:
             assertion.result = VerificationResult.INCONCLUSIVE
             assertion.evidence.append(Evidence(
@@ -539,55 +663,49 @@ class AssertionVerifier:
             ))
             return assertion
 
-        # Capture stdout/stderr
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
-        sys.stdout = io.StringIO()
-        sys.stderr = io.StringIO()
-
-        try:
-            # Execute the verification code
-            exec_globals = {}
-            exec(assertion.verification_code, exec_globals)
-
-            stdout_val = sys.stdout.getvalue()
-            stderr_val = sys.stderr.getvalue()
-
-            # Check for explicit PASS/FAIL markers
-            if "PASS" in stdout_val or "VERIFIED" in stdout_val:
-                assertion.result = VerificationResult.VERIFIED
-                assertion.confidence = 0.9
-            elif "FAIL" in stdout_val or "REFUTED" in stdout_val:
-                assertion.result = VerificationResult.REFUTED
-            else:
-                # No error = likely passed
-                assertion.result = VerificationResult.VERIFIED
-                assertion.confidence = 0.7
+        return self._apply_execution(
+            assertion, self.runner.run(assertion.verification_code)
+        )
 
+    def _apply_execution(self, assertion: Assertion, run: RunResult) -> Assertion:
+        """Update an assertion from the outcome of its verification code."""
+        if run.error:
+            assertion.result = VerificationResult.REFUTED
             assertion.evidence.append(Evidence(
-                type="execution_output",
-                content=stdout_val[:500] if stdout_val else "(no output)"
+                type="execution_error",
+                content=run.error
             ))
-
-            if stderr_val:
+            if run.traceback:
                 assertion.evidence.append(Evidence(
-                    type="execution_stderr",
-                    content=stderr_val[:500]
+                    type="traceback",
+                    content=run.traceback[:500]
                 ))
+            return assertion
 
-        except Exception as e:
+        stdout_val = run.stdout
+        stderr_val = run.stderr
+
+        # Check for explicit PASS/FAIL markers
+        if "PASS" in stdout_val or "VERIFIED" in stdout_val:
+            assertion.result = VerificationResult.VERIFIED
+            assertion.confidence = 0.9
+        elif "FAIL" in stdout_val or "REFUTED" in stdout_val:
             assertion.result = VerificationResult.REFUTED
+        else:
+            # No error = likely passed
+            assertion.result = VerificationResult.VERIFIED
+            assertion.confidence = 0.7
+
+        assertion.evidence.append(Evidence(
+            type="execution_output",
+            content=stdout_val[:500] if stdout_val else "(no output)"
+        ))
+
+        if stderr_val:
             assertion.evidence.append(Evidence(
-                type="execution_error",
-                content=f"{type(e).__name__}: {str(e)}"
-            ))
-            assertion.evidence.append(Evidence(
-                type="traceback",
-                content=traceback.format_exc()[:500]
+                type="execution_stderr",
+                content=stderr_val[:500]
             ))
-        finally:
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
 
         return assertion
 
@@ -607,96 +725,75 @@ class AssertionVerifier:
             assertion.result = VerificationResult.REFUTED
             return assertion
 
-        try:
-            with open(file_path, 'r') as f:
-                source = f.read()
-            tree = ast.parse(source)
+        facts = self._file_facts(assertion.source_file)
+        if facts.error is not None:
+            assertion.result = VerificationResult.ERROR
+            assertion.evidence.append(Evidence(
+                type="error",
+                content=str(facts.error)
+            ))
+            return assertion
 
-            # Parse the claim
-            claim = assertion.claim
-
-            # Handle "X.method accepts parameters: (...)"
-            param_match = re.match(r'(\w+)\.(\w+) accepts parameters: \(([^)]*)\)', claim)
-            if param_match:
-                class_name = param_match.group(1)
-                method_name = param_match.group(2)
-                # Note: We just verify the method exists with some parameters
-                # Full type checking would require mypy
-
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.ClassDef) and node.name == class_name:
-                        for item in node.body:
-                            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                                if item.name == method_name:
-                                    # Extract actual parameters
-                                    actual_params = []
-                                    for arg in item.args.args:
-                                        param = arg.arg
-                                        if arg.annotation:
-                                            param += f": {self._get_name(arg.annotation)}"
-                                        actual_params.append(param)
-
-                                    assertion.result = VerificationResult.VERIFIED
-                                    assertion.confidence = 0.8
-                                    assertion.evidence.append(Evidence(
-                                        type="ast_signature",
-                                        content=f"Found {method_name}({', '.join(actual_params[:3])}...)",
-                                        source_file=assertion.source_file,
-                                        source_line=item.lineno
-                                    ))
-                                    return assertion
+        # Parse the claim
+        claim = assertion.claim
 
-                assertion.result = VerificationResult.REFUTED
+        # Handle "X.method accepts parameters: (...)"
+        param_match = re.match(r'(\w+)\.(\w+) accepts parameters: \(([^)]*)\)', claim)
+        if param_match:
+            class_name = param_match.group(1)
+            method_name = param_match.group(2)
+            # Note: We just verify the method exists with some parameters
+            # Full type checking would require mypy
+            method = facts.methods.get((class_name, method_name))
+
+            if method:
+                assertion.result = VerificationResult.VERIFIED
+                assertion.confidence = 0.8
                 assertion.evidence.append(Evidence(
-                    type="method_not_found",
-                    content=f"Method {method_name} not found in {class_name}"
+                    type="ast_signature",
+                    content=f"Found {method_name}({', '.join(method.params[:3])}...)",
+                    source_file=assertion.source_file,
+                    source_line=method.line
                 ))
                 return assertion
 
-            # Handle "X.method returns Y"
-            return_match = re.match(r'(\w+)\.(\w+) returns (\w+)', claim)
-            if return_match:
-                class_name = return_match.group(1)
-                method_name = return_match.group(2)
-                expected_return = return_match.group(3)
-
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.ClassDef) and node.name == class_name:
-                        for item in node.body:
-                            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                                if item.name == method_name:
-                                    if item.returns:
-                                        actual_return = self._get_name(item.returns)
-                                        assertion.result = VerificationResult.VERIFIED
-                                        assertion.confidence = 0.8
-                                        assertion.evidence.append(Evidence(
-                                            type="ast_return_type",
-                                            content=f"Return type: {actual_return}",
-                                            source_file=assertion.source_file,
-                                            source_line=item.lineno
-                                        ))
-                                    else:
-                                        assertion.result = VerificationResult.VERIFIED
-                                        assertion.confidence = 0.5
-                                        assertion.evidence.append(Evidence(
-                                            type="no_return_annotation",
-                                            content="No return type annotation found",
-                                            source_file=assertion.source_file,
-                                            source_line=item.lineno
-                                        ))
-                                    return assertion
-
-            # Fallback to static verification
-            return self._verify_static(assertion)
-
-        except Exception as e:
-            assertion.result = VerificationResult.ERROR
+            assertion.result = VerificationResult.REFUTED
             assertion.evidence.append(Evidence(
-                type="error",
-                content=str(e)
+                type="method_not_found",
+                content=f"Method {method_name} not found in {class_name}"
             ))
             return assertion
 
+        # Handle "X.method returns Y"
+        return_match = re.match(r'(\w+)\.(\w+) returns (\w+)', claim)
+        if return_match:
+            class_name = return_match.group(1)
+            method_name = return_match.group(2)
+            method = facts.methods.get((class_name, method_name))
+
+            if method:
+                assertion.result = VerificationResult.VERIFIED
+                if method.returns is not None:
+                    assertion.confidence = 0.8
+                    assertion.evidence.append(Evidence(
+                        type="ast_return_type",
+                        content=f"Return type: {method.returns}",
+                        source_file=assertion.source_file,
+                        source_line=method.line
+                    ))
+                else:
+                    assertion.confidence = 0.5
+                    assertion.evidence.append(Evidence(
+                        type="no_return_annotation",
+                        content="No return type annotation found",
+                        source_file=assertion.source_file,
+                        source_line=method.line
+                    ))
+                return assertion
+
+        # Fallback to static verification
+        return self._verify_static(assertion)
+
     def _get_name(self, node: ast.AST) -> str:
         """Extract name from AST node."""
         if isinstance(node, ast.Name):
@@ -753,9 +850,8 @@ class UnderstandingEngine:
         extractor = ClaimExtractor(source, file_path)
         assertions = extractor.extract_from_class(concept, line)
 
-        # Verify each claim
-        for assertion in assertions:
-            verified = self.verifier.verify(assertion)
+        # Verify all claims against one parse of the file
+        for verified in self.verifier.verify_many(assertions):
             state.add_assertion(verified)
 
         # Build program model (structure)
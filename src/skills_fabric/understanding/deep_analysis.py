@@ -13,8 +13,9 @@ implementations for deep code analysis.
 
 import ast
 import re
+from bisect import bisect_left, bisect_right
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Set
+from typing import List, Dict, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 
 try:
@@ -65,6 +66,32 @@ class CallGraphNode:
     called_by: List[str] = field(default_factory=list)
 
 
+@dataclass
+class FileAnalysis:
+    """Everything extracted from one file, memoized per (mtime, size).
+
+    Source lines are read once; for Python files a single AST pass then
+    fills in symbols (with parent classes), imports and every call site.
+    The tree itself is not retained.
+    """
+    file_path: str
+    mtime_ns: int
+    size: int
+    lines: Optional[List[str]]  # None if the file is not readable UTF-8
+    parsed: bool = False
+    valid_python: bool = False
+    symbols: List[ASTSymbol] = field(default_factory=list)
+    imports: List[str] = field(default_factory=list)
+    calls: List[Tuple[int, str]] = field(default_factory=list)  # (line, callee) in source order
+    call_lines: List[int] = field(default_factory=list)
+
+    def calls_between(self, start_line: int, end_line: int) -> List[str]:
+        """Unique callees on lines start_line..end_line, in source order."""
+        lo = bisect_left(self.call_lines, start_line)
+        hi = bisect_right(self.call_lines, end_line)
+        return list(dict.fromkeys(name for _, name in self.calls[lo:hi]))
+
+
 class DeepAnalyzer:
     """
     Performs deep AST/LSP analysis on source code.
@@ -73,47 +100,126 @@ class DeepAnalyzer:
     - Source validation (Level 3)
     - Semantic extraction (Level 4)
     - Proof generation (Level 5)
+
+    Each file is read and parsed at most once per modification (see
+    FileAnalysis), so analyzing a repository is linear in its size.
     """
 
     def __init__(self, repo_path: Path, commit: str):
         self.repo_path = repo_path
         self.commit = commit
-        self._ast_cache: Dict[str, ast.AST] = {}
         self._symbol_index: Dict[str, ASTSymbol] = {}
         self._call_graph: Dict[str, CallGraphNode] = {}
+        self._analyses: Dict[str, FileAnalysis] = {}
 
     def analyze_file(self, file_path: str) -> List[ASTSymbol]:
         """Extract all symbols from a Python file using AST."""
-        full_path = self.repo_path / file_path
+        if not file_path.endswith('.py'):
+            return []
 
-        if not full_path.exists() or not file_path.endswith('.py'):
+        analysis = self._analyze(file_path)
+        if analysis is None or not analysis.valid_python:
             return []
 
+        # Index symbols
+        for sym in analysis.symbols:
+            key = f"{file_path}:{sym.name}"
+            self._symbol_index[key] = sym
+
+        return list(analysis.symbols)
+
+    def analyze_directory(self, subdir: str = "") -> Dict[str, List[ASTSymbol]]:
+        """Analyze every Python file under repo_path/subdir.
+
+        Returns:
+            Mapping of repo-relative file path to its symbols.
+        """
+        root = self.repo_path / subdir if subdir else self.repo_path
+        results = {}
+        for full_path in sorted(root.rglob('*.py')):
+            file_path = full_path.relative_to(self.repo_path).as_posix()
+            results[file_path] = self.analyze_file(file_path)
+        return results
+
+    def _source(self, file_path: str) -> Optional[FileAnalysis]:
+        """Return the memoized entry for a file, re-reading it if it changed."""
+        full_path = self.repo_path / file_path
         try:
-            content = full_path.read_text(encoding='utf-8')
-            tree = ast.parse(content)
-            self._ast_cache[file_path] = tree
-        except (SyntaxError, UnicodeDecodeError):
-            return []
+            stat = full_path.stat()
+        except OSError:
+            return None
+
+        cached = self._analyses.get(file_path)
+        if cached is not None and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            return cached
+
+        try:
+            lines = full_path.read_text(encoding='utf-8').split('\n')
+        except (OSError, UnicodeDecodeError):
+            lines = None
+
+        analysis = FileAnalysis(file_path, stat.st_mtime_ns, stat.st_size, lines)
+        self._analyses[file_path] = analysis
+        return analysis
 
-        symbols = []
-        source_lines = content.split('\n')
+    def _analyze(self, file_path: str) -> Optional[FileAnalysis]:
+        """Return the file's entry with its single-pass AST extraction done."""
+        analysis = self._source(file_path)
+        if analysis is None or analysis.lines is None or analysis.parsed:
+            return analysis
+
+        analysis.parsed = True
+        try:
+            tree = ast.parse('\n'.join(analysis.lines))
+        except (SyntaxError, ValueError):
+            return analysis
+
+        analysis.valid_python = True
+        self._extract_all(tree, analysis)
+        return analysis
+
+    def _extract_all(self, tree: ast.AST, analysis: FileAnalysis) -> None:
+        """One ast.walk collecting symbols, parent classes, calls and imports.
+
+        Symbols keep ast.walk (breadth-first) order. A function is a method
+        when it sits directly in a class body; classes are visited before
+        their bodies, so the parent is always known by then.
+        """
+        source_lines = analysis.lines
+        file_path = analysis.file_path
+        parent_class: Dict[ast.AST, str] = {}
+        calls: List[Tuple[int, int, str]] = []
 
         for node in ast.walk(tree):
             if isinstance(node, ast.ClassDef):
-                symbols.append(self._extract_class(node, file_path, source_lines))
+                analysis.symbols.append(self._extract_class(node, file_path, source_lines))
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        parent_class[item] = node.name
 
-            elif isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-                # Check if it's a method (inside a class)
-                parent_class = self._find_parent_class(tree, node)
-                symbols.append(self._extract_function(node, file_path, source_lines, parent_class))
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                analysis.symbols.append(self._extract_function(
+                    node, file_path, source_lines, parent_class.get(node)
+                ))
 
-        # Index symbols
-        for sym in symbols:
-            key = f"{file_path}:{sym.name}"
-            self._symbol_index[key] = sym
+            elif isinstance(node, ast.Call):
+                if isinstance(node.func, ast.Name):
+                    calls.append((node.lineno, node.col_offset, node.func.id))
+                elif isinstance(node.func, ast.Attribute):
+                    calls.append((node.lineno, node.col_offset, node.func.attr))
+
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    analysis.imports.append(alias.name)
 
-        return symbols
+            elif isinstance(node, ast.ImportFrom):
+                module = node.module or ""
+                for alias in node.names:
+                    analysis.imports.append(f"{module}.{alias.name}")
+
+        calls.sort()
+        analysis.calls = [(line, name) for line, _, name in calls]
+        analysis.call_lines = [line for line, _, _ in calls]
 
     def _extract_class(self, node: ast.ClassDef, file_path: str, source_lines: List[str]) -> ASTSymbol:
         """Extract class information."""
@@ -186,15 +292,6 @@ class DeepAnalyzer:
             body_summary='\n'.join(body_lines),
         )
 
-    def _find_parent_class(self, tree: ast.AST, target: ast.AST) -> Optional[str]:
-        """Find the parent class of a function node."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                for item in node.body:
-                    if item is target:
-                        return node.name
-        return None
-
     def _node_to_string(self, node: ast.AST) -> str:
         """Convert an AST node to its string representation."""
         try:
@@ -208,25 +305,18 @@ class DeepAnalyzer:
 
         Returns True if the file exists and the symbol is found at the line.
         """
-        full_path = self.repo_path / ref.file_path
-
-        if not full_path.exists():
+        analysis = self._source(ref.file_path)
+        if analysis is None or analysis.lines is None:
             return False
 
-        try:
-            content = full_path.read_text(encoding='utf-8')
-            lines = content.split('\n')
-
-            if ref.line > len(lines):
-                return False
-
-            # Check if the symbol name appears near the referenced line
-            context = '\n'.join(lines[max(0, ref.line-3):ref.line+3])
-            return ref.symbol_name in context
-
-        except:
+        lines = analysis.lines
+        if ref.line > len(lines):
             return False
 
+        # Check if the symbol name appears near the referenced line
+        context = '\n'.join(lines[max(0, ref.line-3):ref.line+3])
+        return ref.symbol_name in context
+
     def get_semantic_info(self, ref: SourceRef) -> Optional[SemanticInfo]:
         """
         Level 4: Get deep semantic information about a symbol.
@@ -258,38 +348,19 @@ class DeepAnalyzer:
 
     def _extract_calls(self, file_path: str, start_line: int, end_line: int) -> List[str]:
         """Extract function calls within a line range."""
-        tree = self._ast_cache.get(file_path)
-        if not tree:
+        analysis = self._analyses.get(file_path)
+        if analysis is None or not analysis.valid_python:
             return []
 
-        calls = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                if hasattr(node, 'lineno') and start_line <= node.lineno <= end_line:
-                    if isinstance(node.func, ast.Name):
-                        calls.append(node.func.id)
-                    elif isinstance(node.func, ast.Attribute):
-                        calls.append(node.func.attr)
-
-        return list(set(calls))[:20]  # Limit to 20
+        return analysis.calls_between(start_line, end_line)[:20]  # Limit to 20
 
     def _extract_imports(self, file_path: str) -> List[str]:
         """Extract imports from a file."""
-        tree = self._ast_cache.get(file_path)
-        if not tree:
+        analysis = self._analyses.get(file_path)
+        if analysis is None or not analysis.valid_python:
             return []
 
-        imports = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imports.append(alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                module = node.module or ""
-                for alias in node.names:
-                    imports.append(f"{module}.{alias.name}")
-
-        return imports[:30]  # Limit to 30
+        return analysis.imports[:30]  # Limit to 30
 
     def generate_assertion(self, sym: ASTSymbol) -> Optional[str]:
         """
@@ -326,6 +397,10 @@ class DeepProgressiveUnderstanding(ProgressiveUnderstanding):
         self.repo_path = repo_path
         self.analyzer = DeepAnalyzer(repo_path, commit)
 
+    def analyze_repository(self, subdir: str = "") -> Dict[str, List[ASTSymbol]]:
+        """Analyze every Python file in the repository (each parsed once)."""
+        return self.analyzer.analyze_directory(subdir)
+
     def _find_source_refs(self, node: UnderstandingNode) -> List[SourceRef]:
         """Level 3: Find and validate source references."""
         refs = node.source_refs.copy()
@@ -16,8 +16,6 @@ For code understanding, properties include:
 5. Invariants: "State before and after should satisfy condition"
 """
 import ast
-import sys
-import io
 from dataclasses import dataclass, field
 from typing import Callable, Any, Optional
 from pathlib import Path
@@ -28,8 +26,20 @@ try:
     from .assertions import (
         Assertion, Evidence, VerificationResult, VerificationType
     )
+    from .runner import ExecutionRunner, RunResult, shared_runner
 except ImportError:
-    # When run directly, define minimal versions
+    # When run directly, load the stdlib-only runner beside this file
+    # and define minimal versions of the rest
+    import importlib.util
+    _spec = importlib.util.spec_from_file_location(
+        "skills_fabric_runner", Path(__file__).with_name("runner.py")
+    )
+    _runner_module = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_runner_module)
+    ExecutionRunner = _runner_module.ExecutionRunner
+    RunResult = _runner_module.RunResult
+    shared_runner = _runner_module.shared_runner
+
     from dataclasses import dataclass, field
     from enum import Enum, auto
     from datetime import datetime
@@ -235,64 +245,66 @@ except Exception as e:
 
 
 class PropertyTester:
-    """Execute property tests and collect results."""
+    """Execute property tests and collect results.
+
+    Tests run in isolated worker processes (see runner.py), so a runaway
+    test can't hang or corrupt the caller, and test_many() runs a batch
+    across all workers.
+    """
 
-    def __init__(self, setup_code: str = ""):
+    def __init__(self, setup_code: str = "", runner: Optional[ExecutionRunner] = None):
         """
         Args:
             setup_code: Code to run before each test (e.g., imports)
+            runner: Execution runner (default: the shared one)
         """
         self.setup_code = setup_code
+        self._runner = runner
+
+    @property
+    def runner(self) -> ExecutionRunner:
+        return self._runner or shared_runner()
 
     def test(self, property: Property) -> Property:
         """Test a property and update it with results."""
-        # Capture stdout/stderr
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
-        sys.stdout = io.StringIO()
-        sys.stderr = io.StringIO()
+        return self._apply(property, self.runner.run(self._full_code(property)))
 
-        try:
-            # Build full test code
-            full_code = f"""
+    def test_many(self, properties: list[Property]) -> list[Property]:
+        """Test many properties in one batch across the worker pool."""
+        runs = self.runner.run_many(self._full_code(p) for p in properties)
+        return [self._apply(p, run) for p, run in zip(properties, runs)]
+
+    def _full_code(self, property: Property) -> str:
+        return f"""
 {self.setup_code}
 
 {property.test_code}
 """
-            exec_globals = {}
-            exec(full_code, exec_globals)
-
-            stdout_val = sys.stdout.getvalue()
-            stderr_val = sys.stderr.getvalue()
-
-            property.tested = True
-
-            if property.expected_result in stdout_val:
-                property.passed = True
-                property.evidence.append(Evidence(
-                    type="property_pass",
-                    content=stdout_val.strip()
-                ))
-            else:
-                property.passed = False
-                property.evidence.append(Evidence(
-                    type="property_fail",
-                    content=stdout_val.strip() if stdout_val else stderr_val.strip()
-                ))
-                property.counter_example = stdout_val
-
-        except Exception as e:
-            property.tested = True
+
+    def _apply(self, property: Property, run: RunResult) -> Property:
+        """Update a property from the outcome of its test code."""
+        property.tested = True
+
+        if run.error:
             property.passed = False
             property.evidence.append(Evidence(
                 type="execution_error",
-                content=f"{type(e).__name__}: {str(e)}"
+                content=run.error
             ))
-            property.counter_example = str(e)
-
-        finally:
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
+            property.counter_example = run.error
+        elif property.expected_result in run.stdout:
+            property.passed = True
+            property.evidence.append(Evidence(
+                type="property_pass",
+                content=run.stdout.strip()
+            ))
+        else:
+            property.passed = False
+            property.evidence.append(Evidence(
+                type="property_fail",
+                content=run.stdout.strip() if run.stdout else run.stderr.strip()
+            ))
+            property.counter_example = run.stdout
 
         return property
 
@@ -347,11 +359,7 @@ def test_properties_for_code(
     properties = generator.generate_for_class(class_name, module_path)
 
     tester = PropertyTester(setup_code)
-    tested_properties = []
-
-    for prop in properties:
-        tested = tester.test(prop)
-        tested_properties.append(tested)
+    tested_properties = tester.test_many(properties)
 
     passed = sum(1 for p in tested_properties if p.passed)
 
@@ -0,0 +1,332 @@
+"""Isolated execution runner for verification code.
+
+PropertyTester and AssertionVerifier execute generated verification
+snippets. Running them with in-process exec means swapping the global
+sys.stdout/sys.stderr (so nothing can run concurrently) and lets one
+runaway snippet hang or exhaust the whole process.
+
+ExecutionRunner runs snippets in a pool of long-lived worker processes
+instead:
+- Each worker runs jobs one at a time with fresh globals, capturing
+  stdout/stderr per job, so concurrent jobs never share output streams
+- Per-job wall-clock limit: enforced in the worker with a SIGALRM timer,
+  and by the parent, which kills and replaces a worker that stops answering
+- Per-worker memory limit (RLIMIT_AS), so allocations fail with MemoryError
+- Many jobs are sent per round-trip, and batches run across all workers
+
+This file is stdlib-only and is also the worker entry point: workers run
+it by path, so it works whether or not the package is importable.
+
+Usage:
+    runner = ExecutionRunner(max_workers=4, timeout=5.0)
+    results = runner.run_many(["print('PASS')", "raise ValueError('x')"])
+    results[0].stdout  # "PASS\\n"
+    results[1].error   # "ValueError: x"
+"""
+import atexit
+import io
+import json
+import math
+import os
+import queue
+import selectors
+import signal
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+
+# Parent-side slack on top of a job's own timeout before its worker is killed
+KILL_GRACE_SECONDS = 2.0
+
+# Captured stdout/stderr beyond this many characters is truncated
+MAX_OUTPUT_CHARS = 65536
+
+
+@dataclass
+class RunResult:
+    """Outcome of one executed snippet."""
+    stdout: str = ""
+    stderr: str = ""
+    error: str = ""          # "ExceptionType: message" if the snippet raised
+    traceback: str = ""
+    timed_out: bool = False
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.error and not self.timed_out
+
+
+class _WorkerLost(Exception):
+    """The worker stopped answering (timeout) or exited (crash)."""
+
+    def __init__(self, message: str, timed_out: bool = False):
+        super().__init__(message)
+        self.timed_out = timed_out
+
+
+class _Worker:
+    """Parent-side handle for one worker process."""
+
+    def __init__(self, memory_limit_mb: Optional[int]):
+        self.process = subprocess.Popen(
+            [sys.executable, "-u", str(Path(__file__).resolve()), "--worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._buffer = b""
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.process.stdout, selectors.EVENT_READ)
+        self._write({"sys_path": sys.path, "memory_limit_mb": memory_limit_mb})
+
+    def send(self, jobs: list[tuple[str, float]]) -> None:
+        self._write({"jobs": [{"code": code, "timeout": timeout} for code, timeout in jobs]})
+
+    def receive(self, timeout: float) -> RunResult:
+        """Read the next job result, waiting at most timeout seconds."""
+        deadline = time.monotonic() + timeout
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._selector.select(remaining):
+                raise _WorkerLost(f"no answer after {timeout:.1f}s", timed_out=True)
+            chunk = os.read(self.process.stdout.fileno(), 65536)
+            if not chunk:
+                code = self.process.wait()
+                raise _WorkerLost(f"worker exited with code {code}")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return RunResult(**json.loads(line))
+
+    def kill(self) -> None:
+        try:
+            self.process.kill()
+            self.process.wait()
+        except OSError:
+            pass
+        self._selector.close()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    def _write(self, message: dict) -> None:
+        try:
+            self.process.stdin.write(json.dumps(message).encode() + b"\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise _WorkerLost(f"worker unavailable: {e}")
+
+
+class ExecutionRunner:
+    """Run verification snippets in a pool of isolated worker processes.
+
+    Workers are started lazily and reused across calls; a worker that times
+    out or crashes is killed and replaced, and the rest of its batch is
+    re-sent to a fresh worker.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout: float = 5.0,
+        memory_limit_mb: Optional[int] = 1024,
+        batch_size: int = 32,
+    ):
+        """
+        Args:
+            max_workers: Worker processes (default: CPU count)
+            timeout: Default per-job wall-clock limit in seconds
+            memory_limit_mb: Address-space limit per worker (None = unlimited)
+            batch_size: Maximum jobs sent to a worker per round-trip
+        """
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.batch_size = max(1, batch_size)
+
+        self._idle: queue.Queue[_Worker] = queue.Queue()
+        self._workers: set[_Worker] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def run(self, code: str, timeout: Optional[float] = None) -> RunResult:
+        """Run one snippet."""
+        return self.run_many([code], timeout)[0]
+
+    def run_many(self, codes: Iterable[str], timeout: Optional[float] = None) -> list[RunResult]:
+        """Run many snippets across the pool.
+
+        Args:
+            codes: Snippets to execute, each with fresh globals
+            timeout: Per-job wall-clock limit (default: the runner's)
+
+        Returns:
+            One RunResult per snippet, in input order
+        """
+        if self._closed:
+            raise RuntimeError("ExecutionRunner is closed")
+        limit = self.timeout if timeout is None else timeout
+        jobs = [(code, limit) for code in codes]
+        if not jobs:
+            return []
+
+        size = min(self.batch_size, math.ceil(len(jobs) / self.max_workers))
+        batches = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+        if len(batches) == 1:
+            return self._run_batch(batches[0])
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as pool:
+            return [result for batch in pool.map(self._run_batch, batches) for result in batch]
+
+    def close(self) -> None:
+        """Stop all worker processes."""
+        with self._lock:
+            self._closed = True
+            workers, self._workers = self._workers, set()
+        for worker in workers:
+            worker.kill()
+
+    def __enter__(self) -> "ExecutionRunner":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _run_batch(self, jobs: list[tuple[str, float]]) -> list[RunResult]:
+        results: list[RunResult] = []
+        while len(results) < len(jobs):
+            pending = jobs[len(results):]
+            worker = None
+            try:
+                worker = self._checkout()
+                worker.send(pending)
+                for _, timeout in pending:
+                    results.append(worker.receive(timeout + KILL_GRACE_SECONDS))
+            except _WorkerLost as e:
+                if worker is not None:
+                    self._discard(worker)
+                    worker = None
+                kind = "TimeoutError" if e.timed_out else "WorkerCrashed"
+                results.append(RunResult(error=f"{kind}: {e}", timed_out=e.timed_out))
+            finally:
+                if worker is not None:
+                    self._idle.put(worker)
+        return results
+
+    def _checkout(self) -> _Worker:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        worker = _Worker(self.memory_limit_mb)
+        with self._lock:
+            if self._closed:
+                worker.kill()
+                raise RuntimeError("ExecutionRunner is closed")
+            self._workers.add(worker)
+        return worker
+
+    def _discard(self, worker: _Worker) -> None:
+        with self._lock:
+            self._workers.discard(worker)
+        worker.kill()
+
+
+_shared_runner: Optional[ExecutionRunner] = None
+_shared_lock = threading.Lock()
+
+
+def shared_runner() -> ExecutionRunner:
+    """Get the process-wide runner, starting it on first use."""
+    global _shared_runner
+    with _shared_lock:
+        if _shared_runner is None or _shared_runner._closed:
+            _shared_runner = ExecutionRunner()
+            atexit.register(_shared_runner.close)
+        return _shared_runner
+
+
+# =============================================================================
+# Worker process
+# =============================================================================
+
+class _JobTimeout(BaseException):
+    """Raised by the SIGALRM handler; BaseException so snippets can't swallow it."""
+
+
+def _on_alarm(signum, frame):
+    raise _JobTimeout()
+
+
+def _execute(code: str, timeout: float) -> dict:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    result = {"timed_out": False}
+    sys.stdout, sys.stderr = stdout, stderr
+    start = time.perf_counter()
+    try:
+        if timeout > 0:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        try:
+            exec(compile(code, "<verification>", "exec"), {"__name__": "__verification__"})
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    except _JobTimeout:
+        result["timed_out"] = True
+        result["error"] = f"TimeoutError: exceeded {timeout:.1f}s"
+    except BaseException as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+    finally:
+        sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+    result["seconds"] = time.perf_counter() - start
+    result["stdout"] = stdout.getvalue()[:MAX_OUTPUT_CHARS]
+    result["stderr"] = stderr.getvalue()[:MAX_OUTPUT_CHARS]
+    return result
+
+
+def _worker_main() -> None:
+    # Talk to the parent on private copies of stdin/stdout, so snippets that
+    # read fd 0 or write fd 1 can't corrupt the protocol
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    channel = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(os.open(os.devnull, os.O_RDONLY), 0)
+    os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+    sys.stdin = io.StringIO()
+
+    config = json.loads(requests.readline())
+    sys.path[:] = config["sys_path"]
+    limit_mb = config.get("memory_limit_mb")
+    if limit_mb and resource is not None:
+        limit = limit_mb * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ValueError, OSError):
+            pass
+    signal.signal(signal.SIGALRM, _on_alarm)
+
+    for line in requests:
+        for job in json.loads(line)["jobs"]:
+            try:
+                answer = json.dumps(_execute(job["code"], job["timeout"]))
+            except MemoryError:
+                answer = json.dumps({"error": "MemoryError: result too large"})
+            channel.write(answer + "\n")
+            channel.flush()
+
+
+if __name__ == "__main__" and sys.argv[1:] == ["--worker"]:
+    _worker_main()
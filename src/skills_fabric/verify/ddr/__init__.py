@@ -17,6 +17,7 @@ Batch Processing:
 - Processes ALL concepts without artificial limits
 - Tracks progress for large batches
 - Supports async batch validation for efficiency
+- Streams results from lazily-read query iterables (retrieve_stream)
 
 Multi-Source Validation (Phase 5.2):
 - AST parser for Python files (rich metadata)
@@ -33,10 +34,12 @@ Hall_m Metric Tracking (Phase 5.3):
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Callable, Iterator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from bisect import bisect_right
 import re
 import json
+import threading
 import time
 from datetime import datetime
 
@@ -148,6 +151,11 @@ class HallMetric:
     # Session info
     session_start: datetime = field(default_factory=datetime.now, init=False)
 
+    # Guards totals and history when retrievals run on worker threads
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
     @property
     def total_attempted(self) -> int:
         """Total number of validation attempts."""
@@ -206,10 +214,6 @@ class HallMetric:
         Returns:
             HallMetricSnapshot of this observation.
         """
-        # Update totals
-        self.total_validated += validated
-        self.total_rejected += rejected
-
         # Calculate Hall_m for this observation
         hall_m = self.calculate(validated, rejected)
 
@@ -224,8 +228,11 @@ class HallMetric:
             context=context[:100] if context else "",  # Truncate long contexts
         )
 
-        # Add to history
-        self.history.append(snapshot)
+        # Update totals and history
+        with self._lock:
+            self.total_validated += validated
+            self.total_rejected += rejected
+            self.history.append(snapshot)
 
         # Log the metric
         if self.log_all:
@@ -389,10 +396,11 @@ class HallMetric:
 
     def reset(self) -> None:
         """Reset all metrics and history."""
-        self.total_validated = 0
-        self.total_rejected = 0
-        self.history.clear()
-        self.session_start = datetime.now()
+        with self._lock:
+            self.total_validated = 0
+            self.total_rejected = 0
+            self.history.clear()
+            self.session_start = datetime.now()
 
     def export_history(self) -> list[dict]:
         """Export history as list of dicts for serialization."""
@@ -512,6 +520,25 @@ class ValidationResult:
         }
 
 
+def _read_source_lines(
+    cache: dict[str, tuple[int, int, list[str]]],
+    file_path: Path,
+) -> list[str]:
+    """Return a file's lines, reusing the cached copy while it is unchanged.
+
+    Entries are keyed by path and checked against (mtime_ns, size), so an
+    edited file is re-read on next use without any explicit invalidation.
+    """
+    stat = file_path.stat()
+    key = str(file_path)
+    cached = cache.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    lines = file_path.read_text(encoding="utf-8", errors="ignore").split("\n")
+    cache[key] = (stat.st_mtime_ns, stat.st_size, lines)
+    return lines
+
+
 class MultiSourceValidator:
     """Multi-source symbol validation using AST, Tree-sitter, and LSP.
 
@@ -549,23 +576,31 @@ class MultiSourceValidator:
         # Cache parsed symbols per file to avoid re-parsing
         self._symbol_cache: dict[str, list] = {}
 
+        # Parsers that failed to import; not retried on every validation
+        self._unavailable: set[str] = set()
+
+        # Source lines for the file-content check: path -> (mtime_ns, size, lines)
+        self._line_cache: dict[str, tuple[int, int, list[str]]] = {}
+
     def _get_ast_parser(self):
         """Lazy-load the AST parser."""
-        if self._ast_parser is None:
+        if self._ast_parser is None and "ast" not in self._unavailable:
             try:
-                from ..analyze.ast_parser import ASTParser
+                from skills_fabric.analyze.ast_parser import ASTParser
                 self._ast_parser = ASTParser()
             except ImportError:
+                self._unavailable.add("ast")
                 logger.warning("AST parser not available")
         return self._ast_parser
 
     def _get_tree_sitter_parser(self):
         """Lazy-load the Tree-sitter parser."""
-        if self._tree_sitter_parser is None:
+        if self._tree_sitter_parser is None and "tree_sitter" not in self._unavailable:
             try:
-                from ..analyze.tree_sitter import TreeSitterParser
+                from skills_fabric.analyze.tree_sitter import TreeSitterParser
                 self._tree_sitter_parser = TreeSitterParser()
             except ImportError:
+                self._unavailable.add("tree_sitter")
                 logger.warning("Tree-sitter parser not available")
         return self._tree_sitter_parser
 
@@ -573,7 +608,7 @@ class MultiSourceValidator:
         """Lazy-load the code analyzer (with LSP support)."""
         if self._code_analyzer is None and self._use_lsp:
             try:
-                from ..analyze.code_analyzer import CodeAnalyzer
+                from skills_fabric.analyze.code_analyzer import CodeAnalyzer
                 project_path = self._lsp_project_path or self._repo_path
                 self._code_analyzer = CodeAnalyzer(
                     project_path=project_path,
@@ -899,8 +934,7 @@ class MultiSourceValidator:
         result.sources_checked.append(ValidationSource.FILE_CONTENT)
 
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            lines = content.split("\n")
+            lines = _read_source_lines(self._line_cache, file_path)
 
             # Check around the expected line (with tolerance)
             start_line = max(0, line_number - 6)  # 5 line tolerance + 1 for 0-index
@@ -970,8 +1004,9 @@ class MultiSourceValidator:
         return results
 
     def clear_cache(self) -> None:
-        """Clear the symbol cache to free memory."""
+        """Clear the symbol and source-line caches to free memory."""
         self._symbol_cache.clear()
+        self._line_cache.clear()
 
     def close(self) -> None:
         """Clean up resources."""
@@ -1167,6 +1202,9 @@ class DirectDependencyRetriever:
         self._symbol_index: dict[str, list[dict]] = {}
         self._loaded = False
 
+        # Source lines per file, reused across queries: path -> (mtime_ns, size, lines)
+        self._line_cache: dict[str, tuple[int, int, list[str]]] = {}
+
         # Multi-source validation (Phase 5.2)
         self._use_multi_source = use_multi_source
         self._multi_source_validator: Optional[MultiSourceValidator] = None
@@ -1395,53 +1433,76 @@ class DirectDependencyRetriever:
             hallucination_rate=hallucination_rate,
         )
 
+    @property
+    def _symbol_index(self) -> dict[str, list[dict]]:
+        """Symbol name (lowercase) -> catalog entries."""
+        return self._symbol_entries
+
+    @_symbol_index.setter
+    def _symbol_index(self, index: dict[str, list[dict]]) -> None:
+        # Replacing the index invalidates the derived search table
+        self._symbol_entries = index
+        self._name_table = None
+
+    def _get_name_table(self) -> tuple[str, list[int], list[str]]:
+        """Build (or reuse) the substring-search table over symbol names.
+
+        All index keys are joined into one newline-separated string so a
+        substring probe is a handful of str.find calls instead of a Python
+        loop over every symbol. offsets[i] is where keys[i] starts.
+        """
+        table = self._name_table
+        if table is None or len(table[2]) != len(self._symbol_index):
+            keys = list(self._symbol_index)
+            offsets = []
+            position = 0
+            for key in keys:
+                offsets.append(position)
+                position += len(key) + 1
+            table = ("\n".join(keys), offsets, keys)
+            self._name_table = table
+        return table
+
     def _search_symbols(self, query: str) -> list[dict]:
         """Search symbol index for matches.
 
         Priority order:
         1. Exact matches (highest priority for zero-hallucination)
-        2. Partial matches (query or query words in symbol name)
-        3. Word matches (query words in symbol)
-        4. Individual word searches (for multi-word queries)
-        """
-        exact_matches = []
-        partial_matches = []
-        word_matches = []
-        individual_word_matches = []
+        2. Partial matches (query or any query word in symbol name), in
+           catalog order
 
+        A query word that equals a word of the symbol name ("state graph"
+        vs "StateGraph") is always also a substring of it, so word matches
+        are covered by the partial pass.
+        """
         query_lower = query.lower()
         query_parts = [p for p in query_lower.split() if len(p) > 2]  # Skip tiny words
 
-        for symbol_name, entries in self._symbol_index.items():
-            # Exact match (highest priority)
-            if symbol_name == query_lower:
-                exact_matches.extend(entries)
-                continue
+        exact_matches = list(self._symbol_index.get(query_lower, ()))
 
-            # Partial match (full query contained in symbol)
-            if query_lower in symbol_name:
-                partial_matches.extend(entries)
+        blob, offsets, keys = self._get_name_table()
+        matched: set[int] = set()
+        for needle in dict.fromkeys([query_lower, *query_parts]):
+            if not needle:
+                matched.update(range(len(keys)))
                 continue
-
-            # For multi-word queries: check if ANY query word is in symbol name
-            matched_by_word = False
-            for query_word in query_parts:
-                if query_word in symbol_name:
-                    partial_matches.extend(entries)
-                    matched_by_word = True
-                    break
-
-            if matched_by_word:
+            if "\n" in needle:
                 continue
+            position = blob.find(needle)
+            while position != -1:
+                key_index = bisect_right(offsets, position) - 1
+                matched.add(key_index)
+                if key_index + 1 >= len(offsets):
+                    break
+                position = blob.find(needle, offsets[key_index + 1])
 
-            # Word match (e.g., "state graph" matches "StateGraph")
-            symbol_words = set(re.findall(r'[a-z]+', symbol_name))
-            query_word_set = set(query_parts)
-            if query_word_set & symbol_words:
-                word_matches.extend(entries)
+        partial_matches = []
+        for key_index in sorted(matched):
+            key = keys[key_index]
+            if key != query_lower:
+                partial_matches.extend(self._symbol_index[key])
 
-        # Return in priority order: exact first, then partial, then word
-        return exact_matches + partial_matches + word_matches
+        return exact_matches + partial_matches
 
     def _validate_and_extract(self, candidate: dict) -> Optional[CodeElement]:
         """Validate candidate exists and extract actual content.
@@ -1661,6 +1722,7 @@ class DirectDependencyRetriever:
 
     def close(self) -> None:
         """Clean up resources including multi-source validator."""
+        self._line_cache.clear()
         if self._multi_source_validator:
             self._multi_source_validator.close()
             self._multi_source_validator = None
@@ -1674,7 +1736,7 @@ class DirectDependencyRetriever:
     ) -> tuple[str, str]:
         """Extract actual content from source file."""
         try:
-            lines = file_path.read_text().split('\n')
+            lines = _read_source_lines(self._line_cache, file_path)
 
             if start_line <= 0 or start_line > len(lines):
                 return "", ""
@@ -2008,6 +2070,85 @@ class DirectDependencyRetriever:
             queries_processed=len(queries),
         )
 
+    def retrieve_stream(
+        self,
+        queries: Iterable[str],
+        max_results_per_query: int = 20,
+        max_workers: int = 4,
+        ordered: bool = True,
+        max_in_flight: Optional[int] = None,
+    ) -> Iterator[tuple[int, str, Optional[DDRResult], Optional[Exception]]]:
+        """Stream retrieval results for a lazily-consumed query iterable.
+
+        Unlike retrieve_batch_parallel, queries are pulled from the iterable
+        only as workers free up (at most max_in_flight outstanding), so an
+        unbounded input such as stdin can be processed in constant memory and
+        results are yielded as soon as they are available. Per-query
+        fail_on_exceed is disabled; the caller decides on the aggregate.
+
+        Args:
+            queries: Iterable of search queries, consumed lazily.
+            max_results_per_query: Max elements per query.
+            max_workers: Worker threads sharing this retriever. With 1 worker,
+                queries run inline on the calling thread.
+            ordered: Yield results in input order. When False, results are
+                yielded in completion order.
+            max_in_flight: Bound on submitted-but-unyielded queries
+                (default: 2 * max_workers).
+
+        Yields:
+            Tuples of (input index, query, DDRResult or None, exception or None).
+        """
+        if max_workers <= 1:
+            for index, query in enumerate(queries):
+                try:
+                    yield index, query, self.retrieve(query, max_results_per_query, False), None
+                except Exception as e:
+                    yield index, query, None, e
+            return
+
+        window = max_in_flight or max_workers * 2
+        source = enumerate(queries)
+        exhausted = False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: dict = {}
+            completed: dict[int, tuple] = {}
+            next_index = 0
+
+            while True:
+                while not exhausted and len(pending) + len(completed) < window:
+                    item = next(source, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, query = item
+                    future = executor.submit(
+                        self.retrieve, query, max_results_per_query, False
+                    )
+                    pending[future] = (index, query)
+
+                if not pending and not completed:
+                    return
+
+                if pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index, query = pending.pop(future)
+                        error = future.exception()
+                        result = None if error else future.result()
+                        if error:
+                            logger.warning(f"Query failed: {query[:50]}... - {error}")
+                        completed[index] = (index, query, result, error)
+
+                if ordered:
+                    while next_index in completed:
+                        yield completed.pop(next_index)
+                        next_index += 1
+                else:
+                    for index in list(completed):
+                        yield completed.pop(index)
+
     def retrieve_all_proven_links(
         self,
         on_progress: Optional[Callable[[BatchProgress], None]] = None,
@@ -2023,7 +2164,7 @@ class DirectDependencyRetriever:
         Returns:
             BatchResult with all validated PROVEN links
         """
-        from ..core.database import db
+        from skills_fabric.core.database import db
 
         logger.info("Retrieving ALL PROVEN links (no LIMIT constraint)")
 
@@ -0,0 +1,241 @@
+"""Unit tests for the agent memory system.
+
+This module tests the Beads and MIRIX layers:
+- SQLite-authoritative persistence and reload
+- Incremental blocked-dependency counters
+- Ready-set ordering and select_next
+- Transaction grouping and rollback
+- JSONL export and one-time JSONL import
+- MIRIX topic index (substring match, type/recency filters, BM25)
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Import agent_memory directly to avoid heavy dependencies from skills_fabric.__init__
+_src_path = Path(__file__).parent.parent / "src"
+_agent_memory_path = _src_path / "skills_fabric" / "memory" / "agent_memory.py"
+_spec = importlib.util.spec_from_file_location(
+    "skills_fabric.memory.agent_memory", _agent_memory_path
+)
+_agent_memory_module = importlib.util.module_from_spec(_spec)
+sys.modules["skills_fabric.memory.agent_memory"] = _agent_memory_module
+_spec.loader.exec_module(_agent_memory_module)
+
+Bead = _agent_memory_module.Bead
+BeadPriority = _agent_memory_module.BeadPriority
+BeadStatus = _agent_memory_module.BeadStatus
+BeadsStore = _agent_memory_module.BeadsStore
+MemoryType = _agent_memory_module.MemoryType
+MIRIXMemory = _agent_memory_module.MIRIXMemory
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    """BeadsStore without JSONL export."""
+    beads = BeadsStore(tmp_path / "beads", export_jsonl=False)
+    yield beads
+    beads.close()
+
+
+class TestBeadsReadySet:
+    """Tests for incremental ready-set maintenance."""
+
+    def test_unblocked_bead_is_ready(self, store: BeadsStore):
+        bead = store.create("task")
+        assert [b.id for b in store.get_ready_set()] == [bead.id]
+
+    def test_blocked_bead_not_ready_until_blocker_done(self, store: BeadsStore):
+        parent = store.create("parent")
+        child = store.create("child", blocked_by=[parent.id])
+
+        assert [b.id for b in store.get_ready_set()] == [parent.id]
+
+        store.update_status(parent.id, BeadStatus.DONE)
+        assert [b.id for b in store.get_ready_set()] == [child.id]
+
+    def test_reopening_blocker_reblocks_dependents(self, store: BeadsStore):
+        parent = store.create("parent")
+        child = store.create("child", blocked_by=[parent.id])
+        store.update_status(parent.id, BeadStatus.DONE)
+        store.update_status(parent.id, BeadStatus.OPEN)
+
+        assert [b.id for b in store.get_ready_set()] == [parent.id]
+        assert child.id not in {b.id for b in store.get_ready_set()}
+
+    def test_multiple_blockers(self, store: BeadsStore):
+        a = store.create("a")
+        b = store.create("b")
+        child = store.create("child", blocked_by=[a.id, b.id])
+
+        store.update_status(a.id, BeadStatus.DONE)
+        assert child.id not in {x.id for x in store.get_ready_set()}
+
+        store.update_status(b.id, BeadStatus.DONE)
+        assert child.id in {x.id for x in store.get_ready_set()}
+
+    def test_done_blocker_does_not_block(self, store: BeadsStore):
+        parent = store.create("parent")
+        store.update_status(parent.id, BeadStatus.DONE)
+        child = store.create("child", blocked_by=[parent.id])
+        assert [b.id for b in store.get_ready_set()] == [child.id]
+
+    def test_unknown_blocker_is_ignored(self, store: BeadsStore):
+        bead = store.create("task", blocked_by=["missing"])
+        assert [b.id for b in store.get_ready_set()] == [bead.id]
+
+    def test_ready_set_sorted_by_priority_then_creation(self, store: BeadsStore):
+        low = store.create("low", priority=BeadPriority.LOW)
+        first = store.create("first", priority=BeadPriority.HIGH)
+        second = store.create("second", priority=BeadPriority.HIGH)
+
+        ready = store.get_ready_set()
+        assert [b.id for b in ready] == [first.id, second.id, low.id]
+        assert store.select_next().id == first.id
+
+    def test_in_progress_bead_not_ready(self, store: BeadsStore):
+        bead = store.create("task")
+        store.update_status(bead.id, BeadStatus.IN_PROGRESS)
+        assert store.get_ready_set() == []
+        assert store.select_next() is None
+
+    def test_update_unknown_bead_raises(self, store: BeadsStore):
+        with pytest.raises(KeyError):
+            store.update_status("missing", BeadStatus.DONE)
+
+
+class TestBeadsPersistence:
+    """Tests for SQLite persistence, transactions and JSONL export."""
+
+    def test_reload_preserves_beads_and_counters(self, tmp_path: Path):
+        path = tmp_path / "beads"
+        store = BeadsStore(path, export_jsonl=False)
+        parent = store.create("parent")
+        child = store.create("child", blocked_by=[parent.id])
+        store.close()
+
+        reopened = BeadsStore(path, export_jsonl=False)
+        assert set(reopened.beads) == {parent.id, child.id}
+        assert reopened.beads[parent.id].blocks == [child.id]
+        assert [b.id for b in reopened.get_ready_set()] == [parent.id]
+
+        reopened.update_status(parent.id, BeadStatus.DONE)
+        assert [b.id for b in reopened.get_ready_set()] == [child.id]
+        reopened.close()
+
+    def test_transaction_rollback(self, store: BeadsStore):
+        bead = store.create("task")
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                store._conn.execute(
+                    "UPDATE beads SET status = 'done' WHERE id = ?", (bead.id,)
+                )
+                raise RuntimeError("boom")
+        assert [b.id for b in store.get_ready_set()] == [bead.id]
+
+    def test_jsonl_export(self, tmp_path: Path):
+        store = BeadsStore(tmp_path / "beads")
+        bead = store.create("task")
+        store.update_status(bead.id, BeadStatus.DONE)
+        store.close()
+
+        lines = (tmp_path / "beads" / "beads.jsonl").read_text().splitlines()
+        assert [json.loads(line)["status"] for line in lines] == ["open", "done"]
+
+    def test_jsonl_import_into_empty_db(self, tmp_path: Path):
+        path = tmp_path / "beads"
+        path.mkdir()
+        parent = Bead(id="p1", title="parent", status=BeadStatus.OPEN, blocks=["c1"])
+        child = Bead(id="c1", title="child", status=BeadStatus.OPEN, blocked_by=["p1"])
+        done = Bead(id="p1", title="parent", status=BeadStatus.DONE, blocks=["c1"])
+        with open(path / "beads.jsonl", "w") as f:
+            for bead in (parent, child, done):
+                f.write(json.dumps(bead.to_dict()) + "\n")
+
+        store = BeadsStore(path, export_jsonl=False)
+        assert store.beads["p1"].status == BeadStatus.DONE
+        assert [b.id for b in store.get_ready_set()] == ["c1"]
+        store.close()
+
+    def test_discovery_tree(self, store: BeadsStore):
+        root = store.create("root")
+        child = store.create("child", discovered_from=root.id)
+        tree = store.get_discovery_tree(root.id)
+        assert tree["id"] == root.id
+        assert [c["id"] for c in tree["children"]] == [child.id]
+
+
+class TestMIRIXTopicIndex:
+    """Tests for indexed MIRIX topic retrieval."""
+
+    @pytest.fixture
+    def memory(self, tmp_path: Path):
+        mirix = MIRIXMemory(tmp_path / "mirix")
+        yield mirix
+        mirix.close()
+
+    def test_index_available(self, memory: MIRIXMemory):
+        assert memory.index is not None
+
+    def test_substring_match_on_topic_and_content(self, memory: MIRIXMemory):
+        by_topic = memory.add_semantic("unrelated fact", topic="Requests Library")
+        by_content = memory.add_procedural("Check the requests Session first", "http")
+        memory.add_semantic("nothing here", topic="other")
+
+        found = {e.id for e in memory.retrieve_by_topic("requests")}
+        assert found == {by_topic.id, by_content.id}
+
+    def test_matches_linear_scan(self, tmp_path: Path):
+        indexed = MIRIXMemory(tmp_path / "indexed")
+        scanned = MIRIXMemory(tmp_path / "scanned", use_index=False)
+        for i in range(50):
+            for mirix in (indexed, scanned):
+                mirix.add_semantic(f"fact {i} about graph{i % 7}", topic=f"t{i % 3}")
+
+        for query in ("graph3", "t1", "fact 4", "zz", "a"):
+            expected = [e.id for e in scanned.retrieve_by_topic(query, limit=100)]
+            actual = [e.id for e in indexed.retrieve_by_topic(query, limit=100)]
+            assert sorted(actual) == sorted(expected), query
+        indexed.close()
+
+    def test_type_filter(self, memory: MIRIXMemory):
+        semantic = memory.add_semantic("kuzu graph fact", topic="kuzu")
+        memory.add_procedural("kuzu workflow", task_type="kuzu")
+
+        found = memory.retrieve_by_topic("kuzu", memory_types=[MemoryType.SEMANTIC])
+        assert [e.id for e in found] == [semantic.id]
+        assert memory.retrieve_by_topic("kuzu", memory_types=[]) == []
+
+    def test_recency_filter_and_order(self, memory: MIRIXMemory):
+        old = memory.add_semantic("old kuzu fact", topic="kuzu")
+        new = memory.add_semantic("new kuzu fact", topic="kuzu")
+
+        assert [e.id for e in memory.retrieve_by_topic("kuzu")] == [new.id, old.id]
+        found = memory.retrieve_by_topic("kuzu", since=new.timestamp)
+        assert [e.id for e in found] == [new.id]
+
+    def test_bm25_rank(self, memory: MIRIXMemory):
+        strong = memory.add_semantic("langgraph langgraph langgraph", topic="langgraph")
+        memory.add_semantic("a long note that mentions langgraph once " + "x" * 500, "misc")
+
+        found = memory.retrieve_by_topic("langgraph", rank="bm25")
+        assert found[0].id == strong.id
+
+    def test_index_persists_and_rebuilds(self, tmp_path: Path):
+        path = tmp_path / "mirix"
+        mirix = MIRIXMemory(path)
+        entry = mirix.add_semantic("persisted fact", topic="persist")
+        mirix.close()
+
+        (path / "topic_index.db").unlink()
+        for suffix in ("-wal", "-shm"):
+            (path / f"topic_index.db{suffix}").unlink(missing_ok=True)
+
+        reopened = MIRIXMemory(path)
+        assert [e.id for e in reopened.retrieve_by_topic("persist")] == [entry.id]
+        reopened.close()
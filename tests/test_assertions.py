@@ -0,0 +1,190 @@
+"""Unit tests for batched assertion verification.
+
+This module tests understanding/assertions.py:
+- Per-file lookup tables (definitions, methods, bases, signatures)
+- verify_many results matching one-at-a-time verify()
+- One parse per file per version, across assertions and batches
+- Missing files, unparseable files and execution assertions in a batch
+"""
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.understanding.assertions import (
+    Assertion,
+    AssertionVerifier,
+    ClaimExtractor,
+    UnderstandingEngine,
+    VerificationResult,
+    VerificationType,
+)
+
+
+MODULE = '''"""Sample."""
+from typing import Generic
+
+
+class StateGraph(Generic[T]):
+    """A graph.
+
+    Args:
+        schema: The state schema
+
+    Returns:
+        A new graph
+    """
+
+    def add_node(self, name: str, action) -> None:
+        pass
+
+    async def run(self, config: dict):
+        pass
+
+
+class StateGraph2(StateGraph):
+    def add_edge(self, start, end) -> "StateGraph2":
+        pass
+
+
+def compile_graph(graph):
+    return graph
+'''
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "graph.py").write_text(MODULE)
+    (tmp_path / "pkg" / "other.py").write_text("class Other:\n    def go(self):\n        pass\n")
+    (tmp_path / "pkg" / "broken.py").write_text("class Broken(:\n")
+    return tmp_path
+
+
+def claim(claim: str, concept: str, kind: VerificationType, file: str = "pkg/graph.py") -> Assertion:
+    return Assertion(
+        claim=claim, category="test", source_concept=concept,
+        source_file=file, source_line=1, verification_type=kind,
+    )
+
+
+def sample_assertions() -> list[Assertion]:
+    extractor = ClaimExtractor(MODULE, "pkg/graph.py")
+    return [
+        *extractor.extract_from_class("StateGraph", 5),
+        *extractor.extract_from_class("StateGraph2", 20),
+        claim("compile_graph exists", "compile_graph", VerificationType.EXISTENCE),
+        claim("Ghost exists", "Ghost", VerificationType.EXISTENCE),
+        claim("StateGraph.ghost is a method", "StateGraph.ghost", VerificationType.EXISTENCE),
+        claim("StateGraph.ghost returns int", "StateGraph.ghost", VerificationType.TYPE_CHECK),
+        claim("StateGraph2 inherits from Generic", "StateGraph2", VerificationType.STATIC),
+        claim("Other.go is a method", "Other.go", VerificationType.EXISTENCE, "pkg/other.py"),
+        claim("Broken exists", "Broken", VerificationType.EXISTENCE, "pkg/broken.py"),
+        claim("Broken inherits from X", "Broken", VerificationType.STATIC, "pkg/broken.py"),
+        claim("Gone exists", "Gone", VerificationType.EXISTENCE, "pkg/gone.py"),
+        claim("Gone inherits from X", "Gone", VerificationType.STATIC, "pkg/gone.py"),
+    ]
+
+
+def outcome(assertion: Assertion) -> tuple:
+    return (
+        assertion.result, assertion.confidence,
+        [(e.type, e.content, e.source_line) for e in assertion.evidence],
+    )
+
+
+class TestLookupTables:
+    """Tests for answers drawn from the per-file tables."""
+
+    def test_existence_signature_and_inheritance(self, repo: Path):
+        verifier = AssertionVerifier(repo)
+        results = {a.claim: a for a in verifier.verify_many(sample_assertions())}
+
+        assert results["StateGraph is a class defined at line 5"].is_verified()
+        assert results["StateGraph.run is an async method"].is_verified()
+        assert results["StateGraph2 inherits from StateGraph"].is_verified()
+        assert results["StateGraph.add_node returns None"].confidence == 0.8
+        assert results["StateGraph.run accepts parameters: (self, config: dict)"].is_verified()
+        assert results["compile_graph exists"].evidence[0].source_line == 27
+        assert results["Other.go is a method"].is_verified()
+
+        assert results["Ghost exists"].result == VerificationResult.REFUTED
+        assert results["StateGraph.ghost is a method"].result == VerificationResult.REFUTED
+        assert results["StateGraph2 inherits from Generic"].result == VerificationResult.REFUTED
+
+    def test_unreadable_files(self, repo: Path):
+        verifier = AssertionVerifier(repo)
+        results = {a.claim: a for a in verifier.verify_many(sample_assertions())}
+
+        broken = results["Broken exists"]
+        assert broken.result == VerificationResult.ERROR
+        assert broken.evidence[0].type == "parse_error"
+        assert results["Broken inherits from X"].result == VerificationResult.ERROR
+        assert results["Gone exists"].result == VerificationResult.REFUTED
+        assert results["Gone inherits from X"].result == VerificationResult.ERROR
+
+
+class TestVerifyMany:
+    """Tests for batched, file-grouped verification."""
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_matches_single_verification(self, repo: Path, workers: int):
+        expected = [outcome(AssertionVerifier(repo).verify(a)) for a in sample_assertions()]
+        batch = AssertionVerifier(repo).verify_many(sample_assertions(), max_workers=workers)
+        assert [outcome(a) for a in batch] == expected
+
+    def test_input_order_and_identity(self, repo: Path):
+        assertions = sample_assertions()
+        assert AssertionVerifier(repo).verify_many(assertions) == assertions
+        assert all(a is b for a, b in zip(AssertionVerifier(repo).verify_many(assertions), assertions))
+
+    def test_each_file_parsed_once(self, repo: Path, monkeypatch):
+        verifier = AssertionVerifier(repo)
+        parsed = []
+        real_index = verifier._index_tree
+        monkeypatch.setattr(verifier, "_index_tree", lambda tree, facts: parsed.append(facts.file_path) or real_index(tree, facts))
+
+        verifier.verify_many(sample_assertions())
+        verifier.verify_many(sample_assertions())
+
+        assert sorted(parsed) == ["pkg/graph.py", "pkg/other.py"]
+
+    def test_edit_triggers_reparse(self, repo: Path):
+        verifier = AssertionVerifier(repo)
+        extra = claim("extra exists", "extra", VerificationType.EXISTENCE)
+        assert verifier.verify(extra).result == VerificationResult.REFUTED
+
+        path = repo / "pkg" / "graph.py"
+        path.write_text(MODULE + "\n\ndef extra():\n    pass\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        extra = claim("extra exists", "extra", VerificationType.EXISTENCE)
+        assert verifier.verify(extra).is_verified()
+
+    def test_execution_assertions_in_batch(self, repo: Path):
+        passing = claim("runs", "x", VerificationType.EXECUTION)
+        passing.verification_code = "print('PASS')"
+        failing = claim("raises", "x", VerificationType.EXECUTION)
+        failing.verification_code = "raise ValueError('no')"
+
+        results = AssertionVerifier(repo).verify_many([passing, *sample_assertions(), failing])
+
+        assert results[0].is_verified()
+        assert results[-1].result == VerificationResult.REFUTED
+
+    def test_understand_uses_batch(self, repo: Path):
+        state = UnderstandingEngine(repo).understand("pkg/graph.py", "StateGraph", 5)
+        expected = [
+            outcome(AssertionVerifier(repo).verify(a))
+            for a in ClaimExtractor(MODULE, "pkg/graph.py").extract_from_class("StateGraph", 5)
+        ]
+        assert [outcome(a) for a in state.assertions] == expected
+        assert state.verified_count() == 7
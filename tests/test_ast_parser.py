@@ -13,7 +13,7 @@ Test coverage includes:
 - Enhanced symbol extraction
 - Edge cases and error handling
 - Call graph building
-- Directory parsing
+- Directory parsing (parallel, cached) and indexed caller lookup
 """
 from __future__ import annotations
 
@@ -1116,6 +1116,126 @@ class TestDirectoryParsing:
         assert isinstance(symbols[0], Symbol)
 
 
+class TestDirectoryCache:
+    """Test the in-memory and on-disk parse caches."""
+
+    def test_warm_parse_served_from_disk(self, temp_dir: Path):
+        """A fresh parser reuses another parser's results for unchanged files."""
+        repo = temp_dir / "repo"
+        repo.mkdir()
+        (repo / "a.py").write_text("def alpha(x: int) -> int:\n    return helper(x)\n")
+        (repo / "b.py").write_text("class Beta:\n    @property\n    def value(self): return 1\n")
+        cache_dir = temp_dir / "cache"
+
+        cold = ASTParser(cache_dir=cache_dir).parse_directory(repo)
+        warm_parser = ASTParser(cache_dir=cache_dir)
+        warm = warm_parser.parse_directory(repo)
+
+        assert warm == cold
+        stats = warm_parser.last_parse_stats
+        assert (stats.files, stats.parsed, stats.disk_hits) == (2, 0, 2)
+
+    def test_warm_parse_of_relative_dir_matches_cold(self, temp_dir: Path, monkeypatch):
+        """Cached symbols carry the same normalized file_path as fresh parses."""
+        repo = temp_dir / "repo"
+        (repo / "pkg").mkdir(parents=True)
+        (repo / "a.py").write_text("def alpha(): pass\n")
+        (repo / "pkg" / "b.py").write_text("class Beta: pass\n")
+        cache_dir = temp_dir / "cache"
+        monkeypatch.chdir(repo)
+
+        cold = ASTParser(cache_dir=cache_dir).parse_directory(Path("."))
+        warm_parser = ASTParser(cache_dir=cache_dir)
+        warm = warm_parser.parse_directory(Path("."))
+
+        assert [s.file_path for s in cold] == ["a.py", str(Path("pkg") / "b.py")]
+        assert warm == cold
+        assert warm_parser.last_parse_stats.disk_hits == 2
+
+    def test_memory_cache_and_changed_files(self, ast_parser: ASTParser, temp_dir: Path):
+        """Only files whose mtime or size changed are re-parsed."""
+        (temp_dir / "a.py").write_text("def alpha(): pass\n")
+        (temp_dir / "b.py").write_text("def beta(): pass\n")
+        ast_parser.parse_directory(temp_dir)
+
+        ast_parser.parse_directory(temp_dir)
+        assert ast_parser.last_parse_stats.memory_hits == 2
+
+        (temp_dir / "b.py").write_text("def gamma(): pass\n")
+        symbols = ast_parser.parse_directory(temp_dir)
+        assert [s.name for s in symbols] == ["alpha", "gamma"]
+        assert ast_parser.last_parse_stats.parsed == 1
+
+    def test_modes_and_parser_version_keyed(self, temp_dir: Path, monkeypatch):
+        """Basic/enhanced results and parser versions don't share entries."""
+        repo = temp_dir / "repo"
+        repo.mkdir()
+        (repo / "a.py").write_text("def outer():\n    def inner(): pass\n")
+        cache_dir = temp_dir / "cache"
+        ASTParser(cache_dir=cache_dir).parse_directory(repo)
+
+        basic = ASTParser(cache_dir=cache_dir).parse_directory(repo, enhanced=False)
+        assert {s.name for s in basic} == {"outer", "inner"}
+
+        monkeypatch.setattr(_ast_parser_module, "PARSER_VERSION", "test")
+        parser = ASTParser(cache_dir=cache_dir)
+        parser.parse_directory(repo)
+        assert parser.last_parse_stats.parsed == 1
+
+    def test_skip_dirs_pruned(self, ast_parser: ASTParser, temp_dir: Path):
+        """Skipped directory names are matched as path components."""
+        (temp_dir / "rebuild.py").write_text("def rebuild(): pass\n")
+        (temp_dir / "build").mkdir()
+        (temp_dir / "build" / "gen.py").write_text("def generated(): pass\n")
+
+        names = [s.name for s in ast_parser.parse_directory(temp_dir)]
+        assert names == ["rebuild"]
+
+    def test_parallel_matches_serial(self, temp_dir: Path, monkeypatch):
+        """Worker processes produce the same symbols as in-process parsing."""
+        monkeypatch.syspath_prepend(str(_src_path))
+        # Other test modules may import their own copy; workers are pickled by name
+        monkeypatch.setitem(sys.modules, "skills_fabric.analyze.ast_parser", _ast_parser_module)
+        monkeypatch.setattr(_ast_parser_module, "PARALLEL_MIN_FILES", 2)
+        for i in range(6):
+            (temp_dir / f"mod{i}.py").write_text(
+                f"class C{i}:\n    def run(self, v: int = {i}):\n        return self.step(v)\n"
+            )
+
+        serial = ASTParser().parse_directory(temp_dir, max_workers=1)
+        parallel = ASTParser().parse_directory(temp_dir, max_workers=2)
+        assert parallel == serial
+        assert len(parallel) == 12
+
+
+class TestCallerIndex:
+    """Test indexed get_callers lookups."""
+
+    def test_suffix_matching(self, ast_parser: ASTParser, temp_dir: Path):
+        """Callers match on the full call or any dotted suffix."""
+        (temp_dir / "m.py").write_text(
+            "def a():\n    utils.io.helper()\n"
+            "def b():\n    helper(); helper()\n"
+            "def c():\n    myhelper()\n"
+        )
+        symbols = ast_parser.parse_directory(temp_dir)
+
+        assert ast_parser.get_callers(symbols, "helper") == ["a", "b"]
+        assert ast_parser.get_callers(symbols, "io.helper") == ["a"]
+        assert ast_parser.get_callers(symbols, "utils.io.helper") == ["a"]
+        assert ast_parser.get_callers(symbols, "elper") == []
+
+    def test_index_rebuilt_for_new_symbols(self, ast_parser: ASTParser, temp_dir: Path):
+        """Lookups against a different or grown list see its symbols."""
+        (temp_dir / "m.py").write_text("def a():\n    helper()\n")
+        symbols = ast_parser.parse_directory(temp_dir)
+        assert ast_parser.get_callers(symbols, "helper") == ["a"]
+
+        symbols.append(EnhancedSymbol(name="z", kind="function", file_path="x.py", line=1, calls=["helper"]))
+        assert ast_parser.get_callers(symbols, "helper") == ["a", "z"]
+        assert ast_parser.get_callers(symbols[:1], "helper") == ["a"]
+
+
 # =============================================================================
 # Convenience Function Tests
 # =============================================================================
@@ -0,0 +1,164 @@
+"""Unit tests for the indexed call graph.
+
+This module tests intelligence/call_graph.py:
+- Name index: get_node, get_calls, get_callers and called_by
+- Transitive calls by hop depth and unlimited (memoized) reachability
+- Impact analysis and dead code through cycles (SCC condensation)
+- Agreement with plain BFS on a random graph
+- build_from_directory: pruned walk, process-pool parsing
+"""
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.intelligence import call_graph
+from skills_fabric.intelligence.call_graph import CallGraph, CallNode
+
+
+def make_graph(edges: dict[str, set[str]], file_path: str = "m.py") -> CallGraph:
+    graph = CallGraph()
+    for line, (name, calls) in enumerate(edges.items(), start=1):
+        node = CallNode(name=name, file_path=file_path, line=line, kind="function", calls=set(calls))
+        graph.nodes[node.id] = node
+    graph._build_callers()
+    return graph
+
+
+def bfs(edges: dict[str, set[str]], start: set[str]) -> set[str]:
+    seen, stack = set(), list(start)
+    while stack:
+        name = stack.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        stack.extend(edges.get(name, ()))
+    return seen
+
+
+@pytest.fixture
+def graph() -> CallGraph:
+    # main -> load -> parse <-> validate (cycle) -> log; orphan -> log
+    return make_graph({
+        "main": {"load", "print"},
+        "load": {"parse"},
+        "parse": {"validate"},
+        "validate": {"parse", "log"},
+        "log": set(),
+        "orphan": {"log"},
+    })
+
+
+class TestLookups:
+    """Tests for name lookups and reverse relationships."""
+
+    def test_calls_and_callers(self, graph: CallGraph):
+        assert graph.get_calls("main") == {"load", "print"}
+        assert graph.get_callers("log") == {"m.py:validate", "m.py:orphan"}
+        assert graph.get_callers("parse") == {"m.py:load", "m.py:validate"}
+        assert graph.get_node("missing") is None
+
+    def test_get_node_returns_first_definition(self):
+        graph = make_graph({"helper": set()}, "a.py")
+        node = CallNode(name="helper", file_path="b.py", line=1, kind="function")
+        graph.nodes[node.id] = node
+
+        assert graph.get_node("helper").file_path == "a.py"
+
+    def test_callers_link_every_same_named_node(self):
+        graph = CallGraph()
+        for path in ("a.py", "b.py"):
+            node = CallNode(name="helper", file_path=path, line=1, kind="function")
+            graph.nodes[node.id] = node
+        caller = CallNode(name="run", file_path="c.py", line=1, kind="function", calls={"helper"})
+        graph.nodes[caller.id] = caller
+        graph._build_callers()
+
+        assert all(graph.nodes[f"{p}:helper"].called_by == {"c.py:run"} for p in ("a.py", "b.py"))
+        assert graph.impact_analysis("helper") == {"run"}
+
+
+class TestReachability:
+    """Tests for transitive, impact and dead-code queries."""
+
+    def test_transitive_calls_by_depth(self, graph: CallGraph):
+        assert graph.get_transitive_calls("main", max_depth=1) == {"load", "print"}
+        assert graph.get_transitive_calls("main", max_depth=2) == {"load", "print", "parse"}
+        assert graph.get_transitive_calls("main") == {"load", "print", "parse", "validate", "log"}
+        assert graph.get_transitive_calls("main", max_depth=None) == graph.get_transitive_calls("main")
+
+    def test_cycle_members_reach_each_other(self, graph: CallGraph):
+        assert graph.get_transitive_calls("parse", max_depth=None) == {"validate", "log"}
+        assert graph.impact_analysis("parse") == {"main", "load", "validate"}
+        assert graph.impact_analysis("log") == {"main", "load", "parse", "validate", "orphan"}
+
+    def test_dead_code(self, graph: CallGraph):
+        assert graph.find_dead_code(["main"]) == {"orphan"}
+        assert graph.find_dead_code(["orphan"]) == {"main", "load", "parse", "validate"}
+        assert graph.find_dead_code(["missing"]) == set(n.name for n in graph.nodes.values())
+
+    def test_index_rebuilt_after_changes(self, graph: CallGraph):
+        assert graph.find_dead_code(["main"]) == {"orphan"}
+        node = CallNode(name="start", file_path="n.py", line=1, kind="function", calls={"orphan"})
+        graph.nodes[node.id] = node
+
+        assert graph.find_dead_code(["main"]) == {"orphan", "start"}
+        assert graph.impact_analysis("orphan") == {"start"}
+
+    def test_matches_bfs_on_random_graph(self, monkeypatch):
+        # A small cache budget forces evictions between queries
+        monkeypatch.setattr(call_graph, "MAX_CACHED_REACH", 50)
+        rng = random.Random(7)
+        names = [f"f{i}" for i in range(120)]
+        edges = {n: set(rng.sample(names, rng.randint(0, 3))) for n in names}
+        reverse: dict[str, set[str]] = {n: set() for n in names}
+        for caller, calls in edges.items():
+            for called in calls:
+                reverse[called].add(caller)
+        graph = make_graph(edges)
+
+        for name in rng.sample(names, 40):
+            assert graph.get_transitive_calls(name, max_depth=None) == bfs(edges, edges[name]) - {name}
+            assert graph.impact_analysis(name) == bfs(reverse, {name}) - {name}
+        entries = rng.sample(names, 3)
+        assert graph.find_dead_code(entries) == set(names) - bfs(edges, set(entries))
+
+
+class TestBuildFromDirectory:
+    """Tests for directory builds."""
+
+    def write_repo(self, root: Path, modules: int) -> None:
+        for i in range(modules):
+            (root / f"mod{i}.py").write_text(
+                f"def entry_{i}():\n    return step_{i}()\n\n"
+                f"def step_{i}():\n    return entry_{(i + 1) % modules}()\n"
+            )
+        (root / "venv").mkdir()
+        (root / "venv" / "lib.py").write_text("def vendored(): pass\n")
+        (root / "broken.py").write_text("def broken(:\n")
+
+    def test_serial_build(self, tmp_path: Path):
+        self.write_repo(tmp_path, 3)
+        graph = CallGraph()
+
+        assert graph.build_from_directory(tmp_path, max_workers=1) == 6
+        assert graph.get_node("vendored") is None
+        assert graph.get_callers("step_1") == {f"{tmp_path / 'mod1.py'}:entry_1"}
+        assert graph.find_dead_code(["entry_0"]) == set()
+
+    def test_parallel_matches_serial(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(call_graph, "PARALLEL_MIN_FILES", 2)
+        self.write_repo(tmp_path, 8)
+        serial, parallel = CallGraph(), CallGraph()
+
+        assert serial.build_from_directory(tmp_path, max_workers=1) == 16
+        assert parallel.build_from_directory(tmp_path, max_workers=2) == 16
+        assert list(parallel.nodes) == list(serial.nodes)
+        assert parallel.nodes == serial.nodes
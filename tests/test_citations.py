@@ -0,0 +1,117 @@
+"""Unit tests for the citation system.
+
+This module tests generate/citations.py:
+- Single-pass citation of backticked symbols (all formats)
+- Uncited symbol tracking (ordered, de-duplicated)
+- Streaming citation of chunked text, including references split
+  across chunk boundaries
+"""
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.generate.citations import (
+    CitationConfig,
+    CitationSystem,
+    add_citations,
+    extract_cited_symbols,
+)
+from skills_fabric.verify.ddr import SourceRef
+
+
+@pytest.fixture
+def refs() -> list[SourceRef]:
+    return [
+        SourceRef(symbol_name="StateGraph", file_path="graph/state.py", line_number=50),
+        SourceRef(symbol_name="langgraph.add_node", file_path="graph/state.py", line_number=150, end_line=160),
+        SourceRef(symbol_name="compile", file_path="graph/state.py", line_number=200),
+    ]
+
+
+SAMPLE = (
+    "Create a `StateGraph`, then call `add_node` and `compile`.\n"
+    "`Missing` is not real, nor is `Ghost`; `StateGraph` again and `Missing` again.\n"
+    "Not code: `two words` or ``.\n"
+)
+
+
+class TestAddCitations:
+    """Tests for whole-document citation."""
+
+    def test_markdown_citations(self, refs):
+        result = add_citations(SAMPLE, refs)
+
+        assert "[`StateGraph`](graph/state.py#L50)" in result.cited_content
+        assert "[`add_node`](graph/state.py#L150)" in result.cited_content
+        assert result.citations_added == 4
+        assert result.cited_content.count("[`StateGraph`]") == 2
+        assert "`two words`" in result.cited_content
+        assert result.original_content == SAMPLE
+
+    def test_uncited_symbols_ordered_and_unique(self, refs):
+        result = add_citations(SAMPLE, refs)
+        assert result.uncited_symbols == ["Missing", "Ghost"]
+        assert not CitationSystem().validate_all_cited(result)
+
+    def test_formats(self, refs):
+        inline = CitationSystem(CitationConfig(format="inline")).add_citations(SAMPLE, refs)
+        assert "`compile` (graph/state.py:200)" in inline.cited_content
+
+        github = CitationSystem(CitationConfig(
+            format="github", github_base="https://github.com/o/r/blob/main",
+            include_line_range=True,
+        )).add_citations(SAMPLE, refs)
+        assert "[`add_node`](https://github.com/o/r/blob/main/graph/state.py#L150-L160)" in github.cited_content
+
+    def test_citation_map_and_roundtrip(self, refs):
+        result = add_citations(SAMPLE, refs)
+        assert result.citation_map["compile"] == "[`compile`](graph/state.py#L200)"
+        cited = {symbol for symbol, _ in extract_cited_symbols(result.cited_content)}
+        assert cited == {"StateGraph", "add_node", "compile"}
+
+
+class TestCitationStream:
+    """Tests for incremental citation of streamed chunks."""
+
+    def test_matches_whole_document_for_any_chunking(self, refs):
+        system = CitationSystem()
+        expected = system.add_citations(SAMPLE, refs)
+        rng = random.Random(7)
+
+        for _ in range(200):
+            cuts = sorted(rng.sample(range(1, len(SAMPLE)), rng.randint(1, 30)))
+            chunks = [SAMPLE[a:b] for a, b in zip([0, *cuts], [*cuts, len(SAMPLE)])]
+            stream = system.stream()
+            cited = "".join(stream.feed(chunk) for chunk in chunks) + stream.finish()
+
+            assert cited == expected.cited_content
+            assert stream.citations_added == expected.citations_added
+            assert stream.uncited_symbols == expected.uncited_symbols
+
+    def test_single_character_chunks(self, refs):
+        system = CitationSystem()
+        expected = system.add_citations(SAMPLE, refs).cited_content
+        assert "".join(system.cite_chunks(iter(SAMPLE))) == expected
+
+    def test_holds_only_open_reference(self, refs):
+        stream = CitationSystem().stream(refs)
+        assert stream.feed("Use `State") == "Use "
+        assert stream.feed("Graph` now") == "[`StateGraph`](graph/state.py#L50) now"
+        assert stream.feed(" `not a symbol") == " `not a symbol"
+        assert stream.feed(" tail `") == " tail "
+        assert stream.finish() == "`"
+        assert stream.finish() == ""
+
+    def test_feed_after_finish_raises(self):
+        stream = CitationSystem().stream()
+        stream.finish()
+        with pytest.raises(ValueError):
+            stream.feed("x")
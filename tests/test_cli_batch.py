@@ -0,0 +1,163 @@
+"""Unit tests for streaming bulk verification (``verify --batch``).
+
+This module tests, against a local fixture repository:
+- NDJSON query records, plain-string lines and skill files
+- Ordered and unordered result streams
+- The aggregate summary line (Hall_m, counts, throughput)
+- Malformed records and --strict exit codes
+- Batches always run locally, never through the serve daemon
+"""
+from __future__ import annotations
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+import skills_fabric.__main__ as cli
+
+
+@pytest.fixture
+def fixture_repo(tmp_path: Path) -> tuple[Path, Path]:
+    """A small repository plus a symbol_catalog.md describing it."""
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "pkg" / "graph.py").write_text(
+        "class StateGraph:\n"
+        '    """A graph."""\n'
+        "\n"
+        "    def add_node(self, name):\n"
+        "        return name\n"
+        "\n"
+        "\n"
+        "def compile_graph(graph):\n"
+        "    return graph\n"
+    )
+    codewiki = tmp_path / "codewiki"
+    codewiki.mkdir()
+    (codewiki / "symbol_catalog.md").write_text(
+        "# Symbol Catalog\n\n"
+        "### `pkg/graph.py`\n"
+        "- Line 1: `StateGraph` (class)\n"
+        "- Line 4: `add_node` (method)\n"
+        "- Line 8: `compile_graph` (function)\n\n"
+        "### `pkg/ghost.py`\n"
+        "- Line 0: `Phantom` (class)\n"
+    )
+    return repo, codewiki
+
+
+def run_batch(monkeypatch, capsys, fixture_repo, lines, *extra, stdin=True):
+    repo, codewiki = fixture_repo
+    data = "".join(line + "\n" for line in lines)
+    if stdin:
+        monkeypatch.setattr(sys, "stdin", io.StringIO(data))
+        source = "-"
+    else:
+        source = str(repo.parent / "batch.ndjson")
+        Path(source).write_text(data)
+    monkeypatch.setattr(sys, "argv", [
+        "skills_fabric", "--no-daemon", "verify", "--batch", source,
+        "--codewiki", str(codewiki), "--repo", str(repo), "-q", *extra,
+    ])
+    exit_code = cli.main()
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    return exit_code, records
+
+
+class TestVerifyBatch:
+    """Tests for the NDJSON bulk verification path."""
+
+    def test_query_records_stream_in_order(self, monkeypatch, capsys, fixture_repo):
+        lines = [json.dumps({"id": f"q{i}", "query": q})
+                 for i, q in enumerate(["StateGraph", "compile_graph", "add_node"])]
+        exit_code, records = run_batch(monkeypatch, capsys, fixture_repo, lines, "-w", "2")
+
+        assert exit_code == 0
+        results = [r for r in records if r["type"] == "result"]
+        assert [r["id"] for r in results] == ["q0", "q1", "q2"]
+        assert [r["index"] for r in results] == [0, 1, 2]
+        first = results[0]["elements"][0]
+        assert first["symbol_name"] == "StateGraph"
+        assert first["file_path"] == "pkg/graph.py" and first["line_number"] == 1
+
+        summary = records[-1]
+        assert summary["type"] == "summary"
+        assert summary["queries"] == 3 and summary["failed"] == 0
+        assert summary["validated"] == sum(r["validated_count"] for r in results)
+        assert summary["hall_m"] == 0.0
+        assert summary["per_second"] > 0
+
+    def test_plain_lines_and_file_input(self, monkeypatch, capsys, fixture_repo):
+        exit_code, records = run_batch(
+            monkeypatch, capsys, fixture_repo, ["StateGraph", '"add_node"'], stdin=False
+        )
+        assert exit_code == 0
+        results = [r for r in records if r["type"] == "result"]
+        assert [r["query"] for r in results] == ["StateGraph", "add_node"]
+        assert [r["id"] for r in results] == [1, 2]  # line numbers by default
+
+    def test_unordered_emits_every_result(self, monkeypatch, capsys, fixture_repo):
+        lines = ["StateGraph", "add_node", "compile_graph"] * 5
+        _, records = run_batch(monkeypatch, capsys, fixture_repo, lines, "--unordered")
+        results = [r for r in records if r["type"] == "result"]
+        assert sorted(r["index"] for r in results) == list(range(15))
+
+    def test_skill_file_expands_to_symbols(self, monkeypatch, capsys, fixture_repo, tmp_path):
+        skill = tmp_path / "SKILL.md"
+        skill.write_text(
+            "Build a [`StateGraph`](pkg/graph.py#L1) then call `add_node()`.\n"
+            "Finish with `compile_graph`.\n"
+        )
+        line = json.dumps({"id": "skill", "skill_file": str(skill)})
+        _, records = run_batch(monkeypatch, capsys, fixture_repo, [line])
+
+        results = [r for r in records if r["type"] == "result"]
+        assert [r["query"] for r in results] == ["StateGraph", "add_node", "compile_graph"]
+        assert {r["id"] for r in results} == {"skill"}
+        assert {r["skill_file"] for r in results} == {str(skill)}
+
+    def test_hallucinated_catalog_entry_counts_in_hall_m(self, monkeypatch, capsys, fixture_repo):
+        exit_code, records = run_batch(
+            monkeypatch, capsys, fixture_repo, ["Phantom", "StateGraph"], "--strict"
+        )
+        summary = records[-1]
+        assert summary["rejected"] >= 1
+        assert summary["hall_m"] > 0
+        assert exit_code == 1
+
+    def test_malformed_records_reported(self, monkeypatch, capsys, fixture_repo):
+        lines = ["[1, 2]", json.dumps({"id": 7}), "StateGraph"]
+        exit_code, records = run_batch(monkeypatch, capsys, fixture_repo, lines)
+
+        errors = [r for r in records if r["type"] == "error"]
+        assert [e["line"] for e in errors] == [1, 2]
+        assert records[-1]["invalid"] == 2 and records[-1]["queries"] == 1
+        assert exit_code == 1
+
+    def test_query_or_batch_required(self, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "argv", ["skills_fabric", "--no-daemon", "verify"])
+        assert cli.main() == 2
+
+    def test_batch_file_not_forwarded_to_daemon(self, monkeypatch, capsys, fixture_repo):
+        from skills_fabric import cli_daemon
+
+        def no_forward(argv, **kwargs):
+            raise AssertionError("batch forwarded to daemon")
+
+        monkeypatch.setattr(cli_daemon, "forward", no_forward)
+        repo, codewiki = fixture_repo
+        source = repo.parent / "batch.ndjson"
+        source.write_text("StateGraph\n")
+        monkeypatch.setattr(sys, "argv", [
+            "skills_fabric", "verify", "--batch", str(source),
+            "--codewiki", str(codewiki), "--repo", str(repo), "-q",
+        ])
+        assert cli.main() == 0
+        assert json.loads(capsys.readouterr().out.splitlines()[0])["query"] == "StateGraph"
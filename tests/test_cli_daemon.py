@@ -0,0 +1,192 @@
+"""Unit tests for the resident CLI daemon.
+
+This module tests:
+- Path fingerprints and the polling watcher
+- WarmState caching and path-based invalidation
+- Socket round trips: ping, forwarded commands, shutdown
+- Fallback when no daemon is running
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Import cli_daemon directly to avoid heavy dependencies from skills_fabric.__init__
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+_daemon_path = _src_path / "skills_fabric" / "cli_daemon.py"
+_spec = importlib.util.spec_from_file_location("skills_fabric.cli_daemon", _daemon_path)
+_daemon_module = importlib.util.module_from_spec(_spec)
+sys.modules["skills_fabric.cli_daemon"] = _daemon_module
+_spec.loader.exec_module(_daemon_module)
+
+CLIDaemon = _daemon_module.CLIDaemon
+PathWatcher = _daemon_module.PathWatcher
+WarmState = _daemon_module.WarmState
+forward = _daemon_module.forward
+path_fingerprint = _daemon_module.path_fingerprint
+ping = _daemon_module.ping
+shutdown = _daemon_module.shutdown
+
+
+def _touch_later(path: Path, text: str) -> None:
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestPathWatcher:
+    """Tests for fingerprints and change detection."""
+
+    def test_fingerprint_changes_on_edit_add_and_delete(self, tmp_path: Path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        before = path_fingerprint(tmp_path)
+
+        _touch_later(tmp_path / "a.py", "x = 2\n")
+        edited = path_fingerprint(tmp_path)
+        assert edited != before
+
+        (tmp_path / "b.py").write_text("")
+        added = path_fingerprint(tmp_path)
+        assert added[0] == 2
+
+        (tmp_path / "b.py").unlink()
+        assert path_fingerprint(tmp_path)[0] == 1
+
+    def test_ignored_dirs(self, tmp_path: Path):
+        (tmp_path / "a.py").write_text("")
+        before = path_fingerprint(tmp_path)
+        (tmp_path / "__pycache__").mkdir()
+        (tmp_path / "__pycache__" / "a.pyc").write_text("")
+        assert path_fingerprint(tmp_path)[0] == before[0]
+
+    def test_check_reports_changed_paths(self, tmp_path: Path):
+        changed = []
+        watcher = PathWatcher(changed.append, interval=60)
+        (tmp_path / "a.py").write_text("")
+        watcher.watch(tmp_path)
+
+        assert watcher.check() == []
+        _touch_later(tmp_path / "a.py", "y = 1\n")
+        assert watcher.check() == [tmp_path]
+        assert changed == [tmp_path]
+        assert watcher.check() == []
+
+
+class TestWarmState:
+    """Tests for cached objects and invalidation."""
+
+    def test_get_builds_once(self, tmp_path: Path):
+        state = WarmState()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return object()
+
+        first = state.get(("k",), (tmp_path,), factory)
+        assert state.get(("k",), (tmp_path,), factory) is first
+        assert len(calls) == 1
+
+    def test_invalidate_closes_entries_under_changed_path(self, tmp_path: Path):
+        state = WarmState()
+        closed = []
+        repo = tmp_path / "repo"
+        other = tmp_path / "other"
+        state.get(("repo",), (repo,), lambda: "r", close=closed.append)
+        state.get(("other",), (other,), lambda: "o", close=closed.append)
+
+        assert state.invalidate(repo / "pkg" / "mod.py") == 1
+        assert closed == ["r"]
+        assert len(state) == 1
+        assert state.roots() == {other}
+
+    def test_entries_register_with_watcher(self, tmp_path: Path):
+        watcher = PathWatcher(lambda p: None, interval=60)
+        state = WarmState(watcher=watcher)
+        state.get(("k",), (tmp_path, None), lambda: 1)
+        assert watcher.watched == [tmp_path]
+
+
+class TestDaemonSocket:
+    """Tests for the Unix socket protocol."""
+
+    @pytest.fixture
+    def daemon(self, tmp_path: Path):
+        # Short path: AF_UNIX paths are limited to ~100 bytes
+        socket_path = Path("/tmp") / f"sf-test-{os.getpid()}-{id(tmp_path)}.sock"
+        server = CLIDaemon(socket_path=socket_path, watch_interval=60)
+        server.bind()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        shutdown(socket_path)
+        thread.join(timeout=5)
+
+    def test_ping(self, daemon: CLIDaemon):
+        status = ping(daemon.socket_path)
+        assert status["ok"] and status["pid"] == os.getpid()
+
+    def test_forward_runs_command_with_warm_state(self, daemon: CLIDaemon, monkeypatch, tmp_path: Path):
+        import skills_fabric.__main__ as cli
+
+        seen = {}
+
+        def fake_analyze(args, warm=None):
+            seen["warm"] = warm
+            seen["cwd"] = os.getcwd()
+            print(f"analyzed {args.file}")
+            print("note", file=sys.stderr)
+            return 3
+
+        monkeypatch.setattr(cli, "cmd_analyze", fake_analyze)
+        response = forward(["analyze", "x.py"], socket_path=daemon.socket_path, cwd=str(tmp_path))
+
+        assert response == {"exit_code": 3, "stdout": "analyzed x.py\n", "stderr": "note\n"}
+        assert seen["warm"] is daemon.state
+        assert Path(seen["cwd"]) == tmp_path
+        assert ping(daemon.socket_path)["requests"] == 1
+
+    def test_unserved_command_rejected(self, daemon: CLIDaemon):
+        response = forward(["version"], socket_path=daemon.socket_path)
+        assert response["exit_code"] == 1
+        assert "not served" in response["stderr"]
+
+    def test_argparse_errors_return_exit_code(self, daemon: CLIDaemon):
+        response = forward(["analyze"], socket_path=daemon.socket_path)
+        assert response["exit_code"] == 2
+
+    def test_shutdown_removes_socket(self, daemon: CLIDaemon):
+        assert shutdown(daemon.socket_path)
+        for _ in range(50):
+            if not daemon.socket_path.exists():
+                break
+            threading.Event().wait(0.1)
+        assert not daemon.socket_path.exists()
+
+
+class TestFallback:
+    """Tests for clients when no daemon is running."""
+
+    def test_forward_without_daemon(self, tmp_path: Path):
+        assert forward(["analyze", "x.py"], socket_path=tmp_path / "none.sock") is None
+        assert ping(tmp_path / "none.sock") is None
+
+    def test_no_daemon_env(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv(_daemon_module.NO_DAEMON_ENV, "1")
+        assert forward(["analyze", "x.py"], socket_path=tmp_path / "none.sock") is None
+
+    def test_stale_socket_replaced(self, tmp_path: Path):
+        socket_path = Path("/tmp") / f"sf-stale-{os.getpid()}.sock"
+        socket_path.write_text("")
+        server = CLIDaemon(socket_path=socket_path)
+        server.bind()
+        assert socket_path.is_socket()
+        server.close()
+        assert not socket_path.exists()
@@ -0,0 +1,209 @@
+"""Unit tests for CodeWiki markdown processing.
+
+This module tests ingest/codewiki.py:
+- clean(): UI artifacts, blank-line runs and empty links, matching the
+  previous pattern-by-pattern substitutions byte for byte
+- segment(): H2 / H3 / paragraph splitting, matching the previous re-split
+  implementation (names, section paths and contents)
+- crawl_local_docs(): file selection, order, and process-pool processing
+"""
+from __future__ import annotations
+
+import random
+import re
+import sys
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.ingest import codewiki
+from skills_fabric.ingest.codewiki import CodeWikiCrawler, Concept, MarkdownProcessor
+
+
+class LegacyMarkdownProcessor(MarkdownProcessor):
+    """The previous clean / segment / _split_by_h3 implementation."""
+
+    def clean(self, raw_md: str) -> str:
+        cleaned = raw_md
+        for pattern in [r'copy code', r'zoom_in', r'fullscreen', r'filter_center_focus',
+                        r'\[edit\]', r'\[source\]', r'Skip to content', r'Table of contents']:
+            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+        cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
+        cleaned = re.sub(r'\[\s*\]\([^)]*\)', '', cleaned)
+        return cleaned.strip()
+
+    def segment(self, clean_md: str, source_doc: str, library: str = "") -> list[Concept]:
+        concepts = []
+        parts = re.split(r'(^## .*)', clean_md, flags=re.MULTILINE)
+        if parts[0].strip():
+            concepts.append(Concept("Introduction", parts[0].strip(), source_doc, library, "Introduction"))
+        it = iter(parts[1:])
+        for header in it:
+            content = next(it, "")
+            full_block = header + content
+            title = header.strip().lstrip('#').strip()
+            if self._fits_limits(full_block):
+                concepts.append(Concept(title, full_block, source_doc, library, title))
+            else:
+                concepts.extend(self._legacy_split_by_h3(title, full_block, source_doc, library))
+        return concepts
+
+    def _legacy_split_by_h3(self, h2_title, h2_content, source_doc, library) -> list[Concept]:
+        concepts = []
+        parts = re.split(r'(^### .*)', h2_content, flags=re.MULTILINE)
+        current_chunk = parts[0] if parts[0].strip() else ""
+        current_part = 1
+
+        def chunk() -> Concept:
+            h3_title = self._extract_h3_title(current_chunk) or f"{h2_title} (Part {current_part})"
+            return Concept(h3_title, current_chunk, source_doc, library, f"{h2_title} > {h3_title}")
+
+        it = iter(parts[1:])
+        for header in it:
+            full_section = header + next(it, "")
+            if len(current_chunk) + len(full_section) > self.max_chars:
+                if current_chunk:
+                    concepts.append(chunk())
+                    current_part += 1
+                if not self._fits_limits(full_section):
+                    concepts.extend(self._split_by_paragraph(
+                        header.strip().lstrip('#').strip(), full_section, source_doc, library, h2_title
+                    ))
+                    current_chunk = ""
+                else:
+                    current_chunk = full_section
+            else:
+                current_chunk += full_section
+        if current_chunk:
+            concepts.append(chunk())
+        return concepts
+
+    def _extract_h3_title(self, content: str) -> Optional[str]:
+        match = re.search(r'^### (.+)$', content, re.MULTILINE)
+        return match.group(1).strip() if match else None
+
+
+def as_tuples(concepts: list[Concept]) -> list[tuple]:
+    return [(c.name, c.content, c.source_doc, c.library, c.section_path) for c in concepts]
+
+
+def random_markdown(rng: random.Random, paragraphs: int) -> str:
+    pieces = ["copy code", "Copy Code", "zoom_in", "fullscreen", "filter_center_focus",
+              "[edit]", "[EDIT]", "[source]", "Skip to content", "Table of contents",
+              "Skip to con", "[edit]tent", "Table of content", "[](#x)", "[ ](\nlink)",
+              "\n", "\n\n\n\n", "\r\n", "## ", "### ", "###  ", "\n## Section\n", "\n### Sub\n",
+              "\n###\n", "\n### \n", "word ", "`code` ", "x" * 40]
+    return "".join(rng.choice(pieces) for _ in range(paragraphs))
+
+
+class TestClean:
+    """Tests for clean() against the previous substitutions."""
+
+    @pytest.mark.parametrize("raw", [
+        "Skip to con[edit]tent",
+        "Table of contentSkip to contents",
+        "Skip to con[source]te[edit]nt body",
+        "copy cocopy codede and zoom_IN",
+        "a\n\n\n\n[](x)\n\n\nb",
+        "[\n\n\n](link)\n\n\n\nend",
+        "  \n\nSKIP TO CONTENT\n\n\n",
+        "Caf\u00e9 \u017fkip to content and copy code",  # non-ASCII: long s folds to "s"
+        "",
+    ])
+    def test_matches_legacy(self, raw: str):
+        assert MarkdownProcessor().clean(raw) == LegacyMarkdownProcessor().clean(raw)
+
+    def test_artifacts_far_apart(self):
+        raw = ("Skip to con[edit]tent" + "text " * 200) * 20 + "zoom_in"
+        cleaned = MarkdownProcessor().clean(raw)
+        assert cleaned == LegacyMarkdownProcessor().clean(raw)
+        assert "Skip" not in cleaned and "zoom" not in cleaned
+
+    def test_random_documents(self):
+        rng = random.Random(3)
+        new, legacy = MarkdownProcessor(), LegacyMarkdownProcessor()
+        for _ in range(300):
+            raw = random_markdown(rng, rng.randint(0, 80))
+            assert new.clean(raw) == legacy.clean(raw)
+
+
+class TestSegment:
+    """Tests for segment() against the previous splitting."""
+
+    def test_sections_and_intro(self):
+        md = "Intro text\n\n## Install\npip install x\n\n## Usage\n### Basics\nrun it\n"
+        concepts = MarkdownProcessor().segment(md, "README.md", "lib")
+
+        assert [c.section_path for c in concepts] == ["Introduction", "Install", "Usage"]
+        assert concepts[2].content == "## Usage\n### Basics\nrun it\n"
+        assert as_tuples(concepts) == as_tuples(LegacyMarkdownProcessor().segment(md, "README.md", "lib"))
+
+    def test_oversized_sections_split(self):
+        body = "\n\n".join(f"Paragraph {i} " + "text " * 30 for i in range(12))
+        md = (
+            "## Guide\npreamble\n"
+            "### \nunnamed section\n"
+            "### First\nshort\n"
+            f"### Huge\n{body}\n"
+            "### Second\nshort again\n"
+        )
+        new = MarkdownProcessor(max_chars=400, max_lines=20).segment(md, "g.md")
+        legacy = LegacyMarkdownProcessor(max_chars=400, max_lines=20).segment(md, "g.md")
+
+        assert as_tuples(new) == as_tuples(legacy)
+        assert [c.name for c in new][:2] == ["First", "Huge (Part 1)"]
+        assert all(c.char_count <= 400 for c in new)
+
+    @pytest.mark.parametrize("max_chars", [60, 200, 1000])
+    def test_random_documents(self, max_chars: int):
+        rng = random.Random(max_chars)
+        new = MarkdownProcessor(max_chars=max_chars, max_lines=8)
+        legacy = LegacyMarkdownProcessor(max_chars=max_chars, max_lines=8)
+        for _ in range(200):
+            md = legacy.clean(random_markdown(rng, rng.randint(0, 120)))
+            assert as_tuples(new.segment(md, "r.md")) == as_tuples(legacy.segment(md, "r.md"))
+
+    def test_process_is_clean_then_segment(self):
+        raw = "Skip to content\n## Title\ncopy code\nBody\n\n\n\n"
+        processor = MarkdownProcessor()
+        assert as_tuples(processor.process(raw, "a.md")) == as_tuples(
+            processor.segment(processor.clean(raw), "a.md")
+        )
+
+
+class TestCrawlLocalDocs:
+    """Tests for local documentation crawling."""
+
+    def write_docs(self, root: Path, count: int) -> None:
+        (root / "docs" / "guide").mkdir(parents=True)
+        (root / "README.md").write_text("# Project\n\n## Overview\n" + "About the project. " * 10)
+        (root / "CHANGELOG.md").write_text("## 1.0\n" + "Changes. " * 20)
+        (root / "tiny.md").write_text("## Tiny\n")
+        for i in range(count):
+            (root / "docs" / "guide" / f"page{i:02d}.md").write_text(
+                f"Skip to content\n## Page {i}\n" + "Body text. " * 20 + f"\n### Detail {i}\nMore.\n"
+            )
+
+    def test_selection_and_order(self, tmp_path: Path):
+        self.write_docs(tmp_path, 3)
+        concepts = CodeWikiCrawler().crawl_local_docs(tmp_path, "lib", max_workers=1)
+
+        assert [c.source_doc for c in concepts] == [
+            "README.md", "README.md", "docs/guide/page00.md", "docs/guide/page01.md", "docs/guide/page02.md"
+        ]
+        assert all(c.library == "lib" for c in concepts)
+
+    def test_parallel_matches_serial(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(codewiki, "PARALLEL_MIN_FILES", 2)
+        self.write_docs(tmp_path, 8)
+        crawler = CodeWikiCrawler()
+
+        serial = crawler.crawl_local_docs(tmp_path, "lib", max_workers=1)
+        parallel = crawler.crawl_local_docs(tmp_path, "lib", max_workers=2)
+        assert as_tuples(parallel) == as_tuples(serial)
+        assert len(serial) == 10
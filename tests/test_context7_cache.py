@@ -0,0 +1,192 @@
+"""Unit tests for the Context7 response cache.
+
+This module tests ingest/context7.py:
+- Context7Cache: round trips, compressed payloads, replacement, per-library
+  summary statistics, paged listing, deletion
+- TTL expiry and oldest-first size eviction
+- One-time migration of the legacy one-JSON-file-per-response cache
+- Context7Client fetch/cache/stats/clear on top of the store
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.ingest import context7
+from skills_fabric.ingest.context7 import Context7Cache, Context7Client, FetchStatus
+
+
+def entry(library: str, query: str, response: str = None, **extra) -> dict:
+    return {
+        "library_id": f"/org/{library}",
+        "library_name": library,
+        "query": query,
+        "response": response if response is not None else f"{library} docs for {query}\n" * 20,
+        "code_blocks": 2,
+        "fetched_at": "2026-01-01T00:00:00",
+        **extra,
+    }
+
+
+def write_legacy(cache_dir: Path, data: dict) -> Path:
+    """Write a response the way the previous client did."""
+    hash_id = hashlib.md5(f"{data['library_name']}{data['query']}".encode()).hexdigest()[:12]
+    path = cache_dir / f"{data['library_name']}_{hash_id}.json"
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Context7Cache:
+    store = Context7Cache(tmp_path / Context7Cache.FILENAME)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def offline_client(tmp_path: Path, monkeypatch) -> Context7Client:
+    """A client whose network calls fail the test."""
+    def no_network(self, payload, operation="request"):
+        raise AssertionError(f"unexpected request: {operation}")
+
+    monkeypatch.setattr(Context7Client, "_request_with_retry", no_network)
+    return Context7Client(cache_dir=tmp_path)
+
+
+class TestStore:
+    """Tests for Context7Cache reads, writes and statistics."""
+
+    def test_round_trip_compressed(self, cache: Context7Cache):
+        cache.put(entry("langgraph", "StateGraph"))
+
+        assert cache.get("langgraph", "StateGraph") == entry("langgraph", "StateGraph")
+        assert cache.get("langgraph", "other") is None
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["stored_size_bytes"] < stats["size_bytes"]
+
+    def test_replace_updates_stats(self, cache: Context7Cache):
+        cache.put(entry("langgraph", "q", "short"))
+        cache.put(entry("langgraph", "q", "a much longer response"))
+        cache.put(entry("docling", "q", "x"))
+
+        assert cache.get("langgraph", "q")["response"] == "a much longer response"
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["size_bytes"] == len("a much longer response") + 1
+        assert stats["libraries"] == {"langgraph": 1, "docling": 1}
+
+    def test_paged_listing_in_key_order(self, cache: Context7Cache, monkeypatch):
+        monkeypatch.setattr(Context7Cache, "_PAGE_SIZE", 3)
+        for library in ("b", "a", "c"):
+            for i in range(5):
+                cache.put(entry(library, f"q{i}"))
+
+        listed = [(e["library_name"], e["query"]) for e in cache.iter_entries()]
+        assert len(listed) == 15 and len(set(listed)) == 15
+        assert [lib for lib, _ in listed] == ["a"] * 5 + ["b"] * 5 + ["c"] * 5
+        assert sorted(e["query"] for e in cache.iter_entries("b")) == [f"q{i}" for i in range(5)]
+
+    def test_delete(self, cache: Context7Cache):
+        for library in ("a", "b"):
+            for i in range(3):
+                cache.put(entry(library, f"q{i}"))
+
+        assert cache.delete("a") == 3
+        assert cache.stats()["libraries"] == {"b": 3}
+        assert cache.delete() == 3
+        assert cache.stats() == {"entries": 0, "size_bytes": 0, "stored_size_bytes": 0, "libraries": {}}
+
+
+class TestEviction:
+    """Tests for TTL expiry and the stored-size budget."""
+
+    def test_ttl(self, tmp_path: Path, monkeypatch):
+        now = [1_000_000.0]
+        monkeypatch.setattr(context7.time, "time", lambda: now[0])
+        cache = Context7Cache(tmp_path / "c.sqlite3", ttl=60)
+        cache.put(entry("a", "old"))
+        now[0] += 45
+        cache.put(entry("a", "new"))
+        now[0] += 30
+
+        assert cache.get("a", "old") is None
+        assert [e["query"] for e in cache.iter_entries()] == ["new"]
+
+        cache.put(entry("b", "q"))  # writes purge expired rows
+        assert cache.stats()["libraries"] == {"a": 1, "b": 1}
+        cache.close()
+
+    def test_size_budget_evicts_oldest(self, tmp_path: Path, monkeypatch):
+        now = [1_000_000.0]
+        monkeypatch.setattr(context7.time, "time", lambda: now[0])
+        cache = Context7Cache(tmp_path / "c.sqlite3")
+        cache.put(entry("a", "q0", os.urandom(300).hex()))
+        entry_size = cache.stats()["stored_size_bytes"]
+        cache.max_bytes = int(entry_size * 3.5)
+        for i in range(1, 6):
+            now[0] += 1
+            cache.put(entry("a", f"q{i}", os.urandom(300).hex()))
+
+        kept = sorted(e["query"] for e in cache.iter_entries())
+        assert kept == ["q3", "q4", "q5"]
+        assert cache.stats()["stored_size_bytes"] <= cache.max_bytes
+        cache.close()
+
+
+class TestMigration:
+    """Tests for importing the legacy JSON directory."""
+
+    def test_migrates_once_and_removes_files(self, tmp_path: Path, offline_client: Context7Client):
+        files = [write_legacy(tmp_path, entry("langgraph", f"q{i}")) for i in range(3)]
+        (tmp_path / "broken_0000.json").write_text("{not json")
+
+        client = Context7Client(cache_dir=tmp_path)
+        assert not any(f.exists() for f in files)
+        assert (tmp_path / "broken_0000.json").exists()
+
+        result = client.fetch_and_cache_detailed("langgraph", "q1")
+        assert result.status == FetchStatus.CACHED
+        assert result.doc.content == entry("langgraph", "q1")["response"]
+        assert result.cache_file == tmp_path / Context7Cache.FILENAME
+        assert client.get_cache_stats()["libraries"] == {"langgraph": 3}
+
+    def test_existing_entries_win(self, tmp_path: Path, cache: Context7Cache):
+        cache.put(entry("a", "q", "fresh"))
+        write_legacy(tmp_path, entry("a", "q", "stale"))
+
+        assert cache.migrate_json(tmp_path) == 1
+        assert cache.get("a", "q")["response"] == "fresh"
+
+
+class TestClient:
+    """Tests for Context7Client caching on top of the store."""
+
+    def test_fetch_then_cached(self, tmp_path: Path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(Context7Client, "resolve_library_id_detailed",
+                            lambda self, name, query="documentation": context7.LibraryResolutionResult(
+                                name, context7.LibraryResolutionStatus.RESOLVED, f"/org/{name}", query))
+        monkeypatch.setattr(Context7Client, "get_library_docs",
+                            lambda self, lib_id, query: calls.append(query) or "```x```\n" + "text " * 40)
+        client = Context7Client(cache_dir=tmp_path)
+
+        assert client.fetch_and_cache_detailed("lib", "intro").status == FetchStatus.SUCCESS
+        assert client.fetch_and_cache_detailed("lib", "intro").status == FetchStatus.CACHED
+        assert client.fetch_and_cache_detailed("lib", "intro", force_refresh=True).status == FetchStatus.SUCCESS
+        assert calls == ["intro", "intro"]
+
+        assert [d.query for d in client.load_cached_for_library("lib")] == ["intro"]
+        assert [d["query"] for d in client.load_all_cached()] == ["intro"]
+        assert client.get_cache_stats()["total_files"] == 1
+        assert client.clear_cache("lib") == 1
+        assert list(client.iter_cached()) == []
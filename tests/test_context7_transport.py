@@ -0,0 +1,252 @@
+"""End-to-end tests for the Context7 client transport against a stub server.
+
+This module tests ingest/context7.py:
+- Keep-alive connection pooling for sync and async fetches
+- Async batch fetching (fetch_batch_async) and its concurrency bound
+- Single-flight coalescing of identical concurrent fetches
+- Library ID resolutions persisted across clients
+- Adaptive concurrency: backing off on 429s and recovering, one decrease
+  per burst, and cancelled async waiters
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.ingest.context7 import Context7Client, FetchStatus, _AdaptiveLimit
+
+
+class StubContext7(ThreadingHTTPServer):
+    """Minimal Context7 JSON-RPC server that records its traffic."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.lock = threading.Lock()
+        self.calls: list[tuple[str, dict]] = []
+        self.connections = 0
+        self.active = 0
+        self.peak = 0
+        self.throttle = 0  # answer this many requests with 429
+        self.delay = 0.0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/mcp"
+
+    def tool_calls(self, name: str) -> list[dict]:
+        return [args for tool, args in self.calls if tool == name]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            throttled = server.throttle > 0
+            server.throttle -= throttled
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+        try:
+            if throttled:
+                self.reply(429, {"error": {"message": "rate limited"}}, {"Retry-After": "0"})
+                return
+            time.sleep(server.delay)
+            tool, args = body["params"]["name"], body["params"]["arguments"]
+            with server.lock:
+                server.calls.append((tool, args))
+            if tool == "resolve-library-id":
+                name = args["libraryName"]
+                text = "No libraries found" if name == "missing" else f"- Context7 ID: /org/{name}"
+            else:
+                text = f"# {args['query']}\n```python\nimport {args['libraryId'][5:]}\n```\n" + "docs " * 40
+            self.reply(200, {"jsonrpc": "2.0", "id": body["id"],
+                             "result": {"content": [{"type": "text", "text": text}]}})
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def reply(self, status: int, payload: dict, headers: dict = None):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def server():
+    stub = StubContext7()
+    thread = threading.Thread(target=stub.serve_forever, daemon=True)
+    thread.start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+
+def make_client(server: StubContext7, cache_dir: Path, **kwargs) -> Context7Client:
+    client = Context7Client(cache_dir=cache_dir, retry_delay=0, **kwargs)
+    client.url = server.url
+    return client
+
+
+class TestPooledTransport:
+    """Tests for connection reuse on both transports."""
+
+    def test_sync_requests_share_one_connection(self, server: StubContext7, tmp_path: Path):
+        with make_client(server, tmp_path) as client:
+            batch = client.fetch_batch("langgraph", [f"q{i}" for i in range(5)], parallel=False)
+
+        assert batch.progress.successful == 5
+        assert len(server.calls) == 10
+        assert server.connections == 1
+
+    def test_async_batch(self, server: StubContext7, tmp_path: Path):
+        server.delay = 0.02
+        with make_client(server, tmp_path, max_connections=3) as client:
+            batch = asyncio.run(client.fetch_batch_async("langgraph", [f"q{i}" for i in range(9)]))
+            batch_connections = server.connections
+            missing = asyncio.run(client.fetch_batch_async("missing", ["q0", "q1"]))
+            cached = client.fetch_and_cache_detailed("langgraph", "q4")
+
+        assert sorted(r.query for r in batch.results) == [f"q{i}" for i in range(9)]
+        assert batch.progress.successful == 9
+        assert batch.results[0].doc.content.startswith("# q")
+        assert missing.is_library_not_found
+        assert cached.status == FetchStatus.CACHED
+        assert server.peak <= 3
+        assert batch_connections <= 3
+
+
+class TestCoalescing:
+    """Tests for single-flight fetches."""
+
+    def test_threads_share_one_fetch(self, server: StubContext7, tmp_path: Path):
+        server.delay = 0.2
+        client = make_client(server, tmp_path)
+        barrier = threading.Barrier(5)
+        results = []
+
+        def fetch():
+            barrier.wait()
+            results.append(client.fetch_and_cache_detailed("langgraph", "same"))
+
+        threads = [threading.Thread(target=fetch) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(server.tool_calls("get-library-docs")) == 1
+        assert all(r is results[0] for r in results)
+        assert results[0].status == FetchStatus.SUCCESS
+
+    def test_coroutines_share_one_fetch(self, server: StubContext7, tmp_path: Path):
+        server.delay = 0.1
+        client = make_client(server, tmp_path)
+
+        async def fetch_all():
+            return await asyncio.gather(*[client.fetch_and_cache_async("langgraph", "same") for _ in range(5)])
+
+        results = asyncio.run(fetch_all())
+        assert len(server.tool_calls("resolve-library-id")) == 1
+        assert len(server.tool_calls("get-library-docs")) == 1
+        assert {r.status for r in results} == {FetchStatus.SUCCESS}
+
+
+class TestPersistedResolution:
+    """Tests for the library ID cache surviving the client."""
+
+    def test_new_client_skips_resolution(self, server: StubContext7, tmp_path: Path):
+        with make_client(server, tmp_path) as client:
+            assert client.resolve_library_id("langgraph", "graphs") == "/org/langgraph"
+            assert client.resolve_library_id("missing", "graphs") is None
+
+        with make_client(server, tmp_path) as client:
+            assert client.resolve_library_id("langgraph", "graphs") == "/org/langgraph"
+            result = client.fetch_and_cache_detailed("langgraph", "graphs", force_refresh=True)
+
+        assert result.status == FetchStatus.SUCCESS
+        assert [a["libraryName"] for a in server.tool_calls("resolve-library-id")] == ["langgraph", "missing"]
+
+
+class TestAdaptiveConcurrency:
+    """Tests for backing off on 429 responses."""
+
+    def test_backs_off_and_recovers(self, server: StubContext7, tmp_path: Path):
+        client = make_client(server, tmp_path, max_connections=4)
+        server.throttle = 2
+
+        assert client.fetch_and_cache_detailed("langgraph", "q0").status == FetchStatus.SUCCESS
+        stats = client.get_client_stats()
+        assert stats["concurrency_limit"] == 2  # 4 -> 2 -> 1, then +1 after one success
+        assert stats["retries"] == 2
+
+        client.fetch_batch("langgraph", [f"r{i}" for i in range(3)], parallel=False)
+        assert client.get_client_stats()["concurrency_limit"] == 4
+
+    def test_async_respects_reduced_limit(self, server: StubContext7, tmp_path: Path):
+        server.delay = 0.02
+        client = make_client(server, tmp_path, max_connections=8)
+        client._limit.limit = client._limit.maximum = 2  # held at 2, as if throttled
+
+        asyncio.run(client.fetch_batch_async("langgraph", [f"q{i}" for i in range(8)]))
+        assert server.peak == 2
+        assert len(server.tool_calls("get-library-docs")) == 8
+
+    def test_burst_of_throttles_halves_once(self):
+        limit = _AdaptiveLimit(8)
+        burst = [limit.acquire() for _ in range(6)]
+        for epoch in burst:
+            limit.release(epoch, throttled=True)
+        assert limit.limit == 4
+
+        limit.release(limit.acquire(), throttled=True)  # started after the decrease
+        assert limit.limit == 2
+
+    def test_cancelled_waiter_removed(self, server: StubContext7, tmp_path: Path):
+        client = make_client(server, tmp_path, max_connections=1)
+
+        async def cancel_waiting():
+            epoch = await client._limit.acquire_async()
+            waiting = asyncio.create_task(client._limit.acquire_async())
+            await asyncio.sleep(0)
+            waiting.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+            return epoch
+
+        epoch = asyncio.run(cancel_waiting())
+        assert client._limit._waiters == []
+        client._limit.release(epoch)
+
+        # A waiter left behind by a closed loop is skipped, not woken
+        loop = asyncio.new_event_loop()
+        client._limit._waiters.append((loop, loop.create_future()))
+        loop.close()
+        assert client.fetch_and_cache_detailed("langgraph", "q0").status == FetchStatus.SUCCESS
@@ -4,7 +4,7 @@ This module tests the DDR implementation:
 - Symbol catalog parsing (Markdown, table, simple formats)
 - Validation pipeline (multi-source validation)
 - Hallucination rate (Hall_m) calculation
-- Batch processing (sequential and parallel)
+- Batch processing (sequential, parallel and streaming)
 
 Test coverage includes:
 - HallMetric class and threshold handling
@@ -1252,6 +1252,102 @@ class TestDirectDependencyRetrieverBatch:
         assert progress.total == 2
         assert progress.processed == 2
 
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_retrieve_stream_ordered(self, workers: int):
+        """Test streaming retrieval yields results in input order."""
+        ddr = DirectDependencyRetriever()
+        ddr._symbol_index = {
+            f"sym{i}": [{"symbol": f"Sym{i}", "file": "m.py", "line": i + 1}]
+            for i in range(20)
+        }
+        ddr._loaded = True
+        queries = [f"Sym{i}" for i in range(20)]
+
+        results = list(ddr.retrieve_stream(queries, max_workers=workers))
+
+        assert [index for index, *_ in results] == list(range(20))
+        assert [query for _, query, _, _ in results] == queries
+        assert all(error is None and result.validated_count >= 1
+                   for _, _, result, error in results)
+
+    def test_retrieve_stream_unordered_and_lazy(self):
+        """Test unordered streaming and bounded consumption of the input."""
+        ddr = DirectDependencyRetriever()
+        ddr._symbol_index = {"sym": [{"symbol": "Sym", "file": "m.py", "line": 1}]}
+        ddr._loaded = True
+        pulled = []
+
+        def queries():
+            for i in range(100):
+                pulled.append(i)
+                yield "Sym"
+
+        stream = ddr.retrieve_stream(queries(), max_workers=2, ordered=False, max_in_flight=4)
+        first = next(stream)
+        assert len(pulled) <= 5
+
+        indexes = [first[0]] + [index for index, *_ in stream]
+        assert sorted(indexes) == list(range(100))
+
+    def test_retrieve_stream_reports_errors(self):
+        """Test a failing query is yielded with its exception."""
+        ddr = DirectDependencyRetriever()
+        ddr._loaded = True
+
+        def broken(query):
+            if query == "bad":
+                raise RuntimeError("boom")
+            return []
+
+        ddr._search_symbols = broken
+        results = list(ddr.retrieve_stream(["ok", "bad", "ok"], max_workers=2))
+
+        assert [type(error).__name__ if error else None for *_, error in results] == [
+            None, "RuntimeError", None
+        ]
+        assert results[1][2] is None
+
+    def test_search_matches_substrings_in_catalog_order(self):
+        """Test exact match first, then substring/word matches in catalog order."""
+        ddr = DirectDependencyRetriever()
+        ddr._symbol_index = {
+            "compiledgraph": [{"symbol": "CompiledGraph"}],
+            "add_node": [{"symbol": "add_node"}],
+            "stategraph": [{"symbol": "StateGraph"}],
+            "graph": [{"symbol": "graph"}],
+            "state": [{"symbol": "state"}],
+        }
+
+        names = [c["symbol"] for c in ddr._search_symbols("graph")]
+        assert names == ["graph", "CompiledGraph", "StateGraph"]
+
+        names = [c["symbol"] for c in ddr._search_symbols("state graph")]
+        assert names == ["CompiledGraph", "StateGraph", "graph", "state"]
+
+        # Replacing the index rebuilds the search table
+        ddr._symbol_index = {"node": [{"symbol": "node"}]}
+        assert [c["symbol"] for c in ddr._search_symbols("graph")] == []
+
+    def test_hall_metric_record_is_thread_safe(self, hall_metric: HallMetric):
+        """Test concurrent records keep consistent totals."""
+        import threading
+
+        hall_metric.log_all = False
+
+        def work():
+            for _ in range(500):
+                hall_metric.record(validated=1, rejected=1)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert hall_metric.total_validated == 2000
+        assert hall_metric.total_rejected == 2000
+        assert len(hall_metric.history) == 2000
+
 
 # =============================================================================
 # Integration Tests
@@ -0,0 +1,165 @@
+"""Unit tests for DeepAnalyzer single-pass AST extraction.
+
+This module tests understanding/deep_analysis.py:
+- Symbols, parent classes and methods from one AST pass
+- Per-function call lists and imports from the memoized analysis
+- Memoization per (file, mtime) and re-analysis after edits
+- Source reference validation and repository-wide analysis
+"""
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.understanding.deep_analysis import DeepAnalyzer
+from skills_fabric.understanding.progressive_disclosure import SourceRef
+
+
+MODULE = '''"""Sample."""
+import os
+from pathlib import Path as P
+
+
+class Graph:
+    """A graph."""
+
+    def add_node(self, name: str) -> None:
+        self.nodes.append(name)
+        helper(name)
+
+    async def run(self):
+        def inner():
+            return os.getcwd()
+        return inner()
+
+    if True:
+        def conditional(self):
+            return 1
+
+
+class Graph2(Graph):
+    def add_node(self, name):
+        super().add_node(name)
+
+
+def helper(value):
+    """Return value."""
+    print(value)
+    return len(value)
+'''
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "graph.py").write_text(MODULE)
+    (tmp_path / "pkg" / "broken.py").write_text("def broken(:\n")
+    (tmp_path / "README.md").write_text("StateGraph docs\n")
+    return tmp_path
+
+
+def ref(file_path: str, line: int, symbol_name: str) -> SourceRef:
+    return SourceRef(
+        file_path=file_path, line=line, commit="main", repo="org/repo",
+        symbol_name=symbol_name, symbol_kind="function",
+    )
+
+
+def bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestSinglePassExtraction:
+    """Tests for symbols, parents, calls and imports."""
+
+    def test_symbols_and_parent_classes(self, repo: Path):
+        analyzer = DeepAnalyzer(repo, "main")
+        symbols = {s.name: s for s in analyzer.analyze_file("pkg/graph.py")}
+
+        assert symbols["Graph"].kind == "class"
+        assert symbols["Graph2"].bases == ["Graph"]
+        assert symbols["Graph.add_node"].kind == "method"
+        assert symbols["Graph.run"].kind == "method"
+        assert symbols["Graph2.add_node"].kind == "method"
+        assert symbols["helper"].kind == "function"
+        # Only functions directly in a class body are methods
+        assert symbols["inner"].kind == "function"
+        assert symbols["conditional"].kind == "function"
+        assert symbols["helper"].docstring == "Return value."
+        assert symbols["Graph.add_node"].return_annotation == "None"
+
+    def test_breadth_first_symbol_order(self, repo: Path):
+        analyzer = DeepAnalyzer(repo, "main")
+        names = [s.name for s in analyzer.analyze_file("pkg/graph.py")]
+        assert names[:3] == ["Graph", "Graph2", "helper"]
+        assert names.index("Graph.run") < names.index("inner")
+
+    def test_calls_and_imports(self, repo: Path):
+        analyzer = DeepAnalyzer(repo, "main")
+        info = analyzer.get_semantic_info(ref("pkg/graph.py", 9, "Graph.add_node"))
+
+        assert info.calls == ["append", "helper"]
+        assert info.imports == ["os", "pathlib.Path"]
+
+        helper = analyzer._symbol_index["pkg/graph.py:helper"]
+        assert analyzer._extract_calls("pkg/graph.py", helper.line, helper.end_line) == ["print", "len"]
+
+    def test_unparseable_and_non_python_files(self, repo: Path):
+        analyzer = DeepAnalyzer(repo, "main")
+        assert analyzer.analyze_file("pkg/broken.py") == []
+        assert analyzer.analyze_file("README.md") == []
+        assert analyzer.analyze_file("pkg/missing.py") == []
+
+
+class TestMemoization:
+    """Tests for per-(file, mtime) memoization."""
+
+    def test_file_parsed_once(self, repo: Path, monkeypatch):
+        analyzer = DeepAnalyzer(repo, "main")
+        parses = []
+        real_extract = analyzer._extract_all
+        monkeypatch.setattr(analyzer, "_extract_all", lambda *a: parses.append(1) or real_extract(*a))
+
+        analyzer.analyze_file("pkg/graph.py")
+        analyzer.analyze_file("pkg/graph.py")
+        analyzer.validate_source_ref(ref("pkg/graph.py", 6, "Graph"))
+        analyzer.get_semantic_info(ref("pkg/graph.py", 28, "helper"))
+
+        assert len(parses) == 1
+
+    def test_edit_triggers_reanalysis(self, repo: Path):
+        analyzer = DeepAnalyzer(repo, "main")
+        path = repo / "pkg" / "graph.py"
+        assert "extra" not in {s.name for s in analyzer.analyze_file("pkg/graph.py")}
+
+        path.write_text(MODULE + "\n\ndef extra():\n    pass\n")
+        bump_mtime(path)
+
+        assert "extra" in {s.name for s in analyzer.analyze_file("pkg/graph.py")}
+
+
+class TestValidationAndRepository:
+    """Tests for Level 3 validation and whole-repository analysis."""
+
+    def test_validate_source_ref(self, repo: Path):
+        analyzer = DeepAnalyzer(repo, "main")
+        assert analyzer.validate_source_ref(ref("pkg/graph.py", 6, "Graph"))
+        assert analyzer.validate_source_ref(ref("README.md", 1, "StateGraph"))
+        assert not analyzer.validate_source_ref(ref("pkg/graph.py", 500, "Graph"))
+        assert not analyzer.validate_source_ref(ref("nope.py", 1, "x"))
+
+    def test_analyze_directory(self, repo: Path):
+        analyzer = DeepAnalyzer(repo, "main")
+        results = analyzer.analyze_directory()
+
+        assert set(results) == {"pkg/broken.py", "pkg/graph.py"}
+        assert results["pkg/broken.py"] == []
+        assert "pkg/graph.py:helper" in analyzer._symbol_index
@@ -0,0 +1,176 @@
+"""Unit tests for DepthController caching.
+
+This module tests intelligence/depth_controller.py:
+- Expansion results at each level (symbol, methods, imports, calls, callers)
+- One parse per file shared across all expansion steps
+- Memoized DepthResults keyed by (ref, depth), invalidated by file changes
+- Repository caller index: path order, limit, mtime invalidation
+- Concurrent expansion from several threads
+"""
+from __future__ import annotations
+
+import ast
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.intelligence import depth_controller
+from skills_fabric.intelligence.depth_controller import CodeWikiRef, DepthController, DepthLevel
+
+
+GRAPH = '''"""Graph module."""
+import os
+from langgraph.channels import Channel
+
+
+class StateGraph:
+    """A graph whose nodes share state."""
+
+    def add_node(self, name: str) -> Channel:
+        return Channel(name)
+
+    async def compile(self):
+        return os.path.join("a", "b")
+'''
+
+USES = '''from graph import StateGraph
+
+
+def build():
+    graph = StateGraph()
+    graph.add_node("a")
+    return StateGraph()
+'''
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "graph.py").write_text(GRAPH)
+    (tmp_path / "uses.py").write_text(USES)
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "vendored.py").write_text("StateGraph()\n")
+    return tmp_path
+
+
+@pytest.fixture
+def parse_count(monkeypatch) -> list:
+    calls = []
+    real_parse = ast.parse
+
+    def counting_parse(source, *args, **kwargs):
+        calls.append(source)
+        return real_parse(source, *args, **kwargs)
+
+    monkeypatch.setattr(depth_controller.ast, "parse", counting_parse)
+    return calls
+
+
+def ref(concept: str = "StateGraph", line: int = 6, file_path: str = "graph.py") -> CodeWikiRef:
+    return CodeWikiRef(concept=concept, file_path=file_path, line=line, repo="langgraph")
+
+
+class TestExpansion:
+    """Tests for what each level returns."""
+
+    def test_full_graph_expansion(self, repo: Path):
+        result = DepthController(repo).expand(ref(), DepthLevel.FULL_GRAPH)
+
+        assert result.validated
+        assert result.symbol.name == "StateGraph" and result.symbol.kind == "class"
+        assert [m.name for m in result.methods] == ["add_node", "compile"]
+        assert result.methods[0].parameters == ["self", "name: str"]
+        assert [d.name for d in result.dependencies] == ["os", "Channel"]
+        assert result.imports == ["import os", "from langgraph.channels import Channel"]
+        assert [c.callee for c in result.calls] == ["Channel", "os.path.join"]
+        assert [(c.caller, c.line) for c in result.called_by] == [("uses.py", 5), ("uses.py", 7)]
+
+    def test_invalid_refs(self, repo: Path):
+        controller = DepthController(repo)
+        assert not controller.expand(ref(file_path="missing.py"), DepthLevel.FULL_GRAPH).validated
+        assert not controller.expand(ref("Nothing"), DepthLevel.PARSE_SYMBOL).validated
+
+        (repo / "broken.py").write_text("class StateGraph(:\n")
+        result = controller.expand(ref(line=1, file_path="broken.py"), DepthLevel.CALL_GRAPH)
+        assert result.validated and result.symbol is None and result.calls == []
+
+
+class TestSharedParsing:
+    """Tests for one parse per file across steps and calls."""
+
+    def test_one_parse_per_file(self, repo: Path, parse_count: list):
+        controller = DepthController(repo)
+        controller.expand(ref(), DepthLevel.FULL_GRAPH)
+        assert len(parse_count) == 2  # graph.py and uses.py
+
+        controller.expand(ref("add_node", 9), DepthLevel.FULL_GRAPH)
+        controller.expand(ref("compile", 12), DepthLevel.CALL_GRAPH)
+        assert len(parse_count) == 2
+
+    def test_results_memoized_until_file_changes(self, repo: Path, parse_count: list):
+        controller = DepthController(repo)
+        first = controller.expand(ref(), DepthLevel.DEPENDENCIES)
+        second = controller.expand(ref(), DepthLevel.DEPENDENCIES)
+
+        assert second is not first
+        assert second.methods is first.methods
+        assert len(parse_count) == 1
+
+        (repo / "graph.py").write_text(GRAPH + "\n    def run(self):\n        pass\n")
+        third = controller.expand(ref(), DepthLevel.DEPENDENCIES)
+        assert [m.name for m in third.methods] == ["add_node", "compile", "run"]
+        assert len(parse_count) == 2
+
+
+class TestCallerIndex:
+    """Tests for the repository-wide caller index."""
+
+    def test_new_and_removed_files(self, repo: Path):
+        controller = DepthController(repo, refresh_interval=0)
+        assert len(controller.expand(ref(), DepthLevel.FULL_GRAPH).called_by) == 2
+
+        (repo / "more.py").write_text("x = StateGraph()\n")
+        callers = controller.expand(ref(), DepthLevel.FULL_GRAPH).called_by
+        assert [c.caller for c in callers] == ["more.py", "uses.py", "uses.py"]
+
+        (repo / "uses.py").unlink()
+        callers = controller.expand(ref(), DepthLevel.FULL_GRAPH).called_by
+        assert [c.caller for c in callers] == ["more.py"]
+
+    def test_refresh_interval(self, repo: Path):
+        controller = DepthController(repo, refresh_interval=3600)
+        assert len(controller.expand(ref(), DepthLevel.FULL_GRAPH).called_by) == 2
+
+        (repo / "more.py").write_text("x = StateGraph()\n")
+        assert len(controller.expand(ref(), DepthLevel.FULL_GRAPH).called_by) == 2
+
+        controller._refresh_caller_index(force=True)
+        assert len(controller.expand(ref(), DepthLevel.FULL_GRAPH).called_by) == 3
+
+    def test_caller_limit_in_path_order(self, repo: Path):
+        for i in range(30):
+            (repo / f"user{i:02d}.py").write_text("StateGraph()\nStateGraph()\n")
+        callers = DepthController(repo).expand(ref(), DepthLevel.FULL_GRAPH).called_by
+
+        assert len(callers) == depth_controller.MAX_CALLERS
+        assert callers[0].caller == "user00.py" and callers[-1].caller == "user24.py"
+
+
+class TestConcurrency:
+    """Tests for expansion from several threads."""
+
+    def test_threads_agree_with_serial(self, repo: Path):
+        refs = [ref(), ref("add_node", 9), ref("compile", 12), ref("build", 4, "uses.py")] * 5
+        serial = [DepthController(repo).expand(r, DepthLevel.FULL_GRAPH) for r in refs]
+
+        controller = DepthController(repo)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            threaded = list(pool.map(lambda r: controller.expand(r, DepthLevel.FULL_GRAPH), refs))
+
+        for a, b in zip(serial, threaded):
+            assert (a.symbol, a.methods, a.calls, a.called_by) == (b.symbol, b.methods, b.calls, b.called_by)
@@ -0,0 +1,129 @@
+"""Unit tests for the isolated execution runner.
+
+This module tests understanding/runner.py and its users:
+- Per-job stdout/stderr capture, with no cross-talk between parallel jobs
+- Exceptions, SystemExit and snippets writing to the raw file descriptors
+- Wall-clock limits (in-worker timer and parent-side kill) and crashes,
+  with the rest of the batch still run
+- The per-worker memory limit
+- PropertyTester and AssertionVerifier execution through the runner
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.understanding.assertions import (
+    Assertion,
+    AssertionVerifier,
+    VerificationResult,
+    VerificationType,
+)
+from skills_fabric.understanding.properties import Property, PropertyTester, PropertyType
+from skills_fabric.understanding.runner import ExecutionRunner
+
+
+@pytest.fixture(scope="module")
+def runner():
+    with ExecutionRunner(max_workers=2, timeout=2.0, memory_limit_mb=512, batch_size=8) as runner:
+        yield runner
+
+
+class TestExecutionRunner:
+    """Tests for job execution in worker processes."""
+
+    def test_captures_output_per_job(self, runner):
+        results = runner.run_many(
+            [f"import sys\nprint({i})\nprint('err{i}', file=sys.stderr)" for i in range(50)]
+        )
+        assert [r.stdout for r in results] == [f"{i}\n" for i in range(50)]
+        assert [r.stderr for r in results] == [f"err{i}\n" for i in range(50)]
+        assert all(r.ok for r in results)
+
+    def test_fresh_globals_per_job(self, runner):
+        first, second = runner.run_many(["x = 1", "print(x)"])
+        assert first.ok
+        assert second.error == "NameError: name 'x' is not defined"
+
+    def test_exceptions_and_exit(self, runner):
+        raised, exited, raw = runner.run_many([
+            "raise ValueError('bad input')",
+            "import sys; sys.exit(2)",
+            "import os; os.write(1, b'noise\\n'); print(input('>'))",
+        ])
+        assert raised.error == "ValueError: bad input"
+        assert "Traceback" in raised.traceback
+        assert exited.error == "SystemExit: 2"
+        assert raw.error.startswith("EOFError")
+
+    def test_timeout_in_worker(self, runner):
+        hung, after = runner.run_many(["while True: pass", "print('after')"], timeout=0.3)
+        assert hung.timed_out and not hung.ok
+        assert after.stdout == "after\n"
+
+    def test_unresponsive_worker_is_replaced(self, runner, monkeypatch):
+        import skills_fabric.understanding.runner as runner_module
+        monkeypatch.setattr(runner_module, "KILL_GRACE_SECONDS", 0.3)
+        stuck = "import signal\nsignal.signal(signal.SIGALRM, signal.SIG_IGN)\nwhile True: pass"
+        hung, after = runner.run_many([stuck, "print('after')"], timeout=0.2)
+        assert hung.timed_out
+        assert after.stdout == "after\n"
+
+    def test_crash_reruns_rest_of_batch(self, runner):
+        crashed, after = runner.run_many(["import os; os._exit(3)", "print('after')"])
+        assert crashed.error == "WorkerCrashed: worker exited with code 3"
+        assert after.stdout == "after\n"
+
+    def test_memory_limit(self, runner):
+        result = runner.run("data = bytearray(2 * 1024 ** 3)")
+        assert result.error.startswith("MemoryError")
+        assert runner.run("print('still alive')").stdout == "still alive\n"
+
+    def test_closed_runner_rejects_jobs(self):
+        runner = ExecutionRunner(max_workers=1)
+        runner.close()
+        with pytest.raises(RuntimeError):
+            runner.run("pass")
+
+
+class TestRunnerUsers:
+    """Tests for PropertyTester and AssertionVerifier on the runner."""
+
+    def test_property_tester_batch(self, runner):
+        properties = [
+            Property(name=f"p{i}", property_type=PropertyType.INVARIANT,
+                     description="", test_code=code, expected_result="PASS")
+            for i, code in enumerate(["print('PASS')", "print('FAIL')", "raise KeyError('k')"])
+        ]
+        tested = PropertyTester("import os", runner=runner).test_many(properties)
+
+        assert [p.passed for p in tested] == [True, False, False]
+        assert all(p.tested for p in tested)
+        assert tested[1].counter_example == "FAIL\n"
+        assert tested[2].evidence[-1].content == "KeyError: 'k'"
+
+    def test_verifier_execution(self, runner):
+        def execution(code: str) -> Assertion:
+            return Assertion(
+                claim="runs", category="behavior", source_concept="x", source_file="",
+                source_line=0, verification_type=VerificationType.EXECUTION, verification_code=code,
+            )
+
+        verifier = AssertionVerifier(runner=runner)
+        passed, failed, raised, missing = verifier.verify_many([
+            execution("print('VERIFIED')"), execution("print('REFUTED')"),
+            execution("1 / 0"), execution(""),
+        ])
+
+        assert passed.result == VerificationResult.VERIFIED and passed.confidence == 0.9
+        assert failed.result == VerificationResult.REFUTED
+        assert raised.result == VerificationResult.REFUTED
+        assert [e.type for e in raised.evidence] == ["execution_error", "traceback"]
+        assert missing.result == VerificationResult.INCONCLUSIVE
+        assert verifier.verify(execution("print('done')")).confidence == 0.7
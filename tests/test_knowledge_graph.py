@@ -0,0 +1,190 @@
+"""Unit tests for KnowledgeGraph memory storage and retrieval.
+
+This module tests memory/knowledge_graph.py against a temporary KuzuDB:
+- add_memories() bulk insert round-tripping through _row_to_memory,
+  matching add_memory() row for row
+- get_similar_memories(): ranking, scores, limits and access tracking,
+  against the previous per-row (IDs, then get_memory each) behaviour
+- apply_decay() and prune_forgotten() on memories with relationships
+"""
+from __future__ import annotations
+
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.core.database import KuzuDatabase
+from skills_fabric.memory.knowledge_graph import KnowledgeGraph, Memory, MemoryType
+
+
+NOW = datetime(2026, 3, 1, 12, 30, 15, 250000)
+
+
+def make_kg(path: Path) -> KnowledgeGraph:
+    return KnowledgeGraph(KuzuDatabase(path))
+
+
+def memory(i: int, **overrides) -> Memory:
+    fields = dict(
+        id=f"m{i}",
+        content=f"memory {i}",
+        memory_type=list(MemoryType)[i % len(MemoryType)],
+        created_at=NOW - timedelta(days=i),
+        last_accessed=NOW - timedelta(hours=i),
+        access_count=i + 1,
+        decay_factor=1.0 - i / 100,
+    )
+    fields.update(overrides)
+    return Memory(**fields)
+
+
+def as_tuple(m: Memory) -> tuple:
+    return (m.id, m.memory_type, m.content, m.created_at, m.last_accessed, m.access_count, m.decay_factor)
+
+
+def row(kg: KnowledgeGraph, memory_id: str) -> tuple:
+    res = kg.db.execute(
+        f"MATCH (m:Memory {{id: $id}}) RETURN {kg._MEMORY_RETURN.format(v='m')}", {"id": memory_id}
+    )
+    return as_tuple(kg._row_to_memory(res.get_next()))
+
+
+def memory_count(kg: KnowledgeGraph) -> int:
+    return kg.db.execute("MATCH (m:Memory) RETURN count(m)").get_next()[0]
+
+
+def legacy_similar(kg: KnowledgeGraph, memory_id: str, limit: int) -> list[tuple[Memory, float]]:
+    """The previous implementation: one query for IDs, get_memory per row."""
+    res = kg.db.execute(
+        """
+        MATCH (m:Memory {id: $id})-[r:SIMILAR_TO]->(s:Memory)
+        RETURN s.id, r.similarity
+        ORDER BY r.similarity DESC
+        LIMIT $limit
+        """,
+        {"id": memory_id, "limit": limit},
+    )
+    results = []
+    while res.has_next():
+        similar_id, similarity = res.get_next()
+        results.append((kg.get_memory(similar_id), similarity))
+    return results
+
+
+def similarity_graph(kg: KnowledgeGraph, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    kg.add_memories([memory(i) for i in range(30)])
+    for source in range(5):
+        scores = rng.sample(range(1, 1000), 12)
+        for target, score in zip(rng.sample(range(5, 30), 12), scores):
+            assert kg.link_memories(f"m{source}", f"m{target}", "SIMILAR_TO", score / 1000)
+
+
+class TestBulkInsert:
+    """Tests for add_memories() and row decoding."""
+
+    def test_round_trip(self, tmp_path: Path):
+        kg = make_kg(tmp_path / "kg")
+        memories = [memory(i) for i in range(10)]
+        memories.append(memory(10, content={"code": "x = 1"}, access_count=0, decay_factor=0.0))
+
+        assert kg.add_memories(memories) == 11
+        for m in memories[:10]:
+            assert row(kg, m.id) == as_tuple(m)
+        # Non-string content is stored as text; zero counters read back as defaults
+        assert row(kg, "m10")[2] == "{'code': 'x = 1'}"
+        assert row(kg, "m10")[5:] == (1, 1.0)
+
+    def test_matches_single_inserts(self, tmp_path: Path):
+        bulk, single = make_kg(tmp_path / "bulk"), make_kg(tmp_path / "single")
+        memories = [memory(i) for i in range(8)]
+
+        bulk.add_memories(memories)
+        for m in memories:
+            assert single.add_memory(m)
+        assert [row(bulk, m.id) for m in memories] == [row(single, m.id) for m in memories]
+
+    def test_empty_and_duplicate_batches(self, tmp_path: Path):
+        kg = make_kg(tmp_path / "kg")
+        assert kg.add_memories([]) == 0
+        kg.add_memory(memory(0))
+        assert kg.add_memories([memory(1), memory(0)]) == 0
+        assert memory_count(kg) == 1
+
+    def test_iso_string_timestamps(self):
+        decoded = KnowledgeGraph._row_to_memory(
+            ["m", "skill", "c", NOW.isoformat(), None, None, None]
+        )
+        assert decoded.created_at == NOW
+        assert decoded.access_count == 1 and decoded.decay_factor == 1.0
+
+
+class TestSimilarMemories:
+    """Tests for single-query similarity retrieval."""
+
+    @pytest.mark.parametrize("limit", [1, 5, 12, 50])
+    def test_matches_per_row_lookup(self, tmp_path: Path, limit: int):
+        current, legacy = make_kg(tmp_path / "current"), make_kg(tmp_path / "legacy")
+        similarity_graph(current)
+        similarity_graph(legacy)
+
+        for source in range(5):
+            new = current.get_similar_memories(f"m{source}", limit)
+            old = legacy_similar(legacy, f"m{source}", limit)
+
+            assert len(new) == min(limit, 12)
+            assert [(m.id, score) for m, score in new] == [(m.id, score) for m, score in old]
+            assert [score for _, score in new] == sorted((score for _, score in new), reverse=True)
+            assert [m.content for m, _ in new] == [m.content for m, _ in old]
+            # The previous path returned the row as read before the access
+            # was recorded; the single query returns it after
+            assert [m.access_count for m, _ in new] == [m.access_count + 1 for m, _ in old]
+
+        for i in range(30):
+            assert row(current, f"m{i}")[5] == row(legacy, f"m{i}")[5]
+
+    def test_access_recorded(self, tmp_path: Path):
+        kg = make_kg(tmp_path / "kg")
+        similarity_graph(kg)
+        before = datetime.now()
+
+        results = kg.get_similar_memories("m0", 3)
+        for m, _ in results:
+            assert m.last_accessed >= before
+            assert row(kg, m.id)[4] == m.last_accessed
+
+    def test_unknown_and_isolated(self, tmp_path: Path):
+        kg = make_kg(tmp_path / "kg")
+        similarity_graph(kg)
+        assert kg.get_similar_memories("missing") == []
+        assert kg.get_similar_memories("m29") == []
+
+
+class TestDecayAndPrune:
+    """Tests for set-based decay and pruning."""
+
+    def test_decay_then_prune_linked_memories(self, tmp_path: Path):
+        kg = make_kg(tmp_path / "kg")
+        stale = NOW - timedelta(days=30)
+        kg.add_memories([
+            memory(0, last_accessed=datetime.now(), decay_factor=1.0),
+            memory(1, last_accessed=stale, decay_factor=0.1),
+            memory(2, last_accessed=stale, decay_factor=0.5),
+        ])
+        kg.link_memories("m0", "m1", "SIMILAR_TO", 0.9)
+        kg.link_memories("m1", "m2", "LEARNED_FROM", 2)
+
+        assert kg.apply_decay(hours_threshold=24, decay_rate=0.5) == 2
+        assert row(kg, "m1")[6] == pytest.approx(0.05)
+        assert row(kg, "m0")[6] == 1.0
+
+        assert kg.prune_forgotten(min_decay=0.1) == 1
+        assert memory_count(kg) == 2
+        assert kg.get_similar_memories("m0") == []
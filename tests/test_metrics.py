@@ -0,0 +1,149 @@
+"""Unit tests for the observability metrics registry.
+
+This module tests:
+- QuantileSketch accuracy, merging and bounded memory
+- Striped histogram shards merged on read, bounded under thread churn
+- Timer stats and reset
+"""
+from __future__ import annotations
+
+import importlib.util
+import random
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Import metrics directly to avoid heavy dependencies from skills_fabric.__init__
+_src_path = Path(__file__).parent.parent / "src"
+_metrics_path = _src_path / "skills_fabric" / "observability" / "metrics.py"
+_spec = importlib.util.spec_from_file_location(
+    "skills_fabric.observability.metrics", _metrics_path
+)
+_metrics_module = importlib.util.module_from_spec(_spec)
+sys.modules["skills_fabric.observability.metrics"] = _metrics_module
+_spec.loader.exec_module(_metrics_module)
+
+MetricsRegistry = _metrics_module.MetricsRegistry
+QuantileSketch = _metrics_module.QuantileSketch
+
+
+def _exact(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+class TestQuantileSketch:
+    """Tests for the log-bucketed quantile sketch."""
+
+    def test_empty(self):
+        assert QuantileSketch().stats() == {"count": 0}
+
+    def test_relative_accuracy(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(3, 1.5) for _ in range(20_000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for v in values:
+            sketch.add(v)
+
+        for q in (0.1, 0.5, 0.9, 0.95, 0.99):
+            exact = _exact(values, q)
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+
+    def test_exact_aggregates(self):
+        sketch = QuantileSketch()
+        for v in (-2.0, 0.0, 3.0, 5.0):
+            sketch.add(v)
+        stats = sketch.stats()
+        assert stats["count"] == 4
+        assert stats["sum"] == 6.0
+        assert stats["min"] == -2.0
+        assert stats["max"] == 5.0
+        assert sketch.quantile(0.0) == pytest.approx(-2.0, rel=0.01)
+        assert sketch.quantile(0.25) == 0.0
+
+    def test_merge_matches_single_sketch(self):
+        rng = random.Random(1)
+        values = [rng.uniform(0.1, 1000) for _ in range(5_000)]
+        whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for i, v in enumerate(values):
+            whole.add(v)
+            (left if i % 2 else right).add(v)
+        left.merge(right)
+        assert left.quantiles([0.5, 0.99]) == whole.quantiles([0.5, 0.99])
+        assert left.count == whole.count
+
+    def test_bucket_count_bounded(self):
+        sketch = QuantileSketch(max_buckets=64)
+        for exponent in range(-8, 12):
+            for mantissa in range(1, 100):
+                sketch.add(mantissa * 10.0 ** exponent)
+        assert len(sketch._positive) <= 64
+        # Collapsing only affects the low tail
+        assert sketch.quantile(0.99) == pytest.approx(_exact(
+            [m * 10.0 ** e for e in range(-8, 12) for m in range(1, 100)], 0.99
+        ), rel=0.011)
+
+
+class TestMetricsRegistry:
+    """Tests for sketch-backed histograms and timers."""
+
+    def test_histogram_stats_across_threads(self):
+        registry = MetricsRegistry()
+        values = [float(i) for i in range(1, 4001)]
+
+        def record(chunk):
+            for v in chunk:
+                registry.histogram("latency", v, labels={"op": "read"})
+
+        threads = [threading.Thread(target=record, args=(values[i::4],)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = registry.get_histogram_stats("latency", labels={"op": "read"})
+        assert stats["count"] == 4000
+        assert stats["sum"] == sum(values)
+        assert stats["p50"] == pytest.approx(_exact(values, 0.5), rel=0.011)
+        assert stats["p99"] == pytest.approx(_exact(values, 0.99), rel=0.011)
+        assert registry.get_histogram_stats("latency") == {"count": 0}
+
+    def test_short_lived_threads_share_fixed_stripes(self):
+        registry = MetricsRegistry()
+        for i in range(100):
+            t = threading.Thread(target=registry.histogram, args=("h", float(i + 1)))
+            t.start()
+            t.join()
+        registry.record_duration("step", 1.0)
+
+        shards = registry._sketches["histogram"]["h"][""]
+        assert len(shards) == _metrics_module.SKETCH_STRIPES
+        assert sum(shard.sketch.count for shard in shards) == 100
+        assert len(registry._sketches["timer"]["step"][""]) == _metrics_module.SKETCH_STRIPES
+        stats = registry.get_histogram_stats("h")
+        assert stats["count"] == 100 and stats["max"] == 100.0
+
+    def test_timer_and_all_metrics(self):
+        registry = MetricsRegistry()
+        registry.increment("calls")
+        registry.record_duration("step", 12.5)
+        with registry.timer("step"):
+            pass
+
+        metrics = registry.get_all_metrics()
+        assert metrics["counters"] == {"calls": {"": 1.0}}
+        assert metrics["timers"]["step"][""]["count"] == 2
+        assert registry.get_timer_stats("step")["max"] == 12.5
+
+    def test_reset_drops_thread_local_shards(self):
+        registry = MetricsRegistry()
+        registry.histogram("h", 1.0)
+        registry.reset()
+        assert registry.get_histogram_stats("h") == {"count": 0}
+
+        registry.histogram("h", 2.0)
+        stats = registry.get_histogram_stats("h")
+        assert stats["count"] == 1
+        assert stats["max"] == 2.0
@@ -0,0 +1,134 @@
+"""Unit tests for batched GLiNER extraction.
+
+This module tests analyze/ner_extractor.py with a stand-in model:
+- Windowing of long texts and merging of spans across window boundaries
+- Batched model calls
+- Content-hash caching (repeat calls and duplicates within a call)
+- Model errors and missing GLiNER
+"""
+from __future__ import annotations
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.analyze.ner_extractor import Entity, NERExtractor
+
+
+class FakeGLiNER:
+    """Tags capitalised word runs ("State Graph") as classes; no length limit."""
+
+    pattern = re.compile(r'[A-Z]\w+(?: [A-Z]\w+)*')
+
+    def __init__(self, fail: bool = False):
+        self.batches: list[int] = []
+        self.fail = fail
+
+    def predict_entities(self, text, labels, threshold=0.5):
+        return [
+            {"text": m.group(), "label": "class", "start": m.start(), "end": m.end(),
+             "score": 0.5 + len(m.group()) / 100}
+            for m in self.pattern.finditer(text)
+        ]
+
+    def batch_predict_entities(self, texts, labels, threshold=0.5):
+        if self.fail:
+            raise RuntimeError("model exploded")
+        self.batches.append(len(texts))
+        return [self.predict_entities(text, labels) for text in texts]
+
+
+def make_extractor(model=None, **kwargs) -> NERExtractor:
+    extractor = NERExtractor(**kwargs)
+    extractor._model = model or FakeGLiNER()
+    return extractor
+
+
+def long_text(words: int) -> str:
+    vocab = ["the", "State Graph", "node", "Compiled Graph Runner", "edge", "of", "Pregel"]
+    return " ".join(vocab[i % len(vocab)] for i in range(words))
+
+
+def spans(entities: list[Entity]) -> list[tuple]:
+    return [(e.text, e.start, e.end) for e in entities]
+
+
+class TestWindowing:
+    """Tests for long-text windows and span merging."""
+
+    def test_short_text_is_one_window(self):
+        extractor = make_extractor(window_words=50)
+        assert extractor._windows("a short text") == [(0, 12)]
+
+    def test_windows_overlap_and_cover_text(self):
+        extractor = make_extractor(window_words=20, overlap_words=5)
+        text = long_text(100)
+        windows = extractor._windows(text)
+
+        assert len(windows) > 1
+        assert windows[0][0] == 0 and windows[-1][1] == len(text)
+        assert all(b[0] < a[1] for a, b in zip(windows, windows[1:]))
+
+    @pytest.mark.parametrize("window,overlap", [(20, 5), (13, 4), (50, 10)])
+    def test_windowed_matches_whole_text(self, window, overlap):
+        text = long_text(400)
+        expected = spans(make_extractor(window_words=10_000).extract(text))
+        extractor = make_extractor(window_words=window, overlap_words=overlap)
+
+        assert spans(extractor.extract(text)) == expected
+        assert extractor.last_stats.windows > 1
+        assert all(text[s:e] == t for t, s, e in expected)
+
+
+class TestBatching:
+    """Tests for batched model calls and caching."""
+
+    def test_windows_batched(self):
+        model = FakeGLiNER()
+        extractor = make_extractor(model, window_words=20, overlap_words=5, batch_size=4)
+        texts = [long_text(60 + i) for i in range(5)]
+        results = extractor.extract_many(texts)
+
+        stats = extractor.last_stats
+        assert len(results) == 5
+        assert sum(model.batches) == stats.windows
+        assert max(model.batches) == 4 and stats.batches == len(model.batches)
+        assert stats.documents == 5 and stats.docs_per_second > 0
+
+    def test_cache_and_duplicates(self):
+        model = FakeGLiNER()
+        extractor = make_extractor(model)
+        first = extractor.extract_many(["Use State Graph", "Use State Graph", "Pregel runs"])
+        calls = sum(model.batches)
+
+        assert calls == 2  # duplicate text computed once
+        again = extractor.extract_many(["Pregel runs", "Use State Graph"])
+        assert sum(model.batches) == calls
+        assert extractor.last_stats.cache_hits == 2
+        assert spans(again[1]) == spans(first[0]) == [("Use State Graph", 0, 15)]
+
+        other_labels = extractor.extract("Pregel runs", labels=["module"])
+        assert sum(model.batches) == calls + 1 and spans(other_labels) == [("Pregel", 0, 6)]
+
+    def test_cache_bounded(self):
+        extractor = make_extractor(cache_size=2)
+        extractor.extract_many(["Alpha", "Beta", "Gamma"])
+        assert len(extractor._cache) == 2
+
+    def test_model_error_returns_empty_uncached(self, capsys):
+        extractor = make_extractor(FakeGLiNER(fail=True))
+        assert extractor.extract_many(["Alpha", "Beta"]) == [[], []]
+        assert "model exploded" in capsys.readouterr().out
+        assert not extractor._cache
+
+    def test_missing_gliner(self, monkeypatch):
+        extractor = NERExtractor()
+        monkeypatch.setattr(extractor, "_load_model", lambda: False)
+        assert extractor.extract_many(["Alpha"]) == [[]]
+        assert extractor.extract_code_entities("class Alpha: pass") == []
@@ -0,0 +1,173 @@
+"""Unit tests for the R MCP server symbol service.
+
+This module tests:
+- RSymbolIndex exact, case-folded and substring lookups
+- Keeping every definition of duplicate names
+- Incremental, process-pool directory indexing by mtime
+- Index persistence across server restarts, at the configured path by default
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Import r_server directly to avoid heavy dependencies from skills_fabric.__init__.
+# Registered as a top-level module so pool workers can unpickle its functions.
+_src_path = Path(__file__).parent.parent / "src"
+_r_server_path = _src_path / "skills_fabric" / "mcp" / "r_server.py"
+_spec = importlib.util.spec_from_file_location("r_server", _r_server_path)
+_r_server_module = importlib.util.module_from_spec(_spec)
+sys.modules["r_server"] = _r_server_module
+_spec.loader.exec_module(_r_server_module)
+
+RMCPServer = _r_server_module.RMCPServer
+RSymbol = _r_server_module.RSymbol
+RSymbolIndex = _r_server_module.RSymbolIndex
+
+
+def _symbol(name: str, file_path: str = "a.R", line: int = 1, kind: str = "function") -> RSymbol:
+    return RSymbol(name=name, kind=kind, file_path=file_path, line_number=line)
+
+
+def _write_package(root: Path) -> None:
+    (root / "R").mkdir(parents=True)
+    (root / "R" / "summary.R").write_text(
+        "summarise_data <- function(x, by) {\n  x\n}\n"
+        "print.report <- function(x, ...) {\n  x\n}\n"
+    )
+    (root / "R" / "utils.R").write_text(
+        "helper <- function() NULL\n"
+        "Summarise_Data <- function(df) df\n"
+    )
+    (root / "R" / "zzz.R").write_text("helper <- function(verbose = TRUE) NULL\n")
+
+
+class TestRSymbolIndex:
+    """Tests for the SQLite symbol index."""
+
+    @pytest.fixture
+    def index(self):
+        idx = RSymbolIndex()
+        yield idx
+        idx.close()
+
+    def test_keeps_duplicate_definitions(self, index: RSymbolIndex):
+        index.replace_file("a.R", [_symbol("helper", "a.R", 1)])
+        index.replace_file("b.R", [_symbol("helper", "b.R", 7)])
+        assert [s.to_citation() for s in index.lookup("helper")] == ["a.R:1", "b.R:7"]
+
+    def test_replace_file_drops_stale_symbols(self, index: RSymbolIndex):
+        index.replace_file("a.R", [_symbol("old")])
+        index.replace_file("a.R", [_symbol("new")])
+        assert index.lookup("old") == []
+        assert len(index) == 1
+        assert index.search("old") == []
+
+    def test_case_folded_lookup(self, index: RSymbolIndex):
+        index.replace_file("a.R", [_symbol("ReadData")])
+        assert index.lookup("readdata") == []
+        assert [s.name for s in index.lookup_folded("readdata")] == ["ReadData"]
+
+    def test_substring_search(self, index: RSymbolIndex):
+        index.replace_file("a.R", [_symbol("read_csv"), _symbol("ReadLines"), _symbol("write")])
+        assert [s.name for s in index.search("READ")] == ["read_csv", "ReadLines"]
+        assert [s.name for s in index.search("rd")] == []
+        assert [s.name for s in index.search("ri")] == ["write"]
+        assert [s.name for s in index.search("read", limit=1)] == ["read_csv"]
+        assert [s.name for s in index.search("ReadLines", exact=True)] == ["ReadLines"]
+
+    def test_remove_files(self, index: RSymbolIndex):
+        index.replace_files([("a.R", "/root", 1, 10, [_symbol("f")])])
+        assert index.file_states("/root") == {"a.R": (1, 10)}
+        index.remove_files(["a.R"])
+        assert index.file_states("/root") == {}
+        assert len(index) == 0
+
+
+class TestRMCPServerIndexing:
+    """Tests for the MCP tools backed by the index."""
+
+    @pytest.fixture
+    def server(self, tmp_path: Path):
+        srv = RMCPServer(index_path=tmp_path / "r_symbols.db", max_workers=2)
+        yield srv
+        srv.close()
+
+    async def test_index_directory_and_lookup(self, server: RMCPServer, tmp_path: Path):
+        pkg = tmp_path / "pkg"
+        _write_package(pkg)
+        tools = server.mcp._tools
+
+        stats = await tools["index_r_directory"](str(pkg))
+        assert stats["indexed_files"] == 3
+        assert stats["total_files"] == 3
+
+        helpers = await tools["search_r_symbol"]("helper", exact=True)
+        assert sorted(h["citation"] for h in helpers) == ["R/utils.R:1", "R/zzz.R:1"]
+
+        found = await tools["search_r_symbol"]("summarise")
+        assert {f["name"] for f in found} == {"summarise_data", "Summarise_Data"}
+
+        verified = await tools["verify_r_symbol"]("SUMMARISE_DATA")
+        assert verified["exists"] and verified["fuzzy_match"]
+        assert len(verified["citations"]) == 2
+
+        signature = await tools["get_r_function_signature"]("summarise_data")
+        assert signature["parameters"] == ["x", "by"]
+
+    async def test_incremental_reindex(self, server: RMCPServer, tmp_path: Path):
+        pkg = tmp_path / "pkg"
+        _write_package(pkg)
+        index_dir = server.mcp._tools["index_r_directory"]
+        await index_dir(str(pkg))
+
+        stats = await index_dir(str(pkg))
+        assert stats["indexed_files"] == 0
+        assert stats["unchanged_files"] == 3
+
+        utils = pkg / "R" / "utils.R"
+        utils.write_text("renamed <- function() NULL\n")
+        os.utime(utils, ns=(utils.stat().st_atime_ns, utils.stat().st_mtime_ns + 10**9))
+        (pkg / "R" / "zzz.R").unlink()
+
+        stats = await index_dir(str(pkg))
+        assert stats["indexed_files"] == 1
+        assert stats["removed_files"] == 1
+        assert server.index.lookup("helper") == []
+        assert [s.name for s in server.index.lookup("renamed")] == ["renamed"]
+
+    async def test_index_persists_across_restart(self, tmp_path: Path):
+        pkg = tmp_path / "pkg"
+        _write_package(pkg)
+        db = tmp_path / "r_symbols.db"
+
+        first = RMCPServer(index_path=db, max_workers=1)
+        await first.mcp._tools["index_r_directory"](str(pkg))
+        first.close()
+
+        second = RMCPServer(index_path=db, max_workers=1)
+        assert len(second.index.lookup("helper")) == 2
+        stats = await second.mcp._tools["index_r_directory"](str(pkg))
+        assert stats["indexed_files"] == 0
+        second.close()
+
+    def test_default_index_path_from_config(self, tmp_path: Path, monkeypatch):
+        if str(_src_path) not in sys.path:
+            monkeypatch.syspath_prepend(str(_src_path))
+        from skills_fabric.core.config import config
+
+        monkeypatch.setattr(config, "r_index_path", tmp_path / "relocated" / "r_symbols.db")
+        srv = RMCPServer(max_workers=1)
+        srv.close()
+        assert (tmp_path / "relocated" / "r_symbols.db").exists()
+
+    async def test_parse_r_code_replaces_previous_parse(self, server: RMCPServer):
+        parse = server.mcp._tools["parse_r_code"]
+        await parse("first <- function() 1\n", "inline.R")
+        await parse("second <- function() 2\n", "inline.R")
+        assert server.index.lookup("first") == []
+        assert len(server.index.lookup("second")) == 1
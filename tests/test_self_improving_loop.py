@@ -0,0 +1,171 @@
+"""Unit tests for concurrent SelfImprovingFactory runs.
+
+This module tests orchestration/self_improving_loop.py:
+- Depth expansion runs off the event loop
+- ExpansionCache shares (ref, depth) expansions across cycles and concepts
+- improve_many: bounded in-flight concepts, per-concept failures, stats
+- Process-pool expansion matches thread-pool expansion
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.intelligence.depth_controller import CodeWikiRef, DepthController, DepthLevel
+from skills_fabric.orchestration.self_improving_loop import ExpansionCache, SelfImprovingFactory
+
+
+MODULE = '''"""Graph module."""
+import os
+from langgraph.channels import Channel
+from langgraph.pregel import Pregel
+
+
+class StateGraph:
+    """A graph whose nodes share state."""
+
+    def add_node(self, name):
+        return Channel(name)
+
+
+def compile_graph(graph):
+    return Pregel(graph)
+'''
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "graph.py").write_text(MODULE)
+    return tmp_path
+
+
+class RecordingController(DepthController):
+    """DepthController that records calls, threads and concurrency."""
+
+    def __init__(self, repo_path, delay: float = 0.0, fail_concept: str = ""):
+        super().__init__(repo_path)
+        self.delay = delay
+        self.fail_concept = fail_concept
+        self.calls: Counter = Counter()
+        self.threads: set[str] = set()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def expand(self, ref, depth):
+        with self._lock:
+            self.calls[(ref.concept, ref.line, int(depth))] += 1
+            self.threads.add(threading.current_thread().name)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if ref.concept == self.fail_concept:
+                raise RuntimeError("repository unavailable")
+            return super().expand(ref, depth)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def make_factory(repo: Path, **kwargs) -> SelfImprovingFactory:
+    factory = SelfImprovingFactory(repo, "langgraph")
+    factory.depth_controller = RecordingController(repo, **kwargs)
+    return factory
+
+
+def ref(concept: str = "StateGraph", line: int = 7) -> CodeWikiRef:
+    return CodeWikiRef(concept=concept, file_path="graph.py", line=line, repo="langgraph")
+
+
+class TestExpansionCache:
+    """Tests for off-loop, shared expansion."""
+
+    async def test_expansion_runs_off_event_loop(self, repo: Path):
+        factory = make_factory(repo)
+        result = await factory.generate_with_improvement("StateGraph", "graph.py", 7, max_cycles=2)
+
+        assert result.final_skill.symbols_used == ["StateGraph"]
+        assert threading.current_thread().name not in factory.depth_controller.threads
+
+    async def test_cycles_reuse_expansions(self, repo: Path):
+        # Line 1 doesn't mention the concept: ungrounded, so every cycle explores
+        factory = make_factory(repo)
+        result = await factory.generate_with_improvement("StateGraph", "graph.py", 1, max_cycles=5)
+
+        assert result.cycles_completed == 5
+        assert all(count == 1 for count in factory.depth_controller.calls.values())
+
+    async def test_concurrent_requests_share_one_expansion(self, repo: Path):
+        controller = RecordingController(repo, delay=0.05)
+        cache = ExpansionCache(controller)
+        results = await asyncio.gather(*(cache.expand(ref(), DepthLevel.PARSE_SYMBOL) for _ in range(5)))
+
+        assert sum(controller.calls.values()) == 1
+        assert (cache.misses, cache.hits) == (1, 4)
+        assert all(r is results[0] for r in results)
+
+    async def test_failed_expansion_is_retried(self, repo: Path):
+        controller = RecordingController(repo, fail_concept="StateGraph")
+        cache = ExpansionCache(controller)
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await cache.expand(ref(), DepthLevel.VALIDATE)
+        assert sum(controller.calls.values()) == 2
+
+
+class TestImproveMany:
+    """Tests for multi-concept improvement runs."""
+
+    async def test_results_in_order_with_shared_cache(self, repo: Path):
+        factory = make_factory(repo)
+        refs = [ref(), ref("compile_graph", 14), ref(), ref("Missing", 1)]
+        results = await factory.improve_many(refs, max_cycles=3, use_processes=False)
+
+        assert [r.final_skill.concepts_taught[0] for r in results] == [
+            "StateGraph", "compile_graph", "StateGraph", "Missing"
+        ]
+        assert all(count == 1 for count in factory.depth_controller.calls.values())
+        stats = factory.last_run_stats
+        assert stats.concepts == 4
+        assert stats.cycles == sum(r.cycles_completed for r in results)
+        assert stats.cache_hits > 0
+        assert stats.cycles_per_second > 0
+
+    async def test_in_flight_concepts_bounded(self, repo: Path):
+        factory = make_factory(repo, delay=0.01)
+        refs = [ref(f"Concept{i}", 1) for i in range(12)]
+        await factory.improve_many(refs, max_cycles=2, max_workers=8, max_in_flight=3, use_processes=False)
+
+        assert 1 < factory.depth_controller.max_active <= 3
+
+    async def test_failure_isolated_to_concept(self, repo: Path):
+        factory = make_factory(repo, fail_concept="Broken")
+        results = await factory.improve_many(
+            [ref(), ref("Broken", 1), ref("compile_graph", 14)], max_cycles=2, use_processes=False
+        )
+
+        assert results[1].success is False
+        assert results[1].error == "RuntimeError: repository unavailable"
+        assert results[0].final_skill and results[2].final_skill
+        assert factory.last_run_stats.failed == 1
+
+    async def test_process_pool_matches_threads(self, repo: Path):
+        refs = [ref(), ref("compile_graph", 14), ref("Missing", 1)]
+        factory = SelfImprovingFactory(repo, "langgraph")
+        threaded = await factory.improve_many(refs, max_cycles=3, max_workers=2, use_processes=False)
+        pooled = await factory.improve_many(refs, max_cycles=3, max_workers=2, use_processes=True)
+
+        assert [r.final_quality for r in pooled] == [r.final_quality for r in threaded]
+        assert [r.final_skill.code for r in pooled] == [r.final_skill.code for r in threaded]
+        assert factory.last_run_stats.expansions > 0
@@ -0,0 +1,144 @@
+"""Unit tests for journaled SessionMemory.
+
+This module tests the snapshot + append-only journal backend:
+- Recording events and reloading via journal replay
+- Compaction into the snapshot (periodic and on close)
+- Idempotent replay after a crash between snapshot and truncation
+- Tolerance of a torn journal tail
+- Loading legacy snapshot files without a sequence number
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import shutil
+import sys
+from pathlib import Path
+
+# Import session module directly to avoid heavy dependencies from skills_fabric.__init__
+_src_path = Path(__file__).parent.parent / "src"
+_session_path = _src_path / "skills_fabric" / "memory" / "session.py"
+_spec = importlib.util.spec_from_file_location("skills_fabric.memory.session", _session_path)
+_session_module = importlib.util.module_from_spec(_spec)
+sys.modules["skills_fabric.memory.session"] = _session_module
+_spec.loader.exec_module(_session_module)
+
+SessionMemory = _session_module.SessionMemory
+
+
+def _record_some(memory: SessionMemory) -> str:
+    session = memory.start_session("langgraph")
+    sid = session.session_id
+    memory.record_skill_created(sid)
+    memory.record_skill_created(sid)
+    memory.record_skill_verified(sid)
+    memory.record_failure(sid, "Source not found")
+    memory.record_iteration(sid)
+    memory.record_strategy_adjustment(sid, {"search_depth": 3})
+    memory.end_session(sid)
+    return sid
+
+
+def _assert_recorded(memory: SessionMemory, sid: str) -> None:
+    session = memory.get_session(sid)
+    assert session is not None
+    assert session.library == "langgraph"
+    assert session.skills_created == 2
+    assert session.skills_verified == 1
+    assert session.iterations == 1
+    assert session.errors == ["Source not found"]
+    assert session.strategy_adjustments[0]["search_depth"] == 3
+    assert session.ended_at is not None
+
+
+class TestSessionJournal:
+    """Tests for the journaled session backend."""
+
+    def test_record_updates_in_memory_state(self, tmp_path: Path):
+        with SessionMemory(tmp_path / "sessions.json") as memory:
+            sid = _record_some(memory)
+            _assert_recorded(memory, sid)
+
+    def test_replay_journal_without_close(self, tmp_path: Path):
+        path = tmp_path / "sessions.json"
+        memory = SessionMemory(path)
+        sid = _record_some(memory)
+        # Simulate a crash: no close(), snapshot was never written
+        assert not path.exists()
+
+        reopened = SessionMemory(path)
+        _assert_recorded(reopened, sid)
+        reopened.close()
+
+    def test_close_compacts_into_snapshot(self, tmp_path: Path):
+        path = tmp_path / "sessions.json"
+        memory = SessionMemory(path)
+        sid = _record_some(memory)
+        memory.close()
+
+        assert memory.journal_path.read_text() == ""
+        data = json.loads(path.read_text())
+        assert data["seq"] == 8
+        reopened = SessionMemory(path)
+        _assert_recorded(reopened, sid)
+        reopened.close()
+
+    def test_periodic_compaction(self, tmp_path: Path):
+        path = tmp_path / "sessions.json"
+        memory = SessionMemory(path, compact_every=5)
+        sid = _record_some(memory)
+
+        assert path.exists()
+        assert len(memory.journal_path.read_text().splitlines()) == 3
+        reopened = SessionMemory(path)
+        _assert_recorded(reopened, sid)
+
+    def test_replay_skips_events_already_in_snapshot(self, tmp_path: Path):
+        path = tmp_path / "sessions.json"
+        memory = SessionMemory(path)
+        sid = _record_some(memory)
+        memory.flush()
+        journal_copy = tmp_path / "journal.bak"
+        shutil.copy(memory.journal_path, journal_copy)
+        memory.close()
+
+        # Crash after the snapshot was replaced but before truncation
+        shutil.copy(journal_copy, memory.journal_path)
+        reopened = SessionMemory(path)
+        _assert_recorded(reopened, sid)
+
+    def test_torn_tail_is_ignored(self, tmp_path: Path):
+        path = tmp_path / "sessions.json"
+        memory = SessionMemory(path)
+        sid = _record_some(memory)
+        with open(memory.journal_path, "a") as f:
+            f.write('{"n": 9, "op": "inc", "s": "')
+
+        reopened = SessionMemory(path)
+        _assert_recorded(reopened, sid)
+        reopened.record_skill_created(sid)
+
+        again = SessionMemory(path)
+        assert again.get_session(sid).skills_created == 3
+
+    def test_loads_legacy_snapshot(self, tmp_path: Path):
+        path = tmp_path / "sessions.json"
+        path.write_text(json.dumps({"sessions": [{
+            "session_id": "session-legacy",
+            "started_at": "2026-01-01T00:00:00",
+            "library": "docling",
+            "skills_created": 4,
+        }]}))
+
+        memory = SessionMemory(path)
+        memory.record_skill_created("session-legacy")
+        memory.close()
+
+        reopened = SessionMemory(path)
+        assert reopened.get_session("session-legacy").skills_created == 5
+
+    def test_unknown_session_is_ignored(self, tmp_path: Path):
+        memory = SessionMemory(tmp_path / "sessions.json")
+        memory.record_skill_created("missing")
+        assert memory.end_session("missing") is None
+        assert memory.journal_path.read_text() == ""
@@ -0,0 +1,197 @@
+"""Unit tests for the SkillFactory pipeline stages.
+
+This module tests generate/skill_factory.py:
+- _stage_symbols: chunked UNWIND staging against KuzuDB, duplicate and
+  existing-name handling, row-by-row fallback when a chunk fails
+- _node_enrich: one read per source file, however many links share it
+- _node_generate: pooled generation keeps candidate order; failed
+  candidates are logged, dropped and reported in errors
+"""
+from __future__ import annotations
+
+import builtins
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.core.database import KuzuDatabase
+from skills_fabric.generate import llm_client, skill_factory
+from skills_fabric.generate.skill_factory import SkillCandidate, SkillFactory
+from skills_fabric.ingest import context7
+
+
+@pytest.fixture
+def kuzu_db(tmp_path: Path) -> KuzuDatabase:
+    database = KuzuDatabase(tmp_path / "kuzu")
+    database.init_schema()
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def factory(kuzu_db: KuzuDatabase) -> SkillFactory:
+    instance = SkillFactory()
+    instance.db = kuzu_db
+    return instance
+
+
+def symbols_in(database: KuzuDatabase) -> dict[str, tuple]:
+    res = database.execute("MATCH (s:Symbol) RETURN s.name, s.file_path, s.line")
+    rows = {}
+    while res.has_next():
+        name, file_path, line = res.get_next()
+        rows[name] = (file_path, line)
+    return rows
+
+
+def symbol(name: str, file_path: str = "pkg/a.py", line: int = 1) -> dict:
+    return {"name": name, "file_path": file_path, "line": line}
+
+
+class ConcurrentWriter:
+    """Database proxy that inserts a conflicting Symbol before one UNWIND."""
+
+    def __init__(self, database: KuzuDatabase, before_chunk: int, name: str):
+        self.database = database
+        self.before_chunk = before_chunk
+        self.name = name
+        self.chunks = 0
+
+    def execute(self, query: str, params: dict = None):
+        if "UNWIND" in query:
+            if self.chunks == self.before_chunk:
+                self.database.execute(
+                    "CREATE (s:Symbol {name: $name, file_path: 'other.py', line: 0})", {"name": self.name}
+                )
+            self.chunks += 1
+        return self.database.execute(query, params)
+
+
+class TestStageSymbols:
+    """Tests for bulk symbol staging."""
+
+    def test_chunked_staging(self, factory: SkillFactory, kuzu_db: KuzuDatabase, monkeypatch):
+        monkeypatch.setattr(SkillFactory, "SYMBOL_STAGE_CHUNK", 4)
+        kuzu_db.execute("CREATE (s:Symbol {name: 'existing', file_path: 'old.py', line: 9})")
+        symbols = [symbol(f"s{i}", line=i) for i in range(10)]
+        symbols += [symbol("s3", "dup.py", 99), symbol("existing", "new.py", 1)]
+
+        assert factory._stage_symbols(symbols) == 10
+        stored = symbols_in(kuzu_db)
+        assert len(stored) == 11
+        assert stored["s3"] == ("pkg/a.py", 3)  # first occurrence wins
+        assert stored["existing"] == ("old.py", 9)
+
+    def test_failed_chunk_falls_back_to_rows(self, factory: SkillFactory, kuzu_db: KuzuDatabase, monkeypatch):
+        monkeypatch.setattr(SkillFactory, "SYMBOL_STAGE_CHUNK", 4)
+        factory.db = ConcurrentWriter(kuzu_db, before_chunk=1, name="s5")
+
+        assert factory._stage_symbols([symbol(f"s{i}", line=i) for i in range(10)]) == 9
+        stored = symbols_in(kuzu_db)
+        assert sorted(stored) == sorted(f"s{i}" for i in range(10))
+        assert stored["s5"] == ("other.py", 0)
+        assert stored["s4"] == ("pkg/a.py", 4) and stored["s9"] == ("pkg/a.py", 9)
+
+
+class FakeContext7:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def fetch_and_cache(self, library_name, query):
+        return None
+
+    def iter_cached(self):
+        return iter([context7.Context7Doc(title="lib", content="docs " * 200, source_url="", code_blocks=0)])
+
+    def get_cache_stats(self):
+        return {"total_files": 1}
+
+
+class TestEnrich:
+    """Tests for file-grouped enrichment."""
+
+    def test_each_file_read_once(self, factory: SkillFactory, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(context7, "Context7Client", FakeContext7)
+        repo = tmp_path / "repo"
+        (repo / "pkg").mkdir(parents=True)
+        (repo / "pkg" / "a.py").write_text("A = 1\n" * 1000)
+        (repo / "pkg" / "b.py").write_text("B = 2\n")
+        links = [
+            {"concept": f"c{i}", "symbol": f"s{i}", "file_path": path}
+            for i, path in enumerate(["pkg/a.py", "pkg/b.py", "pkg/a.py", "pkg/missing.py", "pkg/a.py"])
+        ]
+        opened = []
+        real_open = builtins.open
+        monkeypatch.setattr(skill_factory, "open",
+                            lambda path, *a, **kw: opened.append(path) or real_open(path, *a, **kw),
+                            raising=False)
+
+        result = factory._node_enrich({"library_name": "lib", "repo_path": str(repo), "proven_links": links})
+
+        assert sorted(Path(p).name for p in opened) == ["a.py", "b.py", "missing.py"]
+        candidates = result["candidates"]
+        assert [c.symbol_name for c in candidates] == ["s0", "s1", "s2", "s3", "s4"]
+        assert candidates[0].source_code == ("A = 1\n" * 1000)[:2000]
+        assert candidates[1].source_code == "B = 2\n"
+        assert candidates[3].source_code == ""
+        assert all(c.context7_docs == ("docs " * 200)[:500] for c in candidates)
+        assert result["stage_stats"][0]["items"] == 5
+
+
+class FakeGLM:
+    """Answers after a random delay; raises for symbols named 'bad*'."""
+
+    def __init__(self):
+        self.rng = random.Random(0)
+
+    def generate_question(self, source_code: str, context: str = "") -> str:
+        time.sleep(self.rng.random() * 0.01)
+        if source_code.startswith("bad"):
+            raise RuntimeError("upstream 500")
+        if source_code.startswith("empty"):
+            return ""
+        return f"How does {source_code} work?"
+
+
+def candidate(name: str) -> SkillCandidate:
+    return SkillCandidate(concept_name=f"concept {name}", symbol_name=name, file_path="a.py", source_code=name)
+
+
+class TestGenerate:
+    """Tests for pooled question generation."""
+
+    def test_order_and_failures(self, factory: SkillFactory, monkeypatch, caplog):
+        monkeypatch.setattr(llm_client, "GLMClient", FakeGLM)
+        monkeypatch.setattr(factory.config, "max_generate_workers", 4)
+        names = [f"ok{i}" for i in range(12)] + ["bad1", "empty1", "ok12", "bad2"]
+        caplog.set_level(logging.WARNING)
+
+        result = factory._node_generate({"candidates": [candidate(n) for n in names]})
+
+        kept = [c.symbol_name for c in result["candidates"]]
+        assert kept == [f"ok{i}" for i in range(13)]
+        assert all(c.question == f"How does {c.symbol_name} work?" for c in result["candidates"])
+        assert result["errors"] == [
+            "Generate failed for bad1: upstream 500",
+            "Generate failed for bad2: upstream 500",
+        ]
+        assert "Question generation failed for bad1" in caplog.text
+        assert result["stage_stats"][0]["items"] == len(names)
+
+    def test_single_worker_matches_pool(self, factory: SkillFactory, monkeypatch):
+        monkeypatch.setattr(llm_client, "GLMClient", FakeGLM)
+        names = [f"ok{i}" for i in range(6)] + ["bad"]
+        outputs = []
+        for workers in (1, 4):
+            monkeypatch.setattr(factory.config, "max_generate_workers", workers)
+            result = factory._node_generate({"candidates": [candidate(n) for n in names]})
+            outputs.append(([(c.symbol_name, c.question) for c in result["candidates"]], result["errors"]))
+        assert outputs[0] == outputs[1]
@@ -0,0 +1,243 @@
+"""Unit tests for the streaming supervisor workflow.
+
+This module tests agents/supervisor.py with stand-in agents:
+- Symbol-keyed snippet and link indexes
+- Streaming writing → auditing → verifying → storing with bounded queues
+  and per-stage worker limits
+- Barrier mode producing the same skills and metrics
+- WorkflowState.stage advancing through the skill stages in both modes
+- Stage errors stopping the workflow
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import types
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.agents.base import AgentResult, AgentRole, AgentStatus
+from skills_fabric.agents.supervisor import (
+    LinkIndex,
+    SnippetIndex,
+    SupervisorAgent,
+    WorkflowStage,
+    WorkflowState,
+)
+
+
+@dataclass
+class FakeSkill:
+    content: str
+    audited: bool = False
+    verified: bool = False
+    hallucination_rate: float = 0.0
+
+
+def ok(role, output) -> AgentResult:
+    return AgentResult(agent=role, status=AgentStatus.SUCCESS, output=output)
+
+
+class FakeWriter:
+    delay = 0.0
+
+    def execute(self, task, context=None):
+        time.sleep(self.delay)
+        content = f"Use `{task.symbol_name}`: {task.source_code}"
+        return ok(AgentRole.WRITER, types.SimpleNamespace(skill=FakeSkill(content)))
+
+
+class FakeAuditor:
+    seen: list = []
+
+    def execute(self, task, context=None):
+        FakeAuditor.seen.append([r.symbol_name for r in task.source_refs])
+        passed = "Reject" not in task.content
+        return ok(AgentRole.AUDITOR, types.SimpleNamespace(passed=passed, hallucination_rate=0.01))
+
+
+class FakeVerifier:
+    def execute(self, task, context=None):
+        passed = "Unverified" not in task.skill.content
+        return ok(AgentRole.VERIFIER, types.SimpleNamespace(passed=passed))
+
+
+class FakeStore:
+    stored: list = []
+    times: list = []
+
+    def create_skill(self, skill):
+        FakeStore.stored.append(skill)
+        FakeStore.times.append(time.perf_counter())
+
+
+@pytest.fixture(autouse=True)
+def fake_store(monkeypatch):
+    module = types.ModuleType("skills_fabric.store.kuzu_store")
+    module.KuzuSkillStore = FakeStore
+    monkeypatch.setitem(sys.modules, "skills_fabric.store.kuzu_store", module)
+    FakeStore.stored, FakeStore.times, FakeAuditor.seen = [], [], []
+    FakeWriter.delay = 0.0
+
+
+def make_supervisor(**kwargs) -> SupervisorAgent:
+    supervisor = SupervisorAgent(**kwargs)
+    supervisor.writer = FakeWriter()
+    supervisor.auditor = FakeAuditor()
+    supervisor.verifier = FakeVerifier()
+    return supervisor
+
+
+def make_state(n: int = 20) -> WorkflowState:
+    names = [f"Symbol{i}" for i in range(n)]
+    names[3] = "RejectMe"
+    names[5] = "UnverifiedThing"
+    return WorkflowState(
+        library_name="lib",
+        mined_snippets=[{"snippet": f"class {name}: pass"} for name in names],
+        proven_links=[
+            {"concept_name": f"c{i}", "symbol_name": name, "file_path": "pkg/mod.py", "line_number": i}
+            for i, name in enumerate(names)
+        ],
+    )
+
+
+class TestIndexes:
+    """Tests for the symbol-keyed lookups."""
+
+    def test_snippet_index(self):
+        snippets = [
+            {"snippet": "class StateGraph: pass"},
+            {"snippet": "def add_node(): StateGraph()"},
+            {"snippet": "graph.compile()"},
+        ]
+        index = SnippetIndex(snippets)
+        assert index.find("StateGraph") is snippets[0]
+        assert index.find("add_node") is snippets[1]
+        assert index.find("graph.compile") is snippets[2]  # dotted: substring scan
+        assert index.find("Missing") is None
+        assert index.find("Graph") is None  # whole identifiers only
+
+    def test_link_index(self):
+        links = [
+            {"symbol_name": "StateGraph"}, {"symbol_name": "add_node"},
+            {"symbol_name": "graph.compile"}, {"symbol_name": "StateGraph"}, {},
+        ]
+        index = LinkIndex(links)
+        found = index.links_in("Call graph.compile() on a StateGraph")
+        assert found == [links[0], links[2], links[3]]
+        assert index.links_in("nothing here") == []
+
+
+class TestSkillStages:
+    """Tests for the streamed and barrier skill stages."""
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_metrics(self, streaming):
+        supervisor = make_supervisor(streaming=streaming)
+        state = make_state()
+        results = supervisor._run_skill_stages(state)
+
+        assert len(state.skills) == 20
+        assert state.skills_audited == 19
+        assert state.skills_verified == 18
+        assert state.skills_rejected == 1
+        assert state.skills_created == 18 and len(FakeStore.stored) == 18
+        assert state.hallucination_rate == pytest.approx(0.01)
+        assert state.first_stored_ms > 0
+        assert set(results) == {AgentRole.WRITER, AgentRole.AUDITOR, AgentRole.VERIFIER}
+        assert all(s.audited and s.verified for s in state.verified_skills)
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_stage_advances(self, streaming, monkeypatch):
+        order = [WorkflowStage.WRITING, WorkflowStage.AUDITING, WorkflowStage.VERIFYING, WorkflowStage.STORING]
+        state = make_state()
+        seen = {stage: [] for stage in order}
+
+        def observe(stage, call):
+            def wrapped(*args, **kwargs):
+                seen[stage].append(state.stage)
+                return call(*args, **kwargs)
+            return wrapped
+
+        supervisor = make_supervisor(streaming=streaming)
+        for stage, agent in zip(order, (supervisor.writer, supervisor.auditor, supervisor.verifier)):
+            monkeypatch.setattr(agent, "execute", observe(stage, agent.execute))
+        monkeypatch.setattr(FakeStore, "create_skill", observe(WorkflowStage.STORING, FakeStore.create_skill))
+        supervisor._run_skill_stages(state)
+
+        for stage in order:
+            assert seen[stage]
+            if streaming:
+                # Stages overlap: each sees its own stage or a later one
+                assert all(order.index(s) >= order.index(stage) for s in seen[stage])
+            else:
+                assert set(seen[stage]) == {stage}
+        assert state.stage == WorkflowStage.STORING
+
+    def test_audit_refs_from_link_index(self):
+        concurrency = {stage: 1 for stage in SupervisorAgent.STAGE_CONCURRENCY}
+        supervisor = make_supervisor(stage_concurrency=concurrency)
+        supervisor._run_skill_stages(make_state(6))
+        expected = [["Symbol0"], ["Symbol1"], ["Symbol2"], ["RejectMe"], ["Symbol4"], ["UnverifiedThing"]]
+        assert FakeAuditor.seen == expected
+
+    def test_single_workers_preserve_order(self):
+        concurrency = {stage: 1 for stage in SupervisorAgent.STAGE_CONCURRENCY}
+        supervisor = make_supervisor(stage_concurrency=concurrency)
+        state = make_state()
+        supervisor._run_skill_stages(state)
+        barrier = make_state()
+        make_supervisor(streaming=False)._run_skill_stages(barrier)
+
+        assert [s.content for s in state.verified_skills] == [s.content for s in barrier.verified_skills]
+
+    def test_first_skill_stored_before_writing_finishes(self):
+        FakeWriter.delay = 0.01
+        supervisor = make_supervisor(queue_size=2)
+        state = make_state(30)
+        supervisor._run_skill_stages(state)
+
+        elapsed_ms = (FakeStore.times[-1] - FakeStore.times[0]) * 1000
+        assert state.first_stored_ms < elapsed_ms
+
+    def test_extra_workers_get_own_agents(self):
+        supervisor = make_supervisor(stage_concurrency={WorkflowStage.WRITING: 3})
+        supervisor._run_skill_stages(make_state())
+        writers = [a for (name, _), a in supervisor._worker_agents.items() if name == "writer"]
+        assert len({id(a) for a in writers + [supervisor.writer]}) == len(writers) + 1
+
+    def test_stage_error_stops_workflow(self):
+        class BrokenVerifier:
+            def execute(self, task, context=None):
+                raise RuntimeError("verifier down")
+
+        supervisor = make_supervisor()
+        supervisor.verifier = BrokenVerifier()
+        with pytest.raises(RuntimeError, match="verifier down"):
+            supervisor._run_skill_stages(make_state())
+        assert not [t for t in threading.enumerate() if t.name.startswith("supervisor-")]
+
+    def test_execute_end_to_end(self, monkeypatch):
+        supervisor = make_supervisor()
+        prepared = make_state()
+        monkeypatch.setattr(supervisor, "_run_mining", lambda state: (
+            setattr(state, "mined_snippets", prepared.mined_snippets) or state,
+            ok(AgentRole.MINER, None),
+        ))
+        monkeypatch.setattr(supervisor, "_run_linking", lambda state: (
+            setattr(state, "proven_links", prepared.proven_links) or state,
+            ok(AgentRole.LINKER, None),
+        ))
+
+        result = supervisor.run_workflow("lib", "/repo")
+        assert result.success
+        assert result.final_state.stage == WorkflowStage.COMPLETE
+        assert result.final_state.skills_created == 18
@@ -0,0 +1,211 @@
+"""Unit tests for observability tracing.
+
+This module tests:
+- Bounded span retention
+- Batched, off-thread export and the drop counter
+- Per-tracer trace sampling
+- JSON lines and OTLP/JSON file exporters
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import threading
+from pathlib import Path
+
+# Import tracing directly to avoid heavy dependencies from skills_fabric.__init__
+_src_path = Path(__file__).parent.parent / "src"
+_tracing_path = _src_path / "skills_fabric" / "observability" / "tracing.py"
+_spec = importlib.util.spec_from_file_location(
+    "skills_fabric.observability.tracing", _tracing_path
+)
+_tracing_module = importlib.util.module_from_spec(_spec)
+sys.modules["skills_fabric.observability.tracing"] = _tracing_module
+_spec.loader.exec_module(_tracing_module)
+
+SpanStatus = _tracing_module.SpanStatus
+TracerProvider = _tracing_module.TracerProvider
+json_exporter = _tracing_module.json_exporter
+otlp_file_exporter = _tracing_module.otlp_file_exporter
+
+
+class TestRetention:
+    """Tests for the bounded in-memory span buffer."""
+
+    def test_keeps_most_recent_spans(self):
+        provider = TracerProvider(max_spans=5)
+        tracer = provider.get_tracer("test")
+        for i in range(20):
+            with tracer.start_span(f"op{i}"):
+                pass
+        names = [s.name for s in provider.get_all_spans()]
+        assert names == [f"test.op{i}" for i in range(15, 20)]
+
+    def test_get_trace_groups_children(self):
+        provider = TracerProvider()
+        tracer = provider.get_tracer("test")
+        with tracer.start_span("root") as root:
+            with tracer.start_span("child") as child:
+                pass
+        trace = provider.get_trace(root.trace_id)
+        assert {s.span_id for s in trace} == {root.span_id, child.span_id}
+        assert child.parent_span_id == root.span_id
+
+
+class TestBatchExport:
+    """Tests for the batch span processor."""
+
+    def test_exporter_runs_off_caller_thread(self):
+        provider = TracerProvider(schedule_delay=60)
+        tracer = provider.get_tracer("test")
+        seen = []
+        provider.add_exporter(lambda span: seen.append((span.name, threading.current_thread())))
+
+        with tracer.start_span("op"):
+            pass
+        assert seen == []  # Nothing exported synchronously
+
+        provider.shutdown()
+        assert [name for name, _ in seen] == ["test.op"]
+        assert seen[0][1] is not threading.current_thread()
+
+    def test_full_batch_wakes_worker(self):
+        provider = TracerProvider(max_export_batch_size=4, schedule_delay=60)
+        tracer = provider.get_tracer("test")
+        done = threading.Event()
+        batches = []
+
+        class Collector:
+            def export(self, spans):
+                batches.append(len(spans))
+                done.set()
+
+        provider.add_exporter(Collector())
+        for i in range(4):
+            with tracer.start_span(f"op{i}"):
+                pass
+        assert done.wait(5)
+        assert batches[0] == 4
+        provider.shutdown()
+
+    def test_full_queue_drops_and_counts(self):
+        provider = TracerProvider(max_queue_size=3, schedule_delay=60, max_export_batch_size=100)
+        tracer = provider.get_tracer("test")
+        exported = []
+        provider.add_exporter(exported.append)
+        for i in range(10):
+            with tracer.start_span(f"op{i}"):
+                pass
+        assert provider.dropped_spans == 7
+
+        provider.force_flush()
+        assert len(exported) == 3
+        # Retention is independent of the export queue
+        assert len(provider.get_all_spans()) == 10
+        provider.shutdown()
+
+    def test_exporter_errors_are_swallowed(self):
+        provider = TracerProvider(schedule_delay=60)
+        tracer = provider.get_tracer("test")
+        exported = []
+
+        def failing(span):
+            raise RuntimeError("boom")
+
+        provider.add_exporter(failing)
+        provider.add_exporter(exported.append)
+        with tracer.start_span("op"):
+            pass
+        provider.shutdown()
+        assert len(exported) == 1
+
+
+class TestSampling:
+    """Tests for per-tracer sampling."""
+
+    def test_zero_rate_records_nothing(self):
+        provider = TracerProvider()
+        tracer = provider.get_tracer("quiet", sample_rate=0.0)
+        with tracer.start_span("op") as span:
+            span.set_attribute("k", "v")
+        assert provider.get_all_spans() == []
+
+    def test_children_follow_root_decision(self):
+        provider = TracerProvider()
+        noisy = provider.get_tracer("noisy", sample_rate=0.0)
+        other = provider.get_tracer("other")
+        with noisy.start_span("root"):
+            with other.start_span("child"):
+                pass
+        assert provider.get_all_spans() == []
+
+    def test_partial_rate(self):
+        provider = TracerProvider(max_spans=10_000)
+        tracer = provider.get_tracer("half", sample_rate=0.5)
+        for _ in range(2000):
+            with tracer.start_span("op"):
+                pass
+        assert 800 < len(provider.get_all_spans()) < 1200
+
+    def test_rate_update_on_existing_tracer(self):
+        provider = TracerProvider()
+        tracer = provider.get_tracer("t")
+        assert provider.get_tracer("t", sample_rate=0.0) is tracer
+        assert tracer.sample_rate == 0.0
+
+
+class TestFileExporters:
+    """Tests for JSON lines and OTLP file exporters."""
+
+    def test_json_exporter_batch(self, tmp_path: Path):
+        path = tmp_path / "spans.jsonl"
+        provider = TracerProvider(schedule_delay=60)
+        provider.add_exporter(json_exporter(str(path)))
+        tracer = provider.get_tracer("test")
+        for i in range(3):
+            with tracer.start_span(f"op{i}"):
+                pass
+        provider.shutdown()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["name"] for line in lines] == ["test.op0", "test.op1", "test.op2"]
+
+    def test_json_exporter_still_callable_per_span(self, tmp_path: Path):
+        path = tmp_path / "spans.jsonl"
+        provider = TracerProvider()
+        with provider.get_tracer("test").start_span("op") as span:
+            pass
+        json_exporter(str(path))(span)
+        assert json.loads(path.read_text())["span_id"] == span.span_id
+
+    def test_otlp_exporter(self, tmp_path: Path):
+        path = tmp_path / "spans.otlp.jsonl"
+        provider = TracerProvider(schedule_delay=60)
+        provider.add_exporter(otlp_file_exporter(str(path), service_name="svc"))
+        tracer = provider.get_tracer("skills_fabric.trust")
+        try:
+            with tracer.start_span("verify", attributes={"level": 2, "ok": True}) as root:
+                root.add_event("checked", {"n": 1.5})
+                with tracer.start_span("fetch", kind="client"):
+                    raise ValueError("bad")
+        except ValueError:
+            pass
+        provider.shutdown()
+
+        request = json.loads(path.read_text().splitlines()[0])
+        resource = request["resourceSpans"][0]
+        assert resource["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "svc"}}
+        ]
+        scope = resource["scopeSpans"][0]
+        assert scope["scope"]["name"] == "skills_fabric.trust"
+        child, parent = scope["spans"]
+        assert len(parent["traceId"]) == 32
+        assert child["parentSpanId"] == parent["spanId"]
+        assert child["kind"] == 3
+        assert child["status"] == {"code": 2, "message": "bad"}
+        assert {"key": "level", "value": {"intValue": "2"}} in parent["attributes"]
+        assert {"key": "ok", "value": {"boolValue": True}} in parent["attributes"]
+        assert parent["events"][0]["attributes"] == [{"key": "n", "value": {"doubleValue": 1.5}}]
+        assert int(parent["endTimeUnixNano"]) >= int(parent["startTimeUnixNano"])
@@ -11,6 +11,9 @@ Test coverage includes:
 - Error handling for malformed files
 - Directory parsing
 - TSSymbol to EnhancedSymbol conversion
+- Call and import extraction from the capture queries
+- Incremental re-parsing of edited files from retained trees
+- Parallel directory parsing
 """
 from __future__ import annotations
 
@@ -41,6 +44,7 @@ _spec.loader.exec_module(_tree_sitter_module)
 
 TreeSitterParser = _tree_sitter_module.TreeSitterParser
 TSSymbol = _tree_sitter_module.TSSymbol
+TSFileIndex = _tree_sitter_module.TSFileIndex
 
 
 def _has_full_package() -> bool:
@@ -941,3 +945,193 @@ class TestSymbolCounts:
 
         # Sample has: process, transform, create, processData, arrowProcessor, fetchData
         assert len(functions) >= 4
+
+
+# =============================================================================
+# Query Extraction Tests
+# =============================================================================
+
+
+class TestQueryExtraction:
+    """Test calls and imports captured alongside definitions."""
+
+    def test_python_calls_and_imports(
+        self, tree_sitter_parser: "TreeSitterParser", sample_python_file: Path
+    ):
+        """Test Python call and import references."""
+        index = tree_sitter_parser.extract_file(sample_python_file)
+
+        assert index.language == "python"
+        assert not index.has_errors
+        assert [(i.name, i.line) for i in index.imports] == [("dataclasses", 2), ("typing", 3)]
+        call_names = [c.name for c in index.calls]
+        assert "append" in call_names
+        assert "len" in call_names
+        assert all(c.kind == "call" for c in index.calls)
+
+    def test_typescript_calls_and_imports(
+        self, tree_sitter_parser: "TreeSitterParser", temp_dir: Path
+    ):
+        """Test TypeScript import statements, require() and member calls."""
+        file_path = temp_dir / "app.ts"
+        file_path.write_text(
+            'import { a } from "./mod";\n'
+            'const fs = require("fs");\n'
+            'class App { run() { this.start(a); } }\n'
+        )
+        index = tree_sitter_parser.extract_file(file_path)
+
+        assert [i.name for i in index.imports] == ["./mod", "fs"]
+        assert [c.name for c in index.calls] == ["require", "start"]
+        assert [s.name for s in index.symbols] == ["App", "run"]
+
+    def test_symbols_in_document_order(
+        self, tree_sitter_parser: "TreeSitterParser", sample_javascript_file: Path
+    ):
+        """Test that classes come before their methods, in source order."""
+        symbols = tree_sitter_parser.parse_file(sample_javascript_file)
+        names = [s.name for s in symbols]
+
+        assert names[:5] == ["DataProcessor", "constructor", "process", "transform", "create"]
+        assert [s.line for s in symbols] == sorted(s.line for s in symbols)
+
+    def test_unsupported_file_has_no_index(
+        self, tree_sitter_parser: "TreeSitterParser", temp_dir: Path
+    ):
+        """Test that extract_file returns None for unsupported files."""
+        file_path = temp_dir / "main.rs"
+        file_path.write_text("fn main() {}")
+        assert tree_sitter_parser.extract_file(file_path) is None
+
+
+# =============================================================================
+# Incremental Parsing Tests
+# =============================================================================
+
+
+class _RecordingParser:
+    """Wraps a tree-sitter Parser and records whether an old tree was passed."""
+
+    def __init__(self, parser):
+        self.parser = parser
+        self.calls = []
+
+    def parse(self, source, old_tree=None):
+        self.calls.append(old_tree is not None)
+        if old_tree is None:
+            return self.parser.parse(source)
+        return self.parser.parse(source, old_tree)
+
+
+class TestIncrementalParsing:
+    """Test re-parsing from retained trees."""
+
+    def _recording(self, parser: "TreeSitterParser", language: str) -> _RecordingParser:
+        recording = _RecordingParser(parser._parsers[language])
+        parser._parsers[language] = recording
+        return recording
+
+    def test_edit_reparses_incrementally(
+        self, tree_sitter_parser: "TreeSitterParser", sample_python_file: Path
+    ):
+        """Test that an edited file is re-parsed from its old tree."""
+        tree_sitter_parser.parse_file(sample_python_file)
+        recording = self._recording(tree_sitter_parser, "python")
+
+        edited = SAMPLE_PYTHON_CODE.replace(
+            "def standalone_function(", "def helper():\n    pass\n\n\ndef standalone_function("
+        )
+        sample_python_file.write_text(edited)
+        symbols = tree_sitter_parser.parse_file(sample_python_file)
+
+        assert recording.calls == [True]
+        fresh = TreeSitterParser().parse_file(sample_python_file)
+        assert [(s.name, s.line, s.end_line) for s in symbols] == [
+            (s.name, s.line, s.end_line) for s in fresh
+        ]
+        helper = assert_symbol_found(symbols, "helper", kind="function")
+        standalone = assert_symbol_found(symbols, "standalone_function", kind="function")
+        assert standalone.line == helper.line + 4
+
+    def test_unchanged_file_not_reparsed(
+        self, tree_sitter_parser: "TreeSitterParser", sample_typescript_file: Path
+    ):
+        """Test that identical source reuses the previous result."""
+        first = tree_sitter_parser.parse_file(sample_typescript_file)
+        recording = self._recording(tree_sitter_parser, "typescript")
+
+        assert tree_sitter_parser.parse_file(sample_typescript_file) == first
+        assert recording.calls == []
+
+    def test_editor_buffer_edits(
+        self, tree_sitter_parser: "TreeSitterParser", temp_dir: Path
+    ):
+        """Test a series of in-memory edits, including deletions."""
+        file_path = temp_dir / "buffer.js"
+        source = "function a() {}\nfunction b() {}\n"
+        tree_sitter_parser.extract_source(file_path, source)
+
+        for source in (
+            "function a() {}\nclass B {}\nfunction b() {}\n",
+            "function b() {}\n",
+            "// é\nfunction b() {}\nconst c = () => 1;\n",
+        ):
+            index = tree_sitter_parser.extract_source(file_path, source)
+            fresh = TreeSitterParser().extract_source(file_path, source)
+            assert [(s.name, s.kind, s.line) for s in index.symbols] == [
+                (s.name, s.kind, s.line) for s in fresh.symbols
+            ]
+
+    def test_retained_trees_bounded(self, temp_dir: Path):
+        """Test that only the most recently parsed trees are kept."""
+        parser = TreeSitterParser(max_retained_trees=2)
+        for i in range(4):
+            file_path = temp_dir / f"m{i}.py"
+            file_path.write_text(f"class M{i}: pass\n")
+            parser.parse_file(file_path)
+
+        assert list(parser._trees) == [str(temp_dir / "m2.py"), str(temp_dir / "m3.py")]
+        parser.clear_trees()
+        assert not parser._trees
+
+
+# =============================================================================
+# Parallel Directory Parsing Tests
+# =============================================================================
+
+
+class TestParallelDirectoryParsing:
+    """Test the single-walk, multi-process directory parser."""
+
+    def test_parallel_matches_sequential(
+        self, tree_sitter_parser: "TreeSitterParser", temp_dir: Path, monkeypatch
+    ):
+        """Test that worker processes produce the same symbols, in path order."""
+        for i in range(12):
+            sub = temp_dir / f"pkg{i % 3}"
+            sub.mkdir(exist_ok=True)
+            (sub / f"mod{i}.py").write_text(SAMPLE_PYTHON_CODE)
+            (sub / f"mod{i}.ts").write_text(SAMPLE_TYPESCRIPT_CODE)
+        monkeypatch.setattr(_tree_sitter_module, "PARALLEL_MIN_FILES", 2)
+        # Workers are sent _extract_batch by reference, so the package must be importable
+        monkeypatch.syspath_prepend(str(_src_path))
+
+        sequential = tree_sitter_parser.parse_directory(temp_dir, max_workers=1)
+        parallel = TreeSitterParser().parse_directory(temp_dir, max_workers=2)
+
+        assert parallel == sequential
+        assert len({s.file_path for s in parallel}) == 24
+
+    def test_skip_dirs_match_directory_names(
+        self, tree_sitter_parser: "TreeSitterParser", temp_dir: Path
+    ):
+        """Test that skipping matches whole directory names, not substrings."""
+        root = temp_dir / "build"  # The scanned root itself may have any name
+        (root / "dist").mkdir(parents=True)
+        (root / "dist" / "bundle.js").write_text("class Bundle {}")
+        (root / "distance.py").write_text("class Distance: pass")
+        (root / "rebuild").mkdir()
+        (root / "rebuild" / "tool.py").write_text("class Tool: pass")
+
+        files = tree_sitter_parser.find_source_files(root)
+        assert [f.relative_to(root).as_posix() for f in files] == ["distance.py", "rebuild/tool.py"]
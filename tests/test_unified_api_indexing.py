@@ -0,0 +1,228 @@
+"""Unit tests for UnifiedAPI chunked, incremental vector indexing.
+
+This module tests integrations/unified_api.py:
+- Documents streamed in sized chunks, one embed/upsert call per chunk
+- Bounded chunk concurrency with blocking client calls off the event loop
+- Content-hash point IDs: unchanged documents are skipped on re-index
+- Failed chunks reported without losing the others
+- Round trip through an in-memory Qdrant (when qdrant-client is installed)
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+_src_path = Path(__file__).parent.parent / "src"
+if str(_src_path) not in sys.path:
+    sys.path.insert(0, str(_src_path))
+
+from skills_fabric.integrations.unified_api import APIConfig, UnifiedAPI, point_id
+
+try:
+    import qdrant_client
+    HAS_QDRANT = True
+except ImportError:
+    HAS_QDRANT = False
+
+
+class FakeEmbedder:
+    """Stands in for the Voyage client; records calls and concurrency."""
+
+    def __init__(self, delay: float = 0.0, fail_on: str = ""):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls: list[list[str]] = []
+        self.threads: set[str] = set()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def embed(self, texts, model, input_type):
+        with self._lock:
+            self.calls.append(list(texts))
+            self.threads.add(threading.current_thread().name)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail_on and any(self.fail_on in t for t in texts):
+                raise RuntimeError("embedding service unavailable")
+            return types.SimpleNamespace(embeddings=[[float(len(t)), 1.0] for t in texts])
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class FakeQdrant:
+    """Minimal in-memory stand-in for QdrantClient."""
+
+    def __init__(self):
+        self.collections: dict[str, dict] = {}
+        self.upserts: list[int] = []
+        self.threads: set[str] = set()
+        self._lock = threading.Lock()
+
+    def get_collections(self):
+        return types.SimpleNamespace(
+            collections=[types.SimpleNamespace(name=n) for n in self.collections]
+        )
+
+    def create_collection(self, collection_name, vectors_config):
+        self.collections[collection_name] = {}
+
+    def retrieve(self, collection_name, ids, with_payload=True, with_vectors=False):
+        points = self.collections[collection_name]
+        return [types.SimpleNamespace(id=i) for i in ids if i in points]
+
+    def upsert(self, collection_name, points):
+        with self._lock:
+            self.threads.add(threading.current_thread().name)
+            self.upserts.append(len(points))
+            for point in points:
+                self.collections[collection_name][point.id] = point
+
+
+@pytest.fixture(autouse=True)
+def qdrant_models(monkeypatch):
+    """Provide qdrant_client.models when qdrant-client isn't installed."""
+    if not HAS_QDRANT:
+        models = types.ModuleType("qdrant_client.models")
+        models.VectorParams = lambda size, distance: types.SimpleNamespace(size=size, distance=distance)
+        models.Distance = types.SimpleNamespace(COSINE="Cosine")
+        models.PointStruct = lambda id, vector, payload: types.SimpleNamespace(
+            id=id, vector=vector, payload=payload
+        )
+        package = types.ModuleType("qdrant_client")
+        package.models = models
+        monkeypatch.setitem(sys.modules, "qdrant_client", package)
+        monkeypatch.setitem(sys.modules, "qdrant_client.models", models)
+
+
+def make_api(embedder=None, qdrant=None) -> UnifiedAPI:
+    api = UnifiedAPI(APIConfig())
+    api.status = {"qdrant": True, "voyage": True}
+    api._voyage = embedder or FakeEmbedder()
+    api._qdrant = qdrant or FakeQdrant()
+    return api
+
+
+def make_docs(n: int, prefix: str = "def f") -> list[dict]:
+    return [
+        {"content": f"{prefix}{i}(): pass", "file_path": f"pkg/mod{i % 3}.py", "line": i + 1}
+        for i in range(n)
+    ]
+
+
+class TestChunkedIndexing:
+    """Tests for chunking, concurrency and offloading."""
+
+    async def test_documents_indexed_in_chunks(self):
+        api = make_api()
+        assert await api.index_code("code", make_docs(10), vector_size=2, chunk_size=4)
+
+        assert [len(c) for c in api._voyage.calls] == [4, 4, 2]
+        assert sorted(api._qdrant.upserts) == [2, 4, 4]
+        assert len(api._qdrant.collections["code"]) == 10
+        stats = api.last_index_stats
+        assert (stats.documents, stats.chunks, stats.embedded, stats.skipped) == (10, 3, 10, 0)
+
+    async def test_payload_and_content_hash_ids(self):
+        api = make_api()
+        docs = make_docs(3)
+        docs[0]["metadata"] = {"symbol": "f0"}
+        await api.index_code("code", docs, chunk_size=2)
+
+        points = api._qdrant.collections["code"]
+        assert set(points) == {point_id(d) for d in docs}
+        payload = points[point_id(docs[0])].payload
+        assert payload == {"content": "def f0(): pass", "file_path": "pkg/mod0.py", "line": 1, "symbol": "f0"}
+
+    async def test_bounded_concurrency_off_event_loop(self):
+        api = make_api(embedder=FakeEmbedder(delay=0.02))
+        docs = (d for d in make_docs(40))  # generator input
+        assert await api.index_code("code", docs, chunk_size=5, max_concurrency=3)
+
+        assert 1 < api._voyage.max_active <= 3
+        main = threading.current_thread().name
+        assert main not in api._voyage.threads
+        assert main not in api._qdrant.threads
+        assert len(api._qdrant.collections["code"]) == 40
+
+
+class TestIncrementalIndexing:
+    """Tests for content-hash skipping of unchanged documents."""
+
+    def test_point_id_stable_and_content_sensitive(self):
+        doc = {"content": "x = 1", "file_path": "a.py", "line": 3}
+        assert point_id(doc) == point_id(dict(doc))
+        assert point_id(doc) != point_id({**doc, "content": "x = 2"})
+        assert point_id(doc) != point_id({**doc, "line": 4})
+
+    async def test_reindex_skips_unchanged(self):
+        api = make_api()
+        docs = make_docs(8)
+        await api.index_code("code", docs, chunk_size=4)
+        api._voyage.calls.clear()
+
+        assert await api.index_code("code", docs, chunk_size=4)
+        assert api._voyage.calls == []
+        assert api.last_index_stats.skipped == 8
+
+        docs[5] = {**docs[5], "content": "def changed(): pass"}
+        assert await api.index_code("code", docs, chunk_size=4)
+        assert api._voyage.calls == [["def changed(): pass"]]
+        assert api.last_index_stats.embedded == 1
+        assert api.last_index_stats.skipped == 7
+
+    async def test_duplicates_embedded_once(self):
+        api = make_api()
+        docs = make_docs(3) * 2
+        await api.index_code("code", docs, chunk_size=3, skip_unchanged=False)
+
+        assert sum(len(c) for c in api._voyage.calls) == 3
+        assert api.last_index_stats.skipped == 3
+
+
+class TestIndexingFailures:
+    """Tests for partial failures and missing services."""
+
+    async def test_failed_chunk_reported(self):
+        api = make_api(embedder=FakeEmbedder(fail_on="bad"))
+        docs = make_docs(6)
+        docs[4] = {"content": "bad chunk", "file_path": "x.py", "line": 1}
+
+        assert not await api.index_code("code", docs, chunk_size=3)
+        assert api.last_index_stats.failed_chunks == 1
+        assert len(api._qdrant.collections["code"]) == 3
+
+    async def test_invalid_document_reported(self):
+        api = make_api()
+        assert not await api.index_code("code", make_docs(4) + [{"file_path": "x.py"}], chunk_size=4)
+        assert len(api._qdrant.collections["code"]) == 4
+
+    async def test_requires_services(self):
+        api = make_api()
+        api.status = {"qdrant": True, "voyage": False}
+        assert not await api.index_code("code", make_docs(2))
+
+
+@pytest.mark.skipif(not HAS_QDRANT, reason="qdrant-client not installed")
+class TestInMemoryQdrant:
+    """Round trip through qdrant-client's in-memory mode."""
+
+    async def test_index_and_reindex(self):
+        api = make_api(qdrant=qdrant_client.QdrantClient(":memory:"))
+        docs = make_docs(12)
+
+        assert await api.index_code("code", docs, vector_size=2, chunk_size=5)
+        assert api._qdrant.count("code").count == 12
+
+        api._voyage.calls.clear()
+        assert await api.index_code("code", docs, vector_size=2, chunk_size=5)
+        assert api._voyage.calls == []
+        assert api._qdrant.count("code").count == 12